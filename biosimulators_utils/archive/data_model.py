@@ -7,10 +7,12 @@
 """
 
 from ..utils.core import are_lists_equal, none_sorted
+import enum
 
 __all__ = [
     'Archive',
     'ArchiveFile',
+    'ArchiveCompression',
 ]
 
 
@@ -88,3 +90,11 @@ class ArchiveFile(object):
         return self.__class__ == other.__class__ \
             and self.local_path == other.local_path \
             and self.archive_path == other.archive_path
+
+
+class ArchiveCompression(str, enum.Enum):
+    """ Compression method for the members of zip archives """
+    stored = 'stored'
+    deflate = 'deflate'
+    bzip2 = 'bzip2'
+    lzma = 'lzma'
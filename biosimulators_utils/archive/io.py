@@ -6,27 +6,74 @@
 :License: MIT
 """
 
-from .data_model import Archive, ArchiveFile
+from .data_model import Archive, ArchiveFile, ArchiveCompression
 import os
+import threading
 import zipfile
 
 
-__all__ = ['ArchiveWriter', 'ArchiveReader']
+__all__ = [
+    'ArchiveWriter',
+    'ArchiveReader',
+    'mount_archive',
+    'unmount_archive',
+    'get_mounted_archive',
+    'materialize_path',
+    'materialize_model',
+]
+
+_MOUNTED_ARCHIVES = {}
+_MOUNTED_ARCHIVES_LOCK = threading.Lock()
+
+ZIP_COMPRESSION_METHODS = {
+    ArchiveCompression.stored: zipfile.ZIP_STORED,
+    ArchiveCompression.deflate: zipfile.ZIP_DEFLATED,
+    ArchiveCompression.bzip2: zipfile.ZIP_BZIP2,
+    ArchiveCompression.lzma: zipfile.ZIP_LZMA,
+}
+
+# extensions of formats which are already compressed, and which therefore are stored without further compression
+DEFAULT_COMPRESSION_BY_EXTENSION = {
+    extension: ArchiveCompression.stored
+    for extension in [
+        '.pdf', '.png', '.jpg', '.jpeg', '.gif', '.webp',
+        '.zip', '.omex', '.xlsx', '.gz', '.bz2', '.xz',
+    ]
+}
 
 
 class ArchiveWriter(object):
     """ Class for writing zip archives """
 
-    def run(self, archive, archive_filename):
+    def run(self, archive, archive_filename,
+            compression=ArchiveCompression.lzma, compression_level=None,
+            compression_by_extension=DEFAULT_COMPRESSION_BY_EXTENSION):
         """ Bundle a list of files into a zip archive
 
         Args:
             archive (:obj:`Archive`): files to bundle into a zip archive
             archive_filename (:obj:`str`): path to save zip file
+            compression (:obj:`ArchiveCompression`, optional): compression method
+            compression_level (:obj:`int`, optional): compression level (0-9 for deflate, 1-9 for bzip2; ignored for
+                stored and lzma). Default: the default level of the compression method.
+            compression_by_extension (:obj:`dict`, optional): dictionary that maps file extensions (e.g., ``.pdf``)
+                to the compression methods which should be used for files with these extensions, such as to
+                store already compressed formats without further compression
         """
-        with zipfile.ZipFile(archive_filename, mode='w', compression=zipfile.ZIP_LZMA) as zip_file:
+        compression_by_extension = {
+            extension.lower(): ArchiveCompression(extension_compression)
+            for extension, extension_compression in (compression_by_extension or {}).items()
+        }
+
+        def get_compress_type(file):
+            extension = os.path.splitext(file.archive_path)[1].lower()
+            return ZIP_COMPRESSION_METHODS[compression_by_extension.get(extension, ArchiveCompression(compression))]
+
+        with zipfile.ZipFile(archive_filename, mode='w', compression=ZIP_COMPRESSION_METHODS[ArchiveCompression(compression)],
+                             compresslevel=compression_level) as zip_file:
             for file in archive.files:
-                zip_file.write(file.local_path, arcname=file.archive_path)
+                zip_file.write(file.local_path, arcname=file.archive_path,
+                               compress_type=get_compress_type(file), compresslevel=compression_level)
 
 
 class ArchiveReader(object):
@@ -52,3 +99,110 @@ class ArchiveReader(object):
             if out_dir:
                 zip_file.extractall(out_dir)
         return archive
+
+
+def mount_archive(dirname, extractor):
+    """ Mount a lazily-unpacked archive onto a directory so that its members are unpacked into the
+    directory when they are first accessed through :obj:`materialize_path`
+
+    Args:
+        dirname (:obj:`str`): directory where the members of the archive are unpacked
+        extractor (:obj:`object`): object which unpacks members of the archive, such as
+            :obj:`biosimulators_utils.combine.io.CombineArchiveExtractor`. The object must have a
+            ``get_filename(location)`` method which unpacks a member, an ``extract(locations)`` method which
+            unpacks multiple members, a ``read(location, size)`` method which reads a member without unpacking
+            it, and a ``get_locations()`` method which lists the members of the archive.
+    """
+    with _MOUNTED_ARCHIVES_LOCK:
+        _MOUNTED_ARCHIVES[os.path.abspath(dirname)] = extractor
+
+
+def unmount_archive(dirname):
+    """ Unmount an archive from a directory
+
+    Args:
+        dirname (:obj:`str`): directory onto which the archive was mounted
+    """
+    with _MOUNTED_ARCHIVES_LOCK:
+        _MOUNTED_ARCHIVES.pop(os.path.abspath(dirname), None)
+
+
+def get_mounted_archive(path):
+    """ Get the archive mounted onto a directory or one of its parents
+
+    Args:
+        path (:obj:`str`): path
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`object`: extractor for the archive, or :obj:`None` if no archive is mounted onto the path
+            * :obj:`str`: directory onto which the archive is mounted
+    """
+    path = os.path.abspath(path)
+    with _MOUNTED_ARCHIVES_LOCK:
+        if not _MOUNTED_ARCHIVES:
+            return (None, None)
+        dirname = path
+        while True:
+            extractor = _MOUNTED_ARCHIVES.get(dirname, None)
+            if extractor is not None:
+                return (extractor, dirname)
+            parent_dirname = os.path.dirname(dirname)
+            if parent_dirname == dirname:
+                return (None, None)
+            dirname = parent_dirname
+
+
+def materialize_path(path):
+    """ Make sure that a file exists, unpacking it from the archive mounted onto one of its parent directories
+    if it has not yet been unpacked
+
+    Args:
+        path (:obj:`str`): path to a file
+
+    Returns:
+        :obj:`bool`: whether the file exists
+    """
+    if os.path.isfile(path):
+        return True
+
+    extractor, dirname = get_mounted_archive(path)
+    if extractor is None:
+        return False
+
+    try:
+        extractor.get_filename(os.path.relpath(os.path.abspath(path), dirname))
+    except KeyError:
+        return False
+    return os.path.isfile(path)
+
+
+def materialize_model(path):
+    """ Make sure that a model file and the files which it may import exist, unpacking the model and the other
+    members of its directory (and its subdirectories) from the archive mounted onto one of its parent directories
+
+    Models can import other files (e.g., CellML imports, SBML comp external model definitions, XPP ``.set``
+    files, NeuroML includes) which are not referenced by SED-ML files. Because the imports of each language
+    are not resolved, the entire directory of the model is unpacked.
+
+    Args:
+        path (:obj:`str`): path to a model file
+
+    Returns:
+        :obj:`bool`: whether the model file exists
+    """
+    if not materialize_path(path):
+        return False
+
+    extractor, dirname = get_mounted_archive(path)
+    if extractor is None:
+        return True
+
+    model_dirname = os.path.relpath(os.path.dirname(os.path.abspath(path)), dirname).replace(os.sep, '/')
+    if model_dirname == '.':
+        locations = extractor.get_locations()
+    else:
+        locations = [location for location in extractor.get_locations() if location.startswith(model_dirname + '/')]
+    extractor.extract(locations)
+    return True
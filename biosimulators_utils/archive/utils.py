@@ -10,7 +10,7 @@ from .data_model import Archive, ArchiveFile
 import glob
 import os
 
-__all__ = ['build_archive_from_paths']
+__all__ = ['build_archive_from_paths', 'build_archive_from_filenames']
 
 
 def build_archive_from_paths(path_patterns, rel_path=None, recursive=True):
@@ -38,3 +38,27 @@ def build_archive_from_paths(path_patterns, rel_path=None, recursive=True):
                     archive_path=archive_path,
                 ))
     return archive
+
+
+def build_archive_from_filenames(filenames, rel_path=None):
+    """ Build an archive from a list of files
+
+    Args:
+        filenames (:obj:`list` of :obj:`str`): paths to the files to bundle into an archive
+        rel_path (:obj:`str`, optional): if provided, set the archive file names to their path relative to this path
+
+    Returns:
+        :obj:`Archive`: archive
+    """
+    archive = Archive()
+    for local_path in filenames:
+        if rel_path:
+            archive_path = os.path.relpath(local_path, rel_path)
+        else:
+            archive_path = local_path
+
+        archive.files.append(ArchiveFile(
+            local_path=local_path,
+            archive_path=archive_path,
+        ))
+    return archive
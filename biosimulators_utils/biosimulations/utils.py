@@ -5,13 +5,15 @@
 :Copyright: 2021, Center for Reproducible Biomedical Modeling
 :License: MIT
 """
-from ..config import get_config, Config  # noqa: F401
+from ..config import get_app_dirs, get_config, Config  # noqa: F401
+from ..utils.http_cache import HttpCache
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import json
 import os
 import requests
 import simplejson.errors
+import threading
 
 __all__ = [
     'run_simulation_project',
@@ -19,12 +21,16 @@ __all__ = [
     'get_published_project',
     'get_authorization_for_client',
     'get_api_session',
+    'get_api_cache',
     'validate_biosimulations_api_response',
     'get_formats',
     'get_file_extension_combine_uri_map',
     'get_ontology_terms',
 ]
 
+_api_caches = {}
+_api_caches_lock = threading.Lock()
+
 
 def run_simulation_project(name, filename_or_url,
                            simulator, simulator_version='latest',
@@ -192,12 +198,18 @@ def get_authorization_for_client(id, secret, config=None):
     return response_data['token_type'] + ' ' + response_data['access_token']
 
 
-def get_api_session(num_retries=10, backoff_factor=0.25, config=None):
-    """ Get a session for the BioSimulations API with retrying
+def get_api_session(num_retries=10, backoff_factor=0.25, num_connection_retries=2, config=None):
+    """ Get a session for the BioSimulations and BioSimulators APIs with retrying
+
+    Responses with error statuses (e.g., 503) are retried up to :obj:`num_retries` times, after which the last response is
+    returned. Errors in connecting to the APIs (e.g., without network access) are only retried up to
+    :obj:`num_connection_retries` times so that they are reported quickly.
 
     Args:
         num_retries (:obj:`int`): number of times to retry each query
         backoff_factor (:obj:`float`): initial delay between retries
+        num_connection_retries (:obj:`int`): number of times to retry each query after errors in connecting to the APIs or
+            reading their responses
         config (:obj:`Config`, optional): configuration
 
     returns:
@@ -207,16 +219,52 @@ def get_api_session(num_retries=10, backoff_factor=0.25, config=None):
 
     retry_strategy = Retry(
         total=num_retries,
+        connect=num_connection_retries,
+        read=num_connection_retries,
+        status=num_retries,
         backoff_factor=backoff_factor,
         allowed_methods=['GET', 'PUT', 'POST'],
         status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
     )
     adapter = HTTPAdapter(max_retries=retry_strategy)
     session = requests.Session()
     session.mount(config.BIOSIMULATIONS_API_ENDPOINT, adapter)
+    session.mount(config.BIOSIMULATORS_API_ENDPOINT, adapter)
     return session
 
 
+def get_api_cache(config=None):
+    """ Get a cache of responses of the BioSimulations and BioSimulators APIs. Caches are shared within each process, and
+    responses are reused for :obj:`Config.API_CACHE_TTL` seconds before they are revalidated with the APIs. If
+    :obj:`Config.CACHE_API_RESPONSES` is enabled, responses are also stored persistently and reused across processes. If
+    :obj:`Config.API_OFFLINE` is enabled, only cached responses are used.
+
+    Args:
+        config (:obj:`Config`, optional): configuration
+
+    Returns:
+        :obj:`HttpCache`: cache
+    """
+    config = config or get_config()
+
+    if config.CACHE_API_RESPONSES or config.API_OFFLINE:
+        dirname = config.API_CACHE_DIR or os.path.join(get_app_dirs().user_cache_dir, 'api')
+    else:
+        dirname = None
+
+    key = (config.BIOSIMULATIONS_API_ENDPOINT, config.BIOSIMULATORS_API_ENDPOINT, dirname, config.API_CACHE_TTL, config.API_OFFLINE)
+    with _api_caches_lock:
+        cache = _api_caches.get(key, None)
+        if cache is None:
+            cache = _api_caches[key] = HttpCache(dirname=dirname,
+                                                 ttl=config.API_CACHE_TTL,
+                                                 memo_ttl=config.API_CACHE_TTL,
+                                                 offline=config.API_OFFLINE,
+                                                 session=get_api_session(config=config))
+    return cache
+
+
 def validate_biosimulations_api_response(response, failure_introductory_message, exception_type=None):
     """ Validate a response from one of BioSimulation's APIs.
 
@@ -304,6 +352,4 @@ def get_ontology_terms(ontology, config=None):
         :obj:`list` of :obj:`dict`: ontology terms
     """
     config = config or get_config()
-    response = requests.get(config.BIOSIMULATIONS_API_ENDPOINT + 'ontologies/' + ontology)
-    response.raise_for_status()
-    return response.json()
+    return get_api_cache(config=config).get_json(config.BIOSIMULATIONS_API_ENDPOINT + 'ontologies/' + ontology)
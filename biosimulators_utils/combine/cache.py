@@ -0,0 +1,476 @@
+""" Persistent cache of unpacked COMBINE/OMEX archives and the results of their validation
+
+:Date: 2026-10-18
+:Copyright: 2026, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from .._version import __version__
+from ..config import get_app_dirs, get_config, Config  # noqa: F401
+from ..warnings import warn, BioSimulatorsWarning
+from ..utils.cache import (get_versioned_cache_dirname, read_cache_file, write_cache_file, touch_cache_entry,
+                           lock_cache_entry, get_cache_entries, remove_cache_entry, evict_cache_entries,
+                           clear_cache_entries)
+from ..utils.core import flatten_nested_list_of_strings
+from .data_model import CombineArchive  # noqa: F401
+from .io import CombineArchiveReader
+from .validation import validate
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+__all__ = [
+    'CombineArchiveCache',
+    'get_archive_digest',
+]
+
+# version of the format of the entries of the cache
+CACHE_VERSION = 2
+
+# ``ioctl`` request which clones a file on Linux
+FICLONE = 0x40049409
+
+# attributes of the configuration which affect how archives are read and validated
+VALIDATION_CONFIG_ATTRIBUTES = (
+    'VALIDATE_OMEX_MANIFESTS',
+    'VALIDATE_SEDML',
+    'VALIDATE_SEDML_MODELS',
+    'VALIDATE_IMPORTED_MODEL_FILES',
+    'VALIDATE_OMEX_METADATA',
+    'VALIDATE_IMAGES',
+    'OMEX_METADATA_INPUT_FORMAT',
+    'OMEX_METADATA_SCHEMA',
+)
+
+
+class CombineArchiveCache(object):
+    """ Persistent cache of unpacked COMBINE/OMEX archives and the results of their validation, keyed by the
+    SHA-256 digests of the archives
+
+    Each entry of the cache is a directory which contains the unpacked archive (``archive/``), the description
+    of the archive, and the results of its validation with each configuration. Unpacked archives must not be
+    modified. Archives are executed from private copies of their unpacked files (see :obj:`read`) so that
+    simulators can modify and write next to the files of archives without changing the cache. Where the file system
+    supports it (e.g., Btrfs, XFS), the private copies are copy-on-write clones, which are created without copying
+    the content of the files. Otherwise, each read copies all of the files of the archive, which takes time
+    proportional to the size of the unpacked archive.
+
+    When the total size of the cache exceeds :obj:`max_size`, the least recently used entries are evicted. While an
+    entry is used, it holds a shared lock (``flock``) so that other processes do not evict it.
+
+    Attributes:
+        dirname (:obj:`str`): directory for the cache
+        max_size (:obj:`int`): maximum size of the cache in bytes
+    """
+
+    def __init__(self, dirname=None, max_size=None, config=None):
+        """
+        Args:
+            dirname (:obj:`str`, optional): directory for the cache. Default: :obj:`Config.COMBINE_ARCHIVE_CACHE_DIR`.
+            max_size (:obj:`int`, optional): maximum size of the cache in bytes. Default:
+                :obj:`Config.COMBINE_ARCHIVE_CACHE_MAX_SIZE`.
+            config (:obj:`Config`, optional): configuration
+        """
+        if config is None:
+            config = get_config()
+
+        if dirname is None:
+            dirname = config.COMBINE_ARCHIVE_CACHE_DIR or os.path.join(get_app_dirs().user_cache_dir, 'combine_archives')
+        if max_size is None:
+            max_size = config.COMBINE_ARCHIVE_CACHE_MAX_SIZE
+
+        self.dirname = dirname
+        self.max_size = max_size
+        self._digests = {}
+
+    def get_digest(self, archive_filename):
+        """ Get the SHA-256 digest of an archive, memoized by the size and modification time of the file
+
+        Args:
+            archive_filename (:obj:`str`): path to archive
+
+        Returns:
+            :obj:`str`: hexadecimal SHA-256 digest
+        """
+        file_stat = os.stat(archive_filename)
+        key = (os.path.abspath(archive_filename), file_stat.st_size, file_stat.st_mtime_ns)
+        digest = self._digests.get(key, None)
+        if digest is None:
+            digest = self._digests[key] = get_archive_digest(archive_filename)
+        return digest
+
+    def get_entry_dirname(self, digest):
+        """ Get the directory for the entry of an archive
+
+        Args:
+            digest (:obj:`str`): SHA-256 digest of the archive
+
+        Returns:
+            :obj:`str`: directory for the entry
+        """
+        return os.path.join(get_versioned_cache_dirname(self.dirname, CACHE_VERSION), digest)
+
+    def read(self, archive_filename, out_dir=None, config=None):
+        """ Read an archive, unpacking it into the cache if it has not been unpacked before
+
+        Args:
+            archive_filename (:obj:`str`): path to archive
+            out_dir (:obj:`str`, optional): directory in which to create a private, writable copy of the unpacked archive
+            config (:obj:`Config`, optional): configuration
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`CombineArchive`: description of archive
+                * :obj:`str`: directory with the content of the archive in the cache, which must not be modified
+
+        Raises:
+            :obj:`ValueError`: archive is invalid
+        """
+        if config is None:
+            config = get_config()
+
+        if not os.path.isfile(archive_filename):
+            raise ValueError("`{}` is not a file.".format(archive_filename))
+
+        entry_dirname = self.get_entry_dirname(self.get_digest(archive_filename))
+        with self._lock_entry(entry_dirname):
+            return self._read(archive_filename, entry_dirname, out_dir=out_dir, config=config)
+
+    def _read(self, archive_filename, entry_dirname, out_dir=None, config=None):
+        """ Read an archive, unpacking it into the cache if it has not been unpacked before. The caller must hold a
+        lock on the entry of the archive.
+
+        Args:
+            archive_filename (:obj:`str`): path to archive
+            entry_dirname (:obj:`str`): directory for the entry of the archive
+            out_dir (:obj:`str`, optional): directory in which to create a private, writable copy of the unpacked archive
+            config (:obj:`Config`, optional): configuration
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`CombineArchive`: description of archive
+                * :obj:`str`: directory with the content of the archive in the cache, which must not be modified
+        """
+        archive_dirname = os.path.join(entry_dirname, 'archive')
+        archive_description_filename = os.path.join(
+            entry_dirname, 'archive-{}.pickle'.format(int(config.VALIDATE_OMEX_MANIFESTS)))
+
+        if os.path.isdir(archive_dirname):
+            archive_warnings = self._read_pickle(archive_description_filename)
+        else:
+            archive_warnings = (self._add_entry(archive_filename, entry_dirname, config=config), None)
+
+        if archive_warnings is None:
+            reader = CombineArchiveReader()
+            temp_dirname = tempfile.mkdtemp()
+            try:
+                archive = reader.run(archive_filename, temp_dirname, config=config)
+            finally:
+                shutil.rmtree(temp_dirname)
+            self._write_pickle(archive_description_filename, (archive, reader.warnings))
+
+        else:
+            # warnings are only re-raised when the archive is read from the cache; the reader raised them otherwise
+            archive, warnings = archive_warnings
+            if warnings:
+                warn('COMBINE/OMEX archive has warnings.\n  ' + flatten_nested_list_of_strings(warnings).replace('\n', '\n  '),
+                     BioSimulatorsWarning)
+
+        touch_cache_entry(entry_dirname)
+
+        if out_dir is not None:
+            copy_tree(archive_dirname, out_dir)
+
+        return (archive, archive_dirname)
+
+    def validate(self, archive_filename, archive=None, archive_dirname=None, config=None):
+        """ Validate an archive, reusing the results of previous validations of the archive with the same configuration
+
+        Args:
+            archive_filename (:obj:`str`): path to archive
+            archive (:obj:`CombineArchive`, optional): description of the archive, if it has already been read
+                with :obj:`read`
+            archive_dirname (:obj:`str`, optional): private copy of the unpacked archive to validate (see :obj:`read`).
+                Default: validate the unpacked archive in the cache.
+            config (:obj:`Config`, optional): configuration
+
+        Returns:
+            :obj:`tuple`:
+
+                * nested :obj:`list` of :obj:`str`: nested list of errors with the archive
+                * nested :obj:`list` of :obj:`str`: nested list of warnings with the archive
+
+        Raises:
+            :obj:`ValueError`: archive could not be read
+        """
+        if config is None:
+            config = get_config()
+
+        entry_dirname = self.get_entry_dirname(self.get_digest(archive_filename))
+        validation_filename = os.path.join(entry_dirname, 'validation-{}.pickle'.format(get_validation_config_digest(config)))
+
+        errors_warnings = self._read_pickle(validation_filename)
+        if errors_warnings is None:
+            if archive is not None and archive_dirname is not None:
+                errors_warnings = validate(archive, archive_dirname, config=config)
+            else:
+                with self._lock_entry(entry_dirname):
+                    cached_archive, archive_dirname = self._read(archive_filename, entry_dirname, config=config)
+                    errors_warnings = validate(archive or cached_archive, archive_dirname, config=config)
+            self._write_pickle(validation_filename, errors_warnings)
+
+        return errors_warnings
+
+    def read_and_validate(self, archive_filename, out_dir, config=None):
+        """ Read and validate an archive, reusing the unpacked archive and the results of previous validations
+
+        Args:
+            archive_filename (:obj:`str`): path to archive
+            out_dir (:obj:`str`): directory in which to create a private, writable copy of the unpacked archive
+            config (:obj:`Config`, optional): configuration
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`CombineArchive`: description of archive
+                * nested :obj:`list` of :obj:`str`: nested list of errors with the archive
+                * nested :obj:`list` of :obj:`str`: nested list of warnings with the archive
+
+        Raises:
+            :obj:`ValueError`: archive could not be read
+        """
+        archive, _ = self.read(archive_filename, out_dir=out_dir, config=config)
+        errors, warnings = self.validate(archive_filename, archive=archive, archive_dirname=out_dir, config=config)
+        return (archive, errors, warnings)
+
+    def get_size(self):
+        """ Get the total size of the entries of the cache
+
+        Returns:
+            :obj:`int`: size in bytes
+        """
+        return sum(size for _, _, size in self._get_entries())
+
+    def evict(self, keep=None):
+        """ Evict the least recently used entries until the size of the cache is within :obj:`max_size`. Entries
+        which are in use are not evicted.
+
+        Args:
+            keep (:obj:`str`, optional): directory of an entry which should not be evicted
+        """
+        evict_cache_entries(get_versioned_cache_dirname(self.dirname, CACHE_VERSION), self.max_size, keep=keep,
+                            get_size=get_entry_size, use_lock=True)
+
+    def clear(self):
+        """ Remove all entries which are not in use from the cache """
+        clear_cache_entries(get_versioned_cache_dirname(self.dirname, CACHE_VERSION), use_lock=True)
+
+    def _remove_entry(self, entry_dirname):
+        """ Remove an entry from the cache, unless it is in use
+
+        Args:
+            entry_dirname (:obj:`str`): directory for the entry
+
+        Returns:
+            :obj:`bool`: whether the entry was removed
+        """
+        return remove_cache_entry(entry_dirname, use_lock=True)
+
+    def _lock_entry(self, entry_dirname, shared=True, blocking=True):
+        """ Lock an entry of the cache (see :obj:`lock_cache_entry`)
+
+        Args:
+            entry_dirname (:obj:`str`): directory for the entry
+            shared (:obj:`bool`, optional): whether to acquire a shared or an exclusive lock
+            blocking (:obj:`bool`, optional): whether to wait for the lock
+
+        Returns:
+            :obj:`contextlib.AbstractContextManager`: context manager which yields whether the lock was acquired
+        """
+        return lock_cache_entry(entry_dirname, shared=shared, blocking=blocking)
+
+    def _add_entry(self, archive_filename, entry_dirname, config=None):
+        """ Unpack an archive into the cache
+
+        Args:
+            archive_filename (:obj:`str`): path to archive
+            entry_dirname (:obj:`str`): directory for the entry of the archive
+            config (:obj:`Config`, optional): configuration
+
+        Returns:
+            :obj:`CombineArchive`: description of archive
+        """
+        os.makedirs(os.path.dirname(entry_dirname), exist_ok=True)
+
+        # unpack the archive into a temporary directory and then move it into place so that concurrent
+        # readers never observe partially unpacked archives
+        temp_entry_dirname = tempfile.mkdtemp(dir=os.path.dirname(entry_dirname), prefix='.tmp-')
+        try:
+            temp_archive_dirname = os.path.join(temp_entry_dirname, 'archive')
+            reader = CombineArchiveReader()
+            archive = reader.run(archive_filename, temp_archive_dirname, config=config)
+
+            self._write_pickle(
+                os.path.join(temp_entry_dirname, 'archive-{}.pickle'.format(int(config.VALIDATE_OMEX_MANIFESTS))),
+                (archive, reader.warnings))
+
+            size = 0
+            for dirname, _, filenames in os.walk(temp_archive_dirname):
+                for filename in filenames:
+                    size += os.path.getsize(os.path.join(dirname, filename))
+            write_cache_file(os.path.join(temp_entry_dirname, 'size'), str(size))
+
+            try:
+                os.rename(temp_entry_dirname, entry_dirname)
+            except OSError:
+                # another process already added the archive
+                if not os.path.isdir(entry_dirname):
+                    raise
+                remove_tree(temp_entry_dirname)
+        except Exception:
+            if os.path.isdir(temp_entry_dirname):
+                remove_tree(temp_entry_dirname)
+            raise
+
+        self.evict(keep=entry_dirname)
+
+        return archive
+
+    def _get_entries(self):
+        """ Get the entries of the cache
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: time of the last use, directory, and size of each entry
+        """
+        return get_cache_entries(get_versioned_cache_dirname(self.dirname, CACHE_VERSION), get_size=get_entry_size)
+
+    @staticmethod
+    def _read_pickle(filename):
+        """ Read a pickled object from the cache
+
+        Args:
+            filename (:obj:`str`): path to the pickled object
+
+        Returns:
+            :obj:`object`: object, or :obj:`None` if the object is not cached or could not be read
+        """
+        return read_cache_file(filename, pickle.load)
+
+    @staticmethod
+    def _write_pickle(filename, obj):
+        """ Save a pickled object to the cache
+
+        Args:
+            filename (:obj:`str`): path to save the object
+            obj (:obj:`object`): object
+        """
+        write_cache_file(filename, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def get_entry_size(entry_dirname):
+    """ Get the size of the unpacked archive of an entry of the cache
+
+    Args:
+        entry_dirname (:obj:`str`): directory for the entry
+
+    Returns:
+        :obj:`int`: size in bytes
+
+    Raises:
+        :obj:`OSError`: if the size of the entry is not recorded
+        :obj:`ValueError`: if the size of the entry is invalid
+    """
+    with open(os.path.join(entry_dirname, 'size'), 'r') as file:
+        return int(file.read())
+
+
+def get_archive_digest(filename, chunk_size=2 ** 20):
+    """ Get the SHA-256 digest of a file
+
+    Args:
+        filename (:obj:`str`): path to the file
+        chunk_size (:obj:`int`, optional): number of bytes to read at a time
+
+    Returns:
+        :obj:`str`: hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_validation_config_digest(config):
+    """ Get a digest of the attributes of a configuration which affect the validation of archives
+
+    Args:
+        config (:obj:`Config`): configuration
+
+    Returns:
+        :obj:`str`: hexadecimal digest
+    """
+    key = [__version__] + [str(getattr(config, attr)) for attr in VALIDATION_CONFIG_ATTRIBUTES]
+    return hashlib.sha256('\n'.join(key).encode()).hexdigest()[:16]
+
+
+def copy_tree(src_dirname, dest_dirname):
+    """ Copy the files and subdirectories of a directory into another directory. Files are copied as copy-on-write
+    clones where the file system supports it (see :obj:`clone_file`).
+
+    Args:
+        src_dirname (:obj:`str`): original directory
+        dest_dirname (:obj:`str`): directory for the copy
+    """
+    # only try to clone files until the file system rejects a clone
+    cloneable = [True]
+
+    def copy_file(src_filename, dest_filename):
+        if not (cloneable[0] and clone_file(src_filename, dest_filename)):
+            cloneable[0] = False
+            shutil.copyfile(src_filename, dest_filename)
+        return dest_filename
+
+    shutil.copytree(src_dirname, dest_dirname, copy_function=copy_file, dirs_exist_ok=True)
+
+
+def clone_file(src_filename, dest_filename):
+    """ Copy a file as a copy-on-write clone, which shares the content of the original file until either file is
+    modified
+
+    Args:
+        src_filename (:obj:`str`): path to the file
+        dest_filename (:obj:`str`): path for the clone
+
+    Returns:
+        :obj:`bool`: whether the file was cloned, or :obj:`False` if the file system doesn't support clones
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+
+    try:
+        with open(src_filename, 'rb') as src_file:
+            with open(dest_filename, 'wb') as dest_file:
+                fcntl.ioctl(dest_file.fileno(), FICLONE, src_file.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def remove_tree(dirname):
+    """ Remove a directory, ignoring errors
+
+    Args:
+        dirname (:obj:`str`): directory
+    """
+    shutil.rmtree(dirname, ignore_errors=True)
@@ -7,17 +7,20 @@
 """
 
 
-from ..archive.io import ArchiveWriter
-from ..archive.utils import build_archive_from_paths
+from ..archive.io import ArchiveWriter, mount_archive, unmount_archive
+from ..archive.utils import build_archive_from_filenames
 from ..config import get_config, Config  # noqa: F401
 from ..log.data_model import Status, CombineArchiveLog, StandardOutputErrorCapturerLevel  # noqa: F401
 from ..log.utils import init_combine_archive_log, get_summary_combine_archive_log, StandardOutputErrorCapturer
 from ..report.data_model import VariableResults, ReportFormat, SedDocumentResults  # noqa: F401
 from ..sedml.data_model import (SedDocument, Task, Output, Report, DataSet, Plot2D, Curve,  # noqa: F401
                                 Plot3D, Surface, Variable)
+from ..sedml.utils import get_remote_model_cache
 from ..utils.core import flatten_nested_list_of_strings
+from ..utils.output_manifest import OutputManifest
 from ..warnings import warn, BioSimulatorsWarning
 from .exceptions import CombineArchiveExecutionError, NoSedmlError
+from .cache import CombineArchiveCache
 from .data_model import CombineArchive
 from .io import CombineArchiveReader
 from .utils import get_sedml_contents, get_summary_sedml_contents
@@ -25,7 +28,7 @@ from .validation import validate
 from ..viz.data_model import VizFormat  # noqa: F401
 import copy
 import datetime
-import glob
+import inspect
 import os
 import tempfile
 import shutil
@@ -71,6 +74,9 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
                         config (:obj:`Config`, optional): BioSimulators common configuration
                     '''
 
+            Executers can also accept a ``remote_model_cache`` argument (:obj:`HttpCache`), through which the
+            SED documents of the archive share the models which they download from URLs and BioModels.
+
         archive_filename (:obj:`str`): path to COMBINE/OMEX archive
         out_dir (:obj:`str`): path to store the outputs of the archive
 
@@ -97,7 +103,8 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
     if not config:
         config = get_config()
 
-    with StandardOutputErrorCapturer(relay=True, level=log_level, disabled=not config.LOG) as archive_captured:
+    with StandardOutputErrorCapturer(relay=True, level=log_level, disabled=not config.LOG,
+                                     max_size=config.LOG_MAX_OUTPUT_SIZE) as archive_captured:
         verbose = config.VERBOSE
 
         # initialize status and output
@@ -120,11 +127,22 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
         archive_tmp_dir = tempfile.mkdtemp()
 
         try:
-            # unpack archive and read metadata
-            archive = CombineArchiveReader().run(archive_filename, archive_tmp_dir, config=config)
+            if config.CACHE_COMBINE_ARCHIVES:
+                # reuse the unpacked archive and the results of its validation from previous executions
+                archive, errors, warnings = CombineArchiveCache(config=config).read_and_validate(
+                    archive_filename, archive_tmp_dir, config=config)
+
+            else:
+                # unpack archive and read metadata
+                archive_reader = CombineArchiveReader()
+                archive = archive_reader.run(archive_filename, archive_tmp_dir, config=config,
+                                             lazy=config.EXTRACT_COMBINE_ARCHIVES_LAZILY)
+                if archive_reader.extractor:
+                    mount_archive(archive_tmp_dir, archive_reader.extractor)
+
+                # validate archive
+                errors, warnings = validate(archive, archive_tmp_dir, config=config)
 
-            # validate archive
-            errors, warnings = validate(archive, archive_tmp_dir, config=config)
             if warnings:
                 msg = 'The COMBINE/OMEX archive has warnings.\n  {}'.format(
                     flatten_nested_list_of_strings(warnings).replace('\n', '\n  '))
@@ -145,6 +163,7 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
             print(get_summary_sedml_contents(archive, archive_tmp_dir, config=config))
 
         except Exception as exception:
+            unmount_archive(archive_tmp_dir)
             if config.DEBUG:
                 raise
             shutil.rmtree(archive_tmp_dir)
@@ -189,6 +208,16 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
             log = None
 
         # execute SED-ML files: execute tasks and save output
+        report_extensions = ['.' + format.value for format in config.REPORT_FORMATS if format != ReportFormat.h5]
+        viz_extensions = ['.' + format.value for format in config.VIZ_FORMATS]
+        output_extensions = report_extensions + viz_extensions
+        output_manifest = OutputManifest(out_dir)
+
+        # models referenced by URLs are downloaded at most once per archive, rather than once per SED document
+        sed_doc_executer_kwargs = {}
+        if does_function_accept_argument(sed_doc_executer, 'remote_model_cache'):
+            sed_doc_executer_kwargs['remote_model_cache'] = get_remote_model_cache(config)
+
         exceptions = []
         for i_content, content in enumerate(sedml_contents):
             content_filename = os.path.join(archive_tmp_dir, content.location)
@@ -203,7 +232,8 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
             else:
                 doc_log = None
 
-            with StandardOutputErrorCapturer(relay=verbose, level=log_level, disabled=not config.LOG) as doc_captured:
+            with StandardOutputErrorCapturer(relay=verbose, level=log_level, disabled=not config.LOG,
+                                             max_size=config.LOG_MAX_OUTPUT_SIZE) as doc_captured:
                 doc_start_time = datetime.datetime.now()
                 if config.COLLECT_COMBINE_ARCHIVE_RESULTS != config.COLLECT_SED_DOCUMENT_RESULTS:
                     config = copy.copy(config)
@@ -211,16 +241,18 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
 
                 try:
                     working_dir = os.path.dirname(content_filename)
-                    doc_results, _ = sed_doc_executer(
-                        content_filename,
-                        working_dir,
-                        out_dir,
-                        os.path.relpath(content_filename, archive_tmp_dir),
-                        apply_xml_model_changes=apply_xml_model_changes,
-                        log=doc_log,
-                        log_level=log_level,
-                        indent=1,
-                        config=config)
+                    with output_manifest:
+                        doc_results, _ = sed_doc_executer(
+                            content_filename,
+                            working_dir,
+                            out_dir,
+                            os.path.relpath(content_filename, archive_tmp_dir),
+                            apply_xml_model_changes=apply_xml_model_changes,
+                            log=doc_log,
+                            log_level=log_level,
+                            indent=1,
+                            config=config,
+                            **sed_doc_executer_kwargs)
                     if config.COLLECT_COMBINE_ARCHIVE_RESULTS:
                         results[content.location] = doc_results
                     if config.LOG:
@@ -252,47 +284,30 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
         if config.BUNDLE_OUTPUTS:
             print('Bundling outputs ...')
 
+            if not output_manifest.get_filenames(extensions=output_extensions):
+                warn(('No outputs were registered. Outputs which were saved without `register_output_file` '
+                      'were not bundled or cleaned up.'), BioSimulatorsWarning)
+
             # bundle CSV files of reports into zip archive
-            report_formats = config.REPORT_FORMATS
-            archive_paths = [os.path.join(out_dir, '**', '*.' + format.value) for format in report_formats if format != ReportFormat.h5]
-            archive = build_archive_from_paths(archive_paths, out_dir)
+            archive = build_archive_from_filenames(output_manifest.get_filenames(extensions=report_extensions), out_dir)
             if archive.files:
-                ArchiveWriter().run(archive, os.path.join(out_dir, config.REPORTS_PATH))
+                ArchiveWriter().run(archive, os.path.join(out_dir, config.REPORTS_PATH),
+                                    compression=config.BUNDLE_COMPRESSION,
+                                    compression_level=config.BUNDLE_COMPRESSION_LEVEL)
 
             # bundle PDF files of plots into zip archive
-            viz_formats = config.VIZ_FORMATS
-            archive_paths = [os.path.join(out_dir, '**', '*.' + format.value) for format in viz_formats]
-            archive = build_archive_from_paths(archive_paths, out_dir)
+            archive = build_archive_from_filenames(output_manifest.get_filenames(extensions=viz_extensions), out_dir)
             if archive.files:
-                ArchiveWriter().run(archive, os.path.join(out_dir, config.PLOTS_PATH))
+                ArchiveWriter().run(archive, os.path.join(out_dir, config.PLOTS_PATH),
+                                    compression=config.BUNDLE_COMPRESSION,
+                                    compression_level=config.BUNDLE_COMPRESSION_LEVEL)
 
         # cleanup temporary files
         print('Cleaning up ...')
         if not config.KEEP_INDIVIDUAL_OUTPUTS:
+            output_manifest.remove_files(output_manifest.get_filenames(extensions=output_extensions))
 
-            report_formats = config.REPORT_FORMATS
-            viz_formats = config.VIZ_FORMATS
-            path_patterns = (
-                [os.path.join(out_dir, '**', '*.' + format.value) for format in report_formats if format != ReportFormat.h5]
-                + [os.path.join(out_dir, '**', '*.' + format.value) for format in viz_formats]
-            )
-            for path_pattern in path_patterns:
-                for path in glob.glob(path_pattern, recursive=True):
-                    os.remove(path)
-
-            for dir_path, dir_names, file_names in os.walk(out_dir, topdown=False):
-                for dir_name in list(dir_names):
-                    full_dir_name = os.path.join(dir_path, dir_name)
-                    if not os.path.isdir(full_dir_name):
-                        dir_names.remove(dir_name)
-                    elif not os.listdir(full_dir_name):
-                        # not reachable because directory would
-                        # have already been removed by the iteration for the directory
-                        shutil.rmtree(full_dir_name)  # pragma: no cover
-                        dir_names.remove(dir_name)  # pragma: no cover
-                if not dir_names and not file_names:
-                    shutil.rmtree(dir_path)
-
+        unmount_archive(archive_tmp_dir)
         shutil.rmtree(archive_tmp_dir)
 
         # update status
@@ -327,6 +342,23 @@ def exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, appl
     # flush log
     if config.LOG:
         log.export()
+        log.flush()
 
     # return results and log
     return (results, log)
+
+
+def does_function_accept_argument(func, name):
+    """ Determine whether a function has a parameter with a name
+
+    Args:
+        func (:obj:`types.FunctionType`): function
+        name (:obj:`str`): name of the parameter
+
+    Returns:
+        :obj:`bool`: whether the function has the parameter
+    """
+    try:
+        return name in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
@@ -14,14 +14,18 @@ from ..utils.core import flatten_nested_list_of_strings
 from ..warnings import warn, BioSimulatorsWarning
 from zipfile import ZipFile as Zip
 import libcombine
+import libsedml
 import os
 import re
+import shutil
+import threading
 import zipfile
 
 __all__ = [
     'CombineArchiveWriter',
     'CombineArchiveReader',
     'CombineArchiveZipReader',
+    'CombineArchiveExtractor',
 ]
 
 
@@ -121,6 +125,8 @@ class CombineArchiveReader(object):
     Attributes:
         errors (nested :obj:`list` of :obj:`str`): errors
         warnings (nested :obj:`list` of :obj:`str`): warnings
+        extractor (:obj:`CombineArchiveExtractor`): extractor for the members of the archive which were not
+            unpacked by a lazy read
     """
 
     NONE_DATETIME = '2000-01-01T00:00:00Z'
@@ -128,8 +134,10 @@ class CombineArchiveReader(object):
     def __init__(self):
         self.errors = []
         self.warnings = []
+        self.extractor = None
 
-    def run(self, in_file: str, out_dir: str, include_omex_metadata_files: bool = True, config: Config = None) -> CombineArchive:
+    def run(self, in_file: str, out_dir: str, include_omex_metadata_files: bool = True, config: Config = None,
+            lazy: bool = False) -> CombineArchive:
         """ Read an archive from a file
 
         Args:
@@ -138,6 +146,11 @@ class CombineArchiveReader(object):
             include_omex_metadata_files (:obj:`bool`, optional): whether to include the OMEX metadata
                 file as part of the contents of the archive
             config (:obj:`Config`, optional): configuration
+            lazy (:obj:`bool`, optional): if :obj:`True`, read the manifest directly from the archive and only
+                unpack the manifest, the OMEX metadata files, the SED-ML files, and the models and data files
+                that the SED-ML files reference. The other members of the archive can be unpacked or streamed
+                on demand through :obj:`extractor` (e.g., the files which models import are unpacked when models
+                are resolved by :obj:`biosimulators_utils.archive.io.materialize_model`).
 
         Returns:
             :obj:`CombineArchive`: description of archive
@@ -150,16 +163,24 @@ class CombineArchiveReader(object):
 
         self.errors = []
         self.warnings = []
+        self.extractor = None
 
         if not os.path.isfile(in_file):
             msg = "`{}` is not a file.".format(in_file)
             self.errors.append([msg])
             raise ValueError(msg)
 
-        archive_comb = libcombine.CombineArchive()
-        archive_initialized = archive_comb.initializeFromArchive(in_file)
+        if lazy:
+            archive_comb = None
+            manifest_comb = self._read_manifest_from_archive(in_file)
+            archive_initialized = manifest_comb is not None
+        else:
+            archive_comb = libcombine.CombineArchive()
+            archive_initialized = archive_comb.initializeFromArchive(in_file)
+            manifest_comb = archive_comb.getManifest() if archive_initialized else None
+
         if archive_initialized:
-            errors, warnings = get_combine_errors_warnings(archive_comb.getManifest())
+            errors, warnings = get_combine_errors_warnings(manifest_comb)
             if config.VALIDATE_OMEX_MANIFESTS:
                 self.errors.extend(errors)
                 self.warnings.extend(warnings)
@@ -185,26 +206,32 @@ class CombineArchiveReader(object):
         archive = CombineArchive()
 
         # read files
-        for location in archive_comb.getAllLocations():
-            location = location.c_str()
-            file_comb = archive_comb.getEntryByLocation(location)
+        if lazy:
+            files_comb = self._get_manifest_entries(manifest_comb)
+        else:
+            files_comb = (archive_comb.getEntryByLocation(location.c_str()) for location in archive_comb.getAllLocations())
 
+        for file_comb in files_comb:
             if file_comb.isSetFormat():
                 format = file_comb.getFormat()
             else:
                 format = None
 
             content = CombineArchiveContent(
-                location=location,
+                location=file_comb.getLocation(),
                 format=format,
                 master=file_comb.isSetMaster() and file_comb.getMaster(),
             )
             archive.contents.append(content)
 
         # extract files
+        if lazy:
+            self.extractor = CombineArchiveExtractor(in_file, out_dir)
+            self.extractor.extract(['manifest.xml'])
 
-        with Zip(in_file, 'r') as zip_archive:
-            zip_archive.extractall(path=out_dir)
+        else:
+            with Zip(in_file, 'r') as zip_archive:
+                zip_archive.extractall(path=out_dir)
 
 #        archive_comb.extractTo(out_dir) # libcombine incorrectly extracts files as directories.
 
@@ -221,6 +248,9 @@ class CombineArchiveReader(object):
                 ):
                     archive.contents.append(manifest_content)
 
+        if lazy:
+            self.extractor.extract(self.extractor.get_required_locations(archive))
+
         if config.VALIDATE_OMEX_MANIFESTS:
             manifest_includes_archive = False
             for manifest_content in manifest_contents:
@@ -251,6 +281,54 @@ class CombineArchiveReader(object):
         # return information about archive
         return archive
 
+    @staticmethod
+    def _read_manifest_from_archive(in_file):
+        """ Read the OMEX manifest of an archive directly from its zip file
+
+        Args:
+            in_file (:obj:`str`): path to archive
+
+        Returns:
+            :obj:`libcombine.CaOmexManifest`: manifest, or :obj:`None` if the archive does not have a readable manifest
+        """
+        try:
+            with Zip(in_file, 'r') as zip_archive:
+                manifest = zip_archive.read('manifest.xml')
+        except (KeyError, zipfile.BadZipFile):
+            return None
+
+        manifest_comb = libcombine.readOMEXFromString(manifest.decode('utf-8', errors='replace'))
+        if not isinstance(manifest_comb, libcombine.CaOmexManifest):
+            return None
+        return manifest_comb
+
+    @staticmethod
+    def _get_manifest_entries(manifest_comb):
+        """ Get the entries of an OMEX manifest which libCOMBINE reports as the files of an archive
+
+        The archive itself and OMEX metadata files are skipped, consistent with
+        :obj:`libcombine.CombineArchive.getAllLocations`.
+
+        Args:
+            manifest_comb (:obj:`libcombine.CaOmexManifest`): manifest
+
+        Returns:
+            :obj:`list` of :obj:`libcombine.CaContent`: entries
+        """
+        entries = []
+        locations = set()
+        for content_comb in manifest_comb.getListOfContents():
+            location = content_comb.getLocation()
+            if (
+                os.path.relpath(location, '.') == '.'
+                or content_comb.getFormat() == CombineArchiveContentFormat.OMEX_METADATA.value
+                or location in locations
+            ):
+                continue
+            locations.add(location)
+            entries.append(content_comb)
+        return entries
+
     def read_manifest(self, filename, archive_filename=None, config=None):
         """ Read the contents of an OMEX manifest file
 
@@ -352,6 +430,202 @@ class CombineArchiveZipReader(object):
         return combine_archive
 
 
+class CombineArchiveExtractor(object):
+    """ Unpack the members of a COMBINE/OMEX archive on demand
+
+    Attributes:
+        in_file (:obj:`str`): path to archive
+        out_dir (:obj:`str`): directory where members of the archive are unpacked
+        extracted_locations (:obj:`set` of :obj:`str`): normalized locations of the members which have been unpacked
+    """
+
+    def __init__(self, in_file, out_dir):
+        """
+        Args:
+            in_file (:obj:`str`): path to archive
+            out_dir (:obj:`str`): directory where members of the archive should be unpacked
+        """
+        self.in_file = in_file
+        self.out_dir = out_dir
+        self.extracted_locations = set()
+        self._member_names = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_location(location):
+        """ Normalize the location of a member of an archive (e.g., ``./model.xml`` to ``model.xml``)
+
+        Args:
+            location (:obj:`str`): location
+
+        Returns:
+            :obj:`str`: normalized location
+        """
+        return os.path.relpath(os.path.normpath(location.replace('\\', '/')), '.')
+
+    def get_locations(self):
+        """ Get the normalized locations of the files in the archive
+
+        Returns:
+            :obj:`list` of :obj:`str`: locations
+        """
+        return list(self._get_member_names().keys())
+
+    def _get_member_names(self):
+        """ Get a dictionary which maps the normalized locations of the files in the archive to their names
+        within the zip file
+
+        Returns:
+            :obj:`dict`: dictionary that maps normalized locations to the names of members of the zip file
+        """
+        if self._member_names is None:
+            with Zip(self.in_file, 'r') as zip_archive:
+                self._member_names = {
+                    self.normalize_location(info.filename): info.filename
+                    for info in zip_archive.infolist()
+                    if not info.is_dir()
+                }
+        return self._member_names
+
+    def get_required_locations(self, archive):
+        """ Get the locations of the members of an archive which are needed to read and execute its SED-ML
+        files: the manifest, the OMEX metadata files, the SED-ML files, and the models and data files that
+        the SED-ML files reference by relative paths
+
+        Args:
+            archive (:obj:`CombineArchive`): description of the archive
+
+        Returns:
+            :obj:`list` of :obj:`str`: normalized locations
+        """
+        locations = ['manifest.xml']
+        sedml_locations = []
+        for content in archive.contents:
+            if not content.location or not content.format:
+                continue
+            if re.match(CombineArchiveContentFormatPattern.OMEX_METADATA.value, content.format):
+                locations.append(self.normalize_location(content.location))
+            elif re.match(CombineArchiveContentFormatPattern.SED_ML.value, content.format):
+                sedml_locations.append(self.normalize_location(content.location))
+        locations.extend(sedml_locations)
+
+        member_names = self._get_member_names()
+        with Zip(self.in_file, 'r') as zip_archive:
+            for sedml_location in sedml_locations:
+                member_name = member_names.get(sedml_location, None)
+                if member_name is None:
+                    continue
+
+                doc_sed = libsedml.readSedMLFromString(zip_archive.read(member_name).decode('utf-8', errors='replace'))
+                sources = (
+                    [model_sed.getSource() for model_sed in doc_sed.getListOfModels()]
+                    + [data_desc_sed.getSource() for data_desc_sed in doc_sed.getListOfDataDescriptions()]
+                )
+                for source in sources:
+                    if (
+                        source
+                        and not source.startswith('#')
+                        and not re.match(r'^[a-z][a-z0-9+\-.]*:', source, re.IGNORECASE)
+                    ):
+                        locations.append(self.normalize_location(os.path.join(os.path.dirname(sedml_location), source)))
+
+        return list(dict.fromkeys(locations))
+
+    def extract(self, locations=None):
+        """ Unpack members of the archive which have not yet been unpacked
+
+        Args:
+            locations (:obj:`list` of :obj:`str`, optional): locations of the members to unpack. Locations which
+                are not members of the archive are ignored. Default: all members of the archive.
+
+        Returns:
+            :obj:`list` of :obj:`str`: paths to the requested members which are members of the archive
+        """
+        member_names = self._get_member_names()
+        if locations is None:
+            locations = list(member_names.keys())
+        else:
+            locations = [self.normalize_location(location) for location in locations]
+            locations = [location for location in locations if location in member_names]
+
+        with self._lock:
+            locations_to_extract = [location for location in locations if location not in self.extracted_locations]
+            if locations_to_extract:
+                with Zip(self.in_file, 'r') as zip_archive:
+                    for location in locations_to_extract:
+                        zip_archive.extract(member_names[location], path=self.out_dir)
+                        self.extracted_locations.add(location)
+
+        return [os.path.join(self.out_dir, location) for location in locations]
+
+    def get_filename(self, location):
+        """ Get the path to a member of the archive, unpacking the member if it has not yet been unpacked
+
+        Args:
+            location (:obj:`str`): location of the member
+
+        Returns:
+            :obj:`str`: path to the member
+
+        Raises:
+            :obj:`KeyError`: if the archive does not contain the location
+        """
+        filenames = self.extract([location])
+        if not filenames:
+            raise KeyError('`{}` is not a member of `{}`.'.format(location, self.in_file))
+        return filenames[0]
+
+    def read(self, location, size=-1):
+        """ Read a member of the archive without unpacking it
+
+        Args:
+            location (:obj:`str`): location of the member
+            size (:obj:`int`, optional): maximum number of bytes to read. Default: read the entire member.
+
+        Returns:
+            :obj:`bytes`: content of the member
+
+        Raises:
+            :obj:`KeyError`: if the archive does not contain the location
+        """
+        member_name = self._get_member_name(location)
+        with Zip(self.in_file, 'r') as zip_archive:
+            with zip_archive.open(member_name, 'r') as member:
+                return member.read(size)
+
+    def copy(self, location, file):
+        """ Stream a member of the archive to a file-like object without unpacking it
+
+        Args:
+            location (:obj:`str`): location of the member
+            file (:obj:`io.IOBase`): binary file-like object to write the member to
+
+        Raises:
+            :obj:`KeyError`: if the archive does not contain the location
+        """
+        member_name = self._get_member_name(location)
+        with Zip(self.in_file, 'r') as zip_archive:
+            with zip_archive.open(member_name, 'r') as member:
+                shutil.copyfileobj(member, file)
+
+    def _get_member_name(self, location):
+        """ Get the name of the member of the zip file for a location
+
+        Args:
+            location (:obj:`str`): location
+
+        Returns:
+            :obj:`str`: name of the member of the zip file
+
+        Raises:
+            :obj:`KeyError`: if the archive does not contain the location
+        """
+        member_name = self._get_member_names().get(self.normalize_location(location), None)
+        if member_name is None:
+            raise KeyError('`{}` is not a member of `{}`.'.format(location, self.in_file))
+        return member_name
+
+
 def get_combine_errors_warnings(manifest):
     """ Get the errors and warnings of an OMEX manifest
 
@@ -6,6 +6,7 @@
 :License: MIT
 """
 
+from ..archive.io import get_mounted_archive
 from ..config import get_config, Config  # noqa: F401
 from ..omex_meta.io import read_omex_meta_files_for_archive
 from ..sedml.io import SedmlSimulationReader
@@ -19,6 +20,7 @@ __all__ = [
     'validate',
     'validate_format',
     'validate_content',
+    'get_image_format',
 ]
 
 
@@ -56,6 +58,13 @@ def validate(archive: CombineArchive, archive_dirname: str,
     errors = []
     warnings = []
 
+    # if the archive is being unpacked lazily, check the members of the archive rather than the files which have been unpacked
+    extractor, mounted_dirname = get_mounted_archive(archive_dirname)
+    if extractor is not None and mounted_dirname == os.path.abspath(archive_dirname):
+        archive_locations = set(extractor.get_locations())
+    else:
+        archive_locations = None
+
     if config.VALIDATE_OMEX_MANIFESTS:
         if not archive.contents:
             errors.append(['Archive must have at least one content element.'])
@@ -80,11 +89,16 @@ def validate(archive: CombineArchive, archive_dirname: str,
 
         # check that all files in the archive are in the manifest
         missing_locations = []
-        for dirname, _, filenames in os.walk(archive_dirname):
-            for filename in filenames:
-                location = os.path.relpath(os.path.join(dirname, filename), archive_dirname)
+        if archive_locations is not None:
+            for location in archive_locations:
                 if location not in locations:
                     missing_locations.append(location)
+        else:
+            for dirname, _, filenames in os.walk(archive_dirname):
+                for filename in filenames:
+                    location = os.path.relpath(os.path.join(dirname, filename), archive_dirname)
+                    if location not in locations:
+                        missing_locations.append(location)
         if missing_locations:
             errors.append(['The manifest does not contain content items for these locations:', [
                 [location] for location in sorted(missing_locations)]])
@@ -96,7 +110,10 @@ def validate(archive: CombineArchive, archive_dirname: str,
             if isinstance(content, CombineArchiveContent):
                 if content.location:
                     abs_path = os.path.join(archive_dirname, content.location)
-                    if not os.path.isfile(abs_path):
+                    if not (
+                        os.path.isfile(abs_path)
+                        or (archive_locations is not None and os.path.relpath(content.location, '.') in archive_locations)
+                    ):
                         content_errors.append(['Location is not a file.'])
 
                 else:
@@ -227,7 +244,7 @@ def validate_content(content, archive_dirname,
             and re.match(CombineArchiveContentFormatPattern.BMP.value, content.format)
         ):
             file_type = CombineArchiveContentFormat.BMP.name
-            if not (os.path.isfile(filename) and imghdr.what(filename) == 'bmp'):
+            if get_image_format(filename) != 'bmp':
                 errors.append(['`{}` is not a valid BMP image.'.format(content.location)])
 
         elif (
@@ -236,7 +253,7 @@ def validate_content(content, archive_dirname,
             and re.match(CombineArchiveContentFormatPattern.GIF.value, content.format)
         ):
             file_type = CombineArchiveContentFormat.GIF.name
-            if not (os.path.isfile(filename) and imghdr.what(filename) == 'gif'):
+            if get_image_format(filename) != 'gif':
                 errors.append(['`{}` is not a valid GIF image.'.format(content.location)])
 
         elif (
@@ -245,7 +262,7 @@ def validate_content(content, archive_dirname,
             and re.match(CombineArchiveContentFormatPattern.JPEG.value, content.format)
         ):
             file_type = CombineArchiveContentFormat.JPEG.name
-            if not (os.path.isfile(filename) and imghdr.what(filename) == 'jpeg'):
+            if get_image_format(filename) != 'jpeg':
                 errors.append(['`{}` is not a valid JPEG image.'.format(content.location)])
 
         elif (
@@ -254,7 +271,7 @@ def validate_content(content, archive_dirname,
             and re.match(CombineArchiveContentFormatPattern.PNG.value, content.format)
         ):
             file_type = CombineArchiveContentFormat.PNG.name
-            if not (os.path.isfile(filename) and imghdr.what(filename) == 'png'):
+            if get_image_format(filename) != 'png':
                 errors.append(['`{}` is not a valid PNG image.'.format(content.location)])
 
         elif (
@@ -263,7 +280,7 @@ def validate_content(content, archive_dirname,
             and re.match(CombineArchiveContentFormatPattern.TIFF.value, content.format)
         ):
             file_type = CombineArchiveContentFormat.TIFF.name
-            if not (os.path.isfile(filename) and imghdr.what(filename) == 'tiff'):
+            if get_image_format(filename) != 'tiff':
                 errors.append(['`{}` is not a valid TIFF image.'.format(content.location)])
 
         elif (
@@ -272,7 +289,7 @@ def validate_content(content, archive_dirname,
             and re.match(CombineArchiveContentFormatPattern.WEBP.value, content.format)
         ):
             file_type = CombineArchiveContentFormat.WEBP.name
-            if not (os.path.isfile(filename) and imghdr.what(filename) == 'webp'):
+            if get_image_format(filename) != 'webp':
                 errors.append(['`{}` is not a valid WEBP image.'.format(content.location)])
 
     if errors:
@@ -287,3 +304,28 @@ def validate_content(content, archive_dirname,
         ]]
 
     return (errors, warnings)
+
+
+def get_image_format(filename):
+    """ Get the format of an image. If the image is a member of a lazily-unpacked archive which has not yet
+    been unpacked, read the header of the image directly from the archive.
+
+    Args:
+        filename (:obj:`str`): path to the image
+
+    Returns:
+        :obj:`str`: format of the image (e.g., ``png``), or :obj:`None` if the file is not a file or
+        not an image
+    """
+    if os.path.isfile(filename):
+        return imghdr.what(filename)
+
+    extractor, dirname = get_mounted_archive(filename)
+    if extractor is None:
+        return None
+
+    try:
+        header = extractor.read(os.path.relpath(os.path.abspath(filename), dirname), 32)
+    except KeyError:
+        return None
+    return imghdr.what(None, h=header)
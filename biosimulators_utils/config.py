@@ -23,7 +23,15 @@ DEFAULT_ALGORITHM_SUBSTITUTION_POLICY = AlgorithmSubstitutionPolicy.SIMILAR_VARI
 DEFAULT_H5_REPORTS_PATH = 'reports.h5'
 DEFAULT_REPORTS_PATH = 'reports.zip'
 DEFAULT_PLOTS_PATH = 'plots.zip'
+DEFAULT_BUNDLE_COMPRESSION = 'lzma'
 DEFAULT_LOG_PATH = 'log.yml'
+DEFAULT_LOG_EXPORT_INTERVAL = 1.
+DEFAULT_COMBINE_ARCHIVE_CACHE_MAX_SIZE = 10 * 2 ** 30
+DEFAULT_SIMULATION_RESULTS_MEMO_MAX_SIZE = 2 ** 28
+DEFAULT_SIMULATION_RESULTS_CACHE_MAX_SIZE = 10 * 2 ** 30
+DEFAULT_SINGULARITY_IMAGE_CACHE_MAX_SIZE = 20 * 2 ** 30
+DEFAULT_REMOTE_MODEL_CACHE_TTL = 24 * 60 * 60.
+DEFAULT_API_CACHE_TTL = 60 * 60.
 DEFAULT_BIOSIMULATORS_API_ENDPOINT = 'https://api.biosimulators.org/'
 DEFAULT_BIOSIMULATIONS_API_ENDPOINT = 'https://api.biosimulations.org/'
 DEFAULT_BIOSIMULATIONS_API_AUTH_ENDPOINT = 'https://auth.biosimulations.org/oauth/token'
@@ -37,6 +45,37 @@ class Config(object):
         OMEX_METADATA_INPUT_FORMAT (:obj:`OmexMetadataInputFormat`): format to validate OMEX Metadata files against
         OMEX_METADATA_OUTPUT_FORMAT (:obj:`OmexMetadataOutputFormat`): format to export OMEX Metadata files
         OMEX_METADATA_SCHEMA (:obj:`OmexMetadataSchema`): schema to validate OMEX Metadata files against
+        EXTRACT_COMBINE_ARCHIVES_LAZILY (:obj:`bool`): whether to only unpack the files of COMBINE/OMEX archives which are needed
+            to execute them (SED-ML files, the models and data they reference, and the directories of the models), and unpack other
+            files on demand
+        CACHE_COMBINE_ARCHIVES (:obj:`bool`): whether to cache unpacked COMBINE/OMEX archives and the results of their validation
+            across executions
+        COMBINE_ARCHIVE_CACHE_DIR (:obj:`str`): directory for the cache of unpacked COMBINE/OMEX archives (default: a subdirectory
+            of the user's cache directory)
+        COMBINE_ARCHIVE_CACHE_MAX_SIZE (:obj:`int`): maximum size in bytes of the cache of unpacked COMBINE/OMEX archives
+        MEMOIZE_SIMULATION_RESULTS (:obj:`bool`): whether to reuse the results of deterministic simulations of tasks whose models,
+            model changes, simulations, algorithms, and variables are identical to those of previously executed tasks
+        SIMULATION_RESULTS_MEMO_MAX_SIZE (:obj:`int`): maximum size in bytes of the memoized results of simulations kept in memory
+        CACHE_SIMULATION_RESULTS (:obj:`bool`): whether to store the results of deterministic simulations persistently and reuse them
+            across executions
+        SIMULATION_RESULTS_CACHE_DIR (:obj:`str`): directory to store the results of simulations (default: a subdirectory of the user's
+            cache directory if ``CACHE_SIMULATION_RESULTS`` is enabled; otherwise, results are only kept in memory)
+        SIMULATION_RESULTS_CACHE_MAX_SIZE (:obj:`int`): maximum size in bytes of the stored results of simulations
+        SIMULATION_RESULTS_CACHE_NAMESPACE (:obj:`str`): namespace for the stored results of simulations, such as the id and version
+            of the simulator (set by command-line applications created with :obj:`biosimulators_utils.simulator.cli.build_cli`)
+        CACHE_REMOTE_MODELS (:obj:`bool`): whether to store models downloaded from URLs and BioModels persistently and reuse them
+            across executions
+        REMOTE_MODEL_CACHE_DIR (:obj:`str`): directory for the cache of downloaded models (default: a subdirectory of the user's
+            cache directory)
+        REMOTE_MODEL_CACHE_TTL (:obj:`float`): interval in seconds for which stored models are used without contacting their
+            servers; afterwards, models are revalidated with their servers (``ETag``/``Last-Modified``)
+        CACHE_API_RESPONSES (:obj:`bool`): whether to store responses of the BioSimulations and BioSimulators APIs (e.g., formats,
+            ontology terms, specifications of simulators) persistently and reuse them across processes
+        API_CACHE_DIR (:obj:`str`): directory for the cache of responses of the APIs (default: a subdirectory of the user's cache
+            directory)
+        API_CACHE_TTL (:obj:`float`): interval in seconds for which responses of the APIs are reused without contacting the APIs;
+            afterwards, responses are revalidated with the APIs (``ETag``/``Last-Modified``)
+        API_OFFLINE (:obj:`bool`): whether to only use cached responses of the APIs, regardless of their age
         VALIDATE_OMEX_MANIFESTS (:obj:`bool`): whether to validate OMEX manifests during the validation of COMBINE/OMEX archives
         VALIDATE_SEDML (:obj:`bool`): whether to validate SED-ML files during the validation of COMBINE/OMEX archives
         VALIDATE_SEDML_MODELS (:obj:`bool`): whether to validate models referenced by SED-ML files during the validation of COMBINE/OMEX archives
@@ -56,13 +95,31 @@ class Config(object):
         REPORTS_PATH (:obj:`str`): path to save zip archive of reports relative to base output directory
         PLOTS_PATH (:obj:`str`): path to save zip archive of plots relative to base output directory
         BUNDLE_OUTPUTS (:obj:`bool`): indicates whether bundles of report and plot outputs should be produced
+        BUNDLE_COMPRESSION (:obj:`str`): compression method for bundles of outputs (``stored``, ``deflate``, ``bzip2``, or ``lzma``).
+            Already compressed formats (e.g., PDF) are stored without further compression.
+        BUNDLE_COMPRESSION_LEVEL (:obj:`int`): compression level for bundles of outputs (default: default of the compression method)
         KEEP_INDIVIDUAL_OUTPUTS (:obj:`bool`): indicates whether the individual output files should be kept
         LOG (:obj:`bool`): whether to log the execution of a COMBINE/OMEX archive
         LOG_PATH (:obj:`str`): path to save the execution log of a COMBINE/OMEX archive
+        LOG_MAX_OUTPUT_SIZE (:obj:`int`): maximum number of bytes of the standard output/error of each element of a COMBINE/OMEX
+            archive to retain in its execution log (default: unlimited)
+        LOG_FORMAT (:obj:`str`): format to save the execution log of a COMBINE/OMEX archive (``yaml`` or ``json``; default:
+            inferred from the extension of ``LOG_PATH``)
+        LOG_EXPORT_INTERVAL (:obj:`float`): minimum interval in seconds between the rewrites of the execution log of a running
+            COMBINE/OMEX archive
         BIOSIMULATORS_API_ENDPOINT (:obj:`str`): URL for BioSimulators API
         BIOSIMULATIONS_API_ENDPOINT (:obj:`str`): URL for BioSimulations API
         BIOSIMULATIONS_API_AUTH_ENDPOINT (:obj:`str`): authorization endpoint for the BioSimulations API
         BIOSIMULATIONS_API_AUDIENCE (:obj:`str`): audience for the BioSimulations API
+        DOCKER_IMAGE_PULL_MAX_AGE (:obj:`float`): minimum interval in seconds between pulls of each Docker image; local images
+            which were pulled more recently are used without contacting their registries (default: always pull images)
+        DOCKER_IMAGE_DIGEST_CACHE_DIR (:obj:`str`): directory for the record of the digests of pulled Docker images (default: a
+            subdirectory of the user's cache directory)
+        CACHE_SINGULARITY_IMAGES (:obj:`bool`): whether to reuse the Singularity images converted from Docker images, keyed by the
+            ids of the Docker images
+        SINGULARITY_IMAGE_CACHE_DIR (:obj:`str`): directory for the cache of Singularity images (default: a subdirectory of the
+            user's cache directory)
+        SINGULARITY_IMAGE_CACHE_MAX_SIZE (:obj:`int`): maximum size in bytes of the cache of Singularity images
         VERBOSE (:obj:`bool`): whether to display the detailed output of the execution of each task
         DEBUG (:obj:`bool`): whether to raise exceptions rather than capturing them
     """
@@ -71,6 +128,23 @@ class Config(object):
                  OMEX_METADATA_INPUT_FORMAT=DEFAULT_OMEX_METADATA_INPUT_FORMAT,
                  OMEX_METADATA_OUTPUT_FORMAT=DEFAULT_OMEX_METADATA_OUTPUT_FORMAT,
                  OMEX_METADATA_SCHEMA=DEFAULT_OMEX_METADATA_SCHEMA,
+                 EXTRACT_COMBINE_ARCHIVES_LAZILY=False,
+                 CACHE_COMBINE_ARCHIVES=False,
+                 COMBINE_ARCHIVE_CACHE_DIR=None,
+                 COMBINE_ARCHIVE_CACHE_MAX_SIZE=DEFAULT_COMBINE_ARCHIVE_CACHE_MAX_SIZE,
+                 MEMOIZE_SIMULATION_RESULTS=False,
+                 SIMULATION_RESULTS_MEMO_MAX_SIZE=DEFAULT_SIMULATION_RESULTS_MEMO_MAX_SIZE,
+                 CACHE_SIMULATION_RESULTS=False,
+                 SIMULATION_RESULTS_CACHE_DIR=None,
+                 SIMULATION_RESULTS_CACHE_MAX_SIZE=DEFAULT_SIMULATION_RESULTS_CACHE_MAX_SIZE,
+                 SIMULATION_RESULTS_CACHE_NAMESPACE=None,
+                 CACHE_REMOTE_MODELS=False,
+                 REMOTE_MODEL_CACHE_DIR=None,
+                 REMOTE_MODEL_CACHE_TTL=DEFAULT_REMOTE_MODEL_CACHE_TTL,
+                 CACHE_API_RESPONSES=False,
+                 API_CACHE_DIR=None,
+                 API_CACHE_TTL=DEFAULT_API_CACHE_TTL,
+                 API_OFFLINE=False,
                  VALIDATE_OMEX_MANIFESTS=True,
                  VALIDATE_SEDML=True,
                  VALIDATE_SEDML_MODELS=True,
@@ -88,13 +162,23 @@ class Config(object):
                  REPORTS_PATH=DEFAULT_REPORTS_PATH,
                  PLOTS_PATH=DEFAULT_PLOTS_PATH,
                  BUNDLE_OUTPUTS=True,
+                 BUNDLE_COMPRESSION=DEFAULT_BUNDLE_COMPRESSION,
+                 BUNDLE_COMPRESSION_LEVEL=None,
                  KEEP_INDIVIDUAL_OUTPUTS=True,
                  LOG=True,
                  LOG_PATH=DEFAULT_LOG_PATH,
+                 LOG_MAX_OUTPUT_SIZE=None,
+                 LOG_FORMAT=None,
+                 LOG_EXPORT_INTERVAL=DEFAULT_LOG_EXPORT_INTERVAL,
                  BIOSIMULATORS_API_ENDPOINT=DEFAULT_BIOSIMULATORS_API_ENDPOINT,
                  BIOSIMULATIONS_API_ENDPOINT=DEFAULT_BIOSIMULATIONS_API_ENDPOINT,
                  BIOSIMULATIONS_API_AUTH_ENDPOINT=DEFAULT_BIOSIMULATIONS_API_AUTH_ENDPOINT,
                  BIOSIMULATIONS_API_AUDIENCE=DEFAULT_BIOSIMULATIONS_API_AUDIENCE,
+                 DOCKER_IMAGE_PULL_MAX_AGE=None,
+                 DOCKER_IMAGE_DIGEST_CACHE_DIR=None,
+                 CACHE_SINGULARITY_IMAGES=False,
+                 SINGULARITY_IMAGE_CACHE_DIR=None,
+                 SINGULARITY_IMAGE_CACHE_MAX_SIZE=DEFAULT_SINGULARITY_IMAGE_CACHE_MAX_SIZE,
                  VERBOSE=False,
                  DEBUG=False):
         """
@@ -102,6 +186,39 @@ class Config(object):
             OMEX_METADATA_INPUT_FORMAT (:obj:`OmexMetadataInputFormat`, optional): format to validate OMEX Metadata files against
             OMEX_METADATA_OUTPUT_FORMAT (:obj:`OmexMetadataOutputFormat`, optional): format to export OMEX Metadata files
             OMEX_METADATA_SCHEMA (:obj:`OmexMetadataSchema`, optional): schema to validate OMEX Metadata files against
+            EXTRACT_COMBINE_ARCHIVES_LAZILY (:obj:`bool`, optional): whether to only unpack the files of COMBINE/OMEX archives which
+                are needed to execute them (SED-ML files, the models and data they reference, and the directories of the models), and
+                unpack other files on demand
+            CACHE_COMBINE_ARCHIVES (:obj:`bool`, optional): whether to cache unpacked COMBINE/OMEX archives and the results of their
+                validation across executions
+            COMBINE_ARCHIVE_CACHE_DIR (:obj:`str`, optional): directory for the cache of unpacked COMBINE/OMEX archives (default: a
+                subdirectory of the user's cache directory)
+            COMBINE_ARCHIVE_CACHE_MAX_SIZE (:obj:`int`, optional): maximum size in bytes of the cache of unpacked COMBINE/OMEX archives
+            MEMOIZE_SIMULATION_RESULTS (:obj:`bool`, optional): whether to reuse the results of deterministic simulations of tasks whose
+                models, model changes, simulations, algorithms, and variables are identical to those of previously executed tasks
+            SIMULATION_RESULTS_MEMO_MAX_SIZE (:obj:`int`, optional): maximum size in bytes of the memoized results of simulations kept
+                in memory
+            CACHE_SIMULATION_RESULTS (:obj:`bool`, optional): whether to store the results of deterministic simulations persistently
+                and reuse them across executions
+            SIMULATION_RESULTS_CACHE_DIR (:obj:`str`, optional): directory to store the results of simulations (default: a
+                subdirectory of the user's cache directory if ``CACHE_SIMULATION_RESULTS`` is enabled; otherwise, results are only
+                kept in memory)
+            SIMULATION_RESULTS_CACHE_MAX_SIZE (:obj:`int`, optional): maximum size in bytes of the stored results of simulations
+            SIMULATION_RESULTS_CACHE_NAMESPACE (:obj:`str`, optional): namespace for the stored results of simulations, such as the
+                id and version of the simulator
+            CACHE_REMOTE_MODELS (:obj:`bool`, optional): whether to store models downloaded from URLs and BioModels persistently
+                and reuse them across executions
+            REMOTE_MODEL_CACHE_DIR (:obj:`str`, optional): directory for the cache of downloaded models (default: a subdirectory
+                of the user's cache directory)
+            REMOTE_MODEL_CACHE_TTL (:obj:`float`, optional): interval in seconds for which stored models are used without
+                contacting their servers; afterwards, models are revalidated with their servers (``ETag``/``Last-Modified``)
+            CACHE_API_RESPONSES (:obj:`bool`, optional): whether to store responses of the BioSimulations and BioSimulators APIs
+                persistently and reuse them across processes
+            API_CACHE_DIR (:obj:`str`, optional): directory for the cache of responses of the APIs (default: a subdirectory of
+                the user's cache directory)
+            API_CACHE_TTL (:obj:`float`, optional): interval in seconds for which responses of the APIs are reused without
+                contacting the APIs; afterwards, responses are revalidated with the APIs (``ETag``/``Last-Modified``)
+            API_OFFLINE (:obj:`bool`, optional): whether to only use cached responses of the APIs, regardless of their age
             VALIDATE_OMEX_MANIFESTS (:obj:`bool`, optional): whether to validate OMEX manifests during the execution of COMBINE/OMEX archives
             VALIDATE_SEDML (:obj:`bool`, optional): whether to validate SED-ML files during the execution of COMBINE/OMEX archives
             VALIDATE_SEDML_MODELS (:obj:`bool`, optional): whether to validate models referenced by SED-ML files during the execution
@@ -123,19 +240,56 @@ class Config(object):
             REPORTS_PATH (:obj:`str`, optional): path to save zip archive of reports relative to base output directory
             PLOTS_PATH (:obj:`str`, optional): path to save zip archive of plots relative to base output directory
             BUNDLE_OUTPUTS (:obj:`bool`, optional): indicates whether bundles of report and plot outputs should be produced
+            BUNDLE_COMPRESSION (:obj:`str`, optional): compression method for bundles of outputs (``stored``, ``deflate``, ``bzip2``,
+                or ``lzma``). Already compressed formats (e.g., PDF) are stored without further compression.
+            BUNDLE_COMPRESSION_LEVEL (:obj:`int`, optional): compression level for bundles of outputs (default: default of the
+                compression method)
             KEEP_INDIVIDUAL_OUTPUTS (:obj:`bool`, optional): indicates whether the individual output files should be kept
             LOG (:obj:`bool`, optional): whether to log the execution of a COMBINE/OMEX archive
             LOG_PATH (:obj:`str`, optional): path to save the execution status of a COMBINE/OMEX archive
+            LOG_MAX_OUTPUT_SIZE (:obj:`int`, optional): maximum number of bytes of the standard output/error of each element of a
+                COMBINE/OMEX archive to retain in its execution log (default: unlimited)
+            LOG_FORMAT (:obj:`str`, optional): format to save the execution log of a COMBINE/OMEX archive (``yaml`` or ``json``;
+                default: inferred from the extension of ``LOG_PATH``)
+            LOG_EXPORT_INTERVAL (:obj:`float`, optional): minimum interval in seconds between the rewrites of the execution log
+                of a running COMBINE/OMEX archive
             BIOSIMULATORS_API_ENDPOINT (:obj:`str`, optional): URL for BioSimulators API
             BIOSIMULATIONS_API_ENDPOINT (:obj:`str`, optional): URL for BioSimulations API
             BIOSIMULATIONS_API_AUTH_ENDPOINT (:obj:`str`, optional): authorization endpoint for the BioSimulations API
             BIOSIMULATIONS_API_AUDIENCE (:obj:`str`, optional): audience for the BioSimulations API
+            DOCKER_IMAGE_PULL_MAX_AGE (:obj:`float`, optional): minimum interval in seconds between pulls of each Docker image;
+                local images which were pulled more recently are used without contacting their registries (default: always pull
+                images)
+            DOCKER_IMAGE_DIGEST_CACHE_DIR (:obj:`str`, optional): directory for the record of the digests of pulled Docker images
+                (default: a subdirectory of the user's cache directory)
+            CACHE_SINGULARITY_IMAGES (:obj:`bool`, optional): whether to reuse the Singularity images converted from Docker images,
+                keyed by the ids of the Docker images
+            SINGULARITY_IMAGE_CACHE_DIR (:obj:`str`, optional): directory for the cache of Singularity images (default: a
+                subdirectory of the user's cache directory)
+            SINGULARITY_IMAGE_CACHE_MAX_SIZE (:obj:`int`, optional): maximum size in bytes of the cache of Singularity images
             VERBOSE (:obj:`bool`, optional): whether to display the detailed output of the execution of each task
             DEBUG (:obj:`bool`, optional): whether to raise exceptions rather than capturing them
         """
         self.OMEX_METADATA_INPUT_FORMAT = OMEX_METADATA_INPUT_FORMAT
         self.OMEX_METADATA_OUTPUT_FORMAT = OMEX_METADATA_OUTPUT_FORMAT
         self.OMEX_METADATA_SCHEMA = OMEX_METADATA_SCHEMA
+        self.EXTRACT_COMBINE_ARCHIVES_LAZILY = EXTRACT_COMBINE_ARCHIVES_LAZILY
+        self.CACHE_COMBINE_ARCHIVES = CACHE_COMBINE_ARCHIVES
+        self.COMBINE_ARCHIVE_CACHE_DIR = COMBINE_ARCHIVE_CACHE_DIR
+        self.COMBINE_ARCHIVE_CACHE_MAX_SIZE = COMBINE_ARCHIVE_CACHE_MAX_SIZE
+        self.MEMOIZE_SIMULATION_RESULTS = MEMOIZE_SIMULATION_RESULTS
+        self.SIMULATION_RESULTS_MEMO_MAX_SIZE = SIMULATION_RESULTS_MEMO_MAX_SIZE
+        self.CACHE_SIMULATION_RESULTS = CACHE_SIMULATION_RESULTS
+        self.SIMULATION_RESULTS_CACHE_DIR = SIMULATION_RESULTS_CACHE_DIR
+        self.SIMULATION_RESULTS_CACHE_MAX_SIZE = SIMULATION_RESULTS_CACHE_MAX_SIZE
+        self.SIMULATION_RESULTS_CACHE_NAMESPACE = SIMULATION_RESULTS_CACHE_NAMESPACE
+        self.CACHE_REMOTE_MODELS = CACHE_REMOTE_MODELS
+        self.REMOTE_MODEL_CACHE_DIR = REMOTE_MODEL_CACHE_DIR
+        self.REMOTE_MODEL_CACHE_TTL = REMOTE_MODEL_CACHE_TTL
+        self.CACHE_API_RESPONSES = CACHE_API_RESPONSES
+        self.API_CACHE_DIR = API_CACHE_DIR
+        self.API_CACHE_TTL = API_CACHE_TTL
+        self.API_OFFLINE = API_OFFLINE
         self.VALIDATE_OMEX_MANIFESTS = VALIDATE_OMEX_MANIFESTS
         self.VALIDATE_SEDML = VALIDATE_SEDML
         self.VALIDATE_SEDML_MODELS = VALIDATE_SEDML_MODELS
@@ -153,13 +307,23 @@ class Config(object):
         self.REPORTS_PATH = REPORTS_PATH
         self.PLOTS_PATH = PLOTS_PATH
         self.BUNDLE_OUTPUTS = BUNDLE_OUTPUTS
+        self.BUNDLE_COMPRESSION = BUNDLE_COMPRESSION
+        self.BUNDLE_COMPRESSION_LEVEL = BUNDLE_COMPRESSION_LEVEL
         self.KEEP_INDIVIDUAL_OUTPUTS = KEEP_INDIVIDUAL_OUTPUTS
         self.LOG = LOG
         self.LOG_PATH = LOG_PATH
+        self.LOG_MAX_OUTPUT_SIZE = LOG_MAX_OUTPUT_SIZE
+        self.LOG_FORMAT = LOG_FORMAT
+        self.LOG_EXPORT_INTERVAL = LOG_EXPORT_INTERVAL
         self.BIOSIMULATORS_API_ENDPOINT = BIOSIMULATORS_API_ENDPOINT
         self.BIOSIMULATIONS_API_ENDPOINT = BIOSIMULATIONS_API_ENDPOINT
         self.BIOSIMULATIONS_API_AUTH_ENDPOINT = BIOSIMULATIONS_API_AUTH_ENDPOINT
         self.BIOSIMULATIONS_API_AUDIENCE = BIOSIMULATIONS_API_AUDIENCE
+        self.DOCKER_IMAGE_PULL_MAX_AGE = DOCKER_IMAGE_PULL_MAX_AGE
+        self.DOCKER_IMAGE_DIGEST_CACHE_DIR = DOCKER_IMAGE_DIGEST_CACHE_DIR
+        self.CACHE_SINGULARITY_IMAGES = CACHE_SINGULARITY_IMAGES
+        self.SINGULARITY_IMAGE_CACHE_DIR = SINGULARITY_IMAGE_CACHE_DIR
+        self.SINGULARITY_IMAGE_CACHE_MAX_SIZE = SINGULARITY_IMAGE_CACHE_MAX_SIZE
         self.VERBOSE = VERBOSE
         self.DEBUG = DEBUG
 
@@ -189,6 +353,23 @@ def get_config():
             'OMEX_METADATA_OUTPUT_FORMAT', DEFAULT_OMEX_METADATA_OUTPUT_FORMAT)),
         OMEX_METADATA_SCHEMA=OmexMetadataSchema(os.environ.get(
             'OMEX_METADATA_SCHEMA', DEFAULT_OMEX_METADATA_SCHEMA)),
+        EXTRACT_COMBINE_ARCHIVES_LAZILY=os.environ.get('EXTRACT_COMBINE_ARCHIVES_LAZILY', '0').lower() in ['1', 'true'],
+        CACHE_COMBINE_ARCHIVES=os.environ.get('CACHE_COMBINE_ARCHIVES', '0').lower() in ['1', 'true'],
+        COMBINE_ARCHIVE_CACHE_DIR=os.environ.get('COMBINE_ARCHIVE_CACHE_DIR', None) or None,
+        COMBINE_ARCHIVE_CACHE_MAX_SIZE=int(os.environ.get('COMBINE_ARCHIVE_CACHE_MAX_SIZE', DEFAULT_COMBINE_ARCHIVE_CACHE_MAX_SIZE)),
+        MEMOIZE_SIMULATION_RESULTS=os.environ.get('MEMOIZE_SIMULATION_RESULTS', '0').lower() in ['1', 'true'],
+        SIMULATION_RESULTS_MEMO_MAX_SIZE=int(os.environ.get('SIMULATION_RESULTS_MEMO_MAX_SIZE', DEFAULT_SIMULATION_RESULTS_MEMO_MAX_SIZE)),
+        CACHE_SIMULATION_RESULTS=os.environ.get('CACHE_SIMULATION_RESULTS', '0').lower() in ['1', 'true'],
+        SIMULATION_RESULTS_CACHE_DIR=os.environ.get('SIMULATION_RESULTS_CACHE_DIR', None) or None,
+        SIMULATION_RESULTS_CACHE_MAX_SIZE=int(os.environ.get('SIMULATION_RESULTS_CACHE_MAX_SIZE', DEFAULT_SIMULATION_RESULTS_CACHE_MAX_SIZE)),
+        SIMULATION_RESULTS_CACHE_NAMESPACE=os.environ.get('SIMULATION_RESULTS_CACHE_NAMESPACE', None) or None,
+        CACHE_REMOTE_MODELS=os.environ.get('CACHE_REMOTE_MODELS', '0').lower() in ['1', 'true'],
+        REMOTE_MODEL_CACHE_DIR=os.environ.get('REMOTE_MODEL_CACHE_DIR', None) or None,
+        REMOTE_MODEL_CACHE_TTL=float(os.environ.get('REMOTE_MODEL_CACHE_TTL', DEFAULT_REMOTE_MODEL_CACHE_TTL)),
+        CACHE_API_RESPONSES=os.environ.get('CACHE_API_RESPONSES', '0').lower() in ['1', 'true'],
+        API_CACHE_DIR=os.environ.get('API_CACHE_DIR', None) or None,
+        API_CACHE_TTL=float(os.environ.get('API_CACHE_TTL', DEFAULT_API_CACHE_TTL)),
+        API_OFFLINE=os.environ.get('API_OFFLINE', '0').lower() in ['1', 'true'],
         VALIDATE_OMEX_MANIFESTS=os.environ.get('VALIDATE_OMEX_MANIFESTS', '1').lower() in ['1', 'true'],
         VALIDATE_SEDML=os.environ.get('VALIDATE_SEDML', '1').lower() in ['1', 'true'],
         VALIDATE_SEDML_MODELS=os.environ.get('VALIDATE_SEDML_MODELS', '1').lower() in ['1', 'true'],
@@ -207,13 +388,23 @@ def get_config():
         REPORTS_PATH=os.environ.get('REPORTS_PATH', DEFAULT_REPORTS_PATH),
         PLOTS_PATH=os.environ.get('PLOTS_PATH', DEFAULT_PLOTS_PATH),
         BUNDLE_OUTPUTS=os.environ.get('BUNDLE_OUTPUTS', '1').lower() in ['1', 'true'],
+        BUNDLE_COMPRESSION=os.environ.get('BUNDLE_COMPRESSION', DEFAULT_BUNDLE_COMPRESSION).strip().lower(),
+        BUNDLE_COMPRESSION_LEVEL=int(os.environ['BUNDLE_COMPRESSION_LEVEL']) if os.environ.get('BUNDLE_COMPRESSION_LEVEL', '') else None,
         KEEP_INDIVIDUAL_OUTPUTS=os.environ.get('KEEP_INDIVIDUAL_OUTPUTS', '1').lower() in ['1', 'true'],
         LOG=os.environ.get('LOG', '1').lower() in ['1', 'true'],
         LOG_PATH=os.environ.get('LOG_PATH', DEFAULT_LOG_PATH),
+        LOG_MAX_OUTPUT_SIZE=int(os.environ['LOG_MAX_OUTPUT_SIZE']) if os.environ.get('LOG_MAX_OUTPUT_SIZE', '') else None,
+        LOG_FORMAT=os.environ.get('LOG_FORMAT', None) or None,
+        LOG_EXPORT_INTERVAL=float(os.environ.get('LOG_EXPORT_INTERVAL', DEFAULT_LOG_EXPORT_INTERVAL)),
         BIOSIMULATORS_API_ENDPOINT=os.environ.get('BIOSIMULATORS_API_ENDPOINT', DEFAULT_BIOSIMULATORS_API_ENDPOINT),
         BIOSIMULATIONS_API_ENDPOINT=os.environ.get('BIOSIMULATIONS_API_ENDPOINT', DEFAULT_BIOSIMULATIONS_API_ENDPOINT),
         BIOSIMULATIONS_API_AUTH_ENDPOINT=os.environ.get('BIOSIMULATIONS_API_AUTH_ENDPOINT', DEFAULT_BIOSIMULATIONS_API_AUTH_ENDPOINT),
         BIOSIMULATIONS_API_AUDIENCE=os.environ.get('BIOSIMULATIONS_API_AUDIENCE', DEFAULT_BIOSIMULATIONS_API_AUDIENCE),
+        DOCKER_IMAGE_PULL_MAX_AGE=float(os.environ['DOCKER_IMAGE_PULL_MAX_AGE']) if os.environ.get('DOCKER_IMAGE_PULL_MAX_AGE', '') else None,
+        DOCKER_IMAGE_DIGEST_CACHE_DIR=os.environ.get('DOCKER_IMAGE_DIGEST_CACHE_DIR', None) or None,
+        CACHE_SINGULARITY_IMAGES=os.environ.get('CACHE_SINGULARITY_IMAGES', '0').lower() in ['1', 'true'],
+        SINGULARITY_IMAGE_CACHE_DIR=os.environ.get('SINGULARITY_IMAGE_CACHE_DIR', None) or None,
+        SINGULARITY_IMAGE_CACHE_MAX_SIZE=int(os.environ.get('SINGULARITY_IMAGE_CACHE_MAX_SIZE', DEFAULT_SINGULARITY_IMAGE_CACHE_MAX_SIZE)),
         VERBOSE=os.environ.get('VERBOSE', '1').lower() in ['1', 'true'],
         DEBUG=os.environ.get('DEBUG', '0').lower() in ['1', 'true'],
     )
@@ -6,18 +6,30 @@
 :License: MIT
 """
 
+from .config import get_app_dirs, get_config, Config  # noqa: F401
+from .utils.cache import (get_versioned_cache_dirname, read_cache_file, write_cache_file, touch_cache_entry,
+                          lock_cache_entry, get_cache_entries, evict_cache_entries, clear_cache_entries)
+import concurrent.futures
 import docker
+import hashlib
 import json
 import os
+import shutil
 import subprocess
+import tempfile
+import time
 from docker.models.images import Image
 
 __all__ = [
     'login_to_docker_registry',
+    'DockerImageDigestCache',
     'get_docker_image',
     'pull_docker_image',
+    'pull_docker_images',
     'tag_and_push_docker_image',
+    'SingularityImageCache',
     'convert_docker_image_to_singularity',
+    'get_local_docker_image_id',
 ]
 
 
@@ -37,25 +49,156 @@ def login_to_docker_registry(registry: str, username: str, password: str):
     return docker_client
 
 
-def get_docker_image(docker_client: docker.client.DockerClient, tag: str, pull: bool = True) -> Image:
+class DockerImageDigestCache(object):
+    """ Record of the ids and digests of pulled Docker images and when they were pulled
+
+    The record is used to skip pulling images which were pulled recently. Each image is recorded in a separate JSON
+    file so that concurrent processes can update the record without locking.
+
+    Attributes:
+        dirname (:obj:`str`): directory for the record
+    """
+
+    # version of the format of the record
+    VERSION = 1
+
+    def __init__(self, dirname=None, config=None):
+        """
+        Args:
+            dirname (:obj:`str`, optional): directory for the record. Default: :obj:`Config.DOCKER_IMAGE_DIGEST_CACHE_DIR`.
+            config (:obj:`Config`, optional): configuration
+        """
+        if dirname is None:
+            if config is None:
+                config = get_config()
+            dirname = config.DOCKER_IMAGE_DIGEST_CACHE_DIR or os.path.join(get_app_dirs().user_cache_dir, 'docker_images')
+        self.dirname = dirname
+
+    def get(self, tag):
+        """ Get the record of an image
+
+        Args:
+            tag (:obj:`str`): tag or URL of the image
+
+        Returns:
+            :obj:`dict`: dictionary with the id (``id``) and repository digests (``digests``) of the image and the time when
+                it was pulled (``pulled``), or :obj:`None` if the image has not been recorded
+        """
+        entry = read_cache_file(self._get_filename(tag), json.load, mode='r')
+        if not isinstance(entry, dict) or entry.get('tag', None) != tag:
+            return None
+        return entry
+
+    def set(self, tag, image, pulled=None):
+        """ Record that an image was pulled
+
+        Args:
+            tag (:obj:`str`): tag or URL of the image
+            image (:obj:`docker.models.images.Image`): image
+            pulled (:obj:`float`, optional): time when the image was pulled. Default: now.
+        """
+        image_id = getattr(image, 'id', None)
+        if not isinstance(image_id, str):
+            return
+
+        try:
+            digests = list((image.attrs or {}).get('RepoDigests', None) or [])
+        except Exception:
+            digests = []
+
+        entry = {
+            'tag': tag,
+            'id': image_id,
+            'digests': digests,
+            'pulled': time.time() if pulled is None else pulled,
+        }
+
+        write_cache_file(self._get_filename(tag), json.dumps(entry))
+
+    def is_fresh(self, tag, image, max_age):
+        """ Determine whether a local image was pulled within a maximum age
+
+        Args:
+            tag (:obj:`str`): tag or URL of the image
+            image (:obj:`docker.models.images.Image`): local image
+            max_age (:obj:`float`): maximum age in seconds
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the local image is the image which was last pulled for the tag, and it was pulled
+                within :obj:`max_age` seconds
+        """
+        entry = self.get(tag)
+        return (
+            entry is not None
+            and entry.get('id', None) == getattr(image, 'id', None)
+            and 0 <= time.time() - entry.get('pulled', 0) < max_age
+        )
+
+    def get_digest(self, tag):
+        """ Get the recorded repository digest of an image (e.g., ``ghcr.io/biosimulators/tellurium@sha256:...``)
+
+        Args:
+            tag (:obj:`str`): tag or URL of the image
+
+        Returns:
+            :obj:`str`: repository digest, or :obj:`None` if no digest has been recorded for the image
+        """
+        entry = self.get(tag)
+        if entry and entry.get('digests', None):
+            return entry['digests'][0]
+        return None
+
+    def clear(self):
+        """ Remove the records of all images """
+        clear_cache_entries(get_versioned_cache_dirname(self.dirname, self.VERSION))
+
+    def _get_filename(self, tag):
+        """ Get the path to the record of an image
+
+        Args:
+            tag (:obj:`str`): tag or URL of the image
+
+        Returns:
+            :obj:`str`: path to the record
+        """
+        return os.path.join(get_versioned_cache_dirname(self.dirname, self.VERSION), hashlib.sha256(tag.encode()).hexdigest() + '.json')
+
+
+def get_docker_image(docker_client: docker.client.DockerClient, tag: str, pull: bool = True,
+                     max_age: float = None, digest_cache: DockerImageDigestCache = None, config: Config = None) -> Image:
     """ Get a Docker image for a simulator
 
     Args:
         docker_client (:obj:`docker.client.DockerClient`): Docker client
         tag (:obj:`str`): tag (e.g., ``biosimulators/tellurium``) or
             URL (``ghcr.io/biosimulators/tellurium``) for a Docker image of a simulator
+        pull (:obj:`bool`, optional): if :obj:`True`, pull the image
+        max_age (:obj:`float`, optional): if the local image was pulled within this number of seconds, use the local image
+            without pulling it again. Default: :obj:`Config.DOCKER_IMAGE_PULL_MAX_AGE` (always pull).
+        digest_cache (:obj:`DockerImageDigestCache`, optional): record of pulled images
+        config (:obj:`Config`, optional): configuration
 
     Returns:
         :obj:`docker.models.images.Image`: Docker image
     """
+    if pull and max_age is None:
+        if config is None:
+            config = get_config()
+        max_age = config.DOCKER_IMAGE_PULL_MAX_AGE
+    if pull and max_age is not None and digest_cache is None:
+        digest_cache = DockerImageDigestCache(config=config)
+
     image: Image
     try:
         image = docker_client.images.get(tag)
-        if pull:
+        if pull and not (max_age is not None and digest_cache.is_fresh(tag, image, max_age)):
             try:
                 image = docker_client.images.pull(tag)
             except Exception:  # pragma: no cover
                 pass
+            else:
+                if digest_cache is not None:
+                    digest_cache.set(tag, image)
 
     except Exception:
         if pull:
@@ -63,6 +206,8 @@ def get_docker_image(docker_client: docker.client.DockerClient, tag: str, pull:
                 image = docker_client.images.pull(tag)
             except Exception:
                 raise docker.errors.ImageNotFound("Image '{}' for simulator could not be pulled".format(tag))
+            if digest_cache is not None:
+                digest_cache.set(tag, image)
         else:
             raise docker.errors.ImageNotFound("Image '{}' for simulator is not available locally".format(tag))
 
@@ -89,6 +234,53 @@ def pull_docker_image(docker_client, url):
         raise Exception(msg)
 
 
+def pull_docker_images(docker_client, tags, max_age=None, max_workers=None, digest_cache=None, config=None):
+    """ Concurrently pull (prefetch) Docker images, such as the images of the simulators needed for a batch of simulations
+
+    Args:
+        docker_client (:obj:`docker.client.DockerClient`): Docker client
+        tags (:obj:`list` of :obj:`str`): tags or URLs of Docker images
+        max_age (:obj:`float`, optional): skip pulling local images which were pulled within this number of seconds.
+            Default: :obj:`Config.DOCKER_IMAGE_PULL_MAX_AGE` (always pull).
+        max_workers (:obj:`int`, optional): maximum number of images to pull concurrently
+        digest_cache (:obj:`DockerImageDigestCache`, optional): record of pulled images
+        config (:obj:`Config`, optional): configuration
+
+    Returns:
+        :obj:`dict`: dictionary which maps each tag to its image
+
+    Raises:
+        :obj:`docker.errors.ImageNotFound`: if one or more images could not be pulled
+    """
+    if config is None:
+        config = get_config()
+    if max_age is None:
+        max_age = config.DOCKER_IMAGE_PULL_MAX_AGE
+    if max_age is not None and digest_cache is None:
+        digest_cache = DockerImageDigestCache(config=config)
+
+    tags = list(dict.fromkeys(tags))
+    images = {}
+    errors = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(get_docker_image, docker_client, tag, pull=True, max_age=max_age, digest_cache=digest_cache, config=config): tag
+            for tag in tags
+        }
+        for future in concurrent.futures.as_completed(futures):
+            tag = futures[future]
+            try:
+                images[tag] = future.result()
+            except Exception as exception:
+                errors.append('{}: {}'.format(tag, str(exception)))
+
+    if errors:
+        raise docker.errors.ImageNotFound('{} images could not be pulled:\n  {}'.format(
+            len(errors), '\n  '.join(sorted(errors))))
+
+    return {tag: images[tag] for tag in tags}
+
+
 def tag_and_push_docker_image(docker_client, image, tag):
     """ Tag and push Docker image
 
@@ -106,15 +298,153 @@ def tag_and_push_docker_image(docker_client, image, tag):
             tag, response.get('errorDetail', {}).get('message', response['error'])))
 
 
-def convert_docker_image_to_singularity(docker_image_url: str, singularity_filename: str = None):
+class SingularityImageCache(object):
+    """ Cache of Singularity images converted from Docker images, keyed by the ids (SHA-256 digests) of the Docker images
+
+    Each image is converted in a temporary directory and then moved into place so that readers never observe
+    partially built images. Conversions of the same image are serialized with a lock file so that concurrent
+    processes (e.g., HPC jobs) never convert the same image twice. When the total size of the cache exceeds
+    :obj:`max_size`, the least recently used images are evicted. While an image is converted or copied out of the
+    cache, it is locked so that other processes do not evict it.
+
+    Attributes:
+        dirname (:obj:`str`): directory for the cache
+        max_size (:obj:`int`): maximum size of the cache in bytes
+    """
+
+    # version of the format of the entries of the cache
+    VERSION = 1
+
+    def __init__(self, dirname=None, max_size=None, config=None):
+        """
+        Args:
+            dirname (:obj:`str`, optional): directory for the cache. Default: :obj:`Config.SINGULARITY_IMAGE_CACHE_DIR`.
+            max_size (:obj:`int`, optional): maximum size of the cache in bytes. Default:
+                :obj:`Config.SINGULARITY_IMAGE_CACHE_MAX_SIZE`.
+            config (:obj:`Config`, optional): configuration
+        """
+        if config is None:
+            config = get_config()
+
+        if dirname is None:
+            dirname = config.SINGULARITY_IMAGE_CACHE_DIR or os.path.join(get_app_dirs().user_cache_dir, 'singularity')
+        if max_size is None:
+            max_size = config.SINGULARITY_IMAGE_CACHE_MAX_SIZE
+
+        self.dirname = dirname
+        self.max_size = max_size
+
+    def get_filename(self, docker_image_id):
+        """ Get the path to the Singularity image for a Docker image
+
+        Args:
+            docker_image_id (:obj:`str`): id of the Docker image (e.g., ``sha256:...``)
+
+        Returns:
+            :obj:`str`: path to the Singularity image
+        """
+        return os.path.join(get_versioned_cache_dirname(self.dirname, self.VERSION), docker_image_id.split(':')[-1] + '.sif')
+
+    def get(self, docker_image_id, filename=None):
+        """ Get the Singularity image for a Docker image, converting the Docker image if it has not been converted before
+
+        Args:
+            docker_image_id (:obj:`str`): id of a local Docker image (e.g., ``sha256:...``)
+            filename (:obj:`str`, optional): path to save a copy of the Singularity image. The copy is a hard link, if
+                possible, and it remains available after the image is evicted from the cache.
+
+        Returns:
+            :obj:`str`: path to the copy of the Singularity image, or, if no path is given, to the image in the cache.
+            Images in the cache can be evicted by other processes once they are no longer among the most recently used
+            images that fit within :obj:`max_size`.
+        """
+        cached_filename = self.get_filename(docker_image_id)
+        built = False
+
+        # use the image under a shared lock; if the image has not been converted (or it was evicted before it was
+        # locked), convert it under an exclusive lock
+        for shared in (True, False):
+            with lock_cache_entry(cached_filename, shared=shared):
+                # another process may have converted the image while this process waited for the lock
+                if not shared and not os.path.isfile(cached_filename):
+                    self._build(docker_image_id, cached_filename)
+                    built = True
+
+                if os.path.isfile(cached_filename):
+                    touch_cache_entry(cached_filename)
+                    if filename:
+                        link_or_copy_file(cached_filename, filename)
+                    break
+
+        if built:
+            self.evict(keep=cached_filename)
+
+        return filename or cached_filename
+
+    def get_size(self):
+        """ Get the total size of the images of the cache
+
+        Returns:
+            :obj:`int`: size in bytes
+        """
+        return sum(size for _, _, size in self._get_entries())
+
+    def evict(self, keep=None):
+        """ Evict the least recently used images until the size of the cache is within :obj:`max_size`
+
+        Args:
+            keep (:obj:`str`, optional): path of an image which should not be evicted
+        """
+        evict_cache_entries(get_versioned_cache_dirname(self.dirname, self.VERSION), self.max_size, keep=keep, use_lock=True)
+
+    def clear(self):
+        """ Remove all images from the cache """
+        clear_cache_entries(get_versioned_cache_dirname(self.dirname, self.VERSION), use_lock=True)
+
+    def _build(self, docker_image_id, filename):
+        """ Convert a Docker image to a Singularity image
+
+        Args:
+            docker_image_id (:obj:`str`): id of a local Docker image
+            filename (:obj:`str`): path to save the Singularity image
+        """
+        temp_dirname = tempfile.mkdtemp(dir=os.path.dirname(filename), prefix='.tmp-')
+        try:
+            archive_filename = os.path.join(temp_dirname, 'image.tar')
+            temp_filename = os.path.join(temp_dirname, 'image.sif')
+
+            # the image is saved by its id, rather than its tag, so that the image matches its key even if the tag
+            # is moved to another image during the conversion
+            subprocess.check_call(['docker', 'image', 'save', docker_image_id, '-o', archive_filename])
+            subprocess.check_call(['singularity', 'build', temp_filename, 'docker-archive:' + archive_filename])
+            os.replace(temp_filename, filename)
+        finally:
+            shutil.rmtree(temp_dirname, ignore_errors=True)
+
+    def _get_entries(self):
+        """ Get the images of the cache
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: time of the last use, path, and size of each image
+        """
+        return get_cache_entries(get_versioned_cache_dirname(self.dirname, self.VERSION))
+
+
+def convert_docker_image_to_singularity(docker_image_url: str, singularity_filename: str = None,
+                                        cache: SingularityImageCache = None, config: Config = None):
     """ Convert a locally cached Docker image to a Singularity image.
 
     Remotely published Docker images (e.g., images published to Docker Hub, GitHub Container Registry, etc.)
     should first be pulled (e.g., using :obj:`pull_docker_image` or ``docker pull {image}``).
 
+    If :obj:`Config.CACHE_SINGULARITY_IMAGES` is enabled (or a cache is provided), each Docker image is only
+    converted once, and the converted image is reused by subsequent conversions of the same Docker image.
+
     Args:
         docker_image_url (:obj:`str`)
         singularity_filename (:obj:`str`, optional): file name for saving Singularity image
+        cache (:obj:`SingularityImageCache`, optional): cache of Singularity images
+        config (:obj:`Config`, optional): configuration
 
     Returns:
         :obj:`str`: path where Singularity image was saved
@@ -127,6 +457,16 @@ def convert_docker_image_to_singularity(docker_image_url: str, singularity_filen
     if ':' not in docker_image_url:
         docker_image_url += ':latest'
 
+    if cache is None:
+        if config is None:
+            config = get_config()
+        if config.CACHE_SINGULARITY_IMAGES:
+            cache = SingularityImageCache(config=config)
+
+    docker_image_id = get_local_docker_image_id(docker_image_url) if cache is not None else None
+    if docker_image_id:
+        return cache.get(docker_image_id, filename=singularity_filename)
+
     intermediate_archive_name = "docker_image_to_test.tar"
     cmd1: list[str] = ['docker', 'image', 'save', docker_image_url, "-o", intermediate_archive_name]
     subprocess.check_call(cmd1)
@@ -149,3 +489,44 @@ def convert_docker_image_to_singularity(docker_image_url: str, singularity_filen
         subprocess.check_call(cmd2)
 
     return singularity_filename
+
+
+def link_or_copy_file(src_filename, dest_filename):
+    """ Hard link a file, or copy the file if it cannot be linked (e.g., because the destination is on another
+    file system). The destination is replaced atomically.
+
+    Args:
+        src_filename (:obj:`str`): path to the file
+        dest_filename (:obj:`str`): path for the link or copy
+    """
+    if os.path.dirname(dest_filename):
+        os.makedirs(os.path.dirname(dest_filename), exist_ok=True)
+
+    temp_filename = '{}.{}.tmp'.format(dest_filename, os.getpid())
+    try:
+        try:
+            os.link(src_filename, temp_filename)
+        except OSError:
+            shutil.copyfile(src_filename, temp_filename)
+        os.replace(temp_filename, dest_filename)
+    except Exception:
+        if os.path.isfile(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+
+def get_local_docker_image_id(docker_image_url):
+    """ Get the id (SHA-256 digest) of a local Docker image
+
+    Args:
+        docker_image_url (:obj:`str`): tag or URL of the image
+
+    Returns:
+        :obj:`str`: id of the image (e.g., ``sha256:...``), or :obj:`None` if the image is not available locally
+    """
+    try:
+        image_id = subprocess.check_output(['docker', 'image', 'inspect', '--format', '{{.Id}}', docker_image_url],
+                                           stderr=subprocess.DEVNULL)
+    except Exception:
+        return None
+    return image_id.decode().strip() or None
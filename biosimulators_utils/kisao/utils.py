@@ -8,6 +8,7 @@
 
 from kisao import Kisao
 from kisao.data_model import TermType  # noqa: F401
+import functools
 import kisao.utils
 import pronto  # noqa: F401
 import re
@@ -15,8 +16,13 @@ import re
 __all__ = [
     'get_term',
     'get_term_type',
+    'is_algorithm_deterministic',
 ]
 
+# KiSAO characteristics of algorithms
+DETERMINISTIC_SYSTEM_BEHAVIOUR_ID = 'KISAO_0000103'
+STOCHASTIC_SYSTEM_BEHAVIOUR_ID = 'KISAO_0000104'
+
 
 def get_term(id):
     """ Get a KiSAO term
@@ -49,3 +55,50 @@ def get_term_type(term):
         return kisao.utils.get_term_type(term)
 
     return None
+
+
+def is_algorithm_deterministic(id):
+    """ Determine whether an algorithm is deterministic (i.e., whether repeated executions of the algorithm with the
+    same inputs produce the same results)
+
+    Algorithms are considered deterministic if they have the deterministic system behaviour characteristic or belong
+    to a deterministic family of algorithms (e.g., ODE integration, steady-state, flux balance), and they neither
+    have the stochastic system behaviour characteristic nor belong to a stochastic family of algorithms (e.g.,
+    Gillespie-like, tau-leaping, SDE, hybrid).
+
+    Args:
+        id (:obj:`str`): KiSAO id of the algorithm (e.g., ``KISAO_0000019``)
+
+    Returns:
+        :obj:`bool`: :obj:`True`, if the algorithm is deterministic
+    """
+    term = get_term(id)
+    if term is None:
+        return False
+    return term in _get_deterministic_algorithms()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_deterministic_algorithms():
+    """ Get the terms for deterministic algorithms
+
+    Returns:
+        :obj:`frozenset` of :obj:`pronto.Term`: terms
+    """
+    deterministic_algorithms = (
+        kisao.utils.get_terms_with_characteristics(['KISAO_0000000'], [DETERMINISTIC_SYSTEM_BEHAVIOUR_ID])
+        | kisao.utils.get_ode_algorithms()
+        | kisao.utils.get_dae_algorithms()
+        | kisao.utils.get_steadystate_algorithms()
+        | kisao.utils.get_flux_balance_algorithms()
+        | kisao.utils.get_logical_stable_state_search_algorithms()
+        | kisao.utils.get_logical_trap_space_search_algorithms()
+    )
+    stochastic_algorithms = (
+        kisao.utils.get_terms_with_characteristics(['KISAO_0000000'], [STOCHASTIC_SYSTEM_BEHAVIOUR_ID])
+        | kisao.utils.get_gillespie_like_algorithms(exact=True, approximate=True)
+        | kisao.utils.get_tau_leaping_algorithms()
+        | kisao.utils.get_sde_algorithms()
+        | kisao.utils.get_hybrid_algorithms()
+    )
+    return frozenset(deterministic_algorithms - stochastic_algorithms)
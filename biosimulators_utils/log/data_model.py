@@ -8,11 +8,16 @@
 
 from ..config import get_config
 import enum
+import json
 import os
+import threading
+import time
 import yaml
 
 __all__ = [
     'Status',
+    'TERMINAL_STATUSES',
+    'LogFormat',
     'Log',
     'CombineArchiveLog',
     'SedDocumentLog',
@@ -22,8 +27,16 @@ __all__ = [
     'Plot2DLog',
     'Plot3DLog',
     'StandardOutputErrorCapturerLevel',
+    'get_log_format',
+    'dump_log',
+    'write_file_atomically',
 ]
 
+try:
+    YamlDumper = yaml.CDumper
+except AttributeError:  # pragma: no cover # LibYAML is not available
+    YamlDumper = yaml.Dumper
+
 
 class Status(str, enum.Enum):
     """ Status of COMBINE/OMEX archive or one of its components """
@@ -40,6 +53,22 @@ class Status(str, enum.Enum):
     FAILED = 'FAILED'
 
 
+TERMINAL_STATUSES = (Status.SUCCEEDED, Status.SKIPPED, Status.FAILED)
+
+
+class LogFormat(str, enum.Enum):
+    """ Format of an exported execution log """
+    yaml = 'yaml'
+    json = 'json'
+
+
+LOG_FORMAT_EXTENSIONS = {
+    '.yml': LogFormat.yaml,
+    '.yaml': LogFormat.yaml,
+    '.json': LogFormat.json,
+}
+
+
 class Log(object):
     """ Log of a COMBINE/OMEX archive or one of its components
 
@@ -53,6 +82,9 @@ class Log(object):
         out_dir (:obj:`str`): directory to export status
     """
 
+    # whether reaching a terminal status is always exported, rather than batched with other updates
+    EXPORT_TERMINAL_STATUSES = False
+
     def __init__(self, id=None, status=None, exception=None, skip_reason=None, output=None, duration=None, parent=None, out_dir=None):
         """
         Args:
@@ -71,6 +103,9 @@ class Log(object):
         self.duration = duration
         self.parent = parent
         self.out_dir = out_dir
+        self._exported_at = None
+        self._exported_status = None
+        self._export_pending = False
 
     def finalize(self):
         """ Mark all unexecuted elements as skipped """
@@ -111,18 +146,49 @@ class Log(object):
 
         return value
 
-    def export(self):
-        """ Write to a file """
+    def export(self, force=False):
+        """ Write to a file
+
+        Updates are written at most once every ``LOG_EXPORT_INTERVAL`` seconds, and updates made in between are batched
+        into the next write (see :obj:`flush`). The file is always rewritten when the archive or one of its SED documents
+        reaches a terminal status (succeeded, skipped, or failed).
+
+        Args:
+            force (:obj:`bool`, optional): whether to rewrite the file regardless of when it was last rewritten
+        """
+        if self.EXPORT_TERMINAL_STATUSES and self.status in TERMINAL_STATUSES and self.status != self._exported_status:
+            self._exported_status = self.status
+            force = True
+
         if self.out_dir:
-            log_path = get_config().LOG_PATH
+            config = get_config()
+            log_path = config.LOG_PATH
             if log_path:
+                now = time.monotonic()
+                if (
+                    not force
+                    and self._exported_at is not None
+                    and now - self._exported_at < config.LOG_EXPORT_INTERVAL
+                ):
+                    self._export_pending = True
+                    return
+
                 path = os.path.join(self.out_dir, log_path)
                 if not os.path.isdir(self.out_dir):
                     os.makedirs(self.out_dir)
-                with open(path, 'w') as file:
-                    file.write(yaml.dump(self.to_json()))
+                write_file_atomically(path, dump_log(self.to_json(), format=get_log_format(config)))
+                self._exported_at = now
+                self._export_pending = False
+        elif self.parent:
+            self.parent.export(force=force)
+
+    def flush(self):
+        """ Write the updates which have been batched since the file was last rewritten """
+        if self.out_dir:
+            if self._export_pending:
+                self.export(force=True)
         elif self.parent:
-            self.parent.export()
+            self.parent.flush()
 
 
 class CombineArchiveLog(Log):
@@ -139,6 +205,8 @@ class CombineArchiveLog(Log):
         out_dir (:obj:`str`): directory to export status
     """
 
+    EXPORT_TERMINAL_STATUSES = True
+
     def __init__(self, id=None, status=None, exception=None, skip_reason=None, output=None, duration=None, sed_documents=None,
                  out_dir=None):
         """
@@ -198,6 +266,8 @@ class SedDocumentLog(Log):
         out_dir (:obj:`str`): directory to export status
     """
 
+    EXPORT_TERMINAL_STATUSES = True
+
     def __init__(self, location=None, status=None, exception=None, skip_reason=None, output=None, duration=None,
                  tasks=None, outputs=None, parent=None, out_dir=None):
         """
@@ -267,12 +337,14 @@ class TaskLog(Log):
         duration (:obj:`float`): duration in seconds
         algorithm (:obj:`str`): KiSAO id of the requested algorithm
         simulator_details (:obj:`dict`): additional simulator-specific information
+        cache_hits (:obj:`int`): number of simulations of the task (e.g., iterations of a repeated task) whose results were
+            retrieved from the cache of the results of simulations, or :obj:`None` if the cache was not used
         parent (:obj:`SedDocumentLog`): execution status of parent SED document
         out_dir (:obj:`str`): directory to export status
     """
 
     def __init__(self, id=None, status=None, exception=None, skip_reason=None, output=None, duration=None,
-                 algorithm=None, simulator_details=None, parent=None, out_dir=None):
+                 algorithm=None, simulator_details=None, cache_hits=None, parent=None, out_dir=None):
         """
         Args:
             id (:obj:`str`, optional): id of the task
@@ -283,6 +355,8 @@ class TaskLog(Log):
             duration (:obj:`float`, optional): duration in seconds
             algorithm (:obj:`str`, optional): KiSAO id of the executed algorithm
             simulator_details (:obj:`dict`, optional): additional simulator-specific information
+            cache_hits (:obj:`int`, optional): number of simulations of the task whose results were retrieved from the cache of
+                the results of simulations
             parent (:obj:`SedDocumentLog`): execution status of parent SED document
             out_dir (:obj:`str`, optional): directory to export status
         """
@@ -292,6 +366,7 @@ class TaskLog(Log):
         self.id = id
         self.algorithm = algorithm
         self.simulator_details = simulator_details
+        self.cache_hits = cache_hits
 
     def to_json(self):
         """ Generate a JSON-compatible representation
@@ -307,6 +382,9 @@ class TaskLog(Log):
             if self.simulator_details
             else None
         )
+        # only reported when the cache was used so that the logs of other executions are unchanged
+        if self.cache_hits is not None:
+            value['cacheHits'] = self.cache_hits
         return value
 
 
@@ -539,3 +617,57 @@ class StandardOutputErrorCapturerLevel(int, enum.Enum):
     """ Level at which stdout/stderr should be captured """
     python = 0
     c = 1
+
+
+def write_file_atomically(filename, contents):
+    """ Write a file by writing its contents to a temporary file and then renaming the temporary file, so that
+    readers never observe a partially-written file
+
+    Args:
+        filename (:obj:`str`): path to the file
+        contents (:obj:`str` or :obj:`bytes`): contents of the file
+    """
+    tmp_filename = '{}.{}-{}.tmp'.format(filename, os.getpid(), threading.get_ident())
+    try:
+        with open(tmp_filename, 'wb' if isinstance(contents, bytes) else 'w') as file:
+            file.write(contents)
+        os.replace(tmp_filename, filename)
+    except Exception:
+        if os.path.isfile(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+
+def get_log_format(config=None):
+    """ Get the format for exporting execution logs. The format is ``LOG_FORMAT``, if it is set, or is inferred
+    from the extension of ``LOG_PATH`` (``.json`` for JSON, YAML otherwise).
+
+    Args:
+        config (:obj:`Config`, optional): configuration
+
+    Returns:
+        :obj:`LogFormat`: format
+    """
+    config = config or get_config()
+    if config.LOG_FORMAT:
+        return LogFormat(config.LOG_FORMAT.lower())
+    return LOG_FORMAT_EXTENSIONS.get(os.path.splitext(config.LOG_PATH or '')[1].lower(), LogFormat.yaml)
+
+
+def dump_log(value, format=LogFormat.yaml):
+    """ Serialize the JSON-compatible representation of a log
+
+    YAML is emitted with LibYAML, when it is available. JSON is emitted compactly because the C-accelerated
+    JSON encoder does not support indentation.
+
+    Args:
+        value (:obj:`dict`): JSON-compatible representation of a log
+        format (:obj:`LogFormat`, optional): format
+
+    Returns:
+        :obj:`str`: serialized log
+    """
+    if format == LogFormat.json:
+        return json.dumps(value)
+    else:
+        return yaml.dump(value, Dumper=YamlDumper)
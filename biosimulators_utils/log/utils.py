@@ -22,9 +22,13 @@ try:
 except ModuleNotFoundError:
     capturer = None
 import contextlib
+import ctypes
+import ctypes.util
 import io  # noqa: F401
 import os
+import select
 import sys
+import threading
 
 __all__ = [
     'init_combine_archive_log',
@@ -38,6 +42,13 @@ __all__ = [
     'get_summary_combine_archive_log',
 ]
 
+FD_CAPTURE_SUPPORTED = os.name == 'posix'
+
+try:
+    libc = ctypes.CDLL(ctypes.util.find_library('c'))
+except OSError:  # pragma: no cover
+    libc = None
+
 
 def init_combine_archive_log(archive, archive_dir,
                              supported_features=(SedDocument, Task, Report, Plot2D, Plot3D, DataSet, Curve, Surface),
@@ -268,11 +279,212 @@ def init_plot3d_log(plot,
     return log
 
 
+class _FileDescriptorCaptureSession(object):
+    """ Session which captures the standard output and error file descriptors of the process into a pipe, which
+    is drained into a buffer by a reader thread. Nested :obj:`StandardOutputErrorCapturer` contexts share
+    a single session, and each context records the offsets of the bytes which it captured.
+
+    Child processes inherit the redirected file descriptors. So that children which outlive the session (e.g.,
+    long-lived workers) neither block nor receive ``SIGPIPE``, the reader thread continues to drain the pipe after the
+    session is stopped, and passes the output along to the restored standard output, until all of the writers to
+    the pipe have been closed.
+
+    Attributes:
+        scopes (:obj:`list` of :obj:`StandardOutputErrorCapturer`): active contexts, from the outermost to the innermost
+        buffer (:obj:`bytearray`): retained output
+        offset (:obj:`int`): offset of the first byte of :obj:`buffer` in the captured output
+        lock (:obj:`threading.RLock`): lock for the buffer and the contexts
+    """
+
+    TRIM_THRESHOLD = 2 ** 20
+
+    def __init__(self):
+        self.scopes = []
+        self.buffer = bytearray()
+        self.offset = 0
+        self.lock = threading.RLock()
+        self._relay_lock = threading.Lock()
+        self._stdout = None
+        self._stderr = None
+        self._stream = None
+        self._saved_fds = None
+        self._read_fd = None
+        self._reader = None
+        self._stopped = False
+
+    @property
+    def size(self):
+        """ Get the number of bytes which have been captured
+
+        Returns:
+            :obj:`int`: number of bytes which have been captured
+        """
+        return self.offset + len(self.buffer)
+
+    def start(self):
+        """ Redirect standard output and error into the session """
+        _flush_standard_output_error()
+
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        self._saved_fds = (os.dup(1), os.dup(2))
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        self._read_fd = read_fd
+
+        self._stdout = sys.stdout
+        self._stderr = sys.stderr
+        self._stream = open(1, 'w', buffering=1, encoding='utf-8', errors='replace', closefd=False)
+        sys.stdout = self._stream
+        sys.stderr = self._stream
+
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def stop(self):
+        """ Restore standard output and error. The reader thread closes the pipe and the saved file descriptors
+        once all of the writers to the pipe have been closed.
+        """
+        self.sync()
+
+        sys.stdout = self._stdout
+        sys.stderr = self._stderr
+        self._stream.close()
+
+        with self.lock:
+            _, relayed = self._drain()
+            self._stopped = True
+            self._relay(relayed)
+            os.dup2(self._saved_fds[0], 1)
+            os.dup2(self._saved_fds[1], 2)
+
+    def sync(self):
+        """ Wait until all of the output which has been written has been captured """
+        _flush_standard_output_error()
+        self._drain_and_relay()
+
+    def _read(self):
+        """ Drain the pipe until all of the writers to the pipe have been closed """
+        try:
+            while True:
+                select.select([self._read_fd], [], [], 0.1)
+                if self._drain_and_relay():
+                    return
+        finally:
+            os.close(self._read_fd)
+            for fd in self._saved_fds:
+                os.close(fd)
+
+    def _drain_and_relay(self):
+        """ Read the output which is available in the pipe, and pass along the output which should be relayed
+
+        Returns:
+            :obj:`bool`: whether all of the writers to the pipe have been closed
+        """
+        with self.lock:
+            closed, relayed = self._drain()
+
+            # relay outside of the lock, in the order in which the output was read
+            self._relay_lock.acquire()
+        try:
+            self._write(relayed)
+        finally:
+            self._relay_lock.release()
+        return closed
+
+    def _relay(self, data):
+        """ Pass output along to the standard output
+
+        Args:
+            data (:obj:`bytes`): output
+        """
+        with self._relay_lock:
+            self._write(data)
+
+    def _write(self, data):
+        """ Write output to the saved standard output
+
+        Args:
+            data (:obj:`bytes`): output
+        """
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._saved_fds[0], view):]
+
+    def _drain(self):
+        """ Read the output which is available in the pipe. The caller must hold :obj:`lock`.
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`bool`: whether all of the writers to the pipe have been closed
+                * :obj:`bytes`: output which should be passed along to the standard output
+        """
+        relayed = bytearray()
+        while True:
+            try:
+                data = os.read(self._read_fd, 65536)
+            except BlockingIOError:
+                return (False, bytes(relayed))
+            if not data:
+                return (True, bytes(relayed))
+
+            if self._stopped:
+                relayed += data
+                continue
+
+            if all(scope.relay for scope in self.scopes):
+                relayed += data
+
+            self.buffer += data
+            self._trim()
+
+    def _trim(self):
+        """ Discard the output which is no longer needed by any of the active contexts """
+        if not self.scopes:
+            return
+        keep_offset = min(scope._get_first_needed_offset(self.size) for scope in self.scopes)
+        n_discarded = keep_offset - self.offset
+        if n_discarded > max(self.TRIM_THRESHOLD, len(self.buffer) // 2):
+            del self.buffer[:n_discarded]
+            self.offset = keep_offset
+
+    def get_bytes(self, start, end, excluded_ranges):
+        """ Get the captured output within a range, less excluded ranges
+
+        Args:
+            start (:obj:`int`): start offset
+            end (:obj:`int`): end offset
+            excluded_ranges (:obj:`list` of :obj:`list` of :obj:`int`): sorted and non-overlapping ranges to exclude
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`bytes`: output
+                * :obj:`int`: number of bytes of the range which have been discarded
+        """
+        pieces = []
+        n_discarded = 0
+        for piece_start, piece_end in _subtract_ranges(start, end, excluded_ranges):
+            retained_start = max(piece_start, self.offset)
+            n_discarded += min(retained_start, piece_end) - piece_start
+            if piece_end > retained_start:
+                pieces.append(self.buffer[retained_start - self.offset:piece_end - self.offset])
+        return (b''.join(pieces), n_discarded)
+
+
+_fd_capture_session = None
+_fd_capture_session_lock = threading.RLock()
+
+
 class StandardOutputErrorCapturer(contextlib.AbstractContextManager):
-    """ Context manager for capturing standard output/error. When :obj:`capturer` is available (i.e.,
-    Linux, MacOS, Unix), :obj:`capturer` is used to capture standard output/error. When :obj:`capturer` is not
-    available (i.e. Windows), this context manager issues a warn and collects no output. The purpose of this
-    context manager is to encapsulate the handling of whether :obj:`capturer` is or isn't available so
+    """ Context manager for capturing standard output/error. On POSIX systems, output is captured at the C level
+    by redirecting the standard output and error file descriptors of the process into a pipe. Nested contexts
+    share a single redirection, and record the offsets of the output which they captured. When redirecting
+    file descriptors isn't supported, :obj:`capturer` is used to capture standard output/error, if it is available.
+    Otherwise, this context manager issues a warn and collects no output. The purpose of this
+    context manager is to encapsulate the handling of whether output can be captured at the C level so
     that the other modules can work seamless in Linux, as well as Windows (except without the ability to log
     standard output/error).
 
@@ -281,29 +493,42 @@ class StandardOutputErrorCapturer(contextlib.AbstractContextManager):
         relay (:obj:`bool`): if :obj:`True`, collect the standard output/error streams and continue to pass
                 them along. if :obj:`False`, collect the stream, squash them, and do not pass them along.
         disabled (:obj:`bool`): whether to capture standard output and error
+        max_size (:obj:`int`): maximum number of bytes of output to retain; earlier output is discarded
         _captured (:obj:`capturer.CaptureOutput`): logged C output
         _log (:obj:`str`): logged Python output
         _stdout (:obj:`io.IOBase`): overridden stdout
         _stderr (:obj:`io.IOBase`): overridden stderr
     """
 
-    def __init__(self, level=StandardOutputErrorCapturerLevel.c, relay=False, termination_delay=0.01, disabled=False):
+    def __init__(self, level=StandardOutputErrorCapturerLevel.c, relay=False, termination_delay=0.01, disabled=False,
+                 max_size=None):
         """
         Args:
             level (:obj:`StandardOutputErrorCapturerLevel`, optional): level at which stdout/stderr should be captured
             relay (:obj:`bool`): if :obj:`True`, collect the standard output/error streams and continue to pass
                 them along. if :obj:`False`, collect the stream, squash them, and do not pass them along.
             termination_delay (:obj:`float`, optional): The number of seconds to wait before terminating
-                the output relay process.
+                the output relay process of :obj:`capturer`.
             disabled (:obj:`bool`, optional): whether to capture standard output and error
+            max_size (:obj:`int`, optional): maximum number of bytes of output to retain; earlier output is discarded
         """
         self.level = level
         self.relay = relay
         self.disabled = disabled
+        self.max_size = max_size
+        self._backend = None
         if not self.disabled:
-            if self.level >= StandardOutputErrorCapturerLevel.c and capturer:
+            if self.level >= StandardOutputErrorCapturerLevel.c and FD_CAPTURE_SUPPORTED:
+                self._backend = 'fd'
+                self._start = None
+                self._end = None
+                self._excluded_ranges = []
+                self._text = None
+            elif self.level >= StandardOutputErrorCapturerLevel.c and capturer:
+                self._backend = 'capturer'
                 self._captured = capturer.CaptureOutput(merged=True, relay=relay, termination_delay=termination_delay)
             else:
+                self._backend = 'python'
                 self._log = ''
         else:
             msg = (
@@ -315,24 +540,53 @@ class StandardOutputErrorCapturer(contextlib.AbstractContextManager):
 
     def __enter__(self):
         """ Enter a context """
-        if not self.disabled:
-            if self.level >= StandardOutputErrorCapturerLevel.c and capturer:
-                self._captured.start_capture()
-            else:
-                self._stdout = sys.stdout
-                self._stderr = sys.stderr
-                sys.stdout = self
-                sys.stderr = self
+        global _fd_capture_session
+
+        if self._backend == 'fd':
+            with _fd_capture_session_lock:
+                if _fd_capture_session is None:
+                    _fd_capture_session = _FileDescriptorCaptureSession()
+                    _fd_capture_session.start()
+                session = _fd_capture_session
+                session.sync()
+                with session.lock:
+                    self._start = session.size
+                    session.scopes.append(self)
+        elif self._backend == 'capturer':
+            self._captured.start_capture()
+        elif self._backend == 'python':
+            self._stdout = sys.stdout
+            self._stderr = sys.stderr
+            sys.stdout = self
+            sys.stderr = self
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """ Exit a context """
-        if not self.disabled:
-            if self.level >= StandardOutputErrorCapturerLevel.c and capturer:
-                self._captured.finish_capture()
-            else:
-                sys.stdout = self._stdout
-                sys.stderr = self._stderr
+        global _fd_capture_session
+
+        if self._backend == 'fd':
+            with _fd_capture_session_lock:
+                session = _fd_capture_session
+                session.sync()
+                with session.lock:
+                    self._end = session.size
+                    session.scopes.remove(self)
+                    self._text = self._get_text_from_session(session)
+
+                    # output which wasn't relayed isn't visible to the enclosing contexts
+                    if not self.relay:
+                        for scope in session.scopes:
+                            scope._exclude_range(self._start, self._end)
+
+                if not session.scopes:
+                    session.stop()
+                    _fd_capture_session = None
+        elif self._backend == 'capturer':
+            self._captured.finish_capture()
+        elif self._backend == 'python':
+            sys.stdout = self._stdout
+            sys.stderr = self._stderr
 
     def write(self, message):
         if self.relay:
@@ -351,12 +605,114 @@ class StandardOutputErrorCapturer(contextlib.AbstractContextManager):
         """
         if self.disabled:
             return None
+        elif self._backend == 'fd':
+            if self._text is not None:
+                return self._text
+            with _fd_capture_session_lock:
+                session = _fd_capture_session
+                if session is None or self not in session.scopes:
+                    return ''
+                session.sync()
+                with session.lock:
+                    return self._get_text_from_session(session)
+        elif self._backend == 'capturer':
+            bytes = self._captured.get_bytes()
+            return self._truncate(bytes, 0).decode(errors='ignore')
         else:
-            if self.level >= StandardOutputErrorCapturerLevel.c and capturer:
-                bytes = self._captured.get_bytes()
-                return bytes.decode(errors='ignore')
-            else:
-                return self._log
+            return self._truncate(self._log.encode(), 0).decode(errors='ignore')
+
+    def _get_text_from_session(self, session):
+        """ Get the output captured by this context from a file descriptor capture session
+
+        Args:
+            session (:obj:`_FileDescriptorCaptureSession`): session
+
+        Returns:
+            :obj:`str`: captured standard output/error
+        """
+        end = self._end if self._end is not None else session.size
+        bytes, n_discarded = session.get_bytes(self._start, end, self._excluded_ranges)
+        return self._truncate(bytes, n_discarded).decode(errors='ignore')
+
+    def _truncate(self, bytes, n_discarded):
+        """ Limit output to the maximum size and note the size of the discarded output
+
+        Args:
+            bytes (:obj:`bytes`): output
+            n_discarded (:obj:`int`): number of bytes which have already been discarded
+
+        Returns:
+            :obj:`bytes`: truncated output
+        """
+        if self.max_size is not None and len(bytes) > self.max_size:
+            n_discarded += len(bytes) - self.max_size
+            bytes = bytes[len(bytes) - self.max_size:]
+        if n_discarded:
+            bytes = '[{} bytes of earlier output were discarded]\n'.format(n_discarded).encode() + bytes
+        return bytes
+
+    def _exclude_range(self, start, end):
+        """ Exclude a range of output (e.g., output of a nested context which wasn't relayed)
+
+        Args:
+            start (:obj:`int`): start offset
+            end (:obj:`int`): end offset
+        """
+        self._excluded_ranges = [
+            excluded_range for excluded_range in self._excluded_ranges
+            if excluded_range[1] <= start or excluded_range[0] >= end
+        ]
+        self._excluded_ranges.append([start, end])
+        self._excluded_ranges.sort()
+
+    def _get_first_needed_offset(self, size):
+        """ Get the offset of the first byte of output which this context still needs
+
+        Args:
+            size (:obj:`int`): number of bytes which have been captured
+
+        Returns:
+            :obj:`int`: offset
+        """
+        if self.max_size is None:
+            return self._start
+        n_excluded = sum(excluded_end - excluded_start for excluded_start, excluded_end in self._excluded_ranges)
+        return max(self._start, size - self.max_size - n_excluded)
+
+
+def _subtract_ranges(start, end, excluded_ranges):
+    """ Get the sub-ranges of a range which are not excluded
+
+    Args:
+        start (:obj:`int`): start offset
+        end (:obj:`int`): end offset
+        excluded_ranges (:obj:`list` of :obj:`list` of :obj:`int`): sorted and non-overlapping ranges to exclude
+
+    Returns:
+        :obj:`list` of :obj:`tuple` of :obj:`int`: sub-ranges
+    """
+    ranges = []
+    for excluded_start, excluded_end in excluded_ranges:
+        if excluded_start > start:
+            ranges.append((start, min(excluded_start, end)))
+        start = max(start, excluded_end)
+        if start >= end:
+            break
+    if start < end:
+        ranges.append((start, end))
+    return ranges
+
+
+def _flush_standard_output_error():
+    """ Flush the Python and C standard output and error streams """
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:  # pragma: no cover
+            pass
+
+    if libc:
+        libc.fflush(None)
 
 
 def get_summary_combine_archive_log(log):
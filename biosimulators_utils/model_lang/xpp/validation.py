@@ -10,14 +10,17 @@ from ...config import Config  # noqa: F401
 from .data_model import SIMULATION_METHOD_KISAO_MAP
 from biosimulators_utils.sedml.data_model import Symbol
 import collections
+import concurrent.futures
+import functools
 import glob
 import os
 import re
+import shutil
 import subprocess
 import tempfile
 
 
-__all__ = ['validate_model', 'get_xpp_input_configuration_from_directory', 'sanitize_model']
+__all__ = ['validate_model', 'validate_models', 'get_xpp_input_configuration_from_directory', 'sanitize_model']
 
 
 def validate_model(filename,
@@ -65,40 +68,28 @@ def validate_model(filename,
 
     sanitized_filename = sanitize_model(filename, exclude_options=['output'])
 
-    var_param_fid, var_param_filename = tempfile.mkstemp()
-    os.close(var_param_fid)
-
-    cmd = ['xppaut', os.path.basename(sanitized_filename), '-qics', '-qpars', '-outfile', var_param_filename, '-quiet', '0']
-    if set_filename is not None:
-        cmd.append('-setfile')
-        cmd.append(set_filename)
-    if parameter_filename is not None:
-        cmd.append('-parfile')
-        cmd.append(parameter_filename)
-    if initial_conditions_filename is not None:
-        cmd.append('-icfile')
-        cmd.append(initial_conditions_filename)
-    result = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        check=False,
-        cwd=os.path.dirname(sanitized_filename),
-    )
-
-    stdout = result.stdout.decode(errors='ignore').strip()
-
-    if result.returncode != 0:
-        errors.append(['`{}` is not a valid XPP file.'.format(filename), [[stdout]]])
-
-    elif re.search(r'\berror\b', stdout, re.IGNORECASE):
-        errors.append(['`{}` is not a valid XPP file.'.format(filename), [[stdout]]])
-
-    elif 'Too many boundary conditions' in stdout:
-        errors.append(['`{}` has too many boundary conditions'])
-
-    if not errors:
-        cmd = ['xppaut', os.path.basename(sanitized_filename), '-qics', '-qpars', '-outfile', var_param_filename, '-quiet', '1']
+    # run XPP once; the sanitized model and the outputs of XPP are removed even if XPP can't be executed
+    out_dirname = tempfile.mkdtemp()
+    try:
+        # XPP's verbose messages (which report errors) are routed to a log file, whereas the messages which
+        # XPP prints even in quiet mode (e.g., duplicate names) remain in the standard output and are reported as warnings
+        var_param_filename = os.path.join(out_dirname, 'parameters-initial-conditions.txt')
+        log_filename = os.path.join(out_dirname, 'log.txt')
+
+        cmd = [
+            'xppaut', os.path.basename(sanitized_filename),
+            '-qics', '-qpars', '-outfile', var_param_filename,
+            '-quiet', '0', '-logfile', log_filename,
+        ]
+        if set_filename is not None:
+            cmd.append('-setfile')
+            cmd.append(set_filename)
+        if parameter_filename is not None:
+            cmd.append('-parfile')
+            cmd.append(parameter_filename)
+        if initial_conditions_filename is not None:
+            cmd.append('-icfile')
+            cmd.append(initial_conditions_filename)
         result = subprocess.run(
             cmd,
             stdout=subprocess.PIPE,
@@ -106,7 +97,34 @@ def validate_model(filename,
             check=False,
             cwd=os.path.dirname(sanitized_filename),
         )
+
         stdout = result.stdout.decode(errors='ignore').strip()
+        if os.path.isfile(log_filename):
+            with open(log_filename, 'rb') as file:
+                log = file.read().decode(errors='ignore').strip()
+        else:
+            log = ''
+        if os.path.isfile(var_param_filename):
+            with open(var_param_filename, 'r') as file:
+                var_param_lines = file.readlines()
+        else:
+            var_param_lines = []
+    finally:
+        os.remove(sanitized_filename)
+        shutil.rmtree(out_dirname)
+
+    messages = '\n'.join(message for message in [log, stdout] if message)
+
+    if result.returncode != 0:
+        errors.append(['`{}` is not a valid XPP file.'.format(filename), [[messages]]])
+
+    elif re.search(r'\berror\b', messages, re.IGNORECASE):
+        errors.append(['`{}` is not a valid XPP file.'.format(filename), [[messages]]])
+
+    elif 'Too many boundary conditions' in messages:
+        errors.append(['`{}` has too many boundary conditions'.format(filename)])
+
+    if not errors:
         if stdout:
             warnings.append([
                 'The XPP file may be not be formulated correctly',
@@ -134,23 +152,22 @@ def validate_model(filename,
         }
         block = None
         duplicate_ids = set()
-        with open(var_param_filename, 'r') as file:
-            for line in file:
-                line = line.strip()
-                if line.startswith('#'):
-                    if line == '#Parameters query:':
-                        block = 'parameters'
-                    elif line == '#Initial conditions query:':
-                        block = 'initial_conditions'
-                elif block:
-                    id, _, value = line.partition(' ')
-                    if id in simulation[block]:
-                        duplicate_ids.add("{} '{}'".format(block[0:1].upper() + block[1:].replace('_', ' '), id))
-                    else:
-                        simulation[block][id] = float(value)
+        for line in var_param_lines:
+            line = line.strip()
+            if line.startswith('#'):
+                if line == '#Parameters query:':
+                    block = 'parameters'
+                elif line == '#Initial conditions query:':
+                    block = 'initial_conditions'
+            elif block:
+                id, _, value = line.partition(' ')
+                if id in simulation[block]:
+                    duplicate_ids.add("{} '{}'".format(block[0:1].upper() + block[1:].replace('_', ' '), id))
+                else:
+                    simulation[block][id] = float(value)
 
-                    if block == 'initial_conditions':
-                        simulation['outfile_column_names'].append(id)
+                if block == 'initial_conditions':
+                    simulation['outfile_column_names'].append(id)
 
         if duplicate_ids:
             msg = '{} parameters and variables were duplicately defined:\n  - {}'.format(
@@ -483,9 +500,6 @@ def validate_model(filename,
                     ],
                 ])
 
-    os.remove(sanitized_filename)
-    os.remove(var_param_filename)
-
     if simulation:
         all_variable_ids = list(simulation['initial_conditions'].keys()) + \
             list(simulation['auxiliary_variables'].keys()) + ['T']
@@ -539,6 +553,26 @@ def validate_model(filename,
     return (errors, warnings, simulation)
 
 
+def validate_models(filenames, max_workers=None, config=None):
+    """ Check that multiple models are valid
+
+    Each model is validated with a separate ``xppaut`` process. At most ``max_workers`` of these processes are run
+    concurrently.
+
+    Args:
+        filenames (:obj:`list` of :obj:`str`): paths to model files or directories with ``.ode`` and possibly set (``.set``),
+            parameter (``.par``), andd initial conditions (``.ic``) files
+        max_workers (:obj:`int`, optional): maximum number of models to validate concurrently (default: number of CPUs)
+        config (:obj:`Config`, optional): whether to fail on missing includes
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: errors, warnings, and values of parameters of initial conditions of variables of each
+            model (see :obj:`validate_model`), in the same order as :obj:`filenames`
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        return list(executor.map(functools.partial(validate_model, config=config), filenames))
+
+
 def norm_simulation_method_arg(arg):
     """ Normalize the name of a numerical argument
 
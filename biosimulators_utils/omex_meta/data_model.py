@@ -33,6 +33,8 @@ class Triple(object):
         object (:obj:`rdflib.term.BNode`, :obj:`rdflib.term.Literal`, or :obj:`rdflib.term.URIRef`): object
     """
 
+    __slots__ = ('subject', 'predicate', 'object')
+
     def __init__(self, subject, predicate, object):
         """
         Args:
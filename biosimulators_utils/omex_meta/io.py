@@ -18,11 +18,11 @@ from .validation import validate_biosimulations_metadata
 from lxml import etree
 import abc
 import collections
-import json
 import os
 import pyomexmeta
 import rdflib
 import re
+import shutil
 import tempfile
 
 __all__ = [
@@ -35,6 +35,25 @@ __all__ = [
     'BiosimulationsOmexMetaWriter',
 ]
 
+NTRIPLES_NODE_PATTERN = re.compile(
+    r'[ \t]*(?:'
+    r'<(?P<uri>[^>]*)>'
+    r'|_:(?P<bnode>[^ \t]+)'
+    r'|"(?P<literal>(?:[^"\\]|\\.)*)"(?:@[a-zA-Z][a-zA-Z0-9\-]*|\^\^<[^>]*>)?'
+    r')'
+)
+NTRIPLES_ESCAPE_PATTERN = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+NTRIPLES_ESCAPED_CHARS = {
+    't': '\t',
+    'b': '\b',
+    'n': '\n',
+    'r': '\r',
+    'f': '\f',
+    '"': '"',
+    "'": "'",
+    '\\': '\\',
+}
+
 
 def read_omex_meta_file(filename_or_filenames, archive=None, working_dir=None, config=None):
     """ Read an OMEX Metadata file
@@ -195,26 +214,23 @@ class OmexMetaReader(abc.ABC):
         if line.startswith(b'<?xml ') and b'?>' in line:
             decl, sep, after_decl = line.partition(b'?>')
             if b' version="1.1"' in decl or b" version='1.1'" in decl:
+                # patch the XML declaration because the RDF/XML parser doesn't support XML 1.1; the patched copy is
+                # saved next to the file so that relative URIs resolve the same way
                 decl = decl.replace(b' version="1.1"', b' version="1.0"').replace(b" version='1.1'", b" version='1.0'")
-                line = decl + sep + after_decl
-
-                with open(filename, 'rb') as file:
-                    lines = file.readlines()
-
-                lines[0] = line
 
                 temp_fid, temp_filename = tempfile.mkstemp(dir=os.path.dirname(filename))
-                os.close(temp_fid)
-                with open(temp_filename, 'wb') as file:
-                    for line in lines:
-                        file.write(line)
+                with open(filename, 'rb') as file, os.fdopen(temp_fid, 'wb') as temp_file:
+                    file.readline()
+                    temp_file.write(decl + sep + after_decl)
+                    shutil.copyfileobj(file, temp_file)
 
                 filename = temp_filename
 
-        rdf = pyomexmeta.RDF.from_file(filename, config.OMEX_METADATA_INPUT_FORMAT.value)
-
-        if temp_filename:
-            os.remove(temp_filename)
+        try:
+            rdf = pyomexmeta.RDF.from_file(filename, config.OMEX_METADATA_INPUT_FORMAT.value)
+        finally:
+            if temp_filename:
+                os.remove(temp_filename)
 
         pyomexmeta.Logger.set_level(pyomexmeta_log_level)
 
@@ -243,21 +259,60 @@ class OmexMetaReader(abc.ABC):
         Returns:
             * :obj:`list` of :obj:`Triple`: representation of the OMEX Metadata file as list of triples
         """
-        query = "SELECT ?subject ?predicate ?object WHERE { ?subject ?predicate ?object }"
-        plain_triples = json.loads(rdf.query_results_as_string(query, 'json'))['results']['bindings']
-        triples = []
-        for plain_triple in plain_triples:
-            subject = cls.make_rdf_node(plain_triple['subject'])
-            predicate = cls.make_rdf_node(plain_triple['predicate'])
-            object = cls.make_rdf_node(plain_triple['object'])
+        return list(cls.iter_rdf_triples(rdf))
+
+    @classmethod
+    def iter_rdf_triples(cls, rdf):
+        """ Iterate over the triples of an RDF graph
+
+        The graph is serialized to N-Triples, which is streamed line by line into triples.
+
+        Args:
+            rdf (:obj:`pyomexmeta.RDF`): RDF representation of the file
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Triple`: triples of the graph
+        """
+        for line in rdf.to_string('ntriples').splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            nodes = []
+            pos = 0
+            for i_node in range(3):
+                match = NTRIPLES_NODE_PATTERN.match(line, pos)
+                if not match:
+                    raise ValueError('`{}` is not a valid N-Triples statement.'.format(line))
+                nodes.append(cls.make_rdf_node(cls.parse_ntriples_node(match)))
+                pos = match.end()
+
+            yield Triple(
+                subject=nodes[0],
+                predicate=nodes[1],
+                object=nodes[2],
+            )
 
-            triples.append(Triple(
-                subject=subject,
-                predicate=predicate,
-                object=object,
-            ))
+    @classmethod
+    def parse_ntriples_node(cls, match):
+        """ Parse an N-Triples node
+
+        Args:
+            match (:obj:`re.Match`): match of an N-Triples node to :obj:`NTRIPLES_NODE_PATTERN`
+
+        Returns:
+            :obj:`dict`: node with keys ``type`` (``uri``, ``bnode``, or ``literal``) and ``value``
+        """
+        uri, bnode, literal = match.group('uri', 'bnode', 'literal')
+
+        if bnode is not None:
+            return {'type': 'bnode', 'value': bnode}
+
+        elif literal is not None:
+            return {'type': 'literal', 'value': NTRIPLES_ESCAPE_PATTERN.sub(unescape_ntriples_char, literal)}
 
-        return triples
+        else:
+            return {'type': 'uri', 'value': NTRIPLES_ESCAPE_PATTERN.sub(unescape_ntriples_char, uri)}
 
     @classmethod
     def make_rdf_node(cls, node):
@@ -279,6 +334,21 @@ class OmexMetaReader(abc.ABC):
             return rdflib.term.URIRef(node['value'])
 
 
+def unescape_ntriples_char(match):
+    """ Unescape an escaped character of an N-Triples string
+
+    Args:
+        match (:obj:`re.Match`): match to :obj:`NTRIPLES_ESCAPE_PATTERN`
+
+    Returns:
+        :obj:`str`: unescaped character
+    """
+    code_point = match.group(1) or match.group(2)
+    if code_point:
+        return chr(int(code_point, 16))
+    return NTRIPLES_ESCAPED_CHARS.get(match.group(3), match.group(0))
+
+
 class OmexMetaWriter(abc.ABC):
     """ Base class for writing OMEX Metadata files """
 
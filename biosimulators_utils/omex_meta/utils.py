@@ -7,12 +7,23 @@
 """
 
 from .data_model import OmexMetadataOutputFormat
+import concurrent.futures
+import concurrent.futures.process
+import multiprocessing
 import os
 import pyomexmeta
-import subprocess
-import sys
+import threading
 
-__all__ = ['build_omex_meta_file_for_model', 'get_local_combine_archive_content_uri', 'get_global_combine_archive_content_uri']
+__all__ = [
+    'build_omex_meta_file_for_model',
+    'get_omex_meta_file_builder',
+    'shutdown_omex_meta_file_builder',
+    'get_local_combine_archive_content_uri',
+    'get_global_combine_archive_content_uri',
+]
+
+_OMEX_META_FILE_BUILDER = None
+_OMEX_META_FILE_BUILDER_LOCK = threading.RLock()
 
 
 def build_omex_meta_file_for_model(model_filename,
@@ -27,8 +38,9 @@ def build_omex_meta_file_for_model(model_filename,
         metadata_filename (:obj:`str`): path to save metadata
         metadata_format (:obj:`OmexMetadataOutputFormat`, optional): format for :obj:`metadata_filename`
         encoding (:obj:`str`, optional): encoding (e.g., ``utf-8``)
+        archive_uri (:obj:`str`, optional): URI for the parent COMBINE/OMEX archive
     """
-    # uses subprocess because pyomexmeta has insufficient error handling
+    # uses a separate process because pyomexmeta has insufficient error handling
     if not isinstance(model_filename, str) or not os.path.isfile(model_filename):
         raise FileNotFoundError('`{}` is not a file.'.format(model_filename))
 
@@ -41,62 +53,58 @@ def build_omex_meta_file_for_model(model_filename,
     # TODO: uncomment and delete below once pyomexmeta has better error handling
     # _build_omex_meta_file_for_model(model_filename, metadata_filename, metadata_format.value, encoding, archive_uri)
 
-    if archive_uri:
-        process = subprocess.run(
-            [
-                sys.executable, '-c',
-                'from {} import {}; {}("{}", "{}", "{}", "{}", "{}")'.format(
-                    _build_omex_meta_file_for_model_error_wrapper.__module__,
-                    _build_omex_meta_file_for_model_error_wrapper.__name__,
-                    _build_omex_meta_file_for_model_error_wrapper.__name__,
-                    model_filename.replace('"', '\\"'),
-                    metadata_filename.replace('"', '\\"'),
-                    metadata_format.value.replace('"', '\\"'),
-                    encoding.replace('"', '\\"'),
-                    archive_uri.replace('"', '\\"'),
-                )
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True)
-        if process.returncode != 0:
-            raise RuntimeError(process.stderr or 'Model `{}` could not be read'.format(model_filename))
-    else:
-        process = subprocess.run(
-            [
-                sys.executable, '-c',
-                'from {} import {}; {}("{}", "{}", "{}", "{}")'.format(
-                    _build_omex_meta_file_for_model_error_wrapper.__module__,
-                    _build_omex_meta_file_for_model_error_wrapper.__name__,
-                    _build_omex_meta_file_for_model_error_wrapper.__name__,
-                    model_filename.replace('"', '\\"'),
-                    metadata_filename.replace('"', '\\"'),
-                    metadata_format.value.replace('"', '\\"'),
-                    encoding.replace('"', '\\"'),
-                )
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True)
-        if process.returncode != 0:
-            raise RuntimeError(process.stderr or 'Model `{}` could not be read'.format(model_filename))
-
-
-def _build_omex_meta_file_for_model_error_wrapper(model_filename, metadata_filename,
-                                                  metadata_format=OmexMetadataOutputFormat.rdfxml_abbrev.value,
-                                                  encoding='utf-8', archive_uri=None):
-    """ Wrapper for ``_build_omex_meta_file_for_model``
+    args = (model_filename, metadata_filename, metadata_format.value, encoding, archive_uri)
+    try:
+        with _OMEX_META_FILE_BUILDER_LOCK:
+            executor = get_omex_meta_file_builder()
+            try:
+                future = executor.submit(_build_omex_meta_file_for_model, *args)
+            except concurrent.futures.process.BrokenProcessPool:
+                # the worker crashed during an earlier job; replace it
+                shutdown_omex_meta_file_builder(executor)
+                executor = get_omex_meta_file_builder()
+                future = executor.submit(_build_omex_meta_file_for_model, *args)
+
+        future.result()
+    except concurrent.futures.process.BrokenProcessPool:
+        # the worker crashed (e.g., segmentation fault in libOmexMeta); discard it so that the next job gets a new worker
+        shutdown_omex_meta_file_builder(executor)
+        raise RuntimeError('Model `{}` could not be read'.format(model_filename))
+    except Exception as exception:
+        raise RuntimeError(str(exception) or 'Model `{}` could not be read'.format(model_filename)) from exception
+
+
+def get_omex_meta_file_builder():
+    """ Get the persistent worker process which builds OMEX metadata files
+
+    Metadata is extracted in a separate process because pyomexmeta has insufficient error handling (e.g., it can
+    crash the interpreter). The process is reused across models so that pyomexmeta is only imported once.
+
+    Returns:
+        :obj:`concurrent.futures.ProcessPoolExecutor`: worker process
+    """
+    global _OMEX_META_FILE_BUILDER
+
+    if _OMEX_META_FILE_BUILDER is None:
+        _OMEX_META_FILE_BUILDER = concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+
+    return _OMEX_META_FILE_BUILDER
+
+
+def shutdown_omex_meta_file_builder(executor=None):
+    """ Shut down the persistent worker process which builds OMEX metadata files
 
     Args:
-        model_filename (:obj:`str`): path to model to extract metadata about
-        metadata_filename (:obj:`str`): path to save metadata
-        metadata_format (:obj:`str`, optional): format for :obj:`metadata_filename`
-        encoding (:obj:`str`, optional): encoding (e.g., ``utf-8``)
+        executor (:obj:`concurrent.futures.ProcessPoolExecutor`, optional): worker process to shut down; if provided,
+            the current worker is only discarded if it is this worker
     """
-    try:
-        _build_omex_meta_file_for_model(model_filename, metadata_filename, metadata_format, encoding, archive_uri)
-    except (ValueError, RuntimeError) as exception:
-        raise SystemExit(str(exception))
+    global _OMEX_META_FILE_BUILDER
+
+    with _OMEX_META_FILE_BUILDER_LOCK:
+        if _OMEX_META_FILE_BUILDER is not None and executor in [None, _OMEX_META_FILE_BUILDER]:
+            _OMEX_META_FILE_BUILDER.shutdown(wait=True)
+            _OMEX_META_FILE_BUILDER = None
 
 
 def _build_omex_meta_file_for_model(model_filename, metadata_filename,
@@ -7,7 +7,7 @@
 """
 
 from ..combine.data_model import CombineArchiveContentFormatPattern
-from ..utils.identifiers_org import validate_identifiers_org_uri, InvalidIdentifiersOrgUri
+from ..utils.identifiers_org import validate_identifiers_org_uri, validate_identifiers_org_uris, InvalidIdentifiersOrgUri
 from .data_model import BIOSIMULATIONS_PREDICATE_TYPES, BIOSIMULATIONS_THUMBNAIL_FORMATS
 from .utils import get_global_combine_archive_content_uri
 import dateutil.parser
@@ -20,6 +20,8 @@ __all__ = [
     'validate_biosimulations_metadata_for_uri',
 ]
 
+IDENTIFIERS_ORG_URI_PATTERN = re.compile(r'^https?://identifiers\.org/(([^/:]+/[^/:]+|[^/:]+)[/:](.+))$')
+
 
 def validate_biosimulations_metadata(metadata, archive=None, working_dir=None):
     """ Validate BioSimulations metadata for a COMBINE/OMEX archive
@@ -38,13 +40,21 @@ def validate_biosimulations_metadata(metadata, archive=None, working_dir=None):
     errors = []
     warnings = []
 
+    # validate all of the Identifiers.org URIs together
+    identifiers_org_uri_errors = validate_identifiers_org_uris(
+        uri
+        for el_metadata in metadata
+        for uri in get_identifiers_org_uris_for_uri(el_metadata)
+    )
+
     has_archive_metadata = False
     for el_metadata in metadata:
         el_is_archive = el_metadata['uri'] == '.' and el_metadata['combine_archive_uri']
         has_archive_metadata = has_archive_metadata or el_is_archive
 
         temp_errors, temp_warnings = validate_biosimulations_metadata_for_uri(
-            el_metadata, validate_minimal_metadata=el_is_archive, archive=archive, working_dir=working_dir)
+            el_metadata, validate_minimal_metadata=el_is_archive, archive=archive, working_dir=working_dir,
+            identifiers_org_uri_errors=identifiers_org_uri_errors)
 
         if temp_errors:
             el_uri = get_global_combine_archive_content_uri(el_metadata['uri'], el_metadata['combine_archive_uri'])
@@ -66,7 +76,8 @@ def validate_biosimulations_metadata(metadata, archive=None, working_dir=None):
     return errors, warnings
 
 
-def validate_biosimulations_metadata_for_uri(metadata, validate_minimal_metadata=False, archive=None, working_dir=None):
+def validate_biosimulations_metadata_for_uri(metadata, validate_minimal_metadata=False, archive=None, working_dir=None,
+                                             identifiers_org_uri_errors=None):
     """ Validate BioSimulations metadata for a file in a COMBINE/OMEX archive
 
     Args:
@@ -75,6 +86,9 @@ def validate_biosimulations_metadata_for_uri(metadata, validate_minimal_metadata
             are defined
         archive (:obj:`CombineArchive`, optional): parent COMBINE archive
         working_dir (:obj:`str`, optional): working directory (e.g., directory of the parent COMBINE/OMEX archive)
+        identifiers_org_uri_errors (:obj:`dict`, optional): dictionary that maps Identifiers.org URIs which have already
+            been validated to :obj:`None` or to the :obj:`InvalidIdentifiersOrgUri` which describes why they are invalid
+            (see :obj:`validate_identifiers_org_uris`)
 
     Returns:
         :obj:`tuple`:
@@ -110,10 +124,13 @@ def validate_biosimulations_metadata_for_uri(metadata, validate_minimal_metadata
                         errors.append(['URI `{}` of attribute `{}` ({}) is not a valid URI.'.format(
                             object['uri'], predicate_type['attribute'], predicate_type['uri'])])
                     else:
-                        match = re.match(r'^https?://identifiers\.org/(([^/:]+/[^/:]+|[^/:]+)[/:](.+))$', object['uri'])
-                        if match:
+                        if IDENTIFIERS_ORG_URI_PATTERN.match(object['uri']):
                             try:
-                                validate_identifiers_org_uri(object['uri'])
+                                if identifiers_org_uri_errors is not None and object['uri'] in identifiers_org_uri_errors:
+                                    if identifiers_org_uri_errors[object['uri']]:
+                                        raise identifiers_org_uri_errors[object['uri']]
+                                else:
+                                    validate_identifiers_org_uri(object['uri'])
                             except InvalidIdentifiersOrgUri as exception:
                                 msg = (
                                     'URI `{}` of attribute `{}` ({}) is not a valid Identifiers.org identifier.'
@@ -165,3 +182,26 @@ def validate_biosimulations_metadata_for_uri(metadata, validate_minimal_metadata
 
     # return errors and warnings
     return (errors, warnings)
+
+
+def get_identifiers_org_uris_for_uri(metadata):
+    """ Get the Identifiers.org URIs in the BioSimulations metadata for a file in a COMBINE/OMEX archive
+
+    Args:
+        metadata (:obj:`dict`): BioSimulations metadata
+
+    Returns:
+        :obj:`list` of :obj:`str`: Identifiers.org URIs
+    """
+    uris = []
+    for predicate_type in BIOSIMULATIONS_PREDICATE_TYPES.values():
+        if predicate_type['has_uri'] and predicate_type['has_label']:
+            if predicate_type['multiple_allowed']:
+                objects = metadata[predicate_type['attribute']]
+            else:
+                objects = [metadata[predicate_type['attribute']]]
+
+            for object in objects:
+                if object and object['uri'] and uritools.isuri(object['uri']) and IDENTIFIERS_ORG_URI_PATTERN.match(object['uri']):
+                    uris.append(object['uri'])
+    return uris
@@ -9,6 +9,7 @@
 from ..config import get_config
 from ..sedml.data_model import Output, Report, Plot2D, Plot3D  # noqa: F401
 from ..utils.core import pad_arrays_to_consistent_shapes
+from ..utils.output_manifest import register_output_file
 from ..warnings import warn
 from .data_model import DataSetResults, ReportFormat
 from .warnings import (RepeatDataSetLabelsWarning, MissingReportMetadataWarning, MissingDataWarning,
@@ -109,6 +110,7 @@ class ReportWriter(object):
                     os.makedirs(out_dir)
 
                 results_df.to_csv(filename, header=False, sep=',' if format == ReportFormat.csv else '\t')
+                register_output_file(filename)
             else:
                 filename = os.path.join(base_path, os.path.dirname(rel_path) + '.' + format.value)
                 out_dir = os.path.dirname(filename)
@@ -117,6 +119,7 @@ class ReportWriter(object):
 
                 with pandas.ExcelWriter(filename, mode='a' if os.path.isfile(filename) else 'w', engine='openpyxl') as writer:
                     results_df.to_excel(writer, sheet_name=os.path.basename(rel_path), header=False)
+                register_output_file(filename)
 
         elif format == ReportFormat.h5:
             filename = os.path.join(base_path, get_config().H5_REPORTS_PATH)
@@ -153,6 +156,8 @@ class ReportWriter(object):
                     group.attrs['uri'] = uri
                     group.attrs['combineArchiveLocation'] = uri
 
+            register_output_file(filename)
+
         else:
             raise NotImplementedError('Report format {} is not supported'.format(format))
 
@@ -7,7 +7,7 @@
 """
 
 from ..biosimulations.data_model import Metadata  # noqa: F401
-from ..utils.core import are_lists_equal, none_sorted
+from ..utils.core import are_lists_equal, none_sorted, memoize_to_tuple
 import abc
 import enum
 
@@ -144,7 +144,23 @@ class Symbol(str, enum.Enum):
 
 
 class SedBase(abc.ABC):
-    """ Base class for SED classes """
+    """ Base class for SED classes
+
+    The attributes of SED classes are stored in slots. Instances also support weak references, and attributes
+    which are not declared by their classes (e.g., attached by downstream code) are stored in a dictionary which is
+    only created once such an attribute is set.
+    """
+
+    __slots__ = ('__dict__', '__weakref__')
+
+    def __init_subclass__(cls, **kwargs):
+        """ Memoize the tuple representations of instances of subclasses within
+        :obj:`~biosimulators_utils.utils.core.memoize_structures` (e.g., during comparisons of SED documents)
+        """
+        super().__init_subclass__(**kwargs)
+        if 'to_tuple' in cls.__dict__:
+            cls.to_tuple = memoize_to_tuple(cls.__dict__['to_tuple'])
+
     @abc.abstractmethod
     def to_tuple(self):
         """ Get a tuple representation
@@ -174,6 +190,8 @@ class SedIdGroupMixin(abc.ABC):
         name (:obj:`str`): name
     """
 
+    __slots__ = ()
+
     def __init__(self, id: str = None, name: str = None):
         """
         Args:
@@ -205,6 +223,8 @@ class TargetGroupMixin(abc.ABC):
         target_namespaces (:obj:`dict`): map of prefixes of namespaces for the target to their URIs
     """
 
+    __slots__ = ()
+
     def __init__(self, target=None, target_namespaces=None):
         """
         Args:
@@ -242,6 +262,8 @@ class SedDocument(SedBase):
         metadata (:obj:`Metadata`): metadata
     """
 
+    __slots__ = ('level', 'version', 'models', 'simulations', 'tasks', 'data_generators', 'outputs', 'styles', 'metadata')
+
     def __init__(self, level: int = 1, version: int = 3, models: "list[Model]" = None,
                  simulations: "list[Simulation]" = None, tasks: "list[AbstractTask]" = None,
                  data_generators: "list[DataGenerator]" = None, outputs: "list[Output]" = None,
@@ -318,6 +340,8 @@ class Simulation(SedBase, SedIdGroupMixin):
         algorithm (:obj:`Algorithm`): algorithm
     """
 
+    __slots__ = ('id', 'name', 'algorithm')
+
     def __init__(self, id: str = None, name: str = None, algorithm: "Algorithm" = None):
         """
         Args:
@@ -353,6 +377,8 @@ class SteadyStateSimulation(Simulation):
         algorithm (:obj:`Algorithm`): algorithm
     """
 
+    __slots__ = ()
+
     def to_tuple(self):
         """ Get a tuple representation
 
@@ -372,6 +398,8 @@ class OneStepSimulation(Simulation):
         step (:obj:`float`): step
     """
 
+    __slots__ = ('step',)
+
     def __init__(self, id: str = None, name: str = None, algorithm: "Algorithm" = None, step: float = None):
         """
         Args:
@@ -417,6 +445,8 @@ class UniformTimeCourseSimulation(Simulation):
         number_of_steps (:obj:`int`): number of time steps
     """
 
+    __slots__ = ('initial_time', 'output_start_time', 'output_end_time', 'number_of_steps')
+
     def __init__(self, id: str = None, name: str = None, algorithm: "Algorithm" = None,
                  initial_time: float = None, output_start_time: float = None, output_end_time: float = None,
                  number_of_steps: int = None, number_of_points: int = None):
@@ -480,6 +510,8 @@ class Algorithm(SedBase):
         changes (:obj:`list` of :obj:`AlgorithmParameterChange`): parameter changes
     """
 
+    __slots__ = ('kisao_id', 'changes')
+
     def __init__(self, kisao_id: str = None, changes: "list[AlgorithmParameterChange]" = None):
         """
         Args:
@@ -522,6 +554,8 @@ class AlgorithmParameterChange(SedBase):
         new_value (:obj:`str`): new value
     """
 
+    __slots__ = ('kisao_id', 'new_value')
+
     def __init__(self, kisao_id: str = None, new_value: str = None):
         """
         Args:
@@ -565,6 +599,8 @@ class Model(SedBase, SedIdGroupMixin):
         changes (:obj:`list` of :obj:`ModelChange`): model changes
     """
 
+    __slots__ = ('id', 'name', 'source', 'language', 'changes')
+
     def __init__(self, id: str = None, name: str = None, source: str = None,
                  language: str = None, changes: "list[ModelChange]" = None):
         """
@@ -631,6 +667,8 @@ class ModelChange(SedBase, SedIdGroupMixin, TargetGroupMixin):
         target_namespaces (:obj:`dict`): map of prefixes of namespaces for the target to their URIs
     """
 
+    __slots__ = ('id', 'name', 'target', 'target_namespaces')
+
     def __init__(self, id: str = None, name: str = None, target: str = None, target_namespaces: dict = None):
         """
         Args:
@@ -668,6 +706,9 @@ class ModelAttributeChange(ModelChange):
         new_value (:obj:`str`): new value
     """
 
+    # ``model`` is also set when the change is deferred to the simulation tool (see :obj:`sedml.utils.apply_changes_to_xml_model`)
+    __slots__ = ('new_value', 'model')
+
     def __init__(self, id: str = None, name: str = None, target: str = None,
                  target_namespaces: dict = None, new_value: str = None):
         """
@@ -713,6 +754,8 @@ class AddElementModelChange(ModelChange):
         new_elements (:obj:`str`): new element(s)
     """
 
+    __slots__ = ('new_elements',)
+
     def __init__(self, id: str = None, name: str = None, target: str = None,
                  target_namespaces: dict = None, new_elements: str = None):
         """
@@ -758,6 +801,8 @@ class ReplaceElementModelChange(ModelChange):
         new_elements (:obj:`str`): new element(s)
     """
 
+    __slots__ = ('new_elements',)
+
     def __init__(self, id: str = None, name: str = None, target: str = None,
                  target_namespaces: dict = None, new_elements: str = None):
         """
@@ -801,6 +846,8 @@ class RemoveElementModelChange(ModelChange):
         target (:obj:`str`): path to the element to remove
     """
 
+    __slots__ = ()
+
     def to_tuple(self):
         """ Get a tuple representation
 
@@ -819,6 +866,8 @@ class Calculation(SedBase):
         math (:obj:`str`): mathematical expression
     """
 
+    __slots__ = ()
+
     def __init__(self, variables: "list[Variable]" = None, parameters: "list[Parameter]" = None, math: str = None):
         """
         Args:
@@ -859,6 +908,10 @@ class ComputeModelChange(ModelChange, Calculation):
         math (:obj:`str`): mathematical expression
     """
 
+    # ``model`` and ``new_value`` are also set when the change is deferred to the simulation tool
+    # (see :obj:`sedml.utils.apply_changes_to_xml_model`)
+    __slots__ = ('variables', 'parameters', 'math', 'model', 'new_value')
+
     def __init__(self, id: str = None, name: str = None, target: str = None, target_namespaces: dict = None,
                  variables: "list[Variable]" = None, parameters: "list[Parameter]" = None, math: str = None):
         """
@@ -914,6 +967,8 @@ class SetValueComputeModelChange(ComputeModelChange, Calculation):
         symbol (:obj:`str`): symbol
     """
 
+    __slots__ = ('range', 'symbol')
+
     def __init__(self, id: str = None, name: str = None, target: str = None, target_namespaces: dict = None,
                  variables: "list[Variable]" = None, parameters: "list[Parameter]" = None, math: str = None,
                  model: Model = None, range: "Range" = None, symbol: str = None):
@@ -977,6 +1032,8 @@ class AbstractTask(SedBase, SedIdGroupMixin):
         name (:obj:`str`): name
     """
 
+    __slots__ = ('id', 'name')
+
     def __init__(self, id: str = None, name: str = None):
         """
         Args:
@@ -1009,6 +1066,8 @@ class Task(AbstractTask):
         simulation (:obj:`Simulation`): simulation
     """
 
+    __slots__ = ('model', 'simulation')
+
     def __init__(self, id: str = None, name: str = None, model: Model = None, simulation: Simulation = None):
         """
         Args:
@@ -1060,6 +1119,8 @@ class RepeatedTask(AbstractTask):
         ranges (:obj:`list` of :obj:`Range`): ranges
     """
 
+    __slots__ = ('range', 'reset_model_for_each_iteration', 'changes', 'sub_tasks', 'ranges')
+
     def __init__(self, id: str = None, name: str = None, range: "Range" = None,
                  reset_model_for_each_iteration: bool = None, changes: "list[SetValueComputeModelChange]" = None,
                  sub_tasks: "list[SubTask]" = None, ranges: "list[Range]" = None):
@@ -1120,6 +1181,8 @@ class SubTask(SedBase):
         order (:obj:`int`): order in which the subtask should be executed
     """
 
+    __slots__ = ('task', 'order')
+
     def __init__(self, task: AbstractTask = None, order: int = None):
         """
         Args:
@@ -1163,6 +1226,8 @@ class Range(SedBase, SedIdGroupMixin):
         name (:obj:`str`, optional): name
     """
 
+    __slots__ = ('id', 'name')
+
     def __init__(self, id: str = None, name: str = None):
         """
         Args:
@@ -1203,6 +1268,8 @@ class UniformRange(Range):
         type (:obj:`UniformRangeType`): type
     """
 
+    __slots__ = ('start', 'end', 'number_of_steps', 'type')
+
     def __init__(self, id: str = None, name: str = None, start: float = None, end: float = None,
                  number_of_steps: int = None, number_of_points: int = None, type: UniformRangeType = None):
         """
@@ -1264,6 +1331,8 @@ class VectorRange(Range):
         values (:obj:`list` of :obj:`float`): values
     """
 
+    __slots__ = ('values',)
+
     def __init__(self, id: str = None, name: str = None, values: "list[float]" = None):
         """
         Args:
@@ -1307,6 +1376,8 @@ class FunctionalRange(Range, Calculation):
         math (:obj:`str`): mathematical expression
     """
 
+    __slots__ = ('range', 'variables', 'parameters', 'math')
+
     def __init__(self, id: str = None, name: str = None, range: Range = None, variables: "list[Variable]" = None,
                  parameters: "list[Parameter]" = None, math: str = None):
         """
@@ -1360,6 +1431,8 @@ class DataGenerator(Calculation, SedIdGroupMixin):
         math (:obj:`str`): mathematical expression
     """
 
+    __slots__ = ('id', 'name', 'variables', 'parameters', 'math')
+
     def __init__(self, id: str = None, name: str = None, variables: "list[Variable]" = None,
                  parameters: "list[Parameter]" = None, math: str = None):
         """
@@ -1411,6 +1484,8 @@ class Variable(SedBase, SedIdGroupMixin):
         model (:obj:`Model`): model
     """
 
+    __slots__ = ('id', 'name', 'target', 'target_namespaces', 'symbol', 'task', 'model')
+
     def __init__(self, id: str = None, name: str = None, target: str = None, target_namespaces: dict = None,
                  symbol: str = None, task: AbstractTask = None, model: Model = None):
         """
@@ -1468,6 +1543,8 @@ class Parameter(SedBase, SedIdGroupMixin):
         value (:obj:`float`): value
     """
 
+    __slots__ = ('id', 'name', 'value')
+
     def __init__(self, id: str = None, name: str = None, value: float = None):
         """
         Args:
@@ -1509,6 +1586,8 @@ class Output(SedBase, SedIdGroupMixin):
         name (:obj:`str`): name
     """
 
+    __slots__ = ('id', 'name')
+
     def __init__(self, id: str = None, name: str = None):
         """
         Args:
@@ -1540,6 +1619,8 @@ class Report(Output):
         data_sets (:obj:`list` of :obj:`DataSet`): data sets
     """
 
+    __slots__ = ('data_sets',)
+
     def __init__(self, id: str = None, name: str = None, data_sets: "list[DataSet]" = None):
         """
         Args:
@@ -1582,6 +1663,8 @@ class DataSet(SedBase, SedIdGroupMixin):
         data_generator (:obj:`DataGenerator`): data generator
     """
 
+    __slots__ = ('id', 'name', 'label', 'data_generator')
+
     def __init__(self, id: str = None, name: str = None, label: str = None, data_generator: DataGenerator = None):
         """
         Args:
@@ -1629,7 +1712,8 @@ class Plot(Output):
         id (:obj:`str`): id
         name (:obj:`str`): name
     """
-    pass  # pragma: no cover
+
+    __slots__ = ()
 
 
 class Plot2D(Plot):
@@ -1641,6 +1725,8 @@ class Plot2D(Plot):
         curves (:obj:`list` of :obj:`Curve`): curves
     """
 
+    __slots__ = ('curves',)
+
     def __init__(self, id: str = None, name: str = None, curves: "list[Curve]" = None):
         """
         Args:
@@ -1685,6 +1771,8 @@ class Plot3D(Plot):
         surfaces (:obj:`list` of :obj:`Surface`): surfaces
     """
 
+    __slots__ = ('surfaces',)
+
     def __init__(self, id: str = None, name: str = None, surfaces: "list[Surface]" = None):
         """
         Args:
@@ -1750,6 +1838,8 @@ class LineStyle(SedBase):
         thickness (:obj:`float`): type
     """
 
+    __slots__ = ('type', 'color', 'thickness')
+
     def __init__(self, type: LineStyleType = None, color: Color = None, thickness: float = None):
         """
         Args:
@@ -1813,6 +1903,8 @@ class MarkerStyle(SedBase):
         line_thickness (:obj:`float`): line thickness
     """
 
+    __slots__ = ('type', 'size', 'fill_color', 'line_color', 'line_thickness')
+
     def __init__(self, type: MarkerStyleType = None, size: float = None,
                  fill_color: Color = None, line_color: Color = None,
                  line_thickness: float = None):
@@ -1863,6 +1955,8 @@ class FillStyle(SedBase):
         color (:obj:`Color`): color
     """
 
+    __slots__ = ('color',)
+
     def __init__(self, color: Color = None):
         """
         Args:
@@ -1904,6 +1998,8 @@ class Style(SedBase, SedIdGroupMixin):
         fill (:obj:`FillStyle`): fill style
     """
 
+    __slots__ = ('id', 'name', 'base', 'line', 'marker', 'fill')
+
     def __init__(self, id: str = None, name: str = None, base: 'Style' = None,
                  line: LineStyle = None, marker: MarkerStyle = None, fill: FillStyle = None):
         """
@@ -1970,6 +2066,10 @@ class Curve(SedBase, SedIdGroupMixin):
         style (:obj:`Style`): graphical style
     """
 
+    # ``label`` is also set when outputs are expanded into elements for individual variables
+    # (see :obj:`sedml.utils.replace_complex_data_generators_with_generators_for_individual_variables`)
+    __slots__ = ('id', 'name', 'x_scale', 'y_scale', 'x_data_generator', 'y_data_generator', 'style', 'label')
+
     def __init__(self, id: str = None, name: str = None, x_scale: AxisScale = None, y_scale: AxisScale = None,
                  x_data_generator: DataGenerator = None, y_data_generator: DataGenerator = None, style: Style = None):
         """
@@ -2047,6 +2147,13 @@ class Surface(SedBase, SedIdGroupMixin):
         style (:obj:`Style`): graphical style
     """
 
+    # ``label`` is also set when outputs are expanded into elements for individual variables
+    # (see :obj:`sedml.utils.replace_complex_data_generators_with_generators_for_individual_variables`)
+    __slots__ = (
+        'id', 'name', 'x_scale', 'y_scale', 'z_scale', 'x_data_generator', 'y_data_generator', 'z_data_generator',
+        'style', 'label',
+    )
+
     def __init__(self, id: str = None, name: str = None, x_scale: AxisScale = None, y_scale: AxisScale = None,
                  z_scale: AxisScale = None, x_data_generator: DataGenerator = None,
                  y_data_generator: DataGenerator = None, z_data_generator: DataGenerator = None, style: Style = None):
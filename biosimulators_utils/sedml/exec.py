@@ -20,11 +20,13 @@ from .data_model import SedDocument, Model, Task, RepeatedTask, Output, Report,
     DataSet  # noqa: F401
 from .exceptions import SedmlExecutionError
 from .io import SedmlSimulationReader
+from .results_cache import get_simulation_results_cache
 from .utils import (resolve_model_and_apply_xml_changes, get_variables_for_task, is_executable_task,
                     calc_data_generators_results, resolve_range, get_models_referenced_by_task,
                     get_value_of_variable_model_xml_targets, calc_compute_model_change_new_value,
                     apply_changes_to_xml_model, get_first_last_models_executed_by_task,
-                    is_model_language_encoded_in_xml)
+                    is_model_language_encoded_in_xml, get_remote_model_cache, prefetch_remote_models,
+                    ModelOverlay)
 from .warnings import NoTasksWarning, NoOutputsWarning, SedmlFeatureNotSupportedWarning
 from lxml import etree  # noqa: F401
 import copy
@@ -54,7 +56,7 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
                  log=None, indent=0, pretty_print_modified_xml_models=False,
                  log_level=StandardOutputErrorCapturerLevel.c,
                  config=None, get_value_executer=None, set_value_executer=None, preprocessed_task_executer=None,
-                 reset_executer=None):
+                 reset_executer=None, remote_model_cache=None):
     """ Execute the tasks specified in a SED document and generate the specified outputs
 
     Args:
@@ -97,6 +99,8 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
         pretty_print_modified_xml_models (:obj:`bool`, optional): if :obj:`True`, pretty print modified XML models
         log_level (:obj:`StandardOutputErrorCapturerLevel`, optional): level at which to log output
         config (:obj:`Config`): configuration
+        remote_model_cache (:obj:`HttpCache`, optional): cache of models downloaded from URLs and BioModels (e.g., shared
+            by the SED documents of an archive). Default: a new cache (see :obj:`get_remote_model_cache`).
 
     Returns:
         :obj:`tuple`:
@@ -127,8 +131,6 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
         # process arguments
         if not isinstance(doc, SedDocument):
             doc = SedmlSimulationReader().run(doc, config=config)
-        else:
-            doc = copy.deepcopy(doc)
 
         if config.LOG and not log:
             log = init_sed_document_log(doc)
@@ -165,6 +167,11 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
             ' ' * 2 * (indent + 2),
             ('\n' + ' ' * 2 * (indent + 2)).join(sorted('`' + output.id + '`' for output in doc.outputs)),
         ))
+        # models referenced by URLs are downloaded concurrently before the tasks are executed, and at most once per cache
+        if remote_model_cache is None:
+            remote_model_cache = get_remote_model_cache(config)
+        prefetch_remote_models(doc, remote_model_cache)
+
         for i_task in range(0, len(expected_tasks)):
             task = expected_tasks[i_task]
             task_status = Status.QUEUED
@@ -181,13 +188,18 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
             # Execute task
             print('{}Executing simulation ...'.format(' ' * 2 * (indent + 1)), end='')
             sys.stdout.flush()
-            with StandardOutputErrorCapturer(relay=verbose, level=log_level, disabled=not config.LOG) as captured:
+            with StandardOutputErrorCapturer(relay=verbose, level=log_level, disabled=not config.LOG,
+                                             max_size=config.LOG_MAX_OUTPUT_SIZE) as captured:
                 start_time = datetime.datetime.now()
+                model_overlay = ModelOverlay()
+                # iterations whose values are set through the simulator cannot be memoized because their changes are not
+                # reflected in the models
+                results_cache = get_simulation_results_cache(config) \
+                    if (config.MEMOIZE_SIMULATION_RESULTS or config.CACHE_SIMULATION_RESULTS) and not set_value_executer else None
+                cache_hits_before = results_cache.get_stats()[0] if results_cache else None
                 try:
                     # get model and apply changes
                     original_models = get_models_referenced_by_task(task)
-                    original_model_sources = {}
-                    original_model_changes = {}
                     temp_model_sources = []
                     model_etrees = {}
                     preprocessed_task = None
@@ -200,18 +212,15 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
                                                                            config=config)
 
                     for original_model in original_models:
-                        original_model_sources[original_model.id] = original_model.source
-                        original_model_changes[original_model.id] = original_model.changes
-
                         temp_model, temp_model_source, model_etree, preprocessed_task = resolve_model_and_apply_xml_changes(
                             original_model, doc, working_dir,
                             apply_xml_model_changes=apply_xml_model_changes,
                             pretty_print_modified_xml_models=pretty_print_modified_xml_models,
                             set_value_executer=set_value_executer,
-                            preprocessed_task_sub_executer=preprocessed_task_sub_executer)
+                            preprocessed_task_sub_executer=preprocessed_task_sub_executer,
+                            remote_model_cache=remote_model_cache)
 
-                        original_model.source = temp_model.source
-                        original_model.changes = temp_model.changes
+                        model_overlay.set(original_model, temp_model.source, temp_model.changes)
 
                         if temp_model_source:
                             temp_model_sources.append(temp_model_source)
@@ -225,7 +234,8 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
                     # execute task
                     if isinstance(task, Task):
                         task_var_results = exec_task(task, task_executer, task_vars, doc,
-                                                     preprocessed_task=preprocessed_task, log=task_log, config=config)
+                                                     preprocessed_task=preprocessed_task, log=task_log, config=config,
+                                                     results_cache=results_cache)
 
                     elif isinstance(task, RepeatedTask):
                         task_var_results = exec_repeated_task(task, task_executer, task_vars, doc,
@@ -235,7 +245,9 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
                                                               config=config, preprocessed_task=preprocessed_task,
                                                               get_value_executer=get_value_executer,
                                                               set_value_executer=set_value_executer,
-                                                              reset_executer=reset_executer)
+                                                              reset_executer=reset_executer,
+                                                              model_overlay=model_overlay,
+                                                              results_cache=results_cache)
 
                     else:  # pragma: no cover: already validated by :obj:`get_models_referenced_by_task`
                         raise NotImplementedError('Tasks of type {} are not supported.'.format(task.__class__.__name__))
@@ -251,17 +263,19 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
                     # cleanup modified model sources
                     for temp_model_source in temp_model_sources:
                         os.remove(temp_model_source)
-                    for original_model in original_models:
-                        original_model.source = original_model_sources[original_model.id]
-                        original_model.changes = original_model_changes[original_model.id]
                 except Exception as exception:
                     if config.DEBUG:
                         raise
                     exceptions.append(exception)
                     task_status = Status.FAILED
                     task_exception = exception
+                finally:
+                    # restore the original sources and changes of the models
+                    model_overlay.revert()
 
             if config.LOG:
+                if results_cache:
+                    task_log.cache_hits = results_cache.get_stats()[0] - cache_hits_before
                 task_log.status = task_status
                 task_log.exception = task_exception
                 task_log.output = captured.get_text()
@@ -282,7 +296,8 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
                       end='')
                 sys.stdout.flush()
                 start_time = datetime.datetime.now()
-                with StandardOutputErrorCapturer(relay=verbose, level=log_level, disabled=not config.LOG) as captured:
+                with StandardOutputErrorCapturer(relay=verbose, level=log_level, disabled=not config.LOG,
+                                                 max_size=config.LOG_MAX_OUTPUT_SIZE) as captured:
                     try:
                         if config.LOG and log.outputs[output.id].status == Status.SUCCEEDED:
                             output_status = log.outputs[output.id].status
@@ -413,11 +428,15 @@ def exec_sed_doc(task_executer, doc, working_dir, base_out_path, rel_out_path=No
             '\n\n  '.join(str(exception.__class__) + ":" + str(exception).replace('\n', '\n  ')
                           for exception in exceptions))
         raise SedmlExecutionError(msg)
+    finally:
+        # write the updates of the log which have been batched
+        if log:
+            log.flush()
     # return the results of the reports
     return report_results, log
 
 
-def exec_task(task, task_executer, task_vars, doc, log=None, config=None, preprocessed_task=None):
+def exec_task(task, task_executer, task_vars, doc, log=None, config=None, preprocessed_task=None, results_cache=None):
     """ Execute a basic SED task
 
     Args:
@@ -450,13 +469,27 @@ def exec_task(task, task_executer, task_vars, doc, log=None, config=None, prepro
         doc (:obj:`SedDocument` or :obj:`str`): SED document or a path to SED-ML file which defines a SED document
         log (:obj:`TaskLog`, optional): log
         config (:obj:`Config`, optional): BioSimulators common configuration
+        results_cache (:obj:`SimulationResultsCache`, optional): cache of the results of deterministic simulations. If provided,
+            the results of the task are reused if the same simulation was executed before.
 
     Returns:
         :obj:`VariableResults`: results of the variables
     """
+    # get memoized results
+    results_key = None
+    task_variable_results = None
+    if results_cache is not None:
+        results_key = results_cache.get_key(task, task_vars, task_executer=task_executer, config=config)
+        if results_key is not None:
+            task_variable_results = results_cache.get(results_key, task_vars)
+
     # execute task
-    task_variable_results, _ = task_executer(task, task_vars, log=log, config=config,
-                                             preprocessed_task=preprocessed_task)
+    if task_variable_results is None:
+        task_variable_results, _ = task_executer(task, task_vars, log=log, config=config,
+                                                 preprocessed_task=preprocessed_task)
+
+        if results_key is not None:
+            results_cache.set(results_key, task_vars, task_variable_results)
 
     # check that the expected variables were recorded
     variable_results = VariableResults()
@@ -470,7 +503,7 @@ def exec_task(task, task_executer, task_vars, doc, log=None, config=None, prepro
 def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_changes=False, model_etrees=None,
                        pretty_print_modified_xml_models=False, config=None, preprocessed_task=None,
                        get_value_executer=None,
-                       set_value_executer=None, reset_executer=None):
+                       set_value_executer=None, reset_executer=None, model_overlay=None, results_cache=None):
     """ Execute a repeated SED task
 
     Args:
@@ -503,10 +536,30 @@ def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_chan
         model_etrees (:obj:`dict` of :obj:`str` to :obj:`etree._Element`)
         pretty_print_modified_xml_models (:obj:`bool`, optional): if :obj:`True`, pretty print modified XML models
         config (:obj:`Config`, optional): BioSimulators common configuration
+        model_overlay (:obj:`ModelOverlay`, optional): overlay for temporary modifications of the sources and changes of models.
+            If no overlay is provided, the modifications are reverted once the task has been executed.
+        results_cache (:obj:`SimulationResultsCache`, optional): cache of the results of deterministic simulations. If provided,
+            the results of iterations and sub-tasks are reused if the same simulation was executed before. The cache should not be
+            used when :obj:`set_value_executer` is provided because the values that it sets are not reflected in the models. The
+            cache is not used for sub-tasks which :obj:`reset_executer` executes starting from the end state of the previous
+            iteration or sub-task.
 
     Returns:
         :obj:`VariableResults`: results of the variables
     """
+    if model_overlay is None:
+        with ModelOverlay() as model_overlay:
+            return exec_repeated_task(task, task_executer, task_vars, doc,
+                                      apply_xml_model_changes=apply_xml_model_changes,
+                                      model_etrees=model_etrees,
+                                      pretty_print_modified_xml_models=pretty_print_modified_xml_models,
+                                      config=config, preprocessed_task=preprocessed_task,
+                                      get_value_executer=get_value_executer,
+                                      set_value_executer=set_value_executer,
+                                      reset_executer=reset_executer,
+                                      model_overlay=model_overlay,
+                                      results_cache=results_cache)
+
     # warn about inability to not reset models
     if not task.reset_model_for_each_iteration and not reset_executer:
         models = get_first_last_models_executed_by_task(task)
@@ -517,22 +570,29 @@ def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_chan
             )
             warn(msg, SedmlFeatureNotSupportedWarning)
 
+    # the results of sub-tasks which are executed starting from the end state of the previous iteration can't be reused
+    if not task.reset_model_for_each_iteration and reset_executer:
+        results_cache = None
+
     sub_tasks = sorted(task.sub_tasks, key=lambda sub_task: sub_task.order)
     for prev_sub_task, next_sub_task in zip(sub_tasks[0:-1], sub_tasks[1:]):
         if get_first_last_models_executed_by_task(prev_sub_task.task)[-1] == \
-                get_first_last_models_executed_by_task(next_sub_task.task)[0] \
-                and not reset_executer:
-            msg = (
-                'Only independent execution of sub-tasks is supported. '
-                'Successive sub-tasks will not be executed starting from the end state of the previous sub-task.'
-            )
-            warn(msg, SedmlFeatureNotSupportedWarning)
+                get_first_last_models_executed_by_task(next_sub_task.task)[0]:
+            if reset_executer:
+                # the results of sub-tasks which are executed starting from the end state of the previous sub-task can't be
+                # reused
+                results_cache = None
+            else:
+                msg = (
+                    'Only independent execution of sub-tasks is supported. '
+                    'Successive sub-tasks will not be executed starting from the end state of the previous sub-task.'
+                )
+                warn(msg, SedmlFeatureNotSupportedWarning)
             break
 
     # hold onto model to be able to reset it
     if task.reset_model_for_each_iteration:
-        original_doc = doc
-        original_task = task
+        original_model_state = model_overlay.get_state()
         original_model_etrees = model_etrees
 
     # resolve the ranges
@@ -556,8 +616,7 @@ def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_chan
     for i_main_range, _ in enumerate(main_range_values):
         # reset the models referenced by the task
         if task.reset_model_for_each_iteration:
-            doc = copy.deepcopy(original_doc)
-            task = next(task for task in doc.tasks if task.id == original_task.id)
+            model_overlay.restore_state(original_model_state)
             model_etrees = copy.deepcopy(original_model_etrees)
             if reset_executer:
                 reset_executer(preprocessed_task)
@@ -613,7 +672,7 @@ def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_chan
                     apply_changes_to_xml_model(model, model_etrees[change.model.id], None, None)
 
                 else:
-                    change.model.changes.append(attr_change)
+                    model_overlay.add_change(change.model, attr_change)
 
         # sort the sub-tasks
         sub_tasks = sorted(task.sub_tasks, key=lambda sub_task: sub_task.order)
@@ -624,8 +683,9 @@ def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_chan
                 model = sub_task.task.model
                 if apply_xml_model_changes and is_model_language_encoded_in_xml(model.language):
                     original_model_source = model.source
-                    fid, model.source = tempfile.mkstemp(suffix='.xml', dir=os.path.dirname(original_model_source))
+                    fid, temp_model_source = tempfile.mkstemp(suffix='.xml', dir=os.path.dirname(original_model_source))
                     os.close(fid)
+                    model_overlay.set_source(model, temp_model_source)
 
                     model_etrees[model.id].write(model.source,
                                                  xml_declaration=True,
@@ -634,11 +694,11 @@ def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_chan
                                                  pretty_print=pretty_print_modified_xml_models)
 
                 sub_task_var_results = exec_task(sub_task.task, task_executer, task_vars, doc, config=config,
-                                                 preprocessed_task=preprocessed_task)
+                                                 preprocessed_task=preprocessed_task, results_cache=results_cache)
 
                 if apply_xml_model_changes and is_model_language_encoded_in_xml(model.language):
                     os.remove(model.source)
-                    model.source = original_model_source
+                    model_overlay.set_source(model, original_model_source)
 
             elif isinstance(sub_task.task, RepeatedTask):
                 sub_task_var_results = exec_repeated_task(sub_task.task, task_executer, task_vars, doc,
@@ -648,7 +708,8 @@ def exec_repeated_task(task, task_executer, task_vars, doc, apply_xml_model_chan
                                                           config=config, preprocessed_task=preprocessed_task,
                                                           get_value_executer=get_value_executer,
                                                           set_value_executer=set_value_executer,
-                                                          reset_executer=reset_executer)
+                                                          reset_executer=reset_executer,
+                                                          results_cache=results_cache)
 
             else:  # pragma: no cover: already validated by :obj:`get_first_last_models_executed_by_task`
                 raise NotImplementedError(
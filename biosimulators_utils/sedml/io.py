@@ -10,6 +10,7 @@ from . import data_model
 from .utils import add_namespaces_to_xml_node, convert_xml_node_to_string, get_namespaces_for_sed_object
 from .validation import validate_doc
 from .warnings import SedmlFeatureNotSupportedWarning
+from ..archive.io import materialize_path
 from ..biosimulations.data_model import Metadata, ExternalReferences, Citation
 from ..config import Config  # noqa: F401
 from ..data_model import Person, Identifier, OntologyTerm
@@ -1085,7 +1086,7 @@ class SedmlSimulationReader(object):
         self.errors = []
         self.warnings = []
 
-        if not os.path.isfile(filename):
+        if not materialize_path(filename):
             msg = '`{}` is not a file.'.format(filename)
             self.errors.append([msg])
             raise FileNotFoundError(msg)
@@ -0,0 +1,601 @@
+""" Memoization and persistent caching of the results of deterministic simulations of SED tasks
+
+:Date: 2026-10-18
+:Copyright: 2026, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from ..config import get_app_dirs, get_config, Config  # noqa: F401
+from ..kisao.utils import is_algorithm_deterministic
+from ..report.data_model import VariableResults
+from ..utils.cache import (get_versioned_cache_dirname, read_cache_file, write_cache_file, touch_cache_entry,
+                           get_cache_entries, evict_cache_entries, clear_cache_entries)
+from .data_model import ComputeModelChange, ModelLanguagePattern, Task, Variable  # noqa: F401
+from .utils import is_model_language_encoded_in_xml
+from lxml import etree
+import collections
+import copy
+import enum
+import functools
+import glob
+import hashlib
+import io
+import numpy
+import os
+import re
+import sys
+import threading
+import types  # noqa: F401
+
+__all__ = [
+    'SimulationResultsCache',
+    'get_simulation_results_cache',
+    'get_model_file_references',
+]
+
+# version of the format of the keys and entries of the cache
+CACHE_VERSION = 3
+
+# local names of the elements of XML-encoded models which reference other files (SBML comp external model definitions,
+# CellML imports, NeuroML includes, and LEMS includes), and the local names of their attributes which contain the paths
+XML_FILE_REFERENCES = {
+    'externalModelDefinition': 'source',
+    'import': 'href',
+    'include': 'href',
+    'Include': 'file',
+}
+
+# extensions of the set, parameter, and initial condition files which are read alongside XPP models
+XPP_AUXILIARY_FILE_EXTENSIONS = ('.set', '.par', '.ic')
+
+_simulation_results_caches = {}
+_simulation_results_caches_lock = threading.Lock()
+
+
+class SimulationResultsCache(object):
+    """ Cache of the results of deterministic simulations of SED tasks
+
+    Results are keyed by a digest of the content of the model of the task, the changes to the model, the simulation
+    and algorithm of the task (ignoring their ids), the targets and symbols of the variables, the function which
+    executes the task and the version of its package, and the namespace of the cache (e.g., the id and version of
+    the simulator). This enables tasks of SED documents and iterations of repeated tasks which describe the same
+    simulation to be executed once. Results are only cached for algorithms which KiSAO describes as deterministic.
+
+    Keys also include the digests of the files which models import (see :obj:`get_model_file_references`). Results of
+    models which import files that are not available locally are not cached.
+
+    Results are kept in memory, up to :obj:`max_size`, and the least recently used results are discarded first.
+    Optionally, results can also be stored persistently in a directory as NumPy ``.npz`` files. When the total
+    size of the stored results exceeds :obj:`max_disk_size`, the least recently used results are evicted. Results
+    of models in languages whose imports are not known (e.g., BNGL) are only kept in memory.
+
+    Attributes:
+        max_size (:obj:`int`): maximum size in bytes of the results kept in memory
+        dirname (:obj:`str`): directory to also store results, or :obj:`None` to only keep results in memory
+        max_disk_size (:obj:`int`): maximum size in bytes of the results stored in :obj:`dirname`
+    """
+
+    def __init__(self, max_size=None, dirname=None, max_disk_size=None, config=None):
+        """
+        Args:
+            max_size (:obj:`int`, optional): maximum size in bytes of the results kept in memory. Default:
+                :obj:`Config.SIMULATION_RESULTS_MEMO_MAX_SIZE`.
+            dirname (:obj:`str`, optional): directory to also store results. Default: :obj:`Config.SIMULATION_RESULTS_CACHE_DIR`,
+                or a subdirectory of the user's cache directory if :obj:`Config.CACHE_SIMULATION_RESULTS` is enabled.
+            max_disk_size (:obj:`int`, optional): maximum size in bytes of the results stored in :obj:`dirname`. Default:
+                :obj:`Config.SIMULATION_RESULTS_CACHE_MAX_SIZE`.
+            config (:obj:`Config`, optional): configuration
+        """
+        if config is None:
+            config = get_config()
+
+        if max_size is None:
+            max_size = config.SIMULATION_RESULTS_MEMO_MAX_SIZE
+        if dirname is None:
+            dirname = config.SIMULATION_RESULTS_CACHE_DIR
+            if dirname is None and config.CACHE_SIMULATION_RESULTS:
+                dirname = os.path.join(get_app_dirs().user_cache_dir, 'simulation_results')
+        if max_disk_size is None:
+            max_disk_size = config.SIMULATION_RESULTS_CACHE_MAX_SIZE
+
+        self.max_size = max_size
+        self.dirname = dirname
+        self.max_disk_size = max_disk_size
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._file_digests = {}
+        self._file_references = {}
+        self._memory_only_keys = set()
+        self._lock = threading.Lock()
+        self._stats = threading.local()
+
+    def get_key(self, task, variables, task_executer=None, config=None):
+        """ Get the key for the results of a task
+
+        Args:
+            task (:obj:`Task`): task, with the model sources and changes that will be simulated
+            variables (:obj:`list` of :obj:`Variable`): variables that the task must record
+            task_executer (:obj:`types.FunctionType`, optional): function which executes the task
+            config (:obj:`Config`, optional): configuration
+
+        Returns:
+            :obj:`str`: hexadecimal SHA-256 digest, or :obj:`None` if the results of the task cannot be cached (e.g., its
+            algorithm is not deterministic)
+        """
+        if config is None:
+            config = get_config()
+
+        model = task.model
+        simulation = task.simulation
+        if (
+            model is None
+            or simulation is None
+            or simulation.algorithm is None
+            or not is_algorithm_deterministic(simulation.algorithm.kisao_id)
+        ):
+            return None
+
+        try:
+            model_key, all_references_known = self.get_model_key(model)
+            change_keys = []
+            for change in model.changes:
+                change_key = get_anonymous_tuple(change)
+                if isinstance(change, ComputeModelChange):
+                    # the new values of compute changes depend on the models of their variables
+                    variable_model_keys = []
+                    for variable in change.variables:
+                        if variable.model is not None:
+                            variable_model_key, references_known = self.get_model_key(variable.model)
+                            variable_model_keys.append(variable_model_key)
+                            all_references_known = all_references_known and references_known
+                    change_key = (change_key, getattr(change, 'new_value', None), tuple(variable_model_keys))
+                change_keys.append(change_key)
+        except ValueError:
+            return None
+
+        key = (
+            CACHE_VERSION,
+            config.SIMULATION_RESULTS_CACHE_NAMESPACE,
+            get_executer_id(task_executer) if task_executer else None,
+            config.ALGORITHM_SUBSTITUTION_POLICY,
+            model_key,
+            tuple(change_keys),
+            get_anonymous_tuple(simulation),
+            tuple(sorted(set(get_variable_signature(variable) for variable in variables))),
+        )
+        key = hashlib.sha256(repr(canonicalize(key)).encode()).hexdigest()
+
+        # the files which the models import aren't known, so the results are not stored persistently
+        if not all_references_known:
+            with self._lock:
+                self._memory_only_keys.add(key)
+
+        return key
+
+    def get_model_key(self, model):
+        """ Get a representation of the content of a model, including the files which it imports
+
+        Args:
+            model (:obj:`Model`): model
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`tuple`: language of the model and digests of its source and of the files which it imports
+                * :obj:`bool`: whether the files which the model imports are known
+
+        Raises:
+            :obj:`ValueError`: if the source of the model, or a file which it imports, is not available locally
+        """
+        if not model.source or not os.path.isfile(model.source):
+            raise ValueError('The source of model `{}` is not a local file.'.format(model.id))
+
+        referenced_filenames = self.get_referenced_files(model.source, model.language)
+        key = (
+            model.language,
+            self.get_file_digest(model.source),
+            tuple(self.get_file_digest(filename) for filename in referenced_filenames or []),
+        )
+        return key, referenced_filenames is not None
+
+    def get_referenced_files(self, filename, language):
+        """ Get the files which a model imports, directly or indirectly, memoized by the size and modification time of
+        each file
+
+        Args:
+            filename (:obj:`str`): path to the model
+            language (:obj:`str`): language of the model
+
+        Returns:
+            :obj:`list` of :obj:`str`: paths to the files, or :obj:`None` if the files which models in the language can import
+            are not known
+
+        Raises:
+            :obj:`ValueError`: if the model imports a file which is not available locally
+        """
+        filenames = []
+        unvisited_filenames = [filename]
+        visited_filenames = set([os.path.abspath(filename)])
+        while unvisited_filenames:
+            unvisited_filename = os.path.abspath(unvisited_filenames.pop(0))
+            file_stat = os.stat(unvisited_filename)
+            file_key = (unvisited_filename, file_stat.st_size, file_stat.st_mtime_ns, language)
+            if file_key not in self._file_references:
+                self._file_references[file_key] = get_model_file_references(unvisited_filename, language)
+            references = self._file_references[file_key]
+            if references is None:
+                return None
+
+            for reference in references:
+                reference = os.path.abspath(reference)
+                if reference not in visited_filenames:
+                    visited_filenames.add(reference)
+                    filenames.append(reference)
+                    unvisited_filenames.append(reference)
+        return filenames
+
+    def get_file_digest(self, filename):
+        """ Get the SHA-256 digest of a file, memoized by the size and modification time of the file
+
+        Args:
+            filename (:obj:`str`): path to the file
+
+        Returns:
+            :obj:`str`: hexadecimal SHA-256 digest
+        """
+        file_stat = os.stat(filename)
+        file_key = (os.path.abspath(filename), file_stat.st_size, file_stat.st_mtime_ns)
+        digest = self._file_digests.get(file_key, None)
+        if digest is None:
+            digest = hashlib.sha256()
+            with open(filename, 'rb') as file:
+                for chunk in iter(lambda: file.read(2 ** 20), b''):
+                    digest.update(chunk)
+            digest = self._file_digests[file_key] = digest.hexdigest()
+        return digest
+
+    def get(self, key, variables):
+        """ Get the cached results of a task
+
+        Args:
+            key (:obj:`str`): key for the results (see :obj:`get_key`)
+            variables (:obj:`list` of :obj:`Variable`): variables that the task must record
+
+        Returns:
+            :obj:`VariableResults`: results of the variables, or :obj:`None` if the results are not cached
+        """
+        with self._lock:
+            results = self._entries.get(key, None)
+            if results is not None:
+                self._entries.move_to_end(key)
+
+        if results is None and self.dirname and key not in self._memory_only_keys:
+            results = self._read(key)
+            if results is not None:
+                self._add(key, results)
+
+        variable_results = None
+        if results is not None:
+            variable_results = VariableResults()
+            for variable in variables:
+                value = results.get(get_variable_signature(variable), None)
+                if value is None:
+                    variable_results = None
+                    break
+                variable_results[variable.id] = value.copy()
+
+        if variable_results is None:
+            self._stats.misses = getattr(self._stats, 'misses', 0) + 1
+        else:
+            self._stats.hits = getattr(self._stats, 'hits', 0) + 1
+        return variable_results
+
+    def get_stats(self):
+        """ Get the number of hits and misses of the lookups of the current thread
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`int`: number of lookups whose results were cached
+                * :obj:`int`: number of lookups whose results were not cached
+        """
+        return (getattr(self._stats, 'hits', 0), getattr(self._stats, 'misses', 0))
+
+    def set(self, key, variables, variable_results):
+        """ Cache the results of a task. Results which are missing or which are not numerical are not cached.
+
+        Args:
+            key (:obj:`str`): key for the results (see :obj:`get_key`)
+            variables (:obj:`list` of :obj:`Variable`): variables that the task recorded
+            variable_results (:obj:`VariableResults`): results of the variables
+        """
+        results = {}
+        for variable in variables:
+            value = variable_results.get(variable.id, None)
+            if value is None:
+                return
+            value = numpy.array(value)
+            if value.dtype.hasobject:
+                return
+            results[get_variable_signature(variable)] = value
+
+        self._add(key, results)
+        if self.dirname and key not in self._memory_only_keys:
+            self._write(key, results)
+            self.evict(keep=key)
+
+    def get_disk_size(self):
+        """ Get the total size of the results stored in the directory of the cache
+
+        Returns:
+            :obj:`int`: size in bytes
+        """
+        return sum(size for _, _, size in self._get_disk_entries())
+
+    def evict(self, keep=None):
+        """ Evict the least recently used results from the directory of the cache until its size is within
+        :obj:`max_disk_size`
+
+        Args:
+            keep (:obj:`str`, optional): key of results which should not be evicted
+        """
+        if self.dirname:
+            evict_cache_entries(self._get_dirname(), self.max_disk_size, keep=self._get_filename(keep) if keep else None)
+
+    def clear(self, disk=False):
+        """ Remove all results from the memory of the cache
+
+        Args:
+            disk (:obj:`bool`, optional): whether to also remove the results stored in the directory of the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+        if disk and self.dirname:
+            clear_cache_entries(self._get_dirname())
+
+    def _get_disk_entries(self):
+        """ Get the results stored in the directory of the cache
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: time of the last use, path, and size of each file of results
+        """
+        if not self.dirname:
+            return []
+        return get_cache_entries(self._get_dirname())
+
+    def _add(self, key, results):
+        """ Keep results in memory, discarding the least recently used results to stay within :obj:`max_size`
+
+        Args:
+            key (:obj:`str`): key for the results
+            results (:obj:`dict`): dictionary which maps the signatures of variables to their results
+        """
+        size = sum(value.nbytes for value in results.values())
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = results
+            self._size += size
+            while self._size > self.max_size:
+                _, evicted_results = self._entries.popitem(last=False)
+                self._size -= sum(value.nbytes for value in evicted_results.values())
+
+    def _get_dirname(self):
+        """ Get the directory for the files of results in the current format
+
+        Returns:
+            :obj:`str`: path
+        """
+        return get_versioned_cache_dirname(self.dirname, CACHE_VERSION)
+
+    def _get_filename(self, key):
+        """ Get the path to the file for results
+
+        Args:
+            key (:obj:`str`): key for the results
+
+        Returns:
+            :obj:`str`: path
+        """
+        return os.path.join(self._get_dirname(), '{}.npz'.format(key))
+
+    def _read(self, key):
+        """ Read results from the directory of the cache
+
+        Args:
+            key (:obj:`str`): key for the results
+
+        Returns:
+            :obj:`dict`: dictionary which maps the signatures of variables to their results, or :obj:`None` if
+            the results are not stored or could not be read
+        """
+        filename = self._get_filename(key)
+        results = read_cache_file(filename, load_results)
+        if results is not None:
+            touch_cache_entry(filename)
+        return results
+
+    def _write(self, key, results):
+        """ Save results to the directory of the cache
+
+        Args:
+            key (:obj:`str`): key for the results
+            results (:obj:`dict`): dictionary which maps the signatures of variables to their results
+        """
+        signatures = list(results.keys())
+        arrays = {'result_{}'.format(i_signature): results[signature] for i_signature, signature in enumerate(signatures)}
+        file = io.BytesIO()
+        numpy.savez(file, signatures=numpy.array(signatures, dtype=str), **arrays)
+        write_cache_file(self._get_filename(key), file.getvalue())
+
+
+def get_simulation_results_cache(config=None):
+    """ Get the cache of the results of simulations for a configuration. Caches are shared within each process.
+
+    Args:
+        config (:obj:`Config`, optional): configuration
+
+    Returns:
+        :obj:`SimulationResultsCache`: cache
+    """
+    if config is None:
+        config = get_config()
+
+    key = (config.SIMULATION_RESULTS_MEMO_MAX_SIZE, config.SIMULATION_RESULTS_CACHE_DIR, config.CACHE_SIMULATION_RESULTS,
+           config.SIMULATION_RESULTS_CACHE_MAX_SIZE)
+    with _simulation_results_caches_lock:
+        cache = _simulation_results_caches.get(key, None)
+        if cache is None:
+            cache = _simulation_results_caches[key] = SimulationResultsCache(config=config)
+    return cache
+
+
+def load_results(file):
+    """ Read results from a file of the cache
+
+    Args:
+        file (:obj:`io.BufferedReader`): file
+
+    Returns:
+        :obj:`dict`: dictionary which maps the signatures of variables to their results
+    """
+    with numpy.load(file, allow_pickle=False) as npz_file:
+        signatures = npz_file['signatures']
+        return {str(signature): npz_file['result_{}'.format(i_signature)] for i_signature, signature in enumerate(signatures)}
+
+
+def get_model_file_references(filename, language):
+    """ Get the files which a model file directly imports
+
+    * XML-encoded models (e.g., SBML, CellML, NeuroML, LEMS): files referenced by SBML comp external model
+      definitions, CellML imports, and NeuroML and LEMS includes
+    * XPP: files included with ``#include`` and the set, parameter, and initial condition files in the directory of the model
+    * Smoldyn: files read with ``read_file``
+
+    Args:
+        filename (:obj:`str`): path to the model
+        language (:obj:`str`): language of the model
+
+    Returns:
+        :obj:`list` of :obj:`str`: paths to the files, or :obj:`None` if the files which models in the language can import
+        are not known
+
+    Raises:
+        :obj:`ValueError`: if the model imports a file which is not available locally
+    """
+    dirname = os.path.dirname(filename)
+
+    if is_model_language_encoded_in_xml(language):
+        paths = []
+        try:
+            for _, element in etree.iterparse(filename, events=('start',), remove_comments=True, huge_tree=True):
+                if not isinstance(element.tag, str):
+                    continue
+                attr_name = XML_FILE_REFERENCES.get(etree.QName(element).localname, None)
+                if attr_name:
+                    for name, value in element.attrib.items():
+                        if etree.QName(name).localname == attr_name:
+                            paths.append(value)
+        except etree.XMLSyntaxError:
+            return None
+
+    elif language and re.match(ModelLanguagePattern.XPP, language):
+        paths = []
+        with open(filename, 'r', errors='ignore') as file:
+            for line in file:
+                if line.strip().lower().startswith('#include'):
+                    paths.append(line.strip()[len('#include'):].strip())
+        for extension in XPP_AUXILIARY_FILE_EXTENSIONS:
+            paths.extend(sorted(glob.glob(os.path.join(glob.escape(dirname), '*' + extension))))
+
+    elif language and re.match(ModelLanguagePattern.Smoldyn, language):
+        paths = []
+        with open(filename, 'r', errors='ignore') as file:
+            for line in file:
+                statement = line.split('#', 1)[0].split()
+                if len(statement) >= 2 and statement[0] == 'read_file':
+                    paths.append(statement[1])
+
+    else:
+        return None
+
+    filenames = []
+    for path in paths:
+        if re.match(r'^[a-z][a-z0-9+.\-]+:', path, re.IGNORECASE) and not re.match(r'^file:', path, re.IGNORECASE):
+            raise ValueError('`{}` imports `{}`, which is not a local file.'.format(filename, path))
+        if path.lower().startswith('file:'):
+            path = path[len('file:'):]
+        path = os.path.join(dirname, path)
+        if not os.path.isfile(path):
+            raise ValueError('`{}` imports `{}`, which does not exist.'.format(filename, path))
+        filenames.append(path)
+    return filenames
+
+
+def get_executer_id(task_executer):
+    """ Get an identifier for a function which executes tasks, including the version of the package which
+    provides the function (e.g., ``biosimulators_copasi``)
+
+    Args:
+        task_executer (:obj:`types.FunctionType`): function
+
+    Returns:
+        :obj:`tuple`: identifier
+    """
+    if isinstance(task_executer, functools.partial):
+        return (get_executer_id(task_executer.func), repr(task_executer.args), repr(sorted(task_executer.keywords.items())))
+
+    module_name = getattr(task_executer, '__module__', None)
+    package = sys.modules.get(module_name.partition('.')[0], None) if module_name else None
+    return (module_name, getattr(task_executer, '__qualname__', repr(task_executer)), getattr(package, '__version__', None))
+
+
+def get_anonymous_tuple(obj):
+    """ Get the tuple representation of a SED object, ignoring its id and name
+
+    Args:
+        obj (:obj:`SedBase`): object
+
+    Returns:
+        :obj:`tuple`: tuple representation
+    """
+    if hasattr(obj, 'id'):
+        obj = copy.copy(obj)
+        obj.id = None
+        obj.name = None
+    return obj.to_tuple()
+
+
+def get_variable_signature(variable):
+    """ Get the signature of a variable, which identifies the quantity that it records regardless of its id
+
+    Args:
+        variable (:obj:`Variable`): variable
+
+    Returns:
+        :obj:`str`: representation of the target, the namespaces of the target, and the symbol of the variable
+    """
+    return repr(canonicalize((variable.target, variable.target_namespaces, variable.symbol)))
+
+
+def canonicalize(value):
+    """ Get a canonical representation of a value, in which the items of dictionaries are sorted
+
+    Args:
+        value (:obj:`object`): value
+
+    Returns:
+        :obj:`object`: canonical representation
+    """
+    if isinstance(value, (tuple, list)):
+        return tuple(canonicalize(el) for el in value)
+    if isinstance(value, dict):
+        return tuple(sorted(((key, canonicalize(val)) for key, val in value.items()), key=repr))
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
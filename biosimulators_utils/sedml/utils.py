@@ -7,9 +7,12 @@
 """
 import regex
 
+from ..archive.io import materialize_model
+from ..config import get_app_dirs, get_config, Config  # noqa: F401
 from ..log.data_model import Status
 from ..report.data_model import VariableResults, DataGeneratorResults  # noqa: F401
 from ..utils.core import pad_arrays_to_consistent_shapes
+from ..utils.http_cache import HttpCache
 from ..warnings import warn
 from ..xml.utils import eval_xpath
 from .data_model import (SedBase, SedIdGroupMixin, SedDocument,  # noqa: F401
@@ -23,17 +26,20 @@ from .data_model import (SedBase, SedIdGroupMixin, SedDocument,  # noqa: F401
 from .math import AGGREGATE_MATH_FUNCTIONS, compile_math, eval_math
 from .warnings import InconsistentVariableShapesWarning
 from lxml import etree
+import concurrent.futures
 import copy
+import functools
 import io
 import libsedml  # noqa: F401
 import numpy
 import os
 import re
-import requests
 import tempfile
 
 __all__ = [
+    'get_all_nested_children_of_doc',
     'append_all_nested_children_to_doc',
+    'ModelOverlay',
     'add_namespaces_to_xml_node',
     'convert_xml_node_to_string',
     'get_data_generators_for_output',
@@ -42,7 +48,11 @@ __all__ = [
     'is_executable_task',
     'get_model_changes_for_task',
     'resolve_model_and_apply_xml_changes',
+    'get_remote_model_cache',
     'resolve_model',
+    'get_remote_model_source_url',
+    'get_remote_model_urls',
+    'prefetch_remote_models',
     'apply_changes_to_xml_model',
     'get_values_of_variable_model_xml_targets_of_model_change',
     'get_value_of_variable_model_xml_targets',
@@ -67,11 +77,16 @@ __all__ = [
 ]
 
 
-def append_all_nested_children_to_doc(doc):
-    """ Append all nested children to a SED document
+def get_all_nested_children_of_doc(doc):
+    """ Get all of the children of a SED document, including children which are only referenced by other
+    children (e.g., models referenced by tasks), without modifying the document
 
     Args:
         doc (:obj:`SedDocument`): SED document
+
+    Returns:
+        :obj:`dict`: dictionary which maps the name of each type of child of SED documents (e.g., ``models``) to a
+            list of the direct children of the document, followed by the nested children which are not direct children
     """
     styles = set(doc.styles)
     data_generators = set(doc.data_generators)
@@ -130,11 +145,120 @@ def append_all_nested_children_to_doc(doc):
             if task.simulation:
                 simulations.add(task.simulation)
 
-    doc.styles += list(styles - set(doc.styles))
-    doc.models += list(models - set(doc.models))
-    doc.simulations += list(simulations - set(doc.simulations))
-    doc.tasks += list(tasks - set(doc.tasks))
-    doc.data_generators += list(data_generators - set(doc.data_generators))
+    return {
+        'styles': doc.styles + list(styles - set(doc.styles)),
+        'models': doc.models + list(models - set(doc.models)),
+        'simulations': doc.simulations + list(simulations - set(doc.simulations)),
+        'tasks': doc.tasks + list(tasks - set(doc.tasks)),
+        'data_generators': doc.data_generators + list(data_generators - set(doc.data_generators)),
+        'outputs': list(doc.outputs),
+    }
+
+
+def append_all_nested_children_to_doc(doc):
+    """ Append all nested children to a SED document
+
+    Args:
+        doc (:obj:`SedDocument`): SED document
+    """
+    children = get_all_nested_children_of_doc(doc)
+    for child_type in ('styles', 'models', 'simulations', 'tasks', 'data_generators'):
+        getattr(doc, child_type).extend(children[child_type][len(getattr(doc, child_type)):])
+
+
+class ModelOverlay(object):
+    """ Temporary modifications of the sources and changes of models (e.g., to point models to resolved and
+    modified copies of their sources during the execution of tasks). The original sources and changes of the
+    models are restored when the overlay is reverted (or when its context is exited). This enables SED documents
+    to be executed without copying them, and without permanently modifying them.
+
+    Attributes:
+        _originals (:obj:`dict`): dictionary which maps the id of each modified model to a tuple of the model and
+            its original source and changes
+    """
+
+    def __init__(self):
+        self._originals = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.revert()
+
+    def _save(self, model):
+        """ Save the original source and changes of a model, if they have not already been saved
+
+        Args:
+            model (:obj:`Model`): model
+        """
+        if id(model) not in self._originals:
+            self._originals[id(model)] = (model, model.source, model.changes)
+            model.changes = list(model.changes)
+
+    def set(self, model, source, changes):
+        """ Temporarily set the source and changes of a model
+
+        Args:
+            model (:obj:`Model`): model
+            source (:obj:`str`): source
+            changes (:obj:`list` of :obj:`ModelChange`): changes
+        """
+        self._save(model)
+        model.source = source
+        model.changes = changes
+
+    def set_source(self, model, source):
+        """ Temporarily set the source of a model
+
+        Args:
+            model (:obj:`Model`): model
+            source (:obj:`str`): source
+        """
+        self._save(model)
+        model.source = source
+
+    def add_change(self, model, change):
+        """ Temporarily add a change to a model
+
+        Args:
+            model (:obj:`Model`): model
+            change (:obj:`ModelChange`): change
+        """
+        self._save(model)
+        model.changes.append(change)
+
+    def get_state(self):
+        """ Get the current sources and changes of the models modified by the overlay
+
+        Returns:
+            :obj:`dict`: dictionary which maps the id of each modified model to a tuple of its current source and changes
+        """
+        return {
+            model_id: (model.source, list(model.changes))
+            for model_id, (model, _, _) in self._originals.items()
+        }
+
+    def restore_state(self, state):
+        """ Return the models modified by the overlay to a previous state
+
+        Args:
+            state (:obj:`dict`): state returned by :obj:`get_state`
+        """
+        for model_id, (model, source, changes) in self._originals.items():
+            if model_id in state:
+                model.source, changes = state[model_id]
+                model.changes = list(changes)
+            else:
+                model.source = source
+                model.changes = list(changes)
+
+    def revert(self):
+        """ Restore the original sources and changes of the models """
+        for model, source, changes in self._originals.values():
+            model.source = source
+            model.changes = changes
+        self._originals = {}
 
 
 def add_namespaces_to_xml_node(node, namespace_prefixes, namespaces):
@@ -279,7 +403,8 @@ def resolve_model_and_apply_xml_changes(orig_model, sed_doc, working_dir,
                                         save_to_file=True,
                                         pretty_print_modified_xml_models=False,
                                         set_value_executer=None,
-                                        preprocessed_task_sub_executer=None):
+                                        preprocessed_task_sub_executer=None,
+                                        remote_model_cache=None):
     """ Resolve the source of a model and, optionally, apply XML changes to the model.
 
     Args:
@@ -297,6 +422,7 @@ def resolve_model_and_apply_xml_changes(orig_model, sed_doc, working_dir,
             calling :obj:`task_executer`.
         save_to_file (:obj:`bool`): whether to save the resolved/modified model to a file
         pretty_print_modified_xml_models (:obj:`bool`, optional): if :obj:`True`, pretty print modified XML models
+        remote_model_cache (:obj:`HttpCache`, optional): cache of models downloaded from URLs and BioModels
 
     Returns:
         :obj:`tuple`:
@@ -307,12 +433,9 @@ def resolve_model_and_apply_xml_changes(orig_model, sed_doc, working_dir,
             * :obj:`etree._Element`: element tree for the resolved/modified model
     """
     model = copy.deepcopy(orig_model)
-    # We need to save this because we're going to change it, then change it back.
-    orig_model_source = orig_model.source
-    orig_model_changes = orig_model.changes
 
     # resolve model
-    temp_model_source = resolve_model(model, sed_doc, working_dir)
+    temp_model_source = resolve_model(model, sed_doc, working_dir, remote_model_cache=remote_model_cache)
     preprocessed_task = None
 
     # apply changes to model
@@ -325,13 +448,15 @@ def resolve_model_and_apply_xml_changes(orig_model, sed_doc, working_dir,
                 str(exception)))
 
         if model.changes:
-            # Change source here so that tasks point to actual source they can find.
-            orig_model.source = model.source
-            orig_model.changes = model.changes
-            # apply changes
-            preprocessed_task = apply_changes_to_xml_model(model, model_etree, sed_doc, working_dir,
-                                                           set_value_executer=set_value_executer,
-                                                           preprocessed_task_sub_executer=preprocessed_task_sub_executer)
+            # Temporarily change the source of the original model so that tasks point to actual source they can find.
+            with ModelOverlay() as overlay:
+                overlay.set(orig_model, model.source, model.changes)
+
+                # apply changes
+                preprocessed_task = apply_changes_to_xml_model(model, model_etree, sed_doc, working_dir,
+                                                               set_value_executer=set_value_executer,
+                                                               preprocessed_task_sub_executer=preprocessed_task_sub_executer,
+                                                               remote_model_cache=remote_model_cache)
             model.changes.clear()
 
             # write model to file
@@ -350,13 +475,31 @@ def resolve_model_and_apply_xml_changes(orig_model, sed_doc, working_dir,
     else:
         model_etree = None
 
-    # Reset the model source, in case it matters.
-    orig_model.source = orig_model_source
-    orig_model.changes = orig_model_changes
     return model, temp_model_source, model_etree, preprocessed_task
 
 
-def resolve_model(model, sed_doc, working_dir):
+def get_remote_model_cache(config=None):
+    """ Get a cache of models downloaded from URLs and BioModels, such as for an execution of a SED document. Each
+    model is downloaded at most once per cache. If :obj:`Config.CACHE_REMOTE_MODELS` is enabled, downloaded
+    models are also stored persistently and revalidated with their servers after :obj:`Config.REMOTE_MODEL_CACHE_TTL`.
+
+    Args:
+        config (:obj:`Config`, optional): configuration
+
+    Returns:
+        :obj:`HttpCache`: cache
+    """
+    if config is None:
+        config = get_config()
+
+    if config.CACHE_REMOTE_MODELS:
+        dirname = config.REMOTE_MODEL_CACHE_DIR or os.path.join(get_app_dirs().user_cache_dir, 'remote_models')
+    else:
+        dirname = None
+    return HttpCache(dirname=dirname, ttl=config.REMOTE_MODEL_CACHE_TTL)
+
+
+def resolve_model(model, sed_doc, working_dir, remote_model_cache=None):
     """ Resolve the source of a model
 
     Args:
@@ -370,6 +513,8 @@ def resolve_model(model, sed_doc, working_dir):
 
         sed_doc (:obj:`SedDocument`): parent SED document; used to resolve sources defined by reference to other models
         working_dir (:obj:`str`): working directory of the SED document (path relative to which models are located)
+        remote_model_cache (:obj:`HttpCache`, optional): cache of models downloaded from URLs and BioModels. Default:
+            :obj:`get_remote_model_cache`.
 
     Returns:
         :obj:`str`: temporary path to the source of the modified model, if the model needed to be resolved from
@@ -379,33 +524,31 @@ def resolve_model(model, sed_doc, working_dir):
     if source.lower().startswith('urn:'):
         if source.lower().startswith('urn:miriam:biomodels.db:'):
             biomodels_id = source.lower().replace('urn:miriam:biomodels.db:', '')
-            url = BIOMODELS_DOWNLOAD_ENDPOINT.format(biomodels_id, biomodels_id)
-            response = requests.get(url)
+            url = get_remote_model_source_url(source)
             try:
-                response.raise_for_status()
+                content = (remote_model_cache or get_remote_model_cache()).get(url)
             except Exception:
                 raise ValueError('Model `{}` could not be downloaded from BioModels.'.format(biomodels_id))
 
             temp_file, model.source = tempfile.mkstemp()
             os.close(temp_file)
             with open(model.source, 'wb') as file:
-                file.write(response.content)
+                file.write(content)
         else:
             raise NotImplementedError('URN model source `{}` could be resolved.'.format(source))
 
         return model.source
 
     elif re.match(r'^http(s)?://', source, re.IGNORECASE):
-        response = requests.get(source)
         try:
-            response.raise_for_status()
+            content = (remote_model_cache or get_remote_model_cache()).get(source)
         except Exception:
             raise ValueError('Model could not be downloaded from `{}`.'.format(source))
 
         temp_file, model.source = tempfile.mkstemp()
         os.close(temp_file)
         with open(model.source, 'wb') as file:
-            file.write(response.content)
+            file.write(content)
 
         return model.source
 
@@ -417,7 +560,7 @@ def resolve_model(model, sed_doc, working_dir):
 
         model.source = other_model.source
         model.changes = other_model.changes + model.changes
-        return resolve_model(model, sed_doc, working_dir)
+        return resolve_model(model, sed_doc, working_dir, remote_model_cache=remote_model_cache)
 
     else:
         if os.path.isabs(source):
@@ -425,16 +568,90 @@ def resolve_model(model, sed_doc, working_dir):
         else:
             model.source = os.path.join(working_dir, source)
 
-        if not os.path.isfile(model.source):
+        if not materialize_model(model.source):
             raise FileNotFoundError('Model source file `{}` does not exist.'.format(source))
 
         return None
 
 
+def get_remote_model_source_url(source):
+    """ Get the URL for a remote model source
+
+    Args:
+        source (:obj:`str`): source of a model
+
+    Returns:
+        :obj:`str`: URL for the source, or :obj:`None` if the source is not a URL or a MIRIAM URN for an entry in
+            the BioModels database
+    """
+    if source.lower().startswith('urn:miriam:biomodels.db:'):
+        biomodels_id = source.lower().replace('urn:miriam:biomodels.db:', '')
+        return BIOMODELS_DOWNLOAD_ENDPOINT.format(biomodels_id, biomodels_id)
+
+    if re.match(r'^http(s)?://', source, re.IGNORECASE):
+        return source
+
+    return None
+
+
+def get_remote_model_urls(sed_doc):
+    """ Get the URLs of the remote sources of the models of a SED document, including models which are defined by
+    reference to other models (e.g., ``#other-model-id``)
+
+    Args:
+        sed_doc (:obj:`SedDocument`): SED document
+
+    Returns:
+        :obj:`list` of :obj:`str`: URLs
+    """
+    models = {model.id: model for model in sed_doc.models}
+
+    urls = []
+    for model in sed_doc.models:
+        source = model.source
+        visited_sources = set()
+        while source and source.startswith('#') and source not in visited_sources:
+            visited_sources.add(source)
+            other_model = models.get(source[1:], None)
+            source = other_model.source if other_model else None
+
+        url = get_remote_model_source_url(source) if source else None
+        if url and url not in urls:
+            urls.append(url)
+
+    return urls
+
+
+def prefetch_remote_models(sed_doc, remote_model_cache, max_workers=8):
+    """ Concurrently download the remote sources of the models of a SED document into a cache so that the models can
+    be resolved (see :obj:`resolve_model`) without waiting for their servers
+
+    Errors are ignored; they are reported when the models are resolved.
+
+    Args:
+        sed_doc (:obj:`SedDocument`): SED document
+        remote_model_cache (:obj:`HttpCache`): cache of models downloaded from URLs and BioModels
+        max_workers (:obj:`int`, optional): maximum number of models to download concurrently
+    """
+    urls = get_remote_model_urls(sed_doc)
+    if not urls:
+        return
+
+    def download(url):
+        try:
+            remote_model_cache.get(url)
+        except Exception:
+            pass
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        list(executor.map(download, urls))
+
+
 def apply_changes_to_xml_model(model, model_etree, sed_doc=None, working_dir=None,
                                variable_values=None, range_values=None,
                                validate_unique_xml_targets=True,
-                               set_value_executer=None, preprocessed_task_sub_executer=None):
+                               set_value_executer=None, preprocessed_task_sub_executer=None,
+                               remote_model_cache=None):
     """ Modify an XML-encoded model according to a model change
 
     Args:
@@ -450,6 +667,8 @@ def apply_changes_to_xml_model(model, model_etree, sed_doc=None, working_dir=Non
             set value compute model change
         validate_unique_xml_targets (:obj:`bool`, optional): whether to validate the XML targets match
             uniue objects
+        remote_model_cache (:obj:`HttpCache`, optional): cache of models downloaded from URLs and BioModels; used to
+            resolve the models of the variables of compute changes
     """
 
     # First pass:  Must-be-XML changes:
@@ -574,7 +793,8 @@ def apply_changes_to_xml_model(model, model_etree, sed_doc=None, working_dir=Non
             if variable_values is None:
                 model_etrees = {model.id: model_etree}
                 iter_variable_values = \
-                    get_values_of_variable_model_xml_targets_of_model_change(change, sed_doc, model_etrees, working_dir)
+                    get_values_of_variable_model_xml_targets_of_model_change(change, sed_doc, model_etrees, working_dir,
+                                                                             remote_model_cache=remote_model_cache)
             else:
                 iter_variable_values = variable_values
 
@@ -646,7 +866,7 @@ def apply_changes_to_xml_model(model, model_etree, sed_doc=None, working_dir=Non
     return preprocessed_task
 
 
-def get_values_of_variable_model_xml_targets_of_model_change(change, sed_doc, model_etrees, working_dir):
+def get_values_of_variable_model_xml_targets_of_model_change(change, sed_doc, model_etrees, working_dir, remote_model_cache=None):
     """ Get the values of the model variables of a compute model change
 
     Args:
@@ -655,6 +875,7 @@ def get_values_of_variable_model_xml_targets_of_model_change(change, sed_doc, mo
         model_etrees (:obj:`dict` of :obj:`str` to :obj:`etree._Element`): map from the ids of models to element
             trees of their sources
         working_dir (:obj:`str`): working directory of the SED document (path relative to which models are located)
+        remote_model_cache (:obj:`HttpCache`, optional): cache of models downloaded from URLs and BioModels
 
     Returns:
         :obj:`dict`: dictionary which contains the value of each variable of each
@@ -667,7 +888,8 @@ def get_values_of_variable_model_xml_targets_of_model_change(change, sed_doc, mo
             copy_variable_model, temp_model_source, variable_model_etree, preprocessed_task = resolve_model_and_apply_xml_changes(
                 variable_model, sed_doc, working_dir,
                 apply_xml_model_changes=True,
-                save_to_file=False)
+                save_to_file=False,
+                remote_model_cache=remote_model_cache)
             model_etrees[variable_model.id] = variable_model_etree
 
             if temp_model_source:
@@ -1311,6 +1533,28 @@ def does_model_language_use_xpath_variable_targets(language):
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_attribute_names(cls):
+    """ Get the names of the attributes which the slots of a class of SED objects declare. The ``__dict__`` and
+    ``__weakref__`` slots are not attributes of objects.
+
+    Args:
+        cls (:obj:`type`): subclass of :obj:`SedBase`
+
+    Returns:
+        :obj:`tuple` of :obj:`str`: names of the attributes of the class
+    """
+    attr_names = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for attr_name in slots:
+            if attr_name not in attr_names and attr_name not in ('__dict__', '__weakref__'):
+                attr_names.append(attr_name)
+    return tuple(attr_names)
+
+
 def get_all_sed_objects(doc, type=(SedBase, SedIdGroupMixin)):
     """ Get all of the identified objects (instances of :obj:`SedIdGroupMixin`) that
     belong to a SED document
@@ -1325,7 +1569,11 @@ def get_all_sed_objects(doc, type=(SedBase, SedIdGroupMixin)):
     seen_objs = [doc]
     while objs_to_see:
         obj = objs_to_see.pop()
-        for attr in obj.__dict__.values():
+        # attributes declared by slots, and attributes of objects without slots (e.g., objects of subclasses
+        # defined by simulators)
+        attrs = [getattr(obj, attr_name, None) for attr_name in get_attribute_names(obj.__class__)]
+        attrs.extend(getattr(obj, '__dict__', {}).values())
+        for attr in attrs:
             if isinstance(attr, (SedBase, SedIdGroupMixin)):
                 if attr not in seen_objs:
                     objs_to_see.append(attr)
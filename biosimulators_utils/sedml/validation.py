@@ -19,7 +19,7 @@ from .data_model import (SedIdGroupMixin, AbstractTask, Task, RepeatedTask,  # n
                          Report, Plot2D, Plot3D, DataGenerator,
                          Calculation, Style, LineStyleType, MarkerStyleType)
 from .math import compile_math, eval_math
-from .utils import (append_all_nested_children_to_doc, get_range_len,
+from .utils import (get_all_nested_children_of_doc, get_range_len,
                     is_model_language_encoded_in_xml,
                     does_model_language_use_xpath_variable_targets,
                     get_models_referenced_by_task,
@@ -29,7 +29,6 @@ from .utils import (append_all_nested_children_to_doc, get_range_len,
 from kisao.data_model import TermType as KisaoTermType
 from evalidate import CompilationException, ValidationException
 import collections
-import copy
 import lxml.etree
 import math
 import networkx
@@ -155,11 +154,10 @@ def validate_doc(doc, working_dir, validate_semantics=True,
         errors.extend(validate_unique_ids(doc))
 
         # validate the models, simulations, tasks, data generators are children of the SED document
-        doc_copy = copy.deepcopy(doc)
-        append_all_nested_children_to_doc(doc_copy)
+        nested_children = get_all_nested_children_of_doc(doc)
 
         for child_type in ('styles', 'models', 'simulations', 'tasks', 'data_generators', 'outputs'):
-            not_children = set([child.id for child in getattr(doc_copy, child_type)]).difference(
+            not_children = set([child.id for child in nested_children[child_type]]).difference(
                 set([child.id for child in getattr(doc, child_type)]))
             if not_children:
                 errors.append([
@@ -0,0 +1,270 @@
+""" Utilities for concurrently executing COMBINE/OMEX archives with command-line interfaces to simulators
+
+:Date: 2026-10-18
+:Copyright: 2026, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from ..log.data_model import Status
+from .exec import build_cli_args
+import asyncio
+import os
+import signal
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: no cover # e.g., Windows
+    resource = None
+
+__all__ = [
+    'ResourceLimits',
+    'SimulatorCliJob',
+    'exec_sedml_docs_in_archives_with_simulator_cli_async',
+    'exec_sedml_docs_in_archives_with_simulator_cli',
+    'exec_sedml_docs_in_archive_with_simulator_cli_async',
+]
+
+
+class ResourceLimits(object):
+    """ Limits on the resources which the execution of an archive can use
+
+    CPU time and memory are limited with resource limits (``setrlimit``) of the process of the simulator, and are
+    only enforced on POSIX systems. The wall time is enforced by killing the process of the simulator, together with
+    the processes which it started (e.g., MPI ranks or simulators called via a shell).
+
+    Attributes:
+        cpu_time (:obj:`int`): maximum CPU time in seconds
+        memory (:obj:`int`): maximum size of the virtual memory of the process in bytes
+        wall_time (:obj:`float`): maximum wall time in seconds
+    """
+
+    def __init__(self, cpu_time=None, memory=None, wall_time=None):
+        """
+        Args:
+            cpu_time (:obj:`int`, optional): maximum CPU time in seconds
+            memory (:obj:`int`, optional): maximum size of the virtual memory of the process in bytes
+            wall_time (:obj:`float`, optional): maximum wall time in seconds
+        """
+        self.cpu_time = cpu_time
+        self.memory = memory
+        self.wall_time = wall_time
+
+    def apply(self):
+        """ Apply the CPU time and memory limits to the current process (e.g., a process which is about to execute a
+        simulator)
+        """
+        if resource is None:
+            return  # pragma: no cover
+        if self.cpu_time is not None:
+            # the soft limit sends SIGXCPU; the hard limit sends SIGKILL if the simulator ignores SIGXCPU
+            resource.setrlimit(resource.RLIMIT_CPU, (int(self.cpu_time), int(self.cpu_time) + 1))
+        if self.memory is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (int(self.memory), int(self.memory)))
+
+    def is_process_limited(self):
+        """ Determine whether the limits must be applied to the process of the simulator
+
+        Returns:
+            :obj:`bool`: :obj:`True` if there is a CPU time or memory limit
+        """
+        return self.cpu_time is not None or self.memory is not None
+
+
+class SimulatorCliJob(object):
+    """ Execution of a COMBINE/OMEX archive with a command-line interface to a simulator
+
+    Attributes:
+        archive_filename (:obj:`str`): path to a COMBINE/OMEX archive
+        out_dir (:obj:`str`): directory where outputs should be saved
+        simulator_command (:obj:`str` or :obj:`list` of :obj:`str`): system command for the simulator (e.g.,
+            ``tellurium`` or ``['python', '-m', 'biosimulators_tellurium']``)
+        environment (:obj:`dict`): additional environment variables for executing the simulator
+        limits (:obj:`ResourceLimits`): limits on the resources which the simulator can use
+        stdout_filename (:obj:`str`): path to save the standard output of the simulator
+        stderr_filename (:obj:`str`): path to save the standard error of the simulator
+        status (:obj:`Status`): status of the execution
+        return_code (:obj:`int`): exit code of the simulator
+        timed_out (:obj:`bool`): whether the simulator was killed because it exceeded its wall time
+        exception (:obj:`Exception`): exception
+        duration (:obj:`float`): duration of the execution in seconds
+    """
+
+    def __init__(self, archive_filename, out_dir, simulator_command, environment=None, limits=None,
+                 stdout_filename=None, stderr_filename=None):
+        """
+        Args:
+            archive_filename (:obj:`str`): path to a COMBINE/OMEX archive
+            out_dir (:obj:`str`): directory where outputs should be saved
+            simulator_command (:obj:`str` or :obj:`list` of :obj:`str`): system command for the simulator
+            environment (:obj:`dict`, optional): additional environment variables for executing the simulator
+            limits (:obj:`ResourceLimits`, optional): limits on the resources which the simulator can use
+            stdout_filename (:obj:`str`, optional): path to save the standard output of the simulator. Default:
+                ``stdout.txt`` in :obj:`out_dir`.
+            stderr_filename (:obj:`str`, optional): path to save the standard error of the simulator. Default:
+                ``stderr.txt`` in :obj:`out_dir`.
+        """
+        self.archive_filename = archive_filename
+        self.out_dir = out_dir
+        self.simulator_command = simulator_command
+        self.environment = environment or {}
+        self.limits = limits
+        self.stdout_filename = stdout_filename or os.path.join(out_dir, 'stdout.txt')
+        self.stderr_filename = stderr_filename or os.path.join(out_dir, 'stderr.txt')
+        self.status = Status.QUEUED
+        self.return_code = None
+        self.timed_out = False
+        self.exception = None
+        self.duration = None
+
+    def get_command(self):
+        """ Get the command and arguments for executing the archive
+
+        Returns:
+            :obj:`list` of :obj:`str`: command and arguments
+        """
+        if isinstance(self.simulator_command, str):
+            command = [self.simulator_command]
+        else:
+            command = list(self.simulator_command)
+        return command + build_cli_args(self.archive_filename, self.out_dir)
+
+
+async def exec_sedml_docs_in_archive_with_simulator_cli_async(job):
+    """ Use a command-line interface to a simulation tool to execute the tasks specified in a COMBINE/OMEX archive and
+    generate the reports specified in the archive, without blocking the event loop
+
+    The standard output and error of the simulator are streamed to files. Failures are recorded in the attributes of the
+    job rather than raised.
+
+    Args:
+        job (:obj:`SimulatorCliJob`): job
+
+    Returns:
+        :obj:`SimulatorCliJob`: job
+    """
+    job.status = Status.RUNNING
+    start_time = time.time()
+
+    limits = job.limits or ResourceLimits()
+    env = dict(os.environ)
+    env.update({key: str(val) for key, val in job.environment.items()})
+
+    try:
+        if not os.path.isdir(job.out_dir):
+            os.makedirs(job.out_dir)
+        for filename in [job.stdout_filename, job.stderr_filename]:
+            if os.path.dirname(filename) and not os.path.isdir(os.path.dirname(filename)):
+                os.makedirs(os.path.dirname(filename))
+
+        with open(job.stdout_filename, 'wb') as stdout, open(job.stderr_filename, 'wb') as stderr:
+            process = await asyncio.create_subprocess_exec(
+                *job.get_command(),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=stdout,
+                stderr=stderr,
+                env=env,
+                preexec_fn=limits.apply if resource is not None and limits.is_process_limited() else None,
+                # run the simulator in its own process group so that the processes which it starts can be killed with it
+                start_new_session=True,
+            )
+
+            try:
+                job.return_code = await asyncio.wait_for(process.wait(), timeout=limits.wall_time)
+            except asyncio.TimeoutError:
+                job.timed_out = True
+                kill_process_group(process)
+                job.return_code = await process.wait()
+            except asyncio.CancelledError:
+                kill_process_group(process)
+                await process.wait()
+                raise
+
+        if job.timed_out:
+            job.exception = RuntimeError("The command '{}' did not execute the archive within {} s.".format(
+                job.get_command()[0], limits.wall_time))
+        elif job.return_code != 0:
+            job.exception = RuntimeError("The command '{}' could not execute the archive (exit code {}). See `{}`.".format(
+                job.get_command()[0], job.return_code, job.stderr_filename))
+
+    except FileNotFoundError:
+        job.exception = RuntimeError("The command '{}' could not be found".format(job.get_command()[0]))
+
+    except Exception as exception:
+        job.exception = RuntimeError("The command '{}' could not execute the archive{}".format(
+            job.get_command()[0],
+            ':\n\n  ' + str(exception).replace('\n', '\n  ') if str(exception) else '.'))
+
+    job.status = Status.FAILED if job.exception else Status.SUCCEEDED
+    job.duration = time.time() - start_time
+    return job
+
+
+def kill_process_group(process):
+    """ Kill a process which was started in a new session, together with the processes which it started. Where process
+    groups are not available (e.g., Windows), only the process is killed.
+
+    Args:
+        process (:obj:`asyncio.subprocess.Process`): process
+    """
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    try:
+        process.kill()
+    except ProcessLookupError:  # pragma: no cover
+        pass
+
+
+async def exec_sedml_docs_in_archives_with_simulator_cli_async(jobs, max_concurrency=None, progress_callback=None):
+    """ Concurrently execute COMBINE/OMEX archives with command-line interfaces to simulators
+
+    Args:
+        jobs (:obj:`list` of :obj:`SimulatorCliJob`): jobs
+        max_concurrency (:obj:`int`, optional): maximum number of archives to execute concurrently. Default: the number
+            of CPUs.
+        progress_callback (:obj:`types.FunctionType`, optional): function which is called with each job, the number of
+            completed jobs, and the total number of jobs when each job starts and completes
+
+    Returns:
+        :obj:`list` of :obj:`SimulatorCliJob`: jobs
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+    num_completed = 0
+
+    def report_progress(job):
+        if progress_callback:
+            progress_callback(job, num_completed, len(jobs))
+
+    async def exec_job(job):
+        nonlocal num_completed
+        async with semaphore:
+            job.status = Status.RUNNING
+            report_progress(job)
+            await exec_sedml_docs_in_archive_with_simulator_cli_async(job)
+        num_completed += 1
+        report_progress(job)
+        return job
+
+    return list(await asyncio.gather(*[exec_job(job) for job in jobs]))
+
+
+def exec_sedml_docs_in_archives_with_simulator_cli(jobs, max_concurrency=None, progress_callback=None):
+    """ Concurrently execute COMBINE/OMEX archives with command-line interfaces to simulators, blocking until all of the
+    archives have been executed
+
+    Args:
+        jobs (:obj:`list` of :obj:`SimulatorCliJob`): jobs
+        max_concurrency (:obj:`int`, optional): maximum number of archives to execute concurrently. Default: the number
+            of CPUs.
+        progress_callback (:obj:`types.FunctionType`, optional): function which is called with each job, the number of
+            completed jobs, and the total number of jobs when each job starts and completes
+
+    Returns:
+        :obj:`list` of :obj:`SimulatorCliJob`: jobs
+    """
+    return asyncio.run(exec_sedml_docs_in_archives_with_simulator_cli_async(
+        jobs, max_concurrency=max_concurrency, progress_callback=progress_callback))
@@ -149,6 +149,10 @@ def build_cli(cli_name=None, cli_version=None,
             args = self.app.pargs
             config = get_config()
             config.LOG = True
+            if not config.SIMULATION_RESULTS_CACHE_NAMESPACE:
+                # results of simulations are only reused by the same versions of the simulator and its command-line application
+                config.SIMULATION_RESULTS_CACHE_NAMESPACE = '{}:{}/{}:{}'.format(
+                    cli_name, cli_version or '', simulator_name, simulator_version or '')
             try:
                 _, log = combine_archive_executer(args.archive, args.out_dir, config=config)
             except Exception as exception:
@@ -0,0 +1,346 @@
+""" Pool of long-lived containers of simulators for executing many COMBINE/OMEX archives
+
+:Date: 2026-10-18
+:Copyright: 2026, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+try:
+    import docker
+except ModuleNotFoundError:
+    docker = None
+from ..image import get_docker_image
+from .exec import build_cli_args
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import uuid
+
+__all__ = [
+    'DockerContainerPool',
+]
+
+
+class DockerContainerPool(object):
+    """ Pool of long-lived Docker containers of a simulator
+
+    Rather than starting a new container for each COMBINE/OMEX archive, the pool starts up to :obj:`size` containers
+    which idle (by running :obj:`keep_alive_command` in place of the entry point of the image) and executes archives
+    within them with ``docker exec``. A work directory of the host is bind-mounted into each container, and each
+    archive is executed within its own subdirectory of this directory.
+
+    At most :obj:`size` archives are executed concurrently; further executions wait for a container to become
+    available. Before each execution, the pool checks that the container is still running, and replaces containers
+    which have stopped. Containers are recycled (replaced by new containers) after they have executed
+    :obj:`max_jobs_per_container` archives, or if they stop running during an execution.
+
+    Attributes:
+        docker_image (:obj:`str`): tag or URL of the Docker image of the simulator
+        size (:obj:`int`): maximum number of containers
+        max_jobs_per_container (:obj:`int`): maximum number of archives to execute within each container before it is
+            recycled, or :obj:`None` to never recycle containers which execute archives successfully
+        command (:obj:`list` of :obj:`str`): command-line interface to the simulator within the image
+        docker_image_temp_dir (:obj:`str`): path to the temporary directory within the Docker image
+        docker_image_path_sep (:obj:`str`): path separator for the image
+        environment (:obj:`dict`): environment variables for the containers
+        user_to_exec_within_container (:obj:`str`): username or user id to execute commands within the containers
+        keep_alive_command (:obj:`list` of :obj:`str`): command which keeps idle containers running
+        work_dir (:obj:`str`): directory of the host which is mounted into the containers
+    """
+
+    def __init__(self, docker_image, size=1, max_jobs_per_container=None, command=None,
+                 docker_image_temp_dir='/tmp', docker_image_path_sep='/',
+                 environment=None, pull_docker_image=True, user_to_exec_within_container='_CURRENT_USER_',
+                 keep_alive_command=('tail', '-f', '/dev/null'), docker_client=None):
+        """
+        Args:
+            docker_image (:obj:`str`): tag (e.g., ``biosimulators/tellurium``) or
+                URL (``ghcr.io/biosimulators/tellurium``) for a Docker image of a simulator
+            size (:obj:`int`, optional): maximum number of containers (and concurrent executions)
+            max_jobs_per_container (:obj:`int`, optional): maximum number of archives to execute within each container
+                before it is recycled
+            command (:obj:`list` of :obj:`str`, optional): command-line interface to the simulator within the image.
+                Default: the entry point of the image.
+            docker_image_temp_dir (:obj:`str`, optional): Path to the temporary directory within the Docker image
+            docker_image_path_sep (:obj:`str`, optional): Path separator for the image
+            environment (:obj:`dict`, optional): environment variables for the containers
+            pull_docker_image (:obj:`bool`, optional): if :obj:`True`, pull the Docker image
+            user_to_exec_within_container (:obj:`str`, optional): username or user id to execute commands within the containers
+
+                * Use ``_CURRENT_USER_`` to indicate that the containers should execute commands as the current user (``os.getuid()``)
+                * Use ``_SUDO_`` to indicate that Docker should be run with ``sudo``
+                * Use the format ``<name|uid>[:<group|gid>]`` to indicate any other user/group that the containers should use to
+                  execute commands
+
+            keep_alive_command (:obj:`list` of :obj:`str`, optional): command which keeps idle containers running
+            docker_client (:obj:`docker.client.DockerClient`, optional): Docker client
+        """
+        if size < 1:
+            raise ValueError('The size of the pool must be at least 1.')
+
+        if user_to_exec_within_container == '_CURRENT_USER_':
+            if os.name != 'posix':
+                raise NotImplementedError('The current user id can only be retrieved for POSIX OSes')
+            user_to_exec_within_container = str(os.getuid())
+
+        if command is None:
+            if not docker:
+                raise ModuleNotFoundError("No module named 'docker'. Docker and the Python Docker package must be installed.")
+            image = get_docker_image(docker_client or docker.from_env(), docker_image, pull=pull_docker_image)
+            command = image.attrs.get('Config', {}).get('Entrypoint', None)
+            if isinstance(command, str):
+                command = [command]
+            if not command:
+                raise ValueError('The command-line interface of image `{}` must be provided because the image has no entry point.'.format(
+                    docker_image))
+
+        self.docker_image = docker_image
+        self.size = size
+        self.max_jobs_per_container = max_jobs_per_container
+        self.command = list(command)
+        self.docker_image_temp_dir = docker_image_temp_dir
+        self.docker_image_path_sep = docker_image_path_sep
+        self.environment = environment or {}
+        self.user_to_exec_within_container = user_to_exec_within_container
+        self.keep_alive_command = list(keep_alive_command)
+        self.work_dir = tempfile.mkdtemp(prefix='biosimulators-container-pool-')
+
+        self._image_work_dir = docker_image_path_sep.join((docker_image_temp_dir, 'biosimulators-container-pool'))
+        self._idle_containers = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._containers = {}
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def exec_archive(self, archive_filename, out_dir, environment=None, allocate_tty=False):
+        """ Use a container of the pool to execute the tasks specified in a COMBINE/OMEX archive and generate the
+        reports specified in the archive
+
+        Args:
+            archive_filename (:obj:`str`): path to a COMBINE/OMEX archive
+            out_dir (:obj:`str`): directory where outputs should be saved
+            environment (:obj:`dict`, optional): additional environment variables for executing the archive
+            allocate_tty (:obj:`bool`, optional): if :obj:`True`, allocate a pseudo-TTY
+
+        Raises:
+            :obj:`RuntimeError`: if the execution failed
+        """
+        if self._closed:
+            raise RuntimeError('The container pool has been closed.')
+
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.work_dir, job_id)
+        job_in_dir = os.path.join(job_dir, 'in')
+        job_out_dir = os.path.join(job_dir, 'out')
+        os.makedirs(job_in_dir)
+        os.makedirs(job_out_dir)
+        image_job_dir = self.docker_image_path_sep.join((self._image_work_dir, job_id))
+
+        self._slots.acquire()
+        container_id = None
+        succeeded = False
+        try:
+            # copy rather than link the archive so that the containers, which can write to the work directory, can't modify it
+            if os.path.isfile(archive_filename):
+                shutil.copyfile(archive_filename, os.path.join(job_in_dir, os.path.basename(archive_filename)))
+
+            container_id = self._get_container()
+
+            args = self._get_docker_command() + ['exec']
+            if self.user_to_exec_within_container and self.user_to_exec_within_container != '_SUDO_':
+                args.extend(['--user', self.user_to_exec_within_container])
+            for key, val in dict(environment or {}).items():
+                args.extend(['--env', '{}={}'.format(key, val)])
+            if allocate_tty:
+                args.append('--tty')
+            args.append(container_id)
+            args.extend(self.command)
+            args.extend(build_cli_args(
+                self.docker_image_path_sep.join((image_job_dir, 'in', os.path.basename(archive_filename))),
+                self.docker_image_path_sep.join((image_job_dir, 'out')),
+            ))
+
+            subprocess.check_call(args)
+            succeeded = True
+
+        except FileNotFoundError:
+            raise RuntimeError("Docker could not be found")
+
+        except subprocess.CalledProcessError as exception:
+            raise RuntimeError("The image '{}' could not execute the archive:\n\n  The simulator exited with status {}.".format(
+                self.docker_image, exception.returncode))
+
+        except Exception as exception:
+            raise RuntimeError("The image '{}' could not execute the archive:\n\n  {}".format(
+                self.docker_image, str(exception).replace('\n', '\n  ')))
+
+        finally:
+            if container_id:
+                self._release_container(container_id, succeeded)
+            self._slots.release()
+
+            # keep the outputs of failed executions, including their logs, as when the output directory is mounted
+            try:
+                if os.path.isdir(job_out_dir):
+                    if not os.path.isdir(out_dir):
+                        os.makedirs(out_dir)
+                    move_tree(job_out_dir, out_dir)
+            finally:
+                shutil.rmtree(job_dir, ignore_errors=True)
+
+    def get_num_containers(self):
+        """ Get the number of running containers of the pool
+
+        Returns:
+            :obj:`int`: number of containers
+        """
+        with self._lock:
+            return len(self._containers)
+
+    def close(self):
+        """ Remove the containers of the pool and its work directory """
+        self._closed = True
+        while True:
+            try:
+                container_id = self._idle_containers.get_nowait()
+            except queue.Empty:
+                break
+            self._remove_container(container_id)
+
+        with self._lock:
+            container_ids = list(self._containers.keys())
+        for container_id in container_ids:
+            self._remove_container(container_id)
+
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def is_container_healthy(self, container_id):
+        """ Determine whether a container is still running
+
+        Args:
+            container_id (:obj:`str`): id of the container
+
+        Returns:
+            :obj:`bool`: :obj:`True`, if the container is running
+        """
+        try:
+            state = subprocess.check_output(
+                self._get_docker_command() + ['inspect', '--format', '{{.State.Running}}', container_id],
+                stderr=subprocess.DEVNULL)
+        except Exception:
+            return False
+        return state.decode().strip() == 'true'
+
+    def _get_container(self):
+        """ Get an idle, healthy container, starting a new container if necessary
+
+        Returns:
+            :obj:`str`: id of the container
+        """
+        while True:
+            try:
+                container_id = self._idle_containers.get_nowait()
+            except queue.Empty:
+                return self._start_container()
+
+            if self.is_container_healthy(container_id):
+                return container_id
+            self._remove_container(container_id)
+
+    def _release_container(self, container_id, succeeded):
+        """ Return a container to the pool after an execution, or recycle the container
+
+        Args:
+            container_id (:obj:`str`): id of the container
+            succeeded (:obj:`bool`): whether the execution succeeded
+        """
+        with self._lock:
+            self._containers[container_id] += 1
+            num_jobs = self._containers[container_id]
+
+        if (
+            self._closed
+            or (self.max_jobs_per_container is not None and num_jobs >= self.max_jobs_per_container)
+            or (not succeeded and not self.is_container_healthy(container_id))
+        ):
+            self._remove_container(container_id)
+        else:
+            self._idle_containers.put(container_id)
+
+    def _start_container(self):
+        """ Start a container
+
+        Returns:
+            :obj:`str`: id of the container
+        """
+        temp_dir_host_path = os.getenv('TEMP_DIR_HOST_PATH', None)
+        if temp_dir_host_path:
+            mount_work_dir = os.path.join(temp_dir_host_path, os.path.basename(self.work_dir))
+        else:
+            mount_work_dir = self.work_dir
+
+        args = self._get_docker_command() + ['run', '--detach']
+        args.extend(['--mount', 'type=bind,source={},target={}'.format(mount_work_dir, self._image_work_dir)])
+        for key, val in self.environment.items():
+            args.extend(['--env', '{}={}'.format(key, val)])
+        if self.user_to_exec_within_container and self.user_to_exec_within_container != '_SUDO_':
+            args.extend(['--user', self.user_to_exec_within_container])
+        args.extend(['--entrypoint', self.keep_alive_command[0], self.docker_image])
+        args.extend(self.keep_alive_command[1:])
+
+        try:
+            container_id = subprocess.check_output(args, stderr=subprocess.PIPE).decode().strip()
+        except subprocess.CalledProcessError as exception:
+            raise RuntimeError('A container could not be started:\n\n  {}'.format(
+                (exception.stderr or b'').decode(errors='replace').strip().replace('\n', '\n  ') or 'Unknown error'))
+        with self._lock:
+            self._containers[container_id] = 0
+        return container_id
+
+    def _remove_container(self, container_id):
+        """ Remove a container
+
+        Args:
+            container_id (:obj:`str`): id of the container
+        """
+        with self._lock:
+            self._containers.pop(container_id, None)
+        subprocess.call(self._get_docker_command() + ['rm', '--force', container_id],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def _get_docker_command(self):
+        """ Get the command for running Docker
+
+        Returns:
+            :obj:`list` of :obj:`str`: command
+        """
+        if self.user_to_exec_within_container == '_SUDO_':
+            return ['sudo', 'docker']
+        return ['docker']
+
+
+def move_tree(src_dirname, dest_dirname):
+    """ Move the contents of a directory into another directory, merging subdirectories which exist in both
+
+    Args:
+        src_dirname (:obj:`str`): directory whose contents should be moved
+        dest_dirname (:obj:`str`): directory to move the contents into
+    """
+    for basename in os.listdir(src_dirname):
+        src_path = os.path.join(src_dirname, basename)
+        dest_path = os.path.join(dest_dirname, basename)
+        if os.path.isdir(src_path) and os.path.isdir(dest_path):
+            move_tree(src_path, dest_path)
+        else:
+            if os.path.isdir(dest_path):
+                shutil.rmtree(dest_path)
+            shutil.move(src_path, dest_path)
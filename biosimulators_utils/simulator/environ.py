@@ -6,6 +6,7 @@
 :License: MIT
 """
 
+from ..archive.data_model import ArchiveCompression
 from ..config import get_config
 from ..omex_meta.data_model import OmexMetadataInputFormat, OmexMetadataOutputFormat, OmexMetadataSchema
 from ..report.data_model import ReportFormat
@@ -47,6 +48,49 @@ ENVIRONMENT_VARIABLES = {
         more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
     ),
 
+    # COMBINE/OMEX archives
+    'EXTRACT_COMBINE_ARCHIVES_LAZILY': EnvironmentVariable(
+        name='EXTRACT_COMBINE_ARCHIVES_LAZILY',
+        description=(
+            'Whether to only unpack the files of COMBINE/OMEX archives which are needed to execute them (SED-ML '
+            'files, the models and data they reference, and the directories of the models), and unpack other '
+            'files on demand.'
+        ),
+        options=['0', '1'],
+        default='1' if config.EXTRACT_COMBINE_ARCHIVES_LAZILY else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'CACHE_COMBINE_ARCHIVES': EnvironmentVariable(
+        name='CACHE_COMBINE_ARCHIVES',
+        description=(
+            'Whether to cache unpacked COMBINE/OMEX archives and the results of their validation across '
+            'executions.'
+        ),
+        options=['0', '1'],
+        default='1' if config.CACHE_COMBINE_ARCHIVES else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'COMBINE_ARCHIVE_CACHE_DIR': EnvironmentVariable(
+        name='COMBINE_ARCHIVE_CACHE_DIR',
+        description=(
+            "Directory for the cache of unpacked COMBINE/OMEX archives (default: a subdirectory of the user's "
+            'cache directory).'
+        ),
+        options=None,
+        default=config.COMBINE_ARCHIVE_CACHE_DIR,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'COMBINE_ARCHIVE_CACHE_MAX_SIZE': EnvironmentVariable(
+        name='COMBINE_ARCHIVE_CACHE_MAX_SIZE',
+        description='Maximum size in bytes of the cache of unpacked COMBINE/OMEX archives.',
+        options=None,
+        default=str(config.COMBINE_ARCHIVE_CACHE_MAX_SIZE),
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
     # validation
     'VALIDATE_OMEX_MANIFESTS': EnvironmentVariable(
         name='VALIDATE_OMEX_MANIFESTS',
@@ -104,6 +148,95 @@ ENVIRONMENT_VARIABLES = {
         more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
     ),
 
+    # simulation results
+    'MEMOIZE_SIMULATION_RESULTS': EnvironmentVariable(
+        name='MEMOIZE_SIMULATION_RESULTS',
+        description=(
+            'Whether to reuse the results of deterministic simulations of tasks whose models, model changes, '
+            'simulations, algorithms, and variables are identical to those of previously executed tasks.'
+        ),
+        options=['0', '1'],
+        default='1' if config.MEMOIZE_SIMULATION_RESULTS else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'SIMULATION_RESULTS_MEMO_MAX_SIZE': EnvironmentVariable(
+        name='SIMULATION_RESULTS_MEMO_MAX_SIZE',
+        description='Maximum size in bytes of the memoized results of simulations kept in memory.',
+        options=None,
+        default=str(config.SIMULATION_RESULTS_MEMO_MAX_SIZE),
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'CACHE_SIMULATION_RESULTS': EnvironmentVariable(
+        name='CACHE_SIMULATION_RESULTS',
+        description=(
+            'Whether to store the results of deterministic simulations persistently and reuse them across '
+            'executions.'
+        ),
+        options=['0', '1'],
+        default='1' if config.CACHE_SIMULATION_RESULTS else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'SIMULATION_RESULTS_CACHE_DIR': EnvironmentVariable(
+        name='SIMULATION_RESULTS_CACHE_DIR',
+        description=(
+            "Directory to store the results of simulations (default: a subdirectory of the user's cache "
+            'directory).'
+        ),
+        options=None,
+        default=config.SIMULATION_RESULTS_CACHE_DIR,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'SIMULATION_RESULTS_CACHE_MAX_SIZE': EnvironmentVariable(
+        name='SIMULATION_RESULTS_CACHE_MAX_SIZE',
+        description='Maximum size in bytes of the stored results of simulations.',
+        options=None,
+        default=str(config.SIMULATION_RESULTS_CACHE_MAX_SIZE),
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'SIMULATION_RESULTS_CACHE_NAMESPACE': EnvironmentVariable(
+        name='SIMULATION_RESULTS_CACHE_NAMESPACE',
+        description='Namespace for the stored results of simulations (default: the id and version of the simulator).',
+        options=None,
+        default=config.SIMULATION_RESULTS_CACHE_NAMESPACE,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    # remote models
+    'CACHE_REMOTE_MODELS': EnvironmentVariable(
+        name='CACHE_REMOTE_MODELS',
+        description=(
+            'Whether to store models downloaded from URLs and BioModels persistently and reuse them across '
+            'executions.'
+        ),
+        options=['0', '1'],
+        default='1' if config.CACHE_REMOTE_MODELS else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'REMOTE_MODEL_CACHE_DIR': EnvironmentVariable(
+        name='REMOTE_MODEL_CACHE_DIR',
+        description=(
+            "Directory for the cache of downloaded models (default: a subdirectory of the user's cache "
+            'directory).'
+        ),
+        options=None,
+        default=config.REMOTE_MODEL_CACHE_DIR,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'REMOTE_MODEL_CACHE_TTL': EnvironmentVariable(
+        name='REMOTE_MODEL_CACHE_TTL',
+        description='Interval in seconds for which stored models are used without contacting their servers.',
+        options=None,
+        default=str(config.REMOTE_MODEL_CACHE_TTL),
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
     # algorithm substitution
     'ALGORITHM_SUBSTITUTION_POLICY': EnvironmentVariable(
         name='ALGORITHM_SUBSTITUTION_POLICY',
@@ -200,6 +333,28 @@ ENVIRONMENT_VARIABLES = {
         more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
     ),
 
+    'BUNDLE_COMPRESSION': EnvironmentVariable(
+        name='BUNDLE_COMPRESSION',
+        description=(
+            'Compression method for the zip files of reports and plots. Already compressed formats (e.g., PDF) '
+            'are stored without further compression.'
+        ),
+        options=[compression.value for compression in ArchiveCompression],
+        default=config.BUNDLE_COMPRESSION,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'BUNDLE_COMPRESSION_LEVEL': EnvironmentVariable(
+        name='BUNDLE_COMPRESSION_LEVEL',
+        description=(
+            'Compression level for the zip files of reports and plots (default: default of the compression '
+            'method).'
+        ),
+        options=None,
+        default=None,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
     'KEEP_INDIVIDUAL_OUTPUTS': EnvironmentVariable(
         name='KEEP_INDIVIDUAL_OUTPUTS',
         description=(
@@ -216,13 +371,47 @@ ENVIRONMENT_VARIABLES = {
         name='LOG_PATH',
         description=(
             'Path relative to output directories to save YAML-formatted logs of the '
-            'execution of COMBINE/OMEX archives and SED-ML files.'
+            'execution of COMBINE/OMEX archives and SED-ML files. '
+            'Logs are saved in JSON format if the path has the extension `.json`.'
         ),
         options=None,
         default=config.LOG_PATH,
         more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
     ),
 
+    'LOG_FORMAT': EnvironmentVariable(
+        name='LOG_FORMAT',
+        description=(
+            'Format to save logs of the execution of COMBINE/OMEX archives and SED-ML files. '
+            'By default, the format is inferred from the extension of `LOG_PATH`.'
+        ),
+        options=['yaml', 'json'],
+        default=config.LOG_FORMAT,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'LOG_MAX_OUTPUT_SIZE': EnvironmentVariable(
+        name='LOG_MAX_OUTPUT_SIZE',
+        description=(
+            'Maximum number of bytes of the standard output/error of each element of a COMBINE/OMEX archive to '
+            'retain in its execution log (default: unlimited).'
+        ),
+        options=None,
+        default=None,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'LOG_EXPORT_INTERVAL': EnvironmentVariable(
+        name='LOG_EXPORT_INTERVAL',
+        description=(
+            'Minimum interval in seconds between the rewrites of the execution log of a running COMBINE/OMEX '
+            'archive.'
+        ),
+        options=None,
+        default=str(config.LOG_EXPORT_INTERVAL),
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
     'VERBOSE': EnvironmentVariable(
         name='VERBOSE',
         description='Whether to print additional information about simulation runs.',
@@ -231,6 +420,95 @@ ENVIRONMENT_VARIABLES = {
         more_info_url='https://docs.biosimulations.org/concepts/conventions/simulator-interfaces/',
     ),
 
+    # APIs
+    'CACHE_API_RESPONSES': EnvironmentVariable(
+        name='CACHE_API_RESPONSES',
+        description=(
+            'Whether to store responses of the BioSimulations and BioSimulators APIs persistently and reuse them '
+            'across processes.'
+        ),
+        options=['0', '1'],
+        default='1' if config.CACHE_API_RESPONSES else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'API_CACHE_DIR': EnvironmentVariable(
+        name='API_CACHE_DIR',
+        description=(
+            "Directory for the cache of responses of the APIs (default: a subdirectory of the user's cache "
+            'directory).'
+        ),
+        options=None,
+        default=config.API_CACHE_DIR,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'API_CACHE_TTL': EnvironmentVariable(
+        name='API_CACHE_TTL',
+        description='Interval in seconds for which responses of the APIs are reused without contacting the APIs.',
+        options=None,
+        default=str(config.API_CACHE_TTL),
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'API_OFFLINE': EnvironmentVariable(
+        name='API_OFFLINE',
+        description='Whether to only use cached responses of the APIs, regardless of their age.',
+        options=['0', '1'],
+        default='1' if config.API_OFFLINE else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    # containers
+    'DOCKER_IMAGE_PULL_MAX_AGE': EnvironmentVariable(
+        name='DOCKER_IMAGE_PULL_MAX_AGE',
+        description='Minimum interval in seconds between pulls of each Docker image (default: always pull images).',
+        options=None,
+        default=None,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'DOCKER_IMAGE_DIGEST_CACHE_DIR': EnvironmentVariable(
+        name='DOCKER_IMAGE_DIGEST_CACHE_DIR',
+        description=(
+            'Directory for the record of the digests of pulled Docker images (default: a subdirectory of the '
+            "user's cache directory)."
+        ),
+        options=None,
+        default=config.DOCKER_IMAGE_DIGEST_CACHE_DIR,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'CACHE_SINGULARITY_IMAGES': EnvironmentVariable(
+        name='CACHE_SINGULARITY_IMAGES',
+        description=(
+            'Whether to reuse the Singularity images converted from Docker images, keyed by the ids of the Docker '
+            'images.'
+        ),
+        options=['0', '1'],
+        default='1' if config.CACHE_SINGULARITY_IMAGES else '0',
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'SINGULARITY_IMAGE_CACHE_DIR': EnvironmentVariable(
+        name='SINGULARITY_IMAGE_CACHE_DIR',
+        description=(
+            "Directory for the cache of Singularity images (default: a subdirectory of the user's cache "
+            'directory).'
+        ),
+        options=None,
+        default=config.SINGULARITY_IMAGE_CACHE_DIR,
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
+    'SINGULARITY_IMAGE_CACHE_MAX_SIZE': EnvironmentVariable(
+        name='SINGULARITY_IMAGE_CACHE_MAX_SIZE',
+        description='Maximum size in bytes of the cache of Singularity images.',
+        options=None,
+        default=str(config.SINGULARITY_IMAGE_CACHE_MAX_SIZE),
+        more_info_url='https://docs.biosimulators.org/Biosimulators_utils/source/biosimulators_utils.html',
+    ),
+
     # debugging
     'DEBUG': EnvironmentVariable(
         name='DEBUG',
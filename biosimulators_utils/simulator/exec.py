@@ -67,7 +67,8 @@ def exec_sedml_docs_in_archive_with_containerized_simulator(
         archive_filename, out_dir, docker_image,
         docker_image_temp_dir='/tmp', docker_image_path_sep='/',
         environment=None, pull_docker_image=True,
-        user_to_exec_within_container='_CURRENT_USER_', allocate_tty=True, remove_docker_container=True):
+        user_to_exec_within_container='_CURRENT_USER_', allocate_tty=True, remove_docker_container=True,
+        container_pool=None):
     """ Use a containerized simulator tool to execute the tasks specified in a
     COMBINE/OMEX archive and generate the reports specified in the archive
 
@@ -92,10 +93,19 @@ def exec_sedml_docs_in_archive_with_containerized_simulator(
 
         allocate_tty (:obj:`bool`, optional): if :obj:`True`, allocate a pseudo-TTY
         remove_docker_container (:obj:`bool`, optional): if :obj:`True`, automatically remove the container when it exits
+        container_pool (:obj:`DockerContainerPool`, optional): pool of long-lived containers of the image. If provided, the
+            archive is executed within a container of the pool rather than within a new container, and the image, user, and
+            paths of the pool are used.
 
     Raises:
         :obj:`RuntimeError`: if the execution failed
     """
+    if container_pool is not None:
+        if docker_image != container_pool.docker_image:
+            raise ValueError("The container pool is for image '{}' rather than '{}'.".format(container_pool.docker_image, docker_image))
+        container_pool.exec_archive(archive_filename, out_dir, environment=environment, allocate_tty=allocate_tty)
+        return
+
     if not docker:
         raise ModuleNotFoundError("No module named 'docker'. Docker and the Python Docker package must be installed.")
 
@@ -6,6 +6,8 @@
 :License: MIT
 """
 
+from ..biosimulations.utils import get_api_cache
+from ..config import Config  # noqa: F401
 from ..sedml.data_model import (SedDocument, Task, ModelLanguagePattern, ModelLanguageEdamId,  # noqa: F401
                                 SteadyStateSimulation, UniformTimeCourseSimulation, Algorithm, AlgorithmParameterChange)
 from .data_model import SoftwareInterface
@@ -15,7 +17,6 @@ from kisao.utils import get_substitutable_algorithms_for_policy
 import json
 import natsort
 import re
-import requests
 
 __all__ = [
     'BIOSIMULATORS_API_ENDPOINT',
@@ -32,27 +33,24 @@ __all__ = [
 BIOSIMULATORS_API_ENDPOINT = 'https://api.biosimulators.org/simulators'
 
 
-def get_simulator_specs(id, version='latest'):
+def get_simulator_specs(id, version='latest', config=None):
     """ Get the specifications of a simulation tool from the BioSimulators registry
 
     Args:
         id (:obj:`str`): id
         version (:obj:`str`, optional): version
+        config (:obj:`Config`, optional): configuration for the cache of responses of the registry
 
     Returns:
         :obj:`dict` with schema ``https://api.biosimulators.org/openapi.json#/components/schemas/Simulator``: specifications
     """
+    cache = get_api_cache(config=config)
     if version == 'latest':
         url = BIOSIMULATORS_API_ENDPOINT + '/' + id
-        response = requests.get(url)
-        response.raise_for_status()
-        version_specs = natsort.natsorted(response.json(), key=lambda version_spec: version_spec['version'])
-        return version_specs[-1]
+        return max(cache.get_json(url), key=natsort.natsort_keygen(key=lambda version_spec: version_spec['version']))
     else:
         url = BIOSIMULATORS_API_ENDPOINT + '/' + id + '/' + version
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return cache.get_json(url)
 
 
 def does_simulator_have_capabilities_to_execute_sed_document(sed_doc, simulator_specs,
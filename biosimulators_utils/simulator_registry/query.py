@@ -6,7 +6,7 @@
 :License: MIT
 """
 
-from ..biosimulations.utils import validate_biosimulations_api_response
+from ..biosimulations.utils import get_api_cache, validate_biosimulations_api_response
 from ..config import get_config, Config  # noqa: F401
 from ..globals import JSONType
 import requests
@@ -30,14 +30,16 @@ def get_simulator_version_specs(id: str, config: Config = None):
         config = get_config()
 
     endpoint: str = config.BIOSIMULATORS_API_ENDPOINT
-    response: requests.Response = requests.get('{}simulators/{}'.format(endpoint, id))
 
     try:
+        version_specs: JSONType = get_api_cache(config=config).get_json('{}simulators/{}'.format(endpoint, id))
+    except requests.HTTPError as exception:
+        response: requests.Response = exception.response
+        if response is None:
+            raise
+        if response.status_code == 404:
+            return []
         intro_failure_msg: str = "The specifications of the versions of `{}` could not be retrieved from the BioSimulators registry.".format(id)
         validate_biosimulations_api_response(response, intro_failure_msg, ValueError)
-        version_specs: JSONType = response.json()
-    except ValueError:
-        if response.status_code != 404:
-            raise
-        version_specs = []
+        raise
     return version_specs
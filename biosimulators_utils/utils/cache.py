@@ -0,0 +1,237 @@
+""" Utilities for persistent caches
+
+The entries of each persistent cache are stored in a subdirectory for the version of the format of its entries
+(e.g., ``v1``), so that entries in other formats are ignored. Entries are written atomically, and the times when they
+were last used are recorded as their modification times so that the least recently used entries can be evicted.
+Because caches are only optimizations, errors in reading and writing them (e.g., a read-only cache directory) are
+ignored.
+
+:Date: 2026-10-18
+:Copyright: 2026, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from ..log.data_model import write_file_atomically
+from ..warnings import warn, BioSimulatorsWarning
+import contextlib
+import os
+import shutil
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+__all__ = [
+    'get_versioned_cache_dirname',
+    'read_cache_file',
+    'write_cache_file',
+    'touch_cache_entry',
+    'lock_cache_entry',
+    'get_cache_entries',
+    'remove_cache_entry',
+    'evict_cache_entries',
+    'clear_cache_entries',
+]
+
+
+def get_versioned_cache_dirname(dirname, version):
+    """ Get the directory for the entries of a cache in a version of their format
+
+    Args:
+        dirname (:obj:`str`): directory for the cache
+        version (:obj:`int`): version of the format of the entries; increment when the format changes
+
+    Returns:
+        :obj:`str`: directory for the entries
+    """
+    return os.path.join(dirname, 'v{}'.format(version))
+
+
+def read_cache_file(filename, load, mode='rb'):
+    """ Read a file of a cache
+
+    Args:
+        filename (:obj:`str`): path to the file
+        load (:obj:`types.FunctionType`): function which reads the content of the file from a file object
+            (e.g., :obj:`pickle.load`)
+        mode (:obj:`str`, optional): mode to open the file (``rb`` or ``r``)
+
+    Returns:
+        :obj:`object`: content of the file, or :obj:`None` if the file doesn't exist or could not be read
+    """
+    try:
+        with open(filename, mode) as file:
+            return load(file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        warn('Cache `{}` could not be read and will be ignored.'.format(filename), BioSimulatorsWarning)
+        return None
+
+
+def write_cache_file(filename, contents):
+    """ Write a file of a cache atomically, creating its directory if needed
+
+    Args:
+        filename (:obj:`str`): path to the file
+        contents (:obj:`str` or :obj:`bytes`): contents of the file
+
+    Returns:
+        :obj:`bool`: whether the file was written
+    """
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        write_file_atomically(filename, contents)
+    except OSError:
+        return False
+    return True
+
+
+def touch_cache_entry(path):
+    """ Record that an entry of a cache was used
+
+    Args:
+        path (:obj:`str`): path to the entry
+    """
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+@contextlib.contextmanager
+def lock_cache_entry(path, shared=True, blocking=True):
+    """ Lock an entry of a cache with a lock file (``<path>.lock``). Processes which use an entry hold shared locks;
+    processes which build or remove an entry hold exclusive locks.
+
+    Where file locking is not available (e.g., Windows or a read-only cache directory), entries are not locked.
+
+    Args:
+        path (:obj:`str`): path to the entry
+        shared (:obj:`bool`, optional): whether to acquire a shared or an exclusive lock
+        blocking (:obj:`bool`, optional): whether to wait for the lock
+
+    Yields:
+        :obj:`bool`: whether the lock was acquired
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file = open(path + '.lock', 'a')
+    except OSError:
+        file = None
+
+    try:
+        if file is None or fcntl is None:
+            yield True
+            return
+
+        try:
+            fcntl.flock(file.fileno(), (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    finally:
+        if file is not None:
+            file.close()
+
+
+def get_cache_entries(dirname, get_size=None):
+    """ Get the entries of a cache. Temporary files (hidden files and ``*.tmp``) and lock files are ignored.
+
+    Args:
+        dirname (:obj:`str`): directory for the entries (see :obj:`get_versioned_cache_dirname`)
+        get_size (:obj:`types.FunctionType`, optional): function which gets the size of an entry from its path.
+            Default: :obj:`os.path.getsize`.
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: time of the last use, path, and size of each entry
+    """
+    entries = []
+    if not os.path.isdir(dirname):
+        return entries
+
+    for basename in os.listdir(dirname):
+        if basename.startswith('.') or basename.endswith('.tmp') or basename.endswith('.lock'):
+            continue
+        path = os.path.join(dirname, basename)
+        try:
+            last_used = os.stat(path).st_mtime_ns
+            size = (get_size or os.path.getsize)(path)
+        except (OSError, ValueError):
+            continue
+        entries.append((last_used, path, size))
+    return entries
+
+
+def remove_cache_entry(path, use_lock=False):
+    """ Remove an entry (a file or a directory) of a cache
+
+    The entry is moved out of place before it is removed so that it is never read while it is partially removed.
+
+    Args:
+        path (:obj:`str`): path to the entry
+        use_lock (:obj:`bool`, optional): whether the entries of the cache are locked while they are used
+            (see :obj:`lock_cache_entry`). If so, entries which are in use are not removed.
+
+    Returns:
+        :obj:`bool`: whether the entry was removed
+    """
+    lock = lock_cache_entry(path, shared=False, blocking=False) if use_lock else contextlib.nullcontext(True)
+    with lock as locked:
+        if not locked:
+            return False
+
+        try:
+            temp_dirname = tempfile.mkdtemp(dir=os.path.dirname(path), prefix='.tmp-')
+        except OSError:
+            return False
+        try:
+            os.rename(path, os.path.join(temp_dirname, 'entry'))
+        except OSError:
+            shutil.rmtree(temp_dirname, ignore_errors=True)
+            return False
+
+    shutil.rmtree(temp_dirname, ignore_errors=True)
+    return True
+
+
+def evict_cache_entries(dirname, max_size, keep=None, get_size=None, use_lock=False):
+    """ Evict the least recently used entries of a cache until the total size of its entries is within a maximum size
+
+    Args:
+        dirname (:obj:`str`): directory for the entries (see :obj:`get_versioned_cache_dirname`)
+        max_size (:obj:`int`): maximum size in bytes
+        keep (:obj:`str`, optional): path to an entry which should not be evicted
+        get_size (:obj:`types.FunctionType`, optional): function which gets the size of an entry from its path.
+            Default: :obj:`os.path.getsize`.
+        use_lock (:obj:`bool`, optional): whether the entries of the cache are locked while they are used
+            (see :obj:`remove_cache_entry`)
+    """
+    entries = sorted(get_cache_entries(dirname, get_size=get_size))
+    total_size = sum(size for _, _, size in entries)
+    for _, path, size in entries:
+        if total_size <= max_size:
+            break
+        if path == keep:
+            continue
+        if remove_cache_entry(path, use_lock=use_lock):
+            total_size -= size
+
+
+def clear_cache_entries(dirname, use_lock=False):
+    """ Remove all entries of a cache
+
+    Args:
+        dirname (:obj:`str`): directory for the entries (see :obj:`get_versioned_cache_dirname`)
+        use_lock (:obj:`bool`, optional): whether the entries of the cache are locked while they are used
+            (see :obj:`remove_cache_entry`)
+    """
+    for _, path, _ in get_cache_entries(dirname, get_size=lambda path: 0):
+        remove_cache_entry(path, use_lock=use_lock)
@@ -8,12 +8,16 @@
 
 from ..data_model import ValueType, OntologyTerm
 from ..warnings import warn, BioSimulatorsWarning
+import contextlib
+import functools
 import json
 import numpy
 import re
+import threading
 
 __all__ = [
     'are_lists_equal', 'none_sorted', 'assert_exception',
+    'memoize_structures', 'memoize_to_tuple', 'get_structural_digest',
     'validate_value', 'validate_str_value', 'format_value', 'parse_value',
     'patch_dict', 'pad_arrays_to_consistent_shapes',
     'flatten_nested_list_of_strings',
@@ -22,6 +26,101 @@ __all__ = [
 ]
 
 
+_structure_memo = threading.local()
+
+
+@contextlib.contextmanager
+def memoize_structures():
+    """ Context within which the tuple representations (see :obj:`memoize_to_tuple`) and structural digests
+    (see :obj:`get_structural_digest`) of objects are computed at most once. Contexts can be nested; the
+    memoized values are discarded when the outermost context exits. Objects should not be modified within
+    the context.
+    """
+    if getattr(_structure_memo, 'tuples', None) is not None:
+        yield
+        return
+
+    _structure_memo.tuples = {}
+    _structure_memo.digests = {}
+    try:
+        yield
+    finally:
+        _structure_memo.tuples = None
+        _structure_memo.digests = None
+
+
+def memoize_to_tuple(to_tuple):
+    """ Decorate a ``to_tuple`` method so that, within :obj:`memoize_structures`, the tuple representation of
+    each object is computed once, and the tuple representations of parent objects reuse those of their children
+
+    Args:
+        to_tuple (:obj:`types.FunctionType`): method which gets the tuple representation of an object
+
+    Returns:
+        :obj:`types.FunctionType`: decorated method
+    """
+    @functools.wraps(to_tuple)
+    def memoized_to_tuple(self):
+        tuples = getattr(_structure_memo, 'tuples', None)
+        if tuples is None:
+            return to_tuple(self)
+
+        key = (id(self), to_tuple)
+        memoized = tuples.get(key, None)
+        if memoized is None:
+            # the object is retained so that its id isn't reused during the context
+            memoized = tuples[key] = (self, to_tuple(self))
+        return memoized[1]
+
+    return memoized_to_tuple
+
+
+def get_structural_digest(obj):
+    """ Get a digest of the type and the tuple representation of an object. Objects whose tuple representations
+    are equal have equal digests. Digests are only stable within a process.
+
+    Within :obj:`memoize_structures`, the digest of each nested tuple is computed once, so digests of parent objects
+    are computed from the digests of their children.
+
+    Args:
+        obj (:obj:`object`): object with a ``to_tuple`` method
+
+    Returns:
+        :obj:`int`: digest
+    """
+    return hash((obj.__class__.__module__, obj.__class__.__qualname__,
+                 _get_value_digest(obj.to_tuple(), getattr(_structure_memo, 'digests', None))))
+
+
+def _get_value_digest(value, digests):
+    """ Get a digest of a value of a tuple representation
+
+    Args:
+        value (:obj:`object`): value
+        digests (:obj:`dict`): memoized digests of tuples and lists
+
+    Returns:
+        :obj:`int`: digest
+    """
+    if isinstance(value, (tuple, list)):
+        if digests is not None:
+            memoized = digests.get(id(value), None)
+            if memoized is not None:
+                return memoized[1]
+        digest = hash(tuple(_get_value_digest(el, digests) for el in value))
+        if digests is not None:
+            digests[id(value)] = (value, digest)
+        return digest
+
+    if isinstance(value, dict):
+        return hash(frozenset((key, _get_value_digest(val, digests)) for key, val in value.items()))
+
+    try:
+        return hash(value)
+    except TypeError:
+        return hash(repr(value))
+
+
 def are_lists_equal(a, b):
     """ Determine if two lists are equal, optionally up to the order of the elements
 
@@ -35,12 +134,15 @@ def are_lists_equal(a, b):
     if len(a) != len(b):
         return False
 
-    a = none_sorted(a, key=lambda x: x.to_tuple())
-    b = none_sorted(b, key=lambda x: x.to_tuple())
+    with memoize_structures():
+        # order elements by their digests; elements with the same digest are ordered by their tuple representations
+        comparator = none_sort_key_gen()
+        a = sorted(a, key=lambda x: (get_structural_digest(x), comparator(x.to_tuple())))
+        b = sorted(b, key=lambda x: (get_structural_digest(x), comparator(x.to_tuple())))
 
-    for a_el, b_el in zip(a, b):
-        if not a_el.is_equal(b_el):
-            return False
+        for a_el, b_el in zip(a, b):
+            if not a_el.is_equal(b_el):
+                return False
 
     return True
 
@@ -0,0 +1,249 @@
+""" Shared HTTP session and cache of files downloaded over HTTP(S)
+
+:Date: 2026-10-18
+:Copyright: 2026, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from .cache import get_versioned_cache_dirname, read_cache_file, write_cache_file, clear_cache_entries
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+import collections
+import hashlib
+import json
+import os
+import pickle
+import requests
+import threading
+import time
+
+__all__ = [
+    'get_http_session',
+    'HttpCache',
+]
+
+_http_sessions = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(num_retries=5, backoff_factor=0.25, pool_size=16):
+    """ Get a session for HTTP(S) requests with connection pooling and retrying. Sessions are shared within each process.
+
+    Args:
+        num_retries (:obj:`int`, optional): number of times to retry each query
+        backoff_factor (:obj:`float`, optional): initial delay between retries
+        pool_size (:obj:`int`, optional): maximum number of connections to keep open to each host
+
+    Returns:
+        :obj:`requests.Session`: session
+    """
+    key = (num_retries, backoff_factor, pool_size)
+    with _http_sessions_lock:
+        session = _http_sessions.get(key, None)
+        if session is None:
+            retry_strategy = Retry(
+                total=num_retries,
+                backoff_factor=backoff_factor,
+                allowed_methods=['HEAD', 'GET'],
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+            adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _http_sessions[key] = session
+    return session
+
+
+class HttpCache(object):
+    """ Cache of files downloaded over HTTP(S), keyed by their URLs
+
+    Each file is downloaded at most once per instance of the cache (e.g., once per execution of a SED document), or
+    at most once per :obj:`memo_ttl` seconds. Optionally, files are also stored in a directory and reused across
+    instances. Stored files are used without contacting their servers for :obj:`ttl` seconds; afterwards, they are
+    revalidated with conditional requests (``If-None-Match``/``If-Modified-Since``) so that they are only downloaded
+    again if they changed. In offline mode, files are only served from the cache, regardless of their age.
+
+    Attributes:
+        dirname (:obj:`str`): directory to store downloaded files, or :obj:`None` to only keep files in memory
+        ttl (:obj:`float`): interval in seconds for which stored files are used without contacting their servers
+        memo_ttl (:obj:`float`): interval in seconds for which files are reused by the instance without contacting their
+            servers, or :obj:`None` to reuse files for the lifetime of the instance
+        offline (:obj:`bool`): whether to only serve files from the cache
+        session (:obj:`requests.Session`): session for downloading files
+        timeout (:obj:`float`): timeout in seconds for each request
+    """
+
+    # version of the format of the entries of the cache
+    VERSION = 1
+
+    def __init__(self, dirname=None, ttl=0., memo_ttl=None, offline=False, session=None, timeout=60.):
+        """
+        Args:
+            dirname (:obj:`str`, optional): directory to store downloaded files, or :obj:`None` to only keep files in memory
+            ttl (:obj:`float`, optional): interval in seconds for which stored files are used without contacting their servers
+            memo_ttl (:obj:`float`, optional): interval in seconds for which files are reused by the instance without
+                contacting their servers. Default: the lifetime of the instance.
+            offline (:obj:`bool`, optional): whether to only serve files from the cache
+            session (:obj:`requests.Session`, optional): session for downloading files. Default: :obj:`get_http_session`.
+            timeout (:obj:`float`, optional): timeout in seconds for each request
+        """
+        self.dirname = dirname
+        self.ttl = ttl
+        self.memo_ttl = memo_ttl
+        self.offline = offline
+        self.session = session or get_http_session()
+        self.timeout = timeout
+        self._entries = {}
+        self._locks = collections.defaultdict(threading.Lock)
+        self._locks_lock = threading.Lock()
+
+    def get(self, url):
+        """ Get the content of a URL
+
+        Args:
+            url (:obj:`str`): URL
+
+        Returns:
+            :obj:`bytes`: content
+
+        Raises:
+            :obj:`requests.RequestException`: if the URL could not be downloaded, or the cache is offline and the
+                URL has not been cached
+        """
+        entry = self._entries.get(url, None)
+        if entry is not None and self._is_memo_fresh(entry):
+            return entry['content']
+
+        with self._locks_lock:
+            lock = self._locks[url]
+        with lock:
+            entry = self._entries.get(url, None)
+            if entry is None or not self._is_memo_fresh(entry):
+                entry = self._entries[url] = self._download(url, entry)
+        return entry['content']
+
+    def get_json(self, url):
+        """ Get the content of a URL, decoded from JSON
+
+        Args:
+            url (:obj:`str`): URL
+
+        Returns:
+            :obj:`object`: decoded content. Each call returns a new object which callers can modify.
+
+        Raises:
+            :obj:`requests.RequestException`: if the URL could not be downloaded, or the cache is offline and the
+                URL has not been cached
+        """
+        return json.loads(self.get(url))
+
+    def clear(self, disk=False):
+        """ Discard the files downloaded by this instance of the cache and, optionally, the stored files
+
+        Args:
+            disk (:obj:`bool`, optional): whether to also remove the stored files
+        """
+        self._entries.clear()
+
+        if disk and self.dirname:
+            clear_cache_entries(get_versioned_cache_dirname(self.dirname, self.VERSION))
+
+    def _is_memo_fresh(self, entry):
+        """ Determine whether an entry in memory can be reused without contacting its server
+
+        Args:
+            entry (:obj:`dict`): entry
+
+        Returns:
+            :obj:`bool`: whether the entry can be reused
+        """
+        return self.offline or self.memo_ttl is None or 0 <= time.time() - entry['validated'] < self.memo_ttl
+
+    def _download(self, url, entry=None):
+        """ Download a URL, or get it from the stored files
+
+        Args:
+            url (:obj:`str`): URL
+            entry (:obj:`dict`, optional): expired entry in memory for the URL
+
+        Returns:
+            :obj:`dict`: entry
+        """
+        stored_entry = self._read(url)
+        if stored_entry is not None and (entry is None or stored_entry['validated'] > entry['validated']):
+            entry = stored_entry
+
+        if self.offline:
+            if entry is None:
+                raise requests.ConnectionError('`{}` has not been cached and cannot be downloaded in offline mode.'.format(url))
+            return entry
+
+        ttl = self.ttl if self.memo_ttl is None else min(self.ttl, self.memo_ttl)
+        if entry is not None and 0 <= time.time() - entry['validated'] < ttl:
+            return entry
+
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if entry is not None and response.status_code == 304:
+            entry = dict(entry, validated=time.time())
+        else:
+            response.raise_for_status()
+            etag = response.headers.get('ETag', None)
+            last_modified = response.headers.get('Last-Modified', None)
+            entry = {
+                'url': url,
+                'etag': etag if isinstance(etag, str) else None,
+                'last_modified': last_modified if isinstance(last_modified, str) else None,
+                'validated': time.time(),
+                'content': response.content,
+            }
+        self._write(url, entry)
+
+        return entry
+
+    def _get_filename(self, url):
+        """ Get the path to the stored file for a URL
+
+        Args:
+            url (:obj:`str`): URL
+
+        Returns:
+            :obj:`str`: path
+        """
+        return os.path.join(get_versioned_cache_dirname(self.dirname, self.VERSION), hashlib.sha256(url.encode()).hexdigest() + '.pickle')
+
+    def _read(self, url):
+        """ Read the stored file for a URL
+
+        Args:
+            url (:obj:`str`): URL
+
+        Returns:
+            :obj:`dict`: entry, or :obj:`None` if the URL is not stored or the entry could not be read
+        """
+        if not self.dirname:
+            return None
+
+        entry = read_cache_file(self._get_filename(url), pickle.load)
+        if not isinstance(entry, dict) or entry.get('url', None) != url:
+            return None
+        return entry
+
+    def _write(self, url, entry):
+        """ Store the file for a URL
+
+        Args:
+            url (:obj:`str`): URL
+            entry (:obj:`dict`): entry
+        """
+        if not self.dirname:
+            return
+
+        write_cache_file(self._get_filename(url), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
@@ -6,12 +6,16 @@
 :License: MIT
 """
 
+from ..config import get_app_dirs
 from ..warnings import warn, BioSimulatorsWarning
+from .cache import get_versioned_cache_dirname, read_cache_file, write_cache_file
 import dataclasses
 import datetime
 import dateutil.parser
+import functools
 import json
 import os.path
+import pickle
 import pkg_resources
 import regex as re
 import requests
@@ -27,11 +31,41 @@ __all__ = [
     'download_identifiers_org_namespaces',
     'get_identifiers_org_namespace',
     'validate_identifiers_org_uri',
+    'validate_identifiers_org_uris',
 ]
 
 
 NAMESPACES_ENDPOINT = 'https://registry.api.identifiers.org/resolutionApi/getResolverDataset'
 
+# version of the format of the cache of the parsed namespaces, which depends on the data classes below
+NAMESPACES_CACHE_VERSION = 2
+
+URI_PATTERN = re.compile(r'^https?://identifiers\.org/((([^/:]+)/([^/:]+)|[^/:]+)([/:])(.+))$')
+
+# maximum number of URIs whose validity is memoized
+URI_VALIDITY_CACHE_SIZE = 2 ** 16
+
+
+class LazyPattern(object):
+    """ Attribute of a data class which is a regular expression that is compiled when it is first read. The attribute
+    can be set to a regular expression or to the source of a regular expression.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = '_' + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            # the attribute has no default value
+            raise AttributeError(self.name[1:])
+        pattern = obj.__dict__[self.name]
+        if isinstance(pattern, str):
+            pattern = obj.__dict__[self.name] = re.compile(pattern)
+        return pattern
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
 
 @dataclasses.dataclass
 class IdentifiersOrgCountry(object):
@@ -73,7 +107,7 @@ class IdentifiersOrgNamespace(object):
     prefix: str
     name: str
     description: str
-    pattern: re.Pattern
+    pattern: typing.Union[re.Pattern, str] = LazyPattern()
     embedded_in_lui: bool
     sample_id: str
     resources: typing.List[IdentifiersOrgNamespaceResource]
@@ -107,73 +141,23 @@ def get_identifiers_org_namespaces(reload=False):
         filename = pkg_resources.resource_filename('biosimulators_utils', os.path.join('utils', 'identifiers_org.json'))
 
         if os.path.isfile(filename) and not reload:
-            with open(filename, 'r') as file:
-                raw_namespaces = json.load(file)
+            cache_filename = get_identifiers_org_namespaces_cache_filename(filename)
+            namespaces_skipped_namespaces = read_identifiers_org_namespaces_cache(cache_filename)
+            if namespaces_skipped_namespaces is None:
+                with open(filename, 'r') as file:
+                    raw_namespaces = json.load(file)
+                namespaces_skipped_namespaces = parse_identifiers_org_namespaces(raw_namespaces)
+                write_identifiers_org_namespaces_cache(cache_filename, namespaces_skipped_namespaces)
+
         else:
             raw_namespaces = download_identifiers_org_namespaces()
             with open(filename, 'w') as file:
                 json.dump(raw_namespaces, file)
+            namespaces_skipped_namespaces = parse_identifiers_org_namespaces(raw_namespaces)
+            write_identifiers_org_namespaces_cache(get_identifiers_org_namespaces_cache_filename(filename),
+                                                   namespaces_skipped_namespaces)
 
-        namespaces = {}
-        skipped_namespaces = []
-        for namespace in raw_namespaces:
-            resources = []
-            for resource in namespace['resources']:
-                resources.append(IdentifiersOrgNamespaceResource(
-                    id=resource['id'],
-                    mir_id=resource['mirId'],
-                    name=resource['name'],
-                    description=resource['description'],
-                    url_pattern=resource['urlPattern'],
-                    official=resource['official'],
-                    provider_code=resource['providerCode'],
-                    sample_id=resource['sampleId'],
-                    home_url=resource['resourceHomeUrl'],
-                    institution=IdentifiersOrgInstitution(
-                        id=resource['institution']['id'],
-                        name=resource['institution']['name'],
-                        home_url=resource['institution']['homeUrl'],
-                        description=resource['institution']['description'],
-                        ror_id=resource['institution']['rorId'],
-                        country=IdentifiersOrgCountry(
-                            code=resource['institution']['location']['countryCode'],
-                            name=resource['institution']['location']['countryName'],
-                        ),
-                    ),
-                    country=IdentifiersOrgCountry(
-                        code=resource['location']['countryCode'],
-                        name=resource['location']['countryName'],
-                    ),
-                    deprecated=resource['deprecated'],
-                    deprecated_date=dateutil.parser.parse(resource['deprecationDate']) if resource['deprecationDate'] else None,
-                ))
-
-            try:
-                pattern = re.compile(namespace['pattern'])
-            except re.error as exception:
-                msg = "'{}' (prefix '{}'): '{}' is not valid: {}.".format(
-                    namespace['name'], namespace['prefix'], namespace['pattern'], str(exception))
-                skipped_namespaces.append(msg)
-                continue
-
-            namespace_obj = IdentifiersOrgNamespace(
-                id=namespace['id'],
-                mir_id=namespace['mirId'],
-                prefix=namespace['prefix'],
-                name=namespace['name'],
-                description=namespace['description'],
-                pattern=pattern,
-                embedded_in_lui=namespace['namespaceEmbeddedInLui'],
-                sample_id=namespace['sampleId'],
-                resources=resources,
-                deprecated=namespace['deprecated'],
-                deprecated_date=dateutil.parser.parse(namespace['deprecationDate']) if namespace['deprecationDate'] else None,
-                created=dateutil.parser.parse(namespace['created']),
-                modified=dateutil.parser.parse(namespace['modified']),
-            )
-            namespaces[namespace['prefix'].lower()] = namespace_obj
-            for resource in namespace['resources']:
-                namespaces[resource['providerCode'].lower() + '/' + namespace['prefix'].lower()] = namespace_obj
+        namespaces, skipped_namespaces = namespaces_skipped_namespaces
 
         if skipped_namespaces:
             msg = '{} namespaces will not be validated because their regular expression patterns are not valid:\n  - {}'.format(
@@ -181,10 +165,131 @@ def get_identifiers_org_namespaces(reload=False):
             warn(msg, BioSimulatorsWarning)
 
         IDENTIFIERS_ORG_NAMESPACES = namespaces
+        get_identifiers_org_uri_error.cache_clear()
 
     return IDENTIFIERS_ORG_NAMESPACES
 
 
+def parse_identifiers_org_namespaces(raw_namespaces):
+    """ Parse the namespaces registered with `Identifiers.org <https://identifiers.org/>`_.
+
+    Args:
+        raw_namespaces (:obj:`list` of :obj:`dict`): namespaces returned by the Identifiers.org API
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`dict`: dictionary that maps the prefix of each Identifiers.org namespace or
+              a tuple of its provider code and its prefix to its attributes
+            * :obj:`list` of :obj:`str`: descriptions of the namespaces which were skipped because their patterns are invalid
+    """
+    namespaces = {}
+    skipped_namespaces = []
+    for namespace in raw_namespaces:
+        resources = []
+        for resource in namespace['resources']:
+            resources.append(IdentifiersOrgNamespaceResource(
+                id=resource['id'],
+                mir_id=resource['mirId'],
+                name=resource['name'],
+                description=resource['description'],
+                url_pattern=resource['urlPattern'],
+                official=resource['official'],
+                provider_code=resource['providerCode'],
+                sample_id=resource['sampleId'],
+                home_url=resource['resourceHomeUrl'],
+                institution=IdentifiersOrgInstitution(
+                    id=resource['institution']['id'],
+                    name=resource['institution']['name'],
+                    home_url=resource['institution']['homeUrl'],
+                    description=resource['institution']['description'],
+                    ror_id=resource['institution']['rorId'],
+                    country=IdentifiersOrgCountry(
+                        code=resource['institution']['location']['countryCode'],
+                        name=resource['institution']['location']['countryName'],
+                    ),
+                ),
+                country=IdentifiersOrgCountry(
+                    code=resource['location']['countryCode'],
+                    name=resource['location']['countryName'],
+                ),
+                deprecated=resource['deprecated'],
+                deprecated_date=dateutil.parser.parse(resource['deprecationDate']) if resource['deprecationDate'] else None,
+            ))
+
+        # check that the pattern is valid; the pattern is compiled again lazily when it is first used
+        try:
+            re.compile(namespace['pattern'])
+        except re.error as exception:
+            msg = "'{}' (prefix '{}'): '{}' is not valid: {}.".format(
+                namespace['name'], namespace['prefix'], namespace['pattern'], str(exception))
+            skipped_namespaces.append(msg)
+            continue
+
+        namespace_obj = IdentifiersOrgNamespace(
+            id=namespace['id'],
+            mir_id=namespace['mirId'],
+            prefix=namespace['prefix'],
+            name=namespace['name'],
+            description=namespace['description'],
+            pattern=namespace['pattern'],
+            embedded_in_lui=namespace['namespaceEmbeddedInLui'],
+            sample_id=namespace['sampleId'],
+            resources=resources,
+            deprecated=namespace['deprecated'],
+            deprecated_date=dateutil.parser.parse(namespace['deprecationDate']) if namespace['deprecationDate'] else None,
+            created=dateutil.parser.parse(namespace['created']),
+            modified=dateutil.parser.parse(namespace['modified']),
+        )
+        namespaces[namespace['prefix'].lower()] = namespace_obj
+        for resource in namespace['resources']:
+            namespaces[resource['providerCode'].lower() + '/' + namespace['prefix'].lower()] = namespace_obj
+
+    return (namespaces, skipped_namespaces)
+
+
+def get_identifiers_org_namespaces_cache_filename(filename):
+    """ Get the path to the cache of the parsed namespaces for a JSON file of the Identifiers.org namespaces
+
+    The path is keyed by the size and modification time of the JSON file so that the cache is rebuilt whenever the
+    JSON file is updated.
+
+    Args:
+        filename (:obj:`str`): path to the JSON file of the Identifiers.org namespaces
+
+    Returns:
+        :obj:`str`: path to the cache of the parsed namespaces
+    """
+    stat = os.stat(filename)
+    return os.path.join(get_versioned_cache_dirname(os.path.join(get_app_dirs().user_cache_dir, 'identifiers_org'),
+                                                    NAMESPACES_CACHE_VERSION),
+                        'namespaces-{}-{}.pickle'.format(stat.st_size, stat.st_mtime_ns))
+
+
+def read_identifiers_org_namespaces_cache(cache_filename):
+    """ Read the cache of the parsed Identifiers.org namespaces
+
+    Args:
+        cache_filename (:obj:`str`): path to the cache
+
+    Returns:
+        :obj:`tuple`: dictionary of namespaces and list of skipped namespaces (see :obj:`parse_identifiers_org_namespaces`),
+            or :obj:`None` if the cache doesn't exist or can't be read
+    """
+    return read_cache_file(cache_filename, pickle.load)
+
+
+def write_identifiers_org_namespaces_cache(cache_filename, namespaces_skipped_namespaces):
+    """ Save the parsed Identifiers.org namespaces to a cache
+
+    Args:
+        cache_filename (:obj:`str`): path to the cache
+        namespaces_skipped_namespaces (:obj:`tuple`): dictionary of namespaces and list of skipped namespaces
+            (see :obj:`parse_identifiers_org_namespaces`)
+    """
+    write_cache_file(cache_filename, pickle.dumps(namespaces_skipped_namespaces, protocol=pickle.HIGHEST_PROTOCOL))
+
+
 def download_identifiers_org_namespaces():
     """ Get the namespaces registered with `Identifiers.org <https://identifiers.org/>`_.
 
@@ -219,10 +324,91 @@ def get_identifiers_org_namespace(prefix):
 def validate_identifiers_org_uri(uri):
     """ Determine whether a URI is a validate for one of the namespaces registered with Identifiers.org
 
+    The validity of each URI is memoized.
+
+    Args:
+        uri (:obj:`str`): URI
+
     Raises:
         :obj:`InvalidIdentifiersOrgUri`: if the URI is not a valid with one of the namespaces registered with Identifiers.org
     """
-    match = re.match(r'^https?://identifiers\.org/((([^/:]+)/([^/:]+)|[^/:]+)([/:])(.+))$', uri)
+    error = get_identifiers_org_uri_error(uri)
+    if error:
+        raise InvalidIdentifiersOrgUri(error)
+
+
+def validate_identifiers_org_uris(uris):
+    """ Determine whether each of multiple URIs is valid for one of the namespaces registered with Identifiers.org
+
+    Each distinct URI is validated once, and the URIs are validated namespace by namespace. The validity of each URI is
+    memoized together with that of the URIs validated with :obj:`validate_identifiers_org_uri`.
+
+    Args:
+        uris (:obj:`collections.abc.Iterable` of :obj:`str`): URIs
+
+    Returns:
+        :obj:`dict`: dictionary that maps each URI to :obj:`None` if the URI is valid or to an :obj:`InvalidIdentifiersOrgUri`
+            which describes why the URI is invalid
+    """
+    results = {}
+    namespace_uris = {}
+    for uri in uris:
+        if uri in results:
+            continue
+        results[uri] = None
+
+        match = URI_PATTERN.match(uri)
+        prefix = match.group(2).lower() if match else None
+        if prefix not in namespace_uris:
+            namespace_uris[prefix] = []
+        namespace_uris[prefix].append(uri)
+
+    for prefix_uris in namespace_uris.values():
+        for uri in prefix_uris:
+            error = get_identifiers_org_uri_error(uri)
+            if error:
+                results[uri] = InvalidIdentifiersOrgUri(error)
+
+    return results
+
+
+@functools.lru_cache(maxsize=URI_VALIDITY_CACHE_SIZE)
+def get_identifiers_org_uri_error(uri):
+    """ Get a description of why a URI is not valid for one of the namespaces registered with Identifiers.org
+
+    Args:
+        uri (:obj:`str`): URI
+
+    Returns:
+        :obj:`str`: description of why the URI is invalid, or :obj:`None` if the URI is valid
+    """
+    try:
+        namespace, match = parse_identifiers_org_uri(uri)
+        validate_identifiers_org_id(namespace, match)
+    except InvalidIdentifiersOrgUri as exception:
+        return str(exception)
+    return None
+
+
+def parse_identifiers_org_uri(uri):
+    """ Parse an Identifiers.org URI into its namespace and local identifier
+
+    Args:
+        uri (:obj:`str`): URI
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`IdentifiersOrgNamespace`: namespace
+            * :obj:`re.Match`: match of the URI to :obj:`URI_PATTERN`
+
+    Raises:
+        :obj:`InvalidIdentifiersOrgUri`: if the URI is not an Identifiers.org URI or its namespace is not defined
+    """
+    match = URI_PATTERN.match(uri)
+    if not match:
+        raise InvalidIdentifiersOrgUri('`{}` is not an Identifiers.org URI.'.format(uri))
+
     try:
         namespace = get_identifiers_org_namespace(match.group(2).lower())
     except InvalidIdentifiersOrgUri:
@@ -231,13 +417,27 @@ def validate_identifiers_org_uri(uri):
         else:
             raise
 
+    return (namespace, match)
+
+
+def validate_identifiers_org_id(namespace, match):
+    """ Determine whether the local identifier of a parsed Identifiers.org URI is valid for its namespace
+
+    Args:
+        namespace (:obj:`IdentifiersOrgNamespace`): namespace
+        match (:obj:`re.Match`): match of the URI to :obj:`URI_PATTERN`
+
+    Raises:
+        :obj:`InvalidIdentifiersOrgUri`: if the identifier is not valid for the namespace
+    """
+    pattern = namespace.pattern
     if (
         not (
             not (match.group(5) in [':', '/'] and ':' in match.group(6)) and
-            re.match(namespace.pattern, match.group(6))
+            pattern.match(match.group(6))
         ) and
-        not re.match(namespace.pattern, match.group(1)) and
-        not (match.group(4) and re.match(namespace.pattern, match.group(4) + match.group(5) + match.group(6)))
+        not pattern.match(match.group(1)) and
+        not (match.group(4) and pattern.match(match.group(4) + match.group(5) + match.group(6)))
     ):
         raise InvalidIdentifiersOrgUri('Identifier `{}` is not valid for the `{}` namespace.'.format(
             match.group(4) + match.group(5) + match.group(6) if match.group(4) else match.group(6),
@@ -0,0 +1,131 @@
+""" Record of the output files produced by the execution of COMBINE/OMEX archives
+
+:Date: 2026-10-18
+:Copyright: 2026, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+import os
+import threading
+
+__all__ = [
+    'OutputManifest',
+    'register_output_file',
+]
+
+_ACTIVE_MANIFESTS = []
+_ACTIVE_MANIFESTS_LOCK = threading.Lock()
+
+
+class OutputManifest(object):
+    """ Record of the files written into an output directory during an execution
+
+    While a manifest is active (used as a context manager), files registered with :obj:`register_output_file`
+    which are located inside the directory of the manifest are recorded by the manifest. This enables
+    outputs to be bundled and cleaned up without scanning output directories, which may also contain the
+    outputs of other executions. Executers which save outputs without the writers of this package should
+    register them with :obj:`register_output_file`; otherwise, their outputs are not bundled or cleaned up.
+
+    Attributes:
+        dirname (:obj:`str`): output directory
+    """
+
+    def __init__(self, dirname):
+        """
+        Args:
+            dirname (:obj:`str`): output directory
+        """
+        self.dirname = os.path.abspath(dirname)
+        self._filenames = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with _ACTIVE_MANIFESTS_LOCK:
+            _ACTIVE_MANIFESTS.append(self)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        with _ACTIVE_MANIFESTS_LOCK:
+            _ACTIVE_MANIFESTS.remove(self)
+
+    def register(self, filename):
+        """ Record a file, if it is located inside the output directory of the manifest
+
+        Args:
+            filename (:obj:`str`): path to the file
+
+        Returns:
+            :obj:`bool`: whether the file was recorded
+        """
+        filename = os.path.abspath(filename)
+        if not filename.startswith(self.dirname + os.path.sep):
+            return False
+        with self._lock:
+            self._filenames[filename] = None
+        return True
+
+    def get_filenames(self, extensions=None, dirname=None):
+        """ Get the recorded files which still exist, in the order in which they were first recorded
+
+        Args:
+            extensions (:obj:`list` of :obj:`str`, optional): if provided, only get files with these extensions
+                (e.g., ``.csv``)
+            dirname (:obj:`str`, optional): if provided, only get files located inside this directory
+
+        Returns:
+            :obj:`list` of :obj:`str`: absolute paths to the files
+        """
+        if extensions is not None:
+            extensions = set(extension.lower() for extension in extensions)
+        if dirname is not None:
+            dirname = os.path.abspath(dirname) + os.path.sep
+
+        with self._lock:
+            filenames = list(self._filenames.keys())
+
+        return [
+            filename for filename in filenames
+            if (
+                (extensions is None or os.path.splitext(filename)[1].lower() in extensions)
+                and (dirname is None or filename.startswith(dirname))
+                and os.path.isfile(filename)
+            )
+        ]
+
+    def remove_files(self, filenames):
+        """ Remove files, and then remove the parent directories of the files which become empty, up to
+        the output directory of the manifest
+
+        Args:
+            filenames (:obj:`list` of :obj:`str`): paths to the files
+        """
+        dirnames = set()
+        for filename in filenames:
+            filename = os.path.abspath(filename)
+            if os.path.isfile(filename):
+                os.remove(filename)
+            with self._lock:
+                self._filenames.pop(filename, None)
+            dirnames.add(os.path.dirname(filename))
+
+        # remove the deepest directories first so that their parents can become empty
+        for dirname in sorted(dirnames, key=lambda dirname: dirname.count(os.path.sep), reverse=True):
+            while (
+                dirname.startswith(self.dirname + os.path.sep)
+                and os.path.isdir(dirname)
+                and not os.listdir(dirname)
+            ):
+                os.rmdir(dirname)
+                dirname = os.path.dirname(dirname)
+
+
+def register_output_file(filename):
+    """ Record an output file with the active output manifests whose directories contain the file
+
+    Args:
+        filename (:obj:`str`): path to the file
+    """
+    with _ACTIVE_MANIFESTS_LOCK:
+        manifests = list(_ACTIVE_MANIFESTS)
+    for manifest in manifests:
+        manifest.register(filename)
@@ -8,6 +8,7 @@
 
 from ..sedml.data_model import Plot2D, Plot3D  # noqa: F401
 from ..report.data_model import DataGeneratorResults  # noqa: F401
+from ..utils.output_manifest import register_output_file
 from ..warnings import warn
 from .data_model import VizFormat
 from .warnings import IllogicalVizWarning
@@ -98,7 +99,9 @@ def write_plot_2d(plot, data_generator_results, base_path, rel_path, format=VizF
     dirname = os.path.dirname(os.path.join(os.path.join(base_path, rel_path)))
     if not os.path.isdir(dirname):
         os.makedirs(dirname)
-    figure.savefig(os.path.join(base_path, rel_path + '.' + format.value))
+    filename = os.path.join(base_path, rel_path + '.' + format.value)
+    figure.savefig(filename)
+    register_output_file(filename)
 
 
 def write_plot_3d(plot, data_generator_results, base_path, rel_path, format=VizFormat.pdf,
@@ -245,4 +248,6 @@ def write_plot_3d(plot, data_generator_results, base_path, rel_path, format=VizF
     dirname = os.path.dirname(os.path.join(os.path.join(base_path, rel_path)))
     if not os.path.isdir(dirname):
         os.makedirs(dirname)
-    figure.savefig(os.path.join(base_path, rel_path + '.' + format.value))
+    filename = os.path.join(base_path, rel_path + '.' + format.value)
+    figure.savefig(filename)
+    register_output_file(filename)
@@ -5,6 +5,7 @@ import os
 import shutil
 import tempfile
 import unittest
+import zipfile
 
 
 class ArchiveIoTestCase(unittest.TestCase):
@@ -57,3 +58,41 @@ class ArchiveIoTestCase(unittest.TestCase):
 
         archive3 = utils.build_archive_from_paths([os.path.join(archive_outdir, '**')], archive_outdir)
         self.assertTrue(archive2.is_equal(archive3))
+
+    def test_write_with_compression(self):
+        archive = data_model.Archive()
+        for i_file, extension in enumerate(['.csv', '.pdf', '.csv', '.PDF', '.tsv']):
+            filename = os.path.join(self.tmp_dir, 'file-{}{}'.format(i_file, extension))
+            with open(filename, 'w') as file:
+                file.write(('ABC,' * 1000 + '\n') * (i_file + 1))
+            archive.files.append(data_model.ArchiveFile(local_path=filename, archive_path='a/file-{}{}'.format(i_file, extension)))
+
+        for compression in data_model.ArchiveCompression:
+            archive_filename = os.path.join(self.tmp_dir, '{}.zip'.format(compression.value))
+            io.ArchiveWriter().run(archive, archive_filename, compression=compression)
+
+            with zipfile.ZipFile(archive_filename, 'r') as zip_file:
+                self.assertEqual(zip_file.testzip(), None)
+                self.assertEqual(zip_file.namelist(), [file.archive_path for file in archive.files])
+                for file in archive.files:
+                    with open(file.local_path, 'rb') as local_file:
+                        self.assertEqual(zip_file.read(file.archive_path), local_file.read())
+
+                    info = zip_file.getinfo(file.archive_path)
+                    if file.archive_path.lower().endswith('.pdf'):
+                        self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+                    else:
+                        self.assertEqual(info.compress_type, io.ZIP_COMPRESSION_METHODS[compression])
+
+            archive_outdir = os.path.join(self.tmp_dir, 'out-{}'.format(compression.value))
+            self.assertTrue(io.ArchiveReader().run(archive_filename, archive_outdir).is_equal(data_model.Archive(files=[
+                data_model.ArchiveFile(local_path=os.path.join(archive_outdir, file.archive_path), archive_path=file.archive_path)
+                for file in archive.files
+            ])))
+
+        archive_filename = os.path.join(self.tmp_dir, 'level.zip')
+        io.ArchiveWriter().run(archive, archive_filename, compression='deflate', compression_level=1,
+                               compression_by_extension={})
+        with zipfile.ZipFile(archive_filename, 'r') as zip_file:
+            self.assertEqual(zip_file.testzip(), None)
+            self.assertEqual(set(info.compress_type for info in zip_file.infolist()), set([zipfile.ZIP_DEFLATED]))
@@ -1,12 +1,21 @@
 from biosimulators_utils.biosimulations.utils import (
     run_simulation_project, publish_simulation_project, get_published_project,
     get_authorization_for_client, validate_biosimulations_api_response,
-    get_file_extension_combine_uri_map,
+    get_file_extension_combine_uri_map, get_api_cache, get_api_session, get_formats,
 )
+from biosimulators_utils.config import Config
+from biosimulators_utils.simulator import specs
+from biosimulators_utils.simulator_registry.query import get_simulator_version_specs
 from unittest import mock
+import functools
+import http.server
+import json
 import os
 import requests
+import shutil
 import simplejson.errors
+import tempfile
+import threading
 import unittest
 
 
@@ -157,8 +166,133 @@ class BioSimulationsUtilsTestCase(unittest.TestCase):
                 }
             }
         ]
-        with mock.patch('requests.get', return_value=mock.Mock(raise_for_status=lambda: None, json=lambda: formats)):
+        get_api_cache().clear()
+        with mock.patch('requests.Session.get', return_value=mock.Mock(
+                status_code=200, headers={}, raise_for_status=lambda: None, content=json.dumps(formats).encode())):
             map = get_file_extension_combine_uri_map()
+        get_api_cache().clear()
         self.assertEqual(map, {
             'ext': set(['http://purl.org/NET/mediatypes/type', 'uri']),
         })
+
+
+class ApiServer(http.server.ThreadingHTTPServer):
+    """ Stand-in for the BioSimulations and BioSimulators APIs """
+
+    def __init__(self):
+        super(ApiServer, self).__init__(('127.0.0.1', 0), ApiRequestHandler)
+        self.responses = {}
+        self.requests = []
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}/'.format(self.server_address[1])
+
+
+class ApiRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('If-None-Match', None)))
+
+        status, body = self.server.responses.get(self.path, (404, {'error': [{'status': 404, 'title': 'Not found'}]}))
+        etag = '"{}"'.format(hash(json.dumps(body)))
+        if status == 200 and self.headers.get('If-None-Match', None) == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        if status == 200:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ApiCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.server = ApiServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        self.server.responses['/ontologies/EDAM'] = (200, [{
+            'fileExtensions': ['xml'],
+            'mediaTypes': ['application/xml'],
+        }])
+        self.server.responses['/simulators/tellurium'] = (200, [
+            {'id': 'tellurium', 'version': '2.2.0'},
+            {'id': 'tellurium', 'version': '2.10.0'},
+            {'id': 'tellurium', 'version': '2.1.6'},
+        ])
+        self.server.responses['/simulators/invalid'] = (400, {'error': [{'status': 400, 'title': 'Invalid id'}]})
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp_dir)
+
+    def _get_config(self, **kwargs):
+        return Config(BIOSIMULATIONS_API_ENDPOINT=self.server.url,
+                      BIOSIMULATORS_API_ENDPOINT=self.server.url,
+                      CACHE_API_RESPONSES=True,
+                      API_CACHE_DIR=self.tmp_dir,
+                      **kwargs)
+
+    def test_get_api_cache(self):
+        config = self._get_config(API_CACHE_TTL=60.)
+        self.assertIs(get_api_cache(config=config), get_api_cache(config=config))
+
+        # responses are reused within the TTL
+        self.assertEqual(get_formats(config=config)[0]['fileExtensions'], ['xml'])
+        self.assertEqual(get_file_extension_combine_uri_map(config=config),
+                         {'xml': set(['http://purl.org/NET/mediatypes/application/xml'])})
+        self.assertEqual(len(self.server.requests), 1)
+
+        versions = get_simulator_version_specs('tellurium', config=config)
+        versions[0]['version'] = 'modified'
+        self.assertEqual(get_simulator_version_specs('tellurium', config=config)[0]['version'], '2.2.0')
+        with mock.patch.object(specs, 'BIOSIMULATORS_API_ENDPOINT', self.server.url + 'simulators'):
+            self.assertEqual(specs.get_simulator_specs('tellurium', config=config)['version'], '2.10.0')
+        self.assertEqual(len(self.server.requests), 2)
+
+        self.assertEqual(get_simulator_version_specs('undefined', config=config), [])
+        with self.assertRaisesRegex(ValueError, 'Invalid id'):
+            get_simulator_version_specs('invalid', config=config)
+
+        # afterwards, responses are revalidated
+        num_requests = len(self.server.requests)
+        config = self._get_config(API_CACHE_TTL=0.)
+        get_formats(config=config)
+        get_formats(config=config)
+        self.assertEqual(len(self.server.requests), num_requests + 2)
+        self.assertIsNotNone(self.server.requests[-1][1])
+
+        # in offline mode, only stored responses are used
+        num_requests = len(self.server.requests)
+        config = self._get_config(API_CACHE_TTL=0., API_OFFLINE=True)
+        self.assertEqual(get_formats(config=config)[0]['fileExtensions'], ['xml'])
+        self.assertEqual(get_simulator_version_specs('tellurium', config=config)[1]['version'], '2.10.0')
+        with self.assertRaisesRegex(requests.ConnectionError, 'offline'):
+            get_simulator_version_specs('copasi', config=config)
+        self.assertEqual(len(self.server.requests), num_requests)
+
+    def test_errors_of_api(self):
+        # responses with error statuses are retried, and then reported as before
+        self.server.responses['/simulators/unavailable'] = (503, {'error': [{'status': 503, 'title': 'Service unavailable'}]})
+        config = self._get_config(API_CACHE_TTL=30.)
+        with mock.patch('biosimulators_utils.biosimulations.utils.get_api_session',
+                        functools.partial(get_api_session, num_retries=2, backoff_factor=0.)):
+            with self.assertRaisesRegex(ValueError, 'Service unavailable'):
+                get_simulator_version_specs('unavailable', config=config)
+        self.assertEqual([path for path, _ in self.server.requests], ['/simulators/unavailable'] * 3)
+
+        # errors in connecting to the APIs are retried fewer times
+        retry = get_api_session(config=config).get_adapter(self.server.url).max_retries
+        self.assertEqual(retry.status, 10)
+        self.assertEqual(retry.connect, 2)
+        self.assertEqual(retry.read, 2)
@@ -0,0 +1,166 @@
+from biosimulators_utils.combine import cache
+from biosimulators_utils.combine.data_model import CombineArchive, CombineArchiveContent
+from biosimulators_utils.combine.io import CombineArchiveReader, CombineArchiveWriter
+from biosimulators_utils.config import Config
+from biosimulators_utils.utils import cache as utils_cache
+from unittest import mock
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class CombineArchiveCacheTestCase(unittest.TestCase):
+    OMEX_FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'Ciliberto-J-Cell-Biol-2003-morphogenesis-checkpoint.omex')
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+
+    def tearDown(self):
+        cache.remove_tree(self.tmp_dir)
+
+    def test_read_and_validate(self):
+        config = Config(VALIDATE_SEDML_MODELS=False, COMBINE_ARCHIVE_CACHE_DIR=self.cache_dir)
+        archive_cache = cache.CombineArchiveCache(config=config)
+
+        out_dir = os.path.join(self.tmp_dir, 'out')
+        archive, errors, warnings = archive_cache.read_and_validate(self.OMEX_FIXTURE, out_dir, config=config)
+        self.assertEqual(errors, [])
+        self.assertTrue(archive.is_equal(CombineArchiveReader().run(self.OMEX_FIXTURE, os.path.join(self.tmp_dir, 'expected'))))
+
+        # the archive is executed from a private copy of the cache, which can be modified without changing the cache
+        digest = cache.get_archive_digest(self.OMEX_FIXTURE)
+        archive_dirname = os.path.join(archive_cache.get_entry_dirname(digest), 'archive')
+        self.assertFalse(os.path.islink(os.path.join(out_dir, 'simulation_1.sedml')))
+        with open(os.path.join(out_dir, 'simulation_1.sedml'), 'r') as file:
+            with open(os.path.join(archive_dirname, 'simulation_1.sedml'), 'r') as cached_file:
+                self.assertEqual(file.read(), cached_file.read())
+        with open(os.path.join(out_dir, 'simulation_1.sedml'), 'w') as file:
+            file.write('modified')
+        with open(os.path.join(out_dir, 'modified-model.xml'), 'w') as file:
+            file.write('')
+        with open(os.path.join(archive_dirname, 'simulation_1.sedml'), 'r') as cached_file:
+            self.assertNotEqual(cached_file.read(), 'modified')
+        self.assertFalse(os.path.isfile(os.path.join(archive_dirname, 'modified-model.xml')))
+
+        # repeated reads skip unpacking and validation
+        out_dir_2 = os.path.join(self.tmp_dir, 'out-2')
+        with mock.patch.object(CombineArchiveReader, 'run', side_effect=Exception('Archive should not be read')):
+            with mock.patch('biosimulators_utils.combine.cache.validate', side_effect=Exception('Archive should not be validated')):
+                archive_2, errors_2, warnings_2 = cache.CombineArchiveCache(config=config).read_and_validate(
+                    self.OMEX_FIXTURE, out_dir_2, config=config)
+        self.assertTrue(archive_2.is_equal(archive))
+        self.assertEqual(errors_2, errors)
+        self.assertEqual(warnings_2, warnings)
+        self.assertEqual(sorted(os.listdir(out_dir_2)), sorted(os.listdir(archive_dirname)))
+
+        # validation results are keyed by the configuration
+        config.VALIDATE_IMAGES = False
+        with mock.patch('biosimulators_utils.combine.cache.validate', return_value=([], [])) as validate:
+            archive_cache.validate(self.OMEX_FIXTURE, config=config)
+        validate.assert_called_once()
+
+        archive_cache.clear()
+        self.assertEqual(archive_cache.get_size(), 0)
+        self.assertFalse(os.path.isdir(archive_dirname))
+
+    def test_eviction(self):
+        in_dir = os.path.join(self.tmp_dir, 'in')
+        os.mkdir(in_dir)
+        archive = CombineArchive(contents=[
+            CombineArchiveContent(location='data.txt', format='http://purl.org/NET/mediatypes/text/plain'),
+        ])
+
+        archive_filenames = []
+        for i_archive in range(3):
+            with open(os.path.join(in_dir, 'data.txt'), 'w') as file:
+                file.write(str(i_archive) * 1000)
+            archive_filename = os.path.join(self.tmp_dir, 'archive-{}.omex'.format(i_archive))
+            CombineArchiveWriter().run(archive, in_dir, archive_filename)
+            archive_filenames.append(archive_filename)
+
+        config = Config(COMBINE_ARCHIVE_CACHE_DIR=self.cache_dir, COMBINE_ARCHIVE_CACHE_MAX_SIZE=2500)
+        archive_cache = cache.CombineArchiveCache(config=config)
+        archive_cache.read(archive_filenames[0], config=config)
+        archive_cache.read(archive_filenames[1], config=config)
+        self.assertEqual(len(archive_cache._get_entries()), 2)
+
+        # the least recently used archive is evicted
+        os.utime(archive_cache.get_entry_dirname(archive_cache.get_digest(archive_filenames[1])), ns=(0, 0))
+        archive_cache.read(archive_filenames[2], config=config)
+        self.assertEqual(
+            sorted(entry_dirname for _, entry_dirname, _ in archive_cache._get_entries()),
+            sorted([
+                archive_cache.get_entry_dirname(archive_cache.get_digest(archive_filenames[0])),
+                archive_cache.get_entry_dirname(archive_cache.get_digest(archive_filenames[2])),
+            ]),
+        )
+        self.assertLessEqual(archive_cache.get_size(), 2500)
+
+    def test_entries_in_use_are_not_evicted(self):
+        config = Config(VALIDATE_SEDML_MODELS=False, COMBINE_ARCHIVE_CACHE_DIR=self.cache_dir)
+        archive_cache = cache.CombineArchiveCache(config=config)
+        archive_cache.read(self.OMEX_FIXTURE, config=config)
+        entry_dirname = archive_cache.get_entry_dirname(archive_cache.get_digest(self.OMEX_FIXTURE))
+
+        with archive_cache._lock_entry(entry_dirname):
+            archive_cache.max_size = 0
+            archive_cache.evict()
+            if utils_cache.fcntl:
+                self.assertTrue(os.path.isdir(os.path.join(entry_dirname, 'archive')))
+
+        archive_cache.evict()
+        self.assertFalse(os.path.isdir(entry_dirname))
+        self.assertEqual(archive_cache._get_entries(), [])
+
+    def test_invalid_archive(self):
+        config = Config(COMBINE_ARCHIVE_CACHE_DIR=self.cache_dir)
+        archive_cache = cache.CombineArchiveCache(config=config)
+
+        with self.assertRaisesRegex(ValueError, 'is not a file'):
+            archive_cache.read(os.path.join(self.tmp_dir, 'undefined.omex'), config=config)
+
+        filename = os.path.join(self.tmp_dir, 'invalid.omex')
+        with open(filename, 'w') as file:
+            file.write('invalid')
+        with self.assertRaisesRegex(ValueError, 'not a valid COMBINE/OMEX archive'):
+            archive_cache.read(filename, config=config)
+        self.assertEqual(archive_cache._get_entries(), [])
+        self.assertEqual([basename for basename in os.listdir(os.path.join(self.cache_dir, 'v{}'.format(cache.CACHE_VERSION)))
+                          if not basename.endswith('.lock')], [])
+
+    def test_shared_cache_dir(self):
+        shutil.copyfile(self.OMEX_FIXTURE, os.path.join(self.tmp_dir, 'copy.omex'))
+
+        config = Config(VALIDATE_SEDML_MODELS=False, COMBINE_ARCHIVE_CACHE_DIR=self.cache_dir)
+        archive_cache = cache.CombineArchiveCache(config=config)
+        archive_cache.read(self.OMEX_FIXTURE, config=config)
+        archive_cache.read(os.path.join(self.tmp_dir, 'copy.omex'), config=config)
+        self.assertEqual(len(archive_cache._get_entries()), 1)
+
+    def test_copy_tree(self):
+        src_dirname = os.path.join(self.tmp_dir, 'src')
+        os.makedirs(os.path.join(src_dirname, 'subdir'))
+        for filename in ['a.txt', 'b.txt', os.path.join('subdir', 'c.txt')]:
+            with open(os.path.join(src_dirname, filename), 'w') as file:
+                file.write(filename)
+
+        # files are copied if they can't be cloned, and cloning is only attempted once
+        dest_dirname = os.path.join(self.tmp_dir, 'dest')
+        with mock.patch.object(cache, 'clone_file', return_value=False) as clone_file:
+            cache.copy_tree(src_dirname, dest_dirname)
+        self.assertEqual(clone_file.call_count, 1)
+        for filename in ['a.txt', 'b.txt', os.path.join('subdir', 'c.txt')]:
+            with open(os.path.join(dest_dirname, filename), 'r') as file:
+                self.assertEqual(file.read(), filename)
+
+        # clones are independent of the original files
+        dest_dirname = os.path.join(self.tmp_dir, 'dest-2')
+        cache.copy_tree(src_dirname, dest_dirname)
+        with open(os.path.join(dest_dirname, 'a.txt'), 'w') as file:
+            file.write('modified')
+        with open(os.path.join(src_dirname, 'a.txt'), 'r') as file:
+            self.assertEqual(file.read(), 'a.txt')
+        with open(os.path.join(dest_dirname, 'b.txt'), 'r') as file:
+            self.assertEqual(file.read(), 'b.txt')
@@ -1,8 +1,9 @@
-from biosimulators_utils.archive.io import ArchiveReader
+from biosimulators_utils.archive.io import ArchiveReader, get_mounted_archive, materialize_path
 from biosimulators_utils.combine import exec
 from biosimulators_utils.combine.data_model import CombineArchive, CombineArchiveContent, CombineArchiveContentFormat
 from biosimulators_utils.combine.exceptions import CombineArchiveExecutionError, NoSedmlError
-from biosimulators_utils.combine.io import CombineArchiveWriter
+from biosimulators_utils.combine.cache import CombineArchiveCache
+from biosimulators_utils.combine.io import CombineArchiveReader, CombineArchiveWriter
 from biosimulators_utils.config import get_config
 from biosimulators_utils.log import utils as log_utils
 from biosimulators_utils.report.data_model import ReportFormat, ReportResults, SedDocumentResults, VariableResults
@@ -11,7 +12,9 @@ from biosimulators_utils.sedml.data_model import (SedDocument, Task, Report, Mod
 from biosimulators_utils.sedml import exec as sedml_exec
 from biosimulators_utils.sedml.exceptions import SedmlExecutionError
 from biosimulators_utils.sedml.io import SedmlSimulationReader, SedmlSimulationWriter
+from biosimulators_utils.utils.output_manifest import register_output_file
 from biosimulators_utils.viz.data_model import VizFormat
+from biosimulators_utils.warnings import BioSimulatorsWarning
 from unittest import mock
 import builtins
 import datetime
@@ -65,8 +68,10 @@ class ExecCombineTestCase(unittest.TestCase):
                 os.makedirs(out_dir)
             with open(os.path.join(out_dir, 'report1.csv'), 'w') as file:
                 file.write('ABC')
+            register_output_file(os.path.join(out_dir, 'report1.csv'))
             with open(os.path.join(out_dir, 'report2.csv'), 'w') as file:
                 file.write('DEF')
+            register_output_file(os.path.join(out_dir, 'report2.csv'))
             with open(os.path.join(base_out_dir, 'reports.h5'), 'w') as file:
                 file.write('DEF')
             return ReportResults({
@@ -133,8 +138,10 @@ class ExecCombineTestCase(unittest.TestCase):
                 os.makedirs(out_dir)
             with open(os.path.join(out_dir, 'report1.csv'), 'w') as file:
                 file.write('ABC')
+            register_output_file(os.path.join(out_dir, 'report1.csv'))
             with open(os.path.join(out_dir, 'report2.csv'), 'w') as file:
                 file.write('DEF')
+            register_output_file(os.path.join(out_dir, 'report2.csv'))
             with open(os.path.join(base_out_dir, 'reports.h5'), 'w') as file:
                 file.write('DEF')
             raise ValueError('An error')
@@ -194,12 +201,16 @@ class ExecCombineTestCase(unittest.TestCase):
                 os.makedirs(out_dir)
             with open(os.path.join(out_dir, 'report1.csv'), 'w') as file:
                 file.write('ABC')
+            register_output_file(os.path.join(out_dir, 'report1.csv'))
             with open(os.path.join(out_dir, 'report2.csv'), 'w') as file:
                 file.write('DEF')
+            register_output_file(os.path.join(out_dir, 'report2.csv'))
             with open(os.path.join(out_dir, 'plot1.pdf'), 'w') as file:
                 file.write('GHI')
+            register_output_file(os.path.join(out_dir, 'plot1.pdf'))
             with open(os.path.join(out_dir, 'plot2.pdf'), 'w') as file:
                 file.write('JKL')
+            register_output_file(os.path.join(out_dir, 'plot2.pdf'))
             return None, None
 
         with mock.patch('biosimulators_utils.sedml.exec.exec_sed_doc', side_effect=exec_sed_doc):
@@ -299,6 +310,7 @@ class ExecCombineTestCase(unittest.TestCase):
                 os.makedirs(out_dir)
             with open(os.path.join(out_dir, 'report1.csv'), 'w') as file:
                 file.write('ABC')
+            register_output_file(os.path.join(out_dir, 'report1.csv'))
             return None, None
 
         builtin_import = builtins.__import__
@@ -324,6 +336,141 @@ class ExecCombineTestCase(unittest.TestCase):
 
         importlib.reload(log_utils)
 
+    def test_exec_sedml_docs_in_archive_lazily(self):
+        archive_filename = os.path.join(os.path.dirname(__file__), '..', 'fixtures',
+                                        'Ciliberto-J-Cell-Biol-2003-morphogenesis-checkpoint.omex')
+        out_dir = os.path.join(self.tmp_dir, 'outputs')
+
+        working_dirs = []
+
+        def sed_doc_executer(filename, working_dir, base_out_dir, rel_path, apply_xml_model_changes=False,
+                             indent=0, log=None, log_level=None, config=None):
+            working_dirs.append(working_dir)
+            self.assertEqual(sorted(os.listdir(working_dir)), [
+                'BIOMD0000000297_url.xml',
+                'manifest.xml',
+                'metadata.rdf',
+                'simulation_1.sedml',
+            ])
+            self.assertTrue(materialize_path(os.path.join(working_dir, 'reports.h5')))
+            return None, None
+
+        config = get_config()
+        config.EXTRACT_COMBINE_ARCHIVES_LAZILY = True
+        config.VALIDATE_SEDML_MODELS = False
+        config.LOG = False
+        exec.exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, config=config)
+
+        self.assertEqual(len(working_dirs), 1)
+        self.assertEqual(get_mounted_archive(working_dirs[0]), (None, None))
+        self.assertFalse(os.path.isdir(working_dirs[0]))
+
+    def test_exec_sedml_docs_in_archive_with_cache(self):
+        archive_filename = os.path.join(os.path.dirname(__file__), '..', 'fixtures',
+                                        'Ciliberto-J-Cell-Biol-2003-morphogenesis-checkpoint.omex')
+
+        working_dirs = []
+
+        def sed_doc_executer(filename, working_dir, base_out_dir, rel_path, apply_xml_model_changes=False,
+                             indent=0, log=None, log_level=None, config=None):
+            working_dirs.append(working_dir)
+            self.assertFalse(os.path.islink(filename))
+            with open(filename, 'a') as file:
+                file.write('<!-- modified by the simulator -->')
+            with open(os.path.join(working_dir, 'modified-model.xml'), 'w'):
+                pass
+            return None, None
+
+        config = get_config()
+        config.CACHE_COMBINE_ARCHIVES = True
+        config.COMBINE_ARCHIVE_CACHE_DIR = os.path.join(self.tmp_dir, 'cache')
+        config.VALIDATE_SEDML_MODELS = False
+        config.LOG = False
+        exec.exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, os.path.join(self.tmp_dir, 'outputs-1'), config=config)
+
+        with mock.patch.object(CombineArchiveReader, 'run', side_effect=Exception('Archive should not be unpacked')):
+            with mock.patch('biosimulators_utils.combine.cache.validate', side_effect=Exception('Archive should not be validated')):
+                exec.exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, os.path.join(self.tmp_dir, 'outputs-2'),
+                                                config=config)
+
+        self.assertEqual(len(working_dirs), 2)
+        self.assertFalse(os.path.isdir(working_dirs[0]))
+
+        # modifications of the files of the archive do not change the cache
+        archive_cache = CombineArchiveCache(config=config)
+        entry_dirname = archive_cache.get_entry_dirname(archive_cache.get_digest(archive_filename))
+        for dirname, _, filenames in os.walk(os.path.join(entry_dirname, 'archive')):
+            for filename in filenames:
+                with open(os.path.join(dirname, filename), 'rb') as file:
+                    self.assertNotIn(b'<!-- modified by the simulator -->', file.read())
+        archive_cache.clear()
+
+    def test_exec_sedml_docs_in_archive_shares_remote_model_cache(self):
+        archive = CombineArchive(contents=[
+            CombineArchiveContent(location='sim-{}.sedml'.format(i_doc), format=CombineArchiveContentFormat.SED_ML.value)
+            for i_doc in range(2)
+        ])
+        archive_dirname = os.path.join(self.tmp_dir, 'archive')
+        os.makedirs(archive_dirname)
+        for content in archive.contents:
+            SedmlSimulationWriter().run(SedDocument(), os.path.join(archive_dirname, content.location))
+        archive_filename = os.path.join(self.tmp_dir, 'archive.omex')
+        CombineArchiveWriter().run(archive, archive_dirname, archive_filename)
+
+        remote_model_caches = []
+
+        def sed_doc_executer(filename, working_dir, base_out_dir, rel_path, apply_xml_model_changes=False,
+                             indent=0, log=None, log_level=None, config=None, remote_model_cache=None):
+            remote_model_caches.append(remote_model_cache)
+            return None, None
+
+        config = get_config()
+        config.LOG = False
+        exec.exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, os.path.join(self.tmp_dir, 'outputs'), config=config)
+
+        # the SED documents of an archive share a cache of models
+        self.assertEqual(len(remote_model_caches), 2)
+        self.assertIsNotNone(remote_model_caches[0])
+        self.assertIs(remote_model_caches[1], remote_model_caches[0])
+
+        # executers which don't accept a cache are still supported
+        self.assertFalse(exec.does_function_accept_argument(functools.partial(lambda doc, config=None: None), 'remote_model_cache'))
+        self.assertTrue(exec.does_function_accept_argument(
+            functools.partial(sedml_exec.exec_sed_doc, None), 'remote_model_cache'))
+
+    def test_exec_sedml_docs_in_archive_warns_about_unregistered_outputs(self):
+        archive = CombineArchive(contents=[
+            CombineArchiveContent(location='sim.sedml', format=CombineArchiveContentFormat.SED_ML.value),
+        ])
+        archive_dirname = os.path.join(self.tmp_dir, 'archive')
+        os.makedirs(archive_dirname)
+        SedmlSimulationWriter().run(SedDocument(), os.path.join(archive_dirname, 'sim.sedml'))
+        archive_filename = os.path.join(self.tmp_dir, 'archive.omex')
+        CombineArchiveWriter().run(archive, archive_dirname, archive_filename)
+
+        out_dir = os.path.join(self.tmp_dir, 'outputs')
+
+        def sed_doc_executer(filename, working_dir, base_out_dir, rel_path, apply_xml_model_changes=False,
+                             indent=0, log=None, log_level=None, config=None):
+            doc_out_dir = os.path.join(base_out_dir, rel_path)
+            os.makedirs(doc_out_dir)
+            with open(os.path.join(doc_out_dir, 'report.csv'), 'w') as file:
+                file.write('ABC')
+            return None, None
+
+        config = get_config()
+        config.LOG = False
+        config.REPORT_FORMATS = [ReportFormat.csv]
+        config.VIZ_FORMATS = []
+        config.BUNDLE_OUTPUTS = True
+        config.KEEP_INDIVIDUAL_OUTPUTS = False
+        with self.assertWarnsRegex(BioSimulatorsWarning, 'No outputs were registered'):
+            exec.exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir, config=config)
+
+        # unregistered outputs are neither bundled nor cleaned up
+        self.assertFalse(os.path.isfile(os.path.join(out_dir, 'reports.zip')))
+        self.assertTrue(os.path.isfile(os.path.join(out_dir, 'sim.sedml', 'report.csv')))
+
     def test_exec_sedml_docs_in_archive_without_log(self):
         archive = CombineArchive(
             contents=[
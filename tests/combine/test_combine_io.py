@@ -6,8 +6,9 @@ import re
 import shutil
 import tempfile
 import unittest
+import zipfile
 from biosimulators_utils.archive.data_model import Archive, ArchiveFile
-from biosimulators_utils.archive.io import ArchiveWriter
+from biosimulators_utils.archive.io import ArchiveWriter, mount_archive, unmount_archive, materialize_model
 from biosimulators_utils.combine import data_model
 from biosimulators_utils.combine import io
 from biosimulators_utils.combine import validation
@@ -329,3 +330,69 @@ class ReadWriteTestCase(unittest.TestCase):
         config = Config(VALIDATE_OMEX_MANIFESTS=True)
         archive.contents = io.CombineArchiveReader().read_manifest(manifest_filename, archive_filename, config=config)
         self.assertEqual(len(archive.contents), 0)
+
+    def test_read_lazily(self):
+        archive_filename = os.path.join(os.path.dirname(__file__), '..', 'fixtures',
+                                        'Ciliberto-J-Cell-Biol-2003-morphogenesis-checkpoint.omex')
+
+        out_dir = os.path.join(self.temp_dir, 'out')
+        archive = io.CombineArchiveReader().run(archive_filename, out_dir)
+
+        lazy_out_dir = os.path.join(self.temp_dir, 'lazy-out')
+        reader = io.CombineArchiveReader()
+        lazy_archive = reader.run(archive_filename, lazy_out_dir, lazy=True)
+        self.assertTrue(lazy_archive.is_equal(archive))
+
+        self.assertEqual(sorted(os.listdir(lazy_out_dir)), [
+            'BIOMD0000000297_url.xml',
+            'manifest.xml',
+            'metadata.rdf',
+            'simulation_1.sedml',
+        ])
+
+        errors, warnings = validation.validate(lazy_archive, lazy_out_dir, validate_models_with_languages=False)
+        self.assertIn('Location is not a file', str(errors))
+
+        # materialize members on demand
+        filename = reader.extractor.get_filename('./Figure1.jpg')
+        self.assertEqual(filename, os.path.join(lazy_out_dir, 'Figure1.jpg'))
+        with open(filename, 'rb') as file:
+            with open(os.path.join(out_dir, 'Figure1.jpg'), 'rb') as expected_file:
+                self.assertEqual(file.read(), expected_file.read())
+
+        with open(os.path.join(self.temp_dir, 'reports.h5'), 'wb') as file:
+            reader.extractor.copy('reports.h5', file)
+        self.assertNotIn('reports.h5', os.listdir(lazy_out_dir))
+
+        with self.assertRaises(KeyError):
+            reader.extractor.get_filename('undefined.xml')
+
+        reader.extractor.extract()
+        self.assertEqual(sorted(os.listdir(lazy_out_dir)), sorted(os.listdir(out_dir)))
+
+        errors, warnings = validation.validate(lazy_archive, lazy_out_dir, validate_models_with_languages=False)
+        self.assertEqual(errors, [])
+
+    def test_materialize_model_imports(self):
+        archive_filename = os.path.join(self.temp_dir, 'archive.zip')
+        with zipfile.ZipFile(archive_filename, 'w') as zip_file:
+            zip_file.writestr('models/model.cellml', '<model/>')
+            zip_file.writestr('models/imports/units.cellml', '<units/>')
+            zip_file.writestr('data/data.csv', '1,2')
+            zip_file.writestr('root.txt', 'text')
+
+        out_dir = os.path.join(self.temp_dir, 'out')
+        extractor = io.CombineArchiveExtractor(archive_filename, out_dir)
+        mount_archive(out_dir, extractor)
+        try:
+            self.assertTrue(materialize_model(os.path.join(out_dir, 'models', 'model.cellml')))
+            self.assertTrue(os.path.isfile(os.path.join(out_dir, 'models', 'imports', 'units.cellml')))
+            self.assertFalse(os.path.isdir(os.path.join(out_dir, 'data')))
+            self.assertFalse(os.path.isfile(os.path.join(out_dir, 'root.txt')))
+
+            self.assertFalse(materialize_model(os.path.join(out_dir, 'models', 'undefined.cellml')))
+
+            self.assertTrue(materialize_model(os.path.join(out_dir, 'root.txt')))
+            self.assertTrue(os.path.isfile(os.path.join(out_dir, 'data', 'data.csv')))
+        finally:
+            unmount_archive(out_dir)
@@ -1,6 +1,7 @@
+from biosimulators_utils.archive.io import mount_archive, unmount_archive, materialize_path
 from biosimulators_utils.combine.data_model import CombineArchive, CombineArchiveContent, CombineArchiveContentFormat
 from biosimulators_utils.combine.io import CombineArchiveReader
-from biosimulators_utils.combine.validation import validate, validate_format, validate_content
+from biosimulators_utils.combine.validation import validate, validate_format, validate_content, get_image_format
 from biosimulators_utils.config import Config
 from biosimulators_utils.omex_meta.data_model import OmexMetadataSchema
 from biosimulators_utils.omex_meta.io import read_omex_meta_file
@@ -148,6 +149,38 @@ class ValidationTestCase(unittest.TestCase):
         errors, warnings = validate(archive2, self.tmp_dir)
         self.assertIn('does not contain content items', flatten_nested_list_of_strings(errors))
 
+    def test_validate_lazily_unpacked_archive(self):
+        os.remove(os.path.join(self.tmp_dir, 'thumbnail.png'))
+
+        reader = CombineArchiveReader()
+        archive = reader.run(self.OMEX_FIXTURE, self.tmp_dir, lazy=True)
+        mount_archive(self.tmp_dir, reader.extractor)
+        try:
+            errors, warnings = validate(archive, self.tmp_dir, formats_to_validate=[
+                CombineArchiveContentFormat.SED_ML,
+                CombineArchiveContentFormat.JPEG,
+            ])
+            self.assertEqual(errors, [])
+            self.assertNotEqual(warnings, [])
+            self.assertNotIn('Figure1.jpg', os.listdir(self.tmp_dir))
+
+            self.assertEqual(get_image_format(os.path.join(self.tmp_dir, 'Figure1.jpg')), 'jpeg')
+            self.assertEqual(get_image_format(os.path.join(self.tmp_dir, 'undefined.jpg')), None)
+
+            archive.contents = [content for content in archive.contents if content.location != 'Figure3.vg.json']
+            errors, warnings = validate(archive, self.tmp_dir)
+            self.assertIn('does not contain content items for these locations:\n  - Figure3.vg.json',
+                          flatten_nested_list_of_strings(errors))
+
+            self.assertTrue(materialize_path(os.path.join(self.tmp_dir, 'reports.h5')))
+            self.assertIn('reports.h5', os.listdir(self.tmp_dir))
+            self.assertFalse(materialize_path(os.path.join(self.tmp_dir, 'undefined.h5')))
+
+        finally:
+            unmount_archive(self.tmp_dir)
+
+        self.assertFalse(materialize_path(os.path.join(self.tmp_dir, 'Figure2.jpg')))
+
     def test_error_handling(self):
         os.remove(os.path.join(self.tmp_dir, 'thumbnail.png'))
 
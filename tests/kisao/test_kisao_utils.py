@@ -41,3 +41,11 @@ class KisaoUtilsTestCase(unittest.TestCase):
 
         term_type = utils.get_term_type(utils.get_term(None))
         self.assertEqual(term_type, None)
+
+    def test_is_algorithm_deterministic(self):
+        self.assertTrue(utils.is_algorithm_deterministic('KISAO_0000019'))
+        self.assertTrue(utils.is_algorithm_deterministic('KISAO_0000437'))
+        self.assertFalse(utils.is_algorithm_deterministic('KISAO_0000029'))
+        self.assertFalse(utils.is_algorithm_deterministic('KISAO_0000039'))
+        self.assertFalse(utils.is_algorithm_deterministic('KISAO_0000000'))
+        self.assertFalse(utils.is_algorithm_deterministic(None))
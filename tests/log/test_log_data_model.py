@@ -1,5 +1,7 @@
 from biosimulators_utils.config import get_config
 from biosimulators_utils.log import data_model
+from unittest import mock
+import json
 import os
 import shutil
 import tempfile
@@ -177,3 +179,68 @@ class ExecStatusDataModel(unittest.TestCase):
         plot3d_log.export()
         with open(os.path.join(archive_log.out_dir, get_config().LOG_PATH), 'r') as file:
             self.assertEqual(yaml.load(file, Loader=yaml.FullLoader), archive_log.to_json())
+
+    def test_export_debounced(self):
+        archive_log = data_model.CombineArchiveLog(status=data_model.Status.RUNNING, out_dir=os.path.join(self.dirname, 'log'))
+        doc_log = data_model.SedDocumentLog(location='doc_1', status=data_model.Status.QUEUED, parent=archive_log)
+        archive_log.sed_documents = {'doc_1': doc_log}
+        filename = os.path.join(archive_log.out_dir, get_config().LOG_PATH)
+
+        def read_log():
+            with open(filename, 'r') as file:
+                return yaml.load(file, Loader=yaml.FullLoader)
+
+        with mock.patch.dict(os.environ, {'LOG_EXPORT_INTERVAL': '3600'}):
+            archive_log.export()
+            self.assertEqual(read_log()['sedDocuments'][0]['status'], 'QUEUED')
+
+            # updates, including changes to non-terminal statuses, are batched while the archive is running
+            doc_log.status = data_model.Status.RUNNING
+            doc_log.export()
+            self.assertEqual(read_log()['sedDocuments'][0]['status'], 'QUEUED')
+
+            doc_log.output = 'Stdout'
+            doc_log.export()
+            self.assertEqual(read_log()['sedDocuments'][0]['output'], None)
+
+            doc_log.flush()
+            self.assertEqual(read_log()['sedDocuments'][0]['status'], 'RUNNING')
+            self.assertEqual(read_log()['sedDocuments'][0]['output'], 'Stdout')
+
+            doc_log.duration = 1.
+            doc_log.export(force=True)
+            self.assertEqual(read_log()['sedDocuments'][0]['duration'], 1.)
+
+            # terminal statuses of SED documents are always written
+            doc_log.status = data_model.Status.SUCCEEDED
+            doc_log.export()
+            self.assertEqual(read_log()['sedDocuments'][0]['status'], 'SUCCEEDED')
+
+            doc_log.output = 'Stdout/err'
+            doc_log.export()
+            self.assertEqual(read_log()['sedDocuments'][0]['output'], 'Stdout')
+
+            # the log is always written once the archive reaches a terminal status
+            doc_log.output = 'Stdout/err'
+            archive_log.status = data_model.Status.SUCCEEDED
+            archive_log.export()
+            self.assertEqual(read_log(), archive_log.to_json())
+
+        self.assertEqual(os.listdir(archive_log.out_dir), [get_config().LOG_PATH])
+
+    def test_export_json(self):
+        archive_log = data_model.CombineArchiveLog(status=data_model.Status.SUCCEEDED, output='Stdout/err\n' * 10,
+                                                   out_dir=os.path.join(self.dirname, 'log'))
+
+        with mock.patch.dict(os.environ, {'LOG_PATH': 'log.json'}):
+            self.assertEqual(data_model.get_log_format(), data_model.LogFormat.json)
+            archive_log.export()
+        with open(os.path.join(archive_log.out_dir, 'log.json'), 'r') as file:
+            self.assertEqual(json.load(file), archive_log.to_json())
+
+        with mock.patch.dict(os.environ, {'LOG_PATH': 'log.txt', 'LOG_FORMAT': 'json'}):
+            self.assertEqual(data_model.get_log_format(), data_model.LogFormat.json)
+        with mock.patch.dict(os.environ, {'LOG_PATH': 'log.txt'}):
+            self.assertEqual(data_model.get_log_format(), data_model.LogFormat.yaml)
+
+        self.assertEqual(yaml.load(data_model.dump_log(archive_log.to_json()), Loader=yaml.FullLoader), archive_log.to_json())
@@ -4,8 +4,10 @@ from biosimulators_utils.log import utils
 from biosimulators_utils.log.warnings import StandardOutputNotLoggedWarning
 from biosimulators_utils.sedml import data_model as sed_spec
 from biosimulators_utils.sedml.io import SedmlSimulationWriter
+from unittest import mock
 import os
 import shutil
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -1107,3 +1109,62 @@ class StandardOutputErrorCapturerTestCase(unittest.TestCase):
                 print('i am', end='', file=sys.stderr)
                 sys.stderr.flush()
                 self.assertEqual(captured.get_text(), None)
+
+    def test_file_descriptor_capture(self):
+        with mock.patch.object(utils._FileDescriptorCaptureSession, 'start', autospec=True,
+                               side_effect=utils._FileDescriptorCaptureSession.start) as start:
+            with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.c,
+                                                   relay=False) as captured_outer:
+                os.write(1, b'a')
+                with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.c,
+                                                       relay=True) as captured_relayed:
+                    subprocess.run(['echo', '-n', 'b'], check=True)
+                with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.c,
+                                                       relay=False) as captured_squashed:
+                    os.write(2, b'c')
+                    with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.c,
+                                                           relay=True) as captured_nested:
+                        print('d', end='')
+                print('e', end='', file=sys.stderr)
+                self.assertEqual(captured_outer.get_text(), 'abe')
+
+        # a single redirection is shared by nested contexts
+        start.assert_called_once()
+        self.assertIsNone(utils._fd_capture_session)
+
+        self.assertEqual(captured_outer.get_text(), 'abe')
+        self.assertEqual(captured_relayed.get_text(), 'b')
+        self.assertEqual(captured_squashed.get_text(), 'cd')
+        self.assertEqual(captured_nested.get_text(), 'd')
+
+    def test_file_descriptor_capture_with_child_which_outlives_capture(self):
+        with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.c) as captured:
+            print('a', end='')
+            session = utils._fd_capture_session
+            child = subprocess.Popen(['sh', '-c', 'read line; echo late; echo late >&2'], stdin=subprocess.PIPE)
+        self.assertEqual(captured.get_text(), 'a')
+        self.assertIsNone(utils._fd_capture_session)
+
+        # the pipe is drained until the child exits, rather than blocking the child or raising SIGPIPE
+        child.communicate(b'\n', timeout=10)
+        self.assertEqual(child.returncode, 0)
+        session._reader.join(10)
+        self.assertFalse(session._reader.is_alive())
+
+    def test_capture_max_size(self):
+        with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.c, max_size=4) as captured:
+            os.write(1, b'abcdefgh')
+        self.assertEqual(captured.get_text(), '[4 bytes of earlier output were discarded]\nefgh')
+
+        with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.python, max_size=4) as captured:
+            print('abcdefgh', end='')
+        self.assertEqual(captured.get_text(), '[4 bytes of earlier output were discarded]\nefgh')
+
+        # output which is no longer needed is discarded
+        with mock.patch.object(utils._FileDescriptorCaptureSession, 'TRIM_THRESHOLD', 0):
+            with utils.StandardOutputErrorCapturer(level=data_model.StandardOutputErrorCapturerLevel.c, max_size=10) as captured:
+                for _ in range(100):
+                    os.write(1, b'0123456789')
+                    utils._fd_capture_session.sync()
+                self.assertLessEqual(len(utils._fd_capture_session.buffer), 20)
+                self.assertEqual(captured.get_text(), '[990 bytes of earlier output were discarded]\n0123456789')
@@ -181,6 +181,66 @@ class XppValidationTestCase(unittest.TestCase):
             'bound': '40000',
         })
 
+    def test_validate_models(self):
+        filenames = [
+            os.path.join(self.FIXTURE_DIRNAME, 'wilson-cowan.ode'),
+            None,
+            os.path.join(self.FIXTURE_DIRNAME, 'not exist.ode'),
+        ]
+
+        results = validation.validate_models(filenames, max_workers=2)
+        self.assertEqual(len(results), 3)
+
+        errors, warnings, model = results[0]
+        self.assertEqual(errors, [])
+        self.assertEqual(warnings, [])
+        self.assertEqual(model['initial_conditions'], collections.OrderedDict([('U', .1), ('V', .05)]))
+
+        errors, warnings, model = results[1]
+        self.assertIn('is not a path', flatten_nested_list_of_strings(errors))
+        self.assertEqual(model, None)
+
+        errors, warnings, model = results[2]
+        self.assertIn('does not exist', flatten_nested_list_of_strings(errors))
+        self.assertEqual(model, None)
+
+    def test_validate_models_runs_xpp_once_per_model(self):
+        filename = os.path.join(self.FIXTURE_DIRNAME, 'wilson-cowan-invalid.ode')
+        return_value = mock.Mock(
+            returncode=1,
+            stdout=mock.Mock(
+                decode=lambda errors: 'Error message',
+            ),
+        )
+        with mock.patch('subprocess.run', return_value=return_value) as run:
+            results = validation.validate_models([filename, filename])
+        self.assertEqual(run.call_count, 2)
+        for errors, warnings, model in results:
+            self.assertIn('Error message', flatten_nested_list_of_strings(errors))
+            self.assertEqual(model, None)
+
+    def test_validate_model_removes_temporary_files_on_errors(self):
+        dirname = os.path.join(self.dirname, 'model')
+        shutil.copytree(self.FIXTURE_DIRNAME, dirname)
+        filename = os.path.join(dirname, 'wilson-cowan.ode')
+        basenames = sorted(os.listdir(dirname))
+
+        out_dirnames = []
+        mkdtemp = tempfile.mkdtemp
+
+        def mock_mkdtemp(*args, **kwargs):
+            out_dirnames.append(mkdtemp(*args, **kwargs))
+            return out_dirnames[-1]
+
+        with mock.patch('tempfile.mkdtemp', side_effect=mock_mkdtemp):
+            with mock.patch('subprocess.run', side_effect=FileNotFoundError('xppaut')):
+                with self.assertRaises(FileNotFoundError):
+                    validation.validate_model(filename)
+
+        self.assertEqual(sorted(os.listdir(dirname)), basenames)
+        self.assertEqual(len(out_dirnames), 1)
+        self.assertFalse(os.path.isdir(out_dirnames[0]))
+
     def test_get_xpp_input_configuration_from_directory(self):
         with self.assertRaisesRegex(ValueError, 'must contain an ODE file'):
             validation.get_xpp_input_configuration_from_directory(self.dirname)
@@ -6,6 +6,7 @@ from biosimulators_utils.utils.core import flatten_nested_list_of_strings
 from unittest import mock
 import os
 import pyomexmeta
+import rdflib
 import shutil
 import tempfile
 import unittest
@@ -60,6 +61,67 @@ class OmexMetaIoTestCase(unittest.TestCase):
         self.assertGreater(len(triples), 1)
         self.assertIsInstance(triples[0], data_model.Triple)
 
+    def test_read_rdf_xml_1_1(self):
+        filename = os.path.join(self.dir_name, 'metadata.rdf')
+        with open(self.FIXTURE, 'rb') as file:
+            content = file.read()
+        self.assertTrue(content.startswith(b'<?xml version="1.0"'))
+        with open(filename, 'wb') as file:
+            file.write(content.replace(b'<?xml version="1.0"', b'<?xml version="1.1"', 1))
+
+        rdf, errors, warnings = io.OmexMetaReader.read_rdf(filename)
+        self.assertIsInstance(rdf, pyomexmeta.RDF)
+        self.assertEqual(errors, [])
+        self.assertEqual(warnings, [])
+        self.assertEqual(sorted(os.listdir(self.dir_name)), ['metadata.rdf', 'thumbnail.png'])
+
+        expected_rdf, _, _ = io.OmexMetaReader.read_rdf(self.FIXTURE)
+        self.assertEqual(len(io.OmexMetaReader.get_rdf_triples(rdf)), len(io.OmexMetaReader.get_rdf_triples(expected_rdf)))
+
+    def test_make_rdf_node(self):
+        self.assertEqual(io.OmexMetaReader.make_rdf_node({'type': 'uri', 'value': 'http://example.org/a'}),
+                         rdflib.term.URIRef('http://example.org/a'))
+        self.assertEqual(io.OmexMetaReader.make_rdf_node({'type': 'literal', 'value': 'a'}), rdflib.term.Literal('a'))
+        self.assertIsInstance(io.OmexMetaReader.make_rdf_node({'type': 'bnode', 'value': 'b1'}), rdflib.term.BNode)
+
+    def test_get_rdf_triples_escaped_literals(self):
+        filename = os.path.join(self.dir_name, 'metadata.rdf')
+        with open(filename, 'wb') as file:
+            file.write((
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+                '  <rdf:Description rdf:about="http://omex-library.org/BioSim0001.omex">\n'
+                '    <dc:title xml:lang="en">A "quoted" \\ title\twith \u00e9 and \U0001d11e</dc:title>\n'
+                '    <dc:description rdf:datatype="http://www.w3.org/2001/XMLSchema#string">Typed</dc:description>\n'
+                '    <dc:creator rdf:resource="http://example.org/\u00e4"/>\n'
+                '  </rdf:Description>\n'
+                '</rdf:RDF>\n'
+            ).encode())
+
+        rdf, errors, warnings = io.OmexMetaReader.read_rdf(filename)
+        self.assertEqual(errors, [])
+        triples = io.OmexMetaReader.get_rdf_triples(rdf)
+        self.assertEqual(
+            [(triple.subject, triple.predicate, triple.object) for triple in triples],
+            [
+                (
+                    rdflib.term.URIRef('http://omex-library.org/BioSim0001.omex'),
+                    rdflib.term.URIRef('http://purl.org/dc/elements/1.1/title'),
+                    rdflib.term.Literal('A "quoted" \\ title\twith \u00e9 and \U0001d11e'),
+                ),
+                (
+                    rdflib.term.URIRef('http://omex-library.org/BioSim0001.omex'),
+                    rdflib.term.URIRef('http://purl.org/dc/elements/1.1/description'),
+                    rdflib.term.Literal('Typed'),
+                ),
+                (
+                    rdflib.term.URIRef('http://omex-library.org/BioSim0001.omex'),
+                    rdflib.term.URIRef('http://purl.org/dc/elements/1.1/creator'),
+                    rdflib.term.URIRef('http://example.org/\u00e4'),
+                ),
+            ],
+        )
+
     def test_get_rdf_triples_ordered(self):
         filename = os.path.join(self.FIXTURE_DIR, 'multiple-thumbnails.rdf')
         rdf, errors, warnings = io.OmexMetaReader.read_rdf(filename)
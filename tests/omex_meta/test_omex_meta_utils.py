@@ -1,7 +1,10 @@
 from biosimulators_utils.omex_meta.data_model import OmexMetadataOutputFormat
 from biosimulators_utils.omex_meta.utils import (
-    build_omex_meta_file_for_model, _build_omex_meta_file_for_model, _build_omex_meta_file_for_model_error_wrapper,
+    build_omex_meta_file_for_model, _build_omex_meta_file_for_model,
+    get_omex_meta_file_builder, shutdown_omex_meta_file_builder,
     get_local_combine_archive_content_uri, get_global_combine_archive_content_uri)
+from unittest import mock
+import concurrent.futures.process
 import os
 import shutil
 import tempfile
@@ -81,28 +84,6 @@ class OmexMetaUtilsTestCase(unittest.TestCase):
         metadata_format = OmexMetadataOutputFormat.rdfxml_abbrev
         _build_omex_meta_file_for_model(model_filename, metadata_filename, metadata_format.value)
 
-    def test__build_omex_meta_file_for_model_error_handling_wrapper(self):
-        model_filename = os.path.join(self.temp_dirname, 'model.xml')
-        metadata_filename = os.path.join(self.temp_dirname, 'metadata.rdf')
-        metadata_format = OmexMetadataOutputFormat.rdfxml_abbrev
-        with open(model_filename, 'w') as file:
-            file.write('<sbml></sbml')
-        with self.assertRaisesRegex(SystemExit, 'could not be extracted'):
-            _build_omex_meta_file_for_model_error_wrapper(model_filename, metadata_filename, metadata_format.value)
-
-        # model_filename = os.path.join(self.temp_dirname, 'model.xml')
-        # metadata_filename = os.path.join(self.temp_dirname, 'metadata.rdf')
-        # metadata_format = OmexMetadataOutputFormat.rdfxml_abbrev
-        # with open(model_filename, 'w') as file:
-        #     file.write('<sbml></sbml>')
-        # with self.assertRaisesRegex(SystemExit, 'could not be read'):
-        #     _build_omex_meta_file_for_model_error_wrapper(model_filename, metadata_filename, metadata_format.value)
-
-        model_filename = os.path.join(self.FIXTURE_DIRNAME, 'omex-metadata', 'simple-regulation.xml')
-        metadata_filename = os.path.join(self.temp_dirname, 'metadata.rdf')
-        metadata_format = OmexMetadataOutputFormat.rdfxml_abbrev
-        _build_omex_meta_file_for_model_error_wrapper(model_filename, metadata_filename, metadata_format.value)
-
     def test__build_omex_meta_file_for_model_error_handling_subprocess(self):
         model_filename = os.path.join(self.temp_dirname, 'model.xml')
         metadata_filename = os.path.join(self.temp_dirname, 'metadata.rdf')
@@ -125,6 +106,44 @@ class OmexMetaUtilsTestCase(unittest.TestCase):
         metadata_format = OmexMetadataOutputFormat.rdfxml_abbrev
         build_omex_meta_file_for_model(model_filename, metadata_filename, metadata_format)
 
+    def test_build_omex_meta_file_for_model_reuses_worker(self):
+        shutdown_omex_meta_file_builder()
+
+        metadata_format = OmexMetadataOutputFormat.rdfxml_abbrev
+        for i_model in range(2):
+            model_filename = os.path.join(self.temp_dirname, 'model-{}.xml'.format(i_model))
+            shutil.copyfile(os.path.join(self.FIXTURE_DIRNAME, 'omex-metadata', 'simple-regulation.xml'), model_filename)
+            metadata_filename = os.path.join(self.temp_dirname, 'metadata-{}.rdf'.format(i_model))
+            build_omex_meta_file_for_model(model_filename, metadata_filename, metadata_format)
+            self.assertTrue(os.path.isfile(metadata_filename))
+
+            if i_model == 0:
+                builder = get_omex_meta_file_builder()
+            else:
+                self.assertIs(get_omex_meta_file_builder(), builder)
+
+        # worker is replaced after it crashes
+        model_filename = os.path.join(self.temp_dirname, 'model.xml')
+        with open(model_filename, 'w') as file:
+            file.write('<sbml></sbml>')
+        with self.assertRaisesRegex(RuntimeError, 'could not be read'):
+            build_omex_meta_file_for_model(model_filename, os.path.join(self.temp_dirname, 'metadata.rdf'), metadata_format)
+        self.assertIsNot(get_omex_meta_file_builder(), builder)
+
+        model_filename = os.path.join(self.FIXTURE_DIRNAME, 'omex-metadata', 'simple-regulation.xml')
+        shutil.copyfile(model_filename, os.path.join(self.temp_dirname, 'model.xml'))
+        build_omex_meta_file_for_model(os.path.join(self.temp_dirname, 'model.xml'),
+                                       os.path.join(self.temp_dirname, 'metadata.rdf'), metadata_format)
+
+        # worker is replaced if it was broken by an earlier job
+        builder = get_omex_meta_file_builder()
+        with mock.patch.object(builder, 'submit', side_effect=concurrent.futures.process.BrokenProcessPool()):
+            build_omex_meta_file_for_model(os.path.join(self.temp_dirname, 'model.xml'),
+                                           os.path.join(self.temp_dirname, 'metadata.rdf'), metadata_format)
+        self.assertIsNot(get_omex_meta_file_builder(), builder)
+
+        shutdown_omex_meta_file_builder()
+
     def test_get_local_combine_archive_content_uri(self):
         self.assertEqual(
             get_local_combine_archive_content_uri('https://archives.org/archive.omex/thumb.png', 'https://archives.org/archive.omex'),
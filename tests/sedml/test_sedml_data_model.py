@@ -2,7 +2,9 @@ from biosimulators_utils.biosimulations.data_model import Metadata
 from biosimulators_utils.sedml import data_model
 from biosimulators_utils.utils.core import none_sorted
 import copy
+import pickle
 import unittest
+import weakref
 
 
 class DataModelTestCase(unittest.TestCase):
@@ -419,3 +421,32 @@ class DataModelTestCase(unittest.TestCase):
 
         model.changes = [data_model.ComputeModelChange()]
         self.assertFalse(model.has_structural_changes())
+
+    def test_slots(self):
+        model = data_model.Model(id='model', source='model.xml', changes=[
+            data_model.ComputeModelChange(id='change', target='x', variables=[data_model.Variable(id='var', target='y')], math='var'),
+        ])
+        sim = data_model.UniformTimeCourseSimulation(id='sim', algorithm=data_model.Algorithm(kisao_id='KISAO_0000019'))
+        task = data_model.Task(id='task', model=model, simulation=sim)
+        data_gen = data_model.DataGenerator(id='data_gen', variables=[data_model.Variable(id='var', task=task, target='x')],
+                                            math='var')
+        doc = data_model.SedDocument(
+            models=[model],
+            simulations=[sim],
+            tasks=[task],
+            data_generators=[data_gen],
+            outputs=[data_model.Report(id='report', data_sets=[data_model.DataSet(id='data_set', data_generator=data_gen)])],
+        )
+
+        # declared attributes are stored in slots
+        for obj in [doc, model, model.changes[0], sim, task, data_gen, doc.outputs[0], doc.outputs[0].data_sets[0]]:
+            self.assertEqual(vars(obj), {})
+            self.assertIs(weakref.ref(obj)(), obj)
+
+        # other attributes can be attached
+        task.undefined_attribute = 'value'
+        self.assertEqual(vars(task), {'undefined_attribute': 'value'})
+
+        self.assertTrue(copy.deepcopy(doc).is_equal(doc))
+        self.assertTrue(pickle.loads(pickle.dumps(doc)).is_equal(doc))
+        self.assertEqual(pickle.loads(pickle.dumps(doc)).tasks[0].undefined_attribute, 'value')
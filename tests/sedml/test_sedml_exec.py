@@ -9,6 +9,7 @@ from biosimulators_utils.report.warnings import RepeatDataSetLabelsWarning, Cann
 from biosimulators_utils.sedml import data_model
 from biosimulators_utils.sedml import exec
 from biosimulators_utils.sedml import io
+from biosimulators_utils.sedml import results_cache
 from biosimulators_utils.sedml import utils
 from biosimulators_utils.sedml.exceptions import SedmlExecutionError
 from biosimulators_utils.sedml.warnings import (NoTasksWarning, NoOutputsWarning,
@@ -18,6 +19,7 @@ from biosimulators_utils.xml.utils import get_namespaces_with_prefixes
 from lxml import etree
 from unittest import mock
 import builtins
+import copy
 import importlib
 import numpy
 import numpy.testing
@@ -201,7 +203,7 @@ class ExecTaskCase(unittest.TestCase):
             pass
 
         out_dir = os.path.join(self.tmp_dir, 'results')
-        with mock.patch('requests.get', return_value=mock.Mock(raise_for_status=lambda: None, content=b'')):
+        with mock.patch('requests.Session.get', return_value=mock.Mock(raise_for_status=lambda: None, content=b'')):
             with mock.patch('biosimulators_utils.model_lang.sbml.validation.validate_model', return_value=([], [], None)):
                 config = get_config()
                 config.REPORT_FORMATS = [ReportFormat.csv]
@@ -315,7 +317,9 @@ class ExecTaskCase(unittest.TestCase):
             config = get_config()
             config.REPORT_FORMATS = [ReportFormat.h5]
             config.VIZ_FORMATS = []
-            exec.exec_sed_doc(exec_task, filename, os.path.dirname(filename), out_dir, log=log, config=config)
+            with mock.patch.object(log, 'flush', wraps=log.flush) as flush:
+                exec.exec_sed_doc(exec_task, filename, os.path.dirname(filename), out_dir, log=log, config=config)
+            flush.assert_called_once_with()
 
         expected_log = {
             'location': None,
@@ -584,6 +588,15 @@ class ExecTaskCase(unittest.TestCase):
         expected_value = 0.2 * 2.5 + 2.0 * 3.1 * 4.0
         numpy.testing.assert_equal(report_results[doc.outputs[0].id][doc.outputs[0].data_sets[1].id], numpy.array((expected_value)))
 
+        # the SED document is not modified
+        doc = io.SedmlSimulationReader().run(filename, validate_models_with_languages=False)
+        expected_doc = copy.deepcopy(doc)
+        with mock.patch('biosimulators_utils.model_lang.sbml.validation.validate_model', return_value=([], [], None)):
+            report_results, _ = exec.exec_sed_doc(exec_task, doc, working_dir, out_dir,
+                                                  apply_xml_model_changes=True, config=config)
+        numpy.testing.assert_equal(report_results[doc.outputs[0].id][doc.outputs[0].data_sets[0].id], numpy.array((2.5, )))
+        self.assertTrue(doc.is_equal(expected_doc))
+
     def test_warnings(self):
         # no tasks
         doc = data_model.SedDocument()
@@ -1802,6 +1815,8 @@ class ExecTaskCase(unittest.TestCase):
         self.assertEqual(set(results['report'].keys()), set(['data_set_x', 'data_set_y']))
         numpy.testing.assert_allclose(results['report']['data_set_x'], [[numpy.linspace(10., 15., 6)]] * 3)
         numpy.testing.assert_allclose(results['report']['data_set_y'], [[numpy.linspace(20., 25., 6)]] * 3)
+        self.assertEqual(doc.models[0].source, 'model.xml')
+        self.assertEqual(doc.models[0].changes, [])
 
     def test_capturer_not_available(self):
         doc = data_model.SedDocument()
@@ -1925,7 +1940,7 @@ class ExecTaskCase(unittest.TestCase):
         config.COLLECT_SED_DOCUMENT_RESULTS = True
 
         out_dir = os.path.join(self.tmp_dir, 'results')
-        with mock.patch('requests.get', return_value=mock.Mock(raise_for_status=lambda: None, content=b'')):
+        with mock.patch('requests.Session.get', return_value=mock.Mock(raise_for_status=lambda: None, content=b'')):
             with mock.patch('biosimulators_utils.model_lang.sbml.validation.validate_model', return_value=([], [], None)):
                 output_results, log = exec.exec_sed_doc(exec_task, filename, working_dir, out_dir, config=config)
 
@@ -1954,11 +1969,185 @@ class ExecTaskCase(unittest.TestCase):
         config.REPORT_FORMATS = []
         config.COLLECT_SED_DOCUMENT_RESULTS = False
         config.LOG = False
-        with mock.patch('requests.get', return_value=mock.Mock(raise_for_status=lambda: None, content=b'')):
+        with mock.patch('requests.Session.get', return_value=mock.Mock(raise_for_status=lambda: None, content=b'')):
             with mock.patch('biosimulators_utils.model_lang.sbml.validation.validate_model', return_value=([], [], None)):
                 output_results, log = exec.exec_sed_doc(exec_task, filename, working_dir, out_dir, config=config)
         self.assertEqual(output_results, None)
         self.assertEqual(log, None)
 
+    def test_exec_sed_doc_batches_log_exports(self):
+        doc = data_model.SedDocument()
+        doc.models.append(data_model.Model(id='model', source='model.xml', language=data_model.ModelLanguage.SBML.value))
+        doc.simulations.append(data_model.UniformTimeCourseSimulation(
+            id='sim', initial_time=0., output_start_time=0., output_end_time=10., number_of_steps=5,
+            algorithm=data_model.Algorithm(kisao_id='KISAO_0000019')))
+        for i_task in range(20):
+            task = data_model.Task(id='task_{}'.format(i_task), model=doc.models[0], simulation=doc.simulations[0])
+            doc.tasks.append(task)
+            doc.data_generators.append(data_model.DataGenerator(
+                id='data_gen_' + task.id,
+                variables=[data_model.Variable(id='var_' + task.id, target="/model/variable[@id='x']", task=task)],
+                math='var_' + task.id,
+            ))
+            doc.outputs.append(data_model.Report(id='report_' + task.id, data_sets=[
+                data_model.DataSet(id='data_set_' + task.id, label=task.id, data_generator=doc.data_generators[-1]),
+            ]))
+
+        with open(os.path.join(self.tmp_dir, 'model.xml'), 'w') as file:
+            file.write('<model/>')
+
+        def exec_task(task, variables, log=None, config=None, preprocessed_task=None):
+            return VariableResults({variable.id: numpy.array([1., 2.]) for variable in variables}), log
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        out_dir = os.path.join(self.tmp_dir, 'results')
+        log = log_utils.init_sed_document_log(doc)
+        log.parent = CombineArchiveLog(status=Status.RUNNING, out_dir=out_dir)
+
+        with mock.patch.dict(os.environ, {'LOG_EXPORT_INTERVAL': '3600'}):
+            with mock.patch('biosimulators_utils.log.data_model.write_file_atomically') as write_file:
+                exec.exec_sed_doc(exec_task, doc, self.tmp_dir, out_dir, log=log, config=config)
+
+        # the statuses of the tasks and outputs are written in one batch, rather than after each update
+        self.assertEqual(write_file.call_count, 2)
+        self.assertTrue(all(task_log.status == Status.SUCCEEDED for task_log in log.tasks.values()))
+        self.assertTrue(all(output_log.status == Status.SUCCEEDED for output_log in log.outputs.values()))
+
+    def test_memoize_simulation_results(self):
+        doc = data_model.SedDocument()
+        doc.models.append(data_model.Model(id='model_1', source='model.xml', language=data_model.ModelLanguage.SBML.value))
+        doc.models.append(data_model.Model(id='model_2', source='model.xml', language=data_model.ModelLanguage.SBML.value))
+        for i_sim, kisao_id in enumerate(['KISAO_0000019', 'KISAO_0000019', 'KISAO_0000029']):
+            doc.simulations.append(data_model.UniformTimeCourseSimulation(
+                id='sim_{}'.format(i_sim), initial_time=0., output_start_time=0., output_end_time=10., number_of_steps=5,
+                algorithm=data_model.Algorithm(kisao_id=kisao_id)))
+        doc.tasks.append(data_model.Task(id='task_1', model=doc.models[0], simulation=doc.simulations[0]))
+        doc.tasks.append(data_model.Task(id='task_2', model=doc.models[1], simulation=doc.simulations[1]))
+        doc.tasks.append(data_model.Task(id='task_3', model=doc.models[1], simulation=doc.simulations[1]))
+        doc.tasks.append(data_model.Task(id='task_4', model=doc.models[0], simulation=doc.simulations[2]))
+        doc.tasks.append(data_model.Task(id='task_5', model=doc.models[0], simulation=doc.simulations[2]))
+        report = data_model.Report(id='report')
+        doc.outputs.append(report)
+        for task in doc.tasks:
+            doc.data_generators.append(data_model.DataGenerator(
+                id='data_gen_' + task.id,
+                variables=[data_model.Variable(id='var_' + task.id, target="/model/variable[@id='x']", task=task)],
+                math='var_' + task.id,
+            ))
+            report.data_sets.append(data_model.DataSet(id='data_set_' + task.id, label=task.id,
+                                                       data_generator=doc.data_generators[-1]))
+
+        with open(os.path.join(self.tmp_dir, 'model.xml'), 'w') as file:
+            file.write('<model/>')
+
+        executed_task_ids = []
+
+        def exec_task(task, variables, log=None, config=None, preprocessed_task=None):
+            executed_task_ids.append(task.id)
+            return VariableResults({variable.id: numpy.array([1., 2.]) for variable in variables}), log
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        config.COLLECT_SED_DOCUMENT_RESULTS = True
+        config.MEMOIZE_SIMULATION_RESULTS = True
+        config.SIMULATION_RESULTS_MEMO_MAX_SIZE = 2 ** 20 + 1
+        out_dir = os.path.join(self.tmp_dir, 'results')
+        output_results, log = exec.exec_sed_doc(exec_task, doc, self.tmp_dir, out_dir, config=config)
+
+        # identical deterministic simulations are only executed once
+        self.assertEqual(executed_task_ids, ['task_1', 'task_4', 'task_5'])
+        for task in doc.tasks:
+            numpy.testing.assert_allclose(output_results['report']['data_set_' + task.id], numpy.array([1., 2.]))
+        self.assertEqual([log.tasks[task.id].cache_hits for task in doc.tasks], [0, 1, 1, 0, 0])
+        self.assertEqual(log.tasks['task_2'].to_json()['cacheHits'], 1)
+
+        # the results are reused by subsequent documents
+        executed_task_ids.clear()
+        exec.exec_sed_doc(exec_task, doc, self.tmp_dir, out_dir, config=config)
+        self.assertEqual(executed_task_ids, ['task_4', 'task_5'])
+
+        # results are not memoized by default
+        executed_task_ids.clear()
+        config.MEMOIZE_SIMULATION_RESULTS = False
+        _, log = exec.exec_sed_doc(exec_task, doc, self.tmp_dir, out_dir, config=config)
+        self.assertEqual(executed_task_ids, ['task_1', 'task_2', 'task_3', 'task_4', 'task_5'])
+        self.assertEqual(log.tasks['task_2'].cache_hits, None)
+        self.assertNotIn('cacheHits', log.tasks['task_2'].to_json())
+
+        # results can be stored persistently
+        config.CACHE_SIMULATION_RESULTS = True
+        config.SIMULATION_RESULTS_CACHE_DIR = os.path.join(self.tmp_dir, 'cache')
+        executed_task_ids.clear()
+        exec.exec_sed_doc(exec_task, doc, self.tmp_dir, out_dir, config=config)
+        self.assertEqual(executed_task_ids, ['task_1', 'task_4', 'task_5'])
+
+        results_cache.get_simulation_results_cache(config).clear()
+        executed_task_ids.clear()
+        exec.exec_sed_doc(exec_task, doc, self.tmp_dir, out_dir, config=config)
+        self.assertEqual(executed_task_ids, ['task_4', 'task_5'])
+
+        # results of different simulators are not shared
+        config.SIMULATION_RESULTS_CACHE_NAMESPACE = 'other-simulator:1.0'
+        executed_task_ids.clear()
+        exec.exec_sed_doc(exec_task, doc, self.tmp_dir, out_dir, config=config)
+        self.assertEqual(executed_task_ids, ['task_1', 'task_4', 'task_5'])
+
+    def test_memoize_results_of_repeated_tasks_with_state(self):
+        model = data_model.Model(id='model', source=os.path.join(self.tmp_dir, 'model.xml'),
+                                 language=data_model.ModelLanguage.SBML.value)
+        with open(model.source, 'w') as file:
+            file.write('<model/>')
+        sim = data_model.UniformTimeCourseSimulation(
+            id='sim', initial_time=0., output_start_time=0., output_end_time=10., number_of_steps=5,
+            algorithm=data_model.Algorithm(kisao_id='KISAO_0000019'))
+        task = data_model.Task(id='task', model=model, simulation=sim)
+        repeated_task = data_model.RepeatedTask(
+            id='repeated_task',
+            range=data_model.VectorRange(id='range', values=[1., 2., 3.]),
+            sub_tasks=[data_model.SubTask(task=task, order=1)],
+        )
+        repeated_task.ranges = [repeated_task.range]
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']", task=repeated_task)]
+        doc = data_model.SedDocument(models=[model], simulations=[sim], tasks=[task, repeated_task])
+
+        # simulator whose state carries over between executions until it is reset
+        state = {'n_executions_since_reset': 0, 'n_executions': 0}
+
+        def task_executer(task, variables, log=None, config=None, preprocessed_task=None):
+            state['n_executions_since_reset'] += 1
+            state['n_executions'] += 1
+            return VariableResults({
+                variable.id: numpy.array([float(state['n_executions_since_reset'])]) for variable in variables
+            }), log
+
+        def reset_executer(preprocessed_task):
+            state['n_executions_since_reset'] = 0
+
+        def exec_repeated_task():
+            state['n_executions_since_reset'] = 0
+            state['n_executions'] = 0
+            return exec.exec_repeated_task(repeated_task, task_executer, variables, doc, reset_executer=reset_executer,
+                                           results_cache=results_cache.SimulationResultsCache(max_size=2 ** 20, dirname=None))
+
+        # iterations which start from the end state of the previous iteration
+        repeated_task.reset_model_for_each_iteration = False
+        results = exec_repeated_task()
+        numpy.testing.assert_allclose(results['x'][:, 0, 0], [1., 2., 3.])
+
+        # independent iterations are memoized
+        repeated_task.reset_model_for_each_iteration = True
+        results = exec_repeated_task()
+        numpy.testing.assert_allclose(results['x'][:, 0, 0], [1., 1., 1.])
+        self.assertEqual(state['n_executions'], 1)
+
+        # sub-tasks which start from the end state of the previous sub-task
+        repeated_task.sub_tasks.append(data_model.SubTask(task=task, order=2))
+        results = exec_repeated_task()
+        numpy.testing.assert_allclose(results['x'][:, :, 0], [[1., 2.], [1., 2.], [1., 2.]])
+        self.assertEqual(state['n_executions'], 6)
+
 if __name__ == "__main__":
     unittest.main()
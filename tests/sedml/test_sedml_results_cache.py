@@ -0,0 +1,255 @@
+from biosimulators_utils.config import Config
+from biosimulators_utils.report.data_model import VariableResults
+from biosimulators_utils.sedml import data_model
+from biosimulators_utils.sedml.results_cache import SimulationResultsCache, get_simulation_results_cache
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class SimulationResultsCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _build_task(self, id, model_filename, kisao_id='KISAO_0000019', changes=None):
+        with open(os.path.join(self.tmp_dir, model_filename), 'w') as file:
+            file.write('<model/>')
+        model = data_model.Model(id='model_' + id, source=os.path.join(self.tmp_dir, model_filename),
+                                 language=data_model.ModelLanguage.SBML.value, changes=changes or [])
+        simulation = data_model.UniformTimeCourseSimulation(
+            id='sim_' + id, initial_time=0., output_start_time=0., output_end_time=10., number_of_steps=10,
+            algorithm=data_model.Algorithm(kisao_id=kisao_id))
+        return data_model.Task(id=id, model=model, simulation=simulation)
+
+    def test_get_key(self):
+        cache = SimulationResultsCache(config=Config())
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']", target_namespaces={'a': 'b', 'c': 'd'})]
+        other_variables = [data_model.Variable(id='x_2', target="/model/variable[@id='x']", target_namespaces={'c': 'd', 'a': 'b'})]
+
+        key = cache.get_key(self._build_task('task_1', 'model_1.xml'), variables)
+        self.assertEqual(cache.get_key(self._build_task('task_2', 'model_2.xml'), other_variables), key)
+
+        change = data_model.ModelAttributeChange(target="/model/variable[@id='x']/@value", new_value='2')
+        self.assertNotEqual(cache.get_key(self._build_task('task_3', 'model_3.xml', changes=[change]), variables), key)
+
+        task = self._build_task('task_4', 'model_4.xml')
+        task.simulation.output_end_time = 20.
+        self.assertNotEqual(cache.get_key(task, variables), key)
+
+        self.assertNotEqual(cache.get_key(self._build_task('task_5', 'model_5.xml'), variables, task_executer=len), key)
+        self.assertNotEqual(cache.get_key(self._build_task('task_5', 'model_5.xml'), variables,
+                                          config=Config(SIMULATION_RESULTS_CACHE_NAMESPACE='simulator:1.0')), key)
+
+        with open(os.path.join(self.tmp_dir, 'model_6.xml'), 'w') as file:
+            file.write('<model></model>')
+        task = self._build_task('task_6', 'model_1.xml')
+        task.model.source = os.path.join(self.tmp_dir, 'model_6.xml')
+        self.assertNotEqual(cache.get_key(task, variables), key)
+
+        # results of stochastic algorithms and models which are not files are not cached
+        self.assertEqual(cache.get_key(self._build_task('task_7', 'model_7.xml', kisao_id='KISAO_0000029'), variables), None)
+
+        task = self._build_task('task_8', 'model_8.xml')
+        task.model.source = 'https://models.org/model.xml'
+        self.assertEqual(cache.get_key(task, variables), None)
+
+    def test_get_key_with_compute_changes(self):
+        cache = SimulationResultsCache(config=Config())
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']")]
+
+        with open(os.path.join(self.tmp_dir, 'other-model.xml'), 'w') as file:
+            file.write('<model><variable id="y" value="1"/></model>')
+        other_model = data_model.Model(id='other_model', source=os.path.join(self.tmp_dir, 'other-model.xml'),
+                                       language=data_model.ModelLanguage.SBML.value)
+        change = data_model.ComputeModelChange(
+            target="/model/variable[@id='x']/@value",
+            variables=[data_model.Variable(id='y', target="/model/variable[@id='y']/@value", model=other_model)],
+            math='y')
+        task = self._build_task('task_1', 'model_1.xml', changes=[change])
+        key = cache.get_key(task, variables)
+        self.assertNotEqual(key, None)
+
+        # the content of the models of the variables of compute changes is part of the key
+        with open(os.path.join(self.tmp_dir, 'other-model.xml'), 'w') as file:
+            file.write('<model><variable id="y" value="10"/></model>')
+        self.assertNotEqual(cache.get_key(task, variables), key)
+        key = cache.get_key(task, variables)
+
+        # so are the values of compute changes which were calculated before they were deferred to simulators
+        change.new_value = '2'
+        self.assertNotEqual(cache.get_key(task, variables), key)
+
+        # results are not cached if the models of the variables are not local files
+        other_model.source = 'https://models.org/model.xml'
+        self.assertEqual(cache.get_key(task, variables), None)
+
+    def test_get_key_with_imports(self):
+        cache = SimulationResultsCache(config=Config())
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']")]
+
+        def write_file(filename, content):
+            with open(os.path.join(self.tmp_dir, filename), 'w') as file:
+                file.write(content)
+
+        # SBML comp external model definitions, including imports of imports
+        task = self._build_task('task_1', 'model_1.xml')
+        write_file('model_1.xml', (
+            '<sbml xmlns:comp="http://www.sbml.org/sbml/level3/version1/comp/version1">'
+            '<comp:listOfExternalModelDefinitions>'
+            '<comp:externalModelDefinition comp:id="ext" comp:source="sub-model.xml"/>'
+            '</comp:listOfExternalModelDefinitions>'
+            '</sbml>'
+        ))
+        write_file('sub-model.xml', '<sbml><include href="sub-sub-model.xml"/></sbml>')
+        write_file('sub-sub-model.xml', '<sbml/>')
+        task.model.language = data_model.ModelLanguage.NeuroML.value
+        self.assertEqual(cache.get_referenced_files(task.model.source, task.model.language),
+                         [os.path.join(self.tmp_dir, 'sub-model.xml'), os.path.join(self.tmp_dir, 'sub-sub-model.xml')])
+        key = cache.get_key(task, variables)
+
+        write_file('sub-sub-model.xml', '<sbml><model/></sbml>')
+        self.assertNotEqual(cache.get_key(task, variables), key)
+
+        # CellML imports
+        task = self._build_task('task_2', 'model_2.xml')
+        task.model.language = data_model.ModelLanguage.CellML.value
+        write_file('model_2.xml', '<model xmlns:xlink="http://www.w3.org/1999/xlink"><import xlink:href="units.xml"/></model>')
+        write_file('units.xml', '<model/>')
+        key = cache.get_key(task, variables)
+        write_file('units.xml', '<model><units/></model>')
+        self.assertNotEqual(cache.get_key(task, variables), key)
+
+        # XPP set files
+        os.mkdir(os.path.join(self.tmp_dir, 'xpp'))
+        task = self._build_task('task_3', os.path.join('xpp', 'model.ode'))
+        task.model.language = data_model.ModelLanguage.XPP.value
+        write_file(os.path.join('xpp', 'model.set'), 'x 1')
+        key = cache.get_key(task, variables)
+        write_file(os.path.join('xpp', 'model.set'), 'x 2')
+        self.assertNotEqual(cache.get_key(task, variables), key)
+
+        # results of models which import files that are not available locally are not cached
+        task = self._build_task('task_4', 'model_4.xml')
+        task.model.language = data_model.ModelLanguage.CellML.value
+        write_file('model_4.xml', '<model xmlns:xlink="http://www.w3.org/1999/xlink"><import xlink:href="missing.xml"/></model>')
+        self.assertEqual(cache.get_key(task, variables), None)
+
+        write_file('model_4.xml', (
+            '<model xmlns:xlink="http://www.w3.org/1999/xlink"><import xlink:href="https://models.org/units.xml"/></model>'
+        ))
+        self.assertEqual(cache.get_key(task, variables), None)
+
+    def test_results_of_models_with_unknown_imports_are_not_stored(self):
+        dirname = os.path.join(self.tmp_dir, 'cache')
+        cache = SimulationResultsCache(dirname=dirname, config=Config())
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']")]
+
+        task = self._build_task('task_1', 'model.bngl')
+        task.model.language = data_model.ModelLanguage.BNGL.value
+        key = cache.get_key(task, variables)
+        self.assertNotEqual(key, None)
+
+        cache.set(key, variables, VariableResults({'x': numpy.array([1., 2.])}))
+        numpy.testing.assert_allclose(cache.get(key, variables)['x'], numpy.array([1., 2.]))
+        self.assertEqual(cache._get_disk_entries(), [])
+
+    def test_get_set(self):
+        cache = SimulationResultsCache(max_size=1000, config=Config())
+        variables = [
+            data_model.Variable(id='x', target="/model/variable[@id='x']"),
+            data_model.Variable(id='time', symbol=data_model.Symbol.time.value),
+        ]
+        other_variables = [
+            data_model.Variable(id='time_2', symbol=data_model.Symbol.time.value),
+        ]
+
+        self.assertEqual(cache.get('key', variables), None)
+
+        cache.set('key', variables, VariableResults({'x': numpy.array([1., 2.]), 'time': numpy.array([0., 1.])}))
+        results = cache.get('key', variables)
+        self.assertEqual(set(results.keys()), set(['x', 'time']))
+        numpy.testing.assert_allclose(results['x'], numpy.array([1., 2.]))
+        numpy.testing.assert_allclose(results['time'], numpy.array([0., 1.]))
+
+        # results are mapped to variables with the same targets and symbols
+        numpy.testing.assert_allclose(cache.get('key', other_variables)['time_2'], numpy.array([0., 1.]))
+
+        # cached results are not modified by callers
+        results['x'][0] = 10.
+        numpy.testing.assert_allclose(cache.get('key', variables)['x'], numpy.array([1., 2.]))
+
+        # incomplete results are not cached
+        cache.set('key_2', variables, VariableResults({'x': numpy.array([1., 2.])}))
+        self.assertEqual(cache.get('key_2', variables), None)
+
+        # least recently used results are discarded
+        cache.set('key_3', variables, VariableResults({'x': numpy.zeros((40,)), 'time': numpy.zeros((40,))}))
+        cache.get('key', variables)
+        cache.set('key_4', variables, VariableResults({'x': numpy.zeros((40,)), 'time': numpy.zeros((40,))}))
+        self.assertNotEqual(cache.get('key', variables), None)
+        self.assertEqual(cache.get('key_3', variables), None)
+        self.assertNotEqual(cache.get('key_4', variables), None)
+
+        cache.clear()
+        self.assertEqual(cache.get('key', variables), None)
+
+    def test_dir(self):
+        dirname = os.path.join(self.tmp_dir, 'cache')
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']")]
+
+        cache = SimulationResultsCache(dirname=dirname, config=Config())
+        cache.set('key', variables, VariableResults({'x': numpy.array([1., 2.])}))
+
+        cache = SimulationResultsCache(dirname=dirname, config=Config())
+        numpy.testing.assert_allclose(cache.get('key', variables)['x'], numpy.array([1., 2.]))
+
+        with open(cache._get_filename('key'), 'w') as file:
+            file.write('invalid')
+        cache.clear()
+        with self.assertWarnsRegex(UserWarning, 'could not be read'):
+            self.assertEqual(cache.get('key', variables), None)
+
+    def test_disk_eviction(self):
+        dirname = os.path.join(self.tmp_dir, 'cache')
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']")]
+
+        cache = SimulationResultsCache(dirname=dirname, max_disk_size=10000, config=Config())
+        cache.set('key_1', variables, VariableResults({'x': numpy.zeros((400,))}))
+        cache.set('key_2', variables, VariableResults({'x': numpy.zeros((400,))}))
+        self.assertEqual(len(cache._get_disk_entries()), 2)
+
+        # the least recently used results are evicted
+        os.utime(cache._get_filename('key_2'), ns=(0, 0))
+        cache.clear()
+        self.assertNotEqual(cache.get('key_1', variables), None)
+        cache.set('key_3', variables, VariableResults({'x': numpy.zeros((400,))}))
+        self.assertEqual(sorted(filename for _, filename, _ in cache._get_disk_entries()),
+                         sorted([cache._get_filename('key_1'), cache._get_filename('key_3')]))
+        self.assertLessEqual(cache.get_disk_size(), 10000)
+
+        cache.clear(disk=True)
+        self.assertEqual(cache.get_disk_size(), 0)
+        self.assertEqual(cache.get('key_1', variables), None)
+
+    def test_stats(self):
+        variables = [data_model.Variable(id='x', target="/model/variable[@id='x']")]
+        cache = SimulationResultsCache(config=Config())
+        cache.set('key', variables, VariableResults({'x': numpy.zeros((4,))}))
+        cache.get('key', variables)
+        cache.get('key', variables)
+        cache.get('key_2', variables)
+        self.assertEqual(cache.get_stats(), (2, 1))
+
+    def test_get_simulation_results_cache(self):
+        config = Config()
+        self.assertIs(get_simulation_results_cache(config), get_simulation_results_cache(Config()))
+
+        config.SIMULATION_RESULTS_MEMO_MAX_SIZE = 10
+        self.assertIsNot(get_simulation_results_cache(config), get_simulation_results_cache(Config()))
+        self.assertEqual(get_simulation_results_cache(config).max_size, 10)
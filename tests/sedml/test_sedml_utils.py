@@ -1,3 +1,4 @@
+from biosimulators_utils.config import Config
 from biosimulators_utils.sedml import data_model
 from biosimulators_utils.sedml import io
 from biosimulators_utils.sedml import utils
@@ -59,44 +60,44 @@ class SedmlUtilsTestCase(unittest.TestCase):
         self.assertEqual(doc_2.models[3].source, os.path.join(self.tmp_dir, doc.models[0].source))
         self.assertEqual(doc_2.models[3].changes, [1, 2, 5, 6, 7])
 
-        def requests_get(url):
+        def requests_get(url, **kwargs):
             assert url == 'https://server.edu/model.xml'
             return mock.Mock(raise_for_status=lambda: None, content='best model'.encode())
         doc_2 = copy.deepcopy(doc)
-        with mock.patch('requests.get', side_effect=requests_get):
+        with mock.patch('requests.Session.get', side_effect=requests_get):
             utils.resolve_model(doc_2.models[4], doc_2, working_dir=self.tmp_dir)
         with open(doc_2.models[4].source, 'r') as file:
             self.assertEqual(file.read(), 'best model')
         self.assertEqual(doc_2.models[4].changes, [8])
 
-        def requests_get(url):
+        def requests_get(url, **kwargs):
             assert url == 'https://www.ebi.ac.uk/biomodels/model/download/123?filename=123_url.xml'
             return mock.Mock(raise_for_status=lambda: None, content='second best model'.encode())
         doc_2 = copy.deepcopy(doc)
-        with mock.patch('requests.get', side_effect=requests_get):
+        with mock.patch('requests.Session.get', side_effect=requests_get):
             utils.resolve_model(doc_2.models[5], doc_2, working_dir=self.tmp_dir)
         with open(doc_2.models[5].source, 'r') as file:
             self.assertEqual(file.read(), 'second best model')
         self.assertEqual(doc_2.models[5].changes, [9])
 
-        def requests_get(url):
+        def requests_get(url, **kwargs):
             assert url == 'https://www.ebi.ac.uk/biomodels/model/download/123?filename=123_url.xml'
             return mock.Mock(raise_for_status=lambda: None, content='second best model'.encode())
         doc_2 = copy.deepcopy(doc)
-        with mock.patch('requests.get', side_effect=requests_get):
+        with mock.patch('requests.Session.get', side_effect=requests_get):
             utils.resolve_model(doc_2.models[6], doc_2, working_dir=self.tmp_dir)
         with open(doc_2.models[6].source, 'r') as file:
             self.assertEqual(file.read(), 'second best model')
         self.assertEqual(doc_2.models[6].changes, [9, 10])
 
         # error handling:
-        def bad_requests_get(url):
+        def bad_requests_get(url, **kwargs):
             def raise_for_status():
                 raise Exception('error')
             return mock.Mock(raise_for_status=raise_for_status)
         doc_2 = copy.deepcopy(doc)
         with self.assertRaisesRegex(ValueError, 'could not be downloaded from BioModels'):
-            with mock.patch('requests.get', side_effect=bad_requests_get):
+            with mock.patch('requests.Session.get', side_effect=bad_requests_get):
                 utils.resolve_model(doc_2.models[5], doc_2, working_dir=self.tmp_dir)
 
         doc_2 = copy.deepcopy(doc)
@@ -106,7 +107,7 @@ class SedmlUtilsTestCase(unittest.TestCase):
 
         doc_2 = copy.deepcopy(doc)
         with self.assertRaisesRegex(ValueError, 'could not be downloaded'):
-            with mock.patch('requests.get', side_effect=bad_requests_get):
+            with mock.patch('requests.Session.get', side_effect=bad_requests_get):
                 utils.resolve_model(doc_2.models[4], doc_2, working_dir=self.tmp_dir)
 
         doc_2 = copy.deepcopy(doc)
@@ -119,6 +120,66 @@ class SedmlUtilsTestCase(unittest.TestCase):
         with self.assertRaisesRegex(FileNotFoundError, 'does not exist'):
             utils.resolve_model(doc_2.models[0], doc_2, working_dir=self.tmp_dir)
 
+        # models are downloaded at most once per cache
+        remote_model_cache = utils.get_remote_model_cache(Config())
+        self.assertEqual(remote_model_cache.dirname, None)
+        with mock.patch('requests.Session.get', return_value=mock.Mock(raise_for_status=lambda: None, content=b'model')) as requests_get:
+            for model in [doc.models[4], doc.models[5], doc.models[6], doc.models[4]]:
+                doc_2 = copy.deepcopy(doc)
+                utils.resolve_model(model, doc_2, working_dir=self.tmp_dir, remote_model_cache=remote_model_cache)
+        self.assertEqual(requests_get.call_count, 2)
+
+        config = Config(CACHE_REMOTE_MODELS=True, REMOTE_MODEL_CACHE_DIR=self.tmp_dir, REMOTE_MODEL_CACHE_TTL=10.)
+        remote_model_cache = utils.get_remote_model_cache(config)
+        self.assertEqual(remote_model_cache.dirname, self.tmp_dir)
+        self.assertEqual(remote_model_cache.ttl, 10.)
+
+    def test_prefetch_remote_models(self):
+        doc = data_model.SedDocument(
+            models=[
+                data_model.Model(id='model_0', source='model_0.xml'),
+                data_model.Model(id='model_1', source='https://server.edu/model_1.xml'),
+                data_model.Model(id='model_2', source='#model_1'),
+                data_model.Model(id='model_3', source='#model_4'),
+                data_model.Model(id='model_4', source='urn:miriam:biomodels.db:BIOMD0000000012'),
+                data_model.Model(id='model_5', source='https://server.edu/model_1.xml'),
+                data_model.Model(id='model_6', source='#model_7'),
+                data_model.Model(id='model_7', source='#model_6'),
+                data_model.Model(id='model_8', source='#undefined'),
+                data_model.Model(id='model_9', source='https://server.edu/model_9.xml'),
+            ],
+        )
+        urls = [
+            'https://server.edu/model_1.xml',
+            'https://www.ebi.ac.uk/biomodels/model/download/biomd0000000012?filename=biomd0000000012_url.xml',
+            'https://server.edu/model_9.xml',
+        ]
+        self.assertEqual(utils.get_remote_model_urls(doc), urls)
+
+        def requests_get(url, **kwargs):
+            if url == 'https://server.edu/model_9.xml':
+                raise Exception('error')
+            return mock.Mock(raise_for_status=lambda: None, content=url.encode())
+
+        remote_model_cache = utils.get_remote_model_cache(Config())
+        with mock.patch('requests.Session.get', side_effect=requests_get) as session_get:
+            utils.prefetch_remote_models(doc, remote_model_cache)
+            self.assertEqual(sorted(call[0][0] for call in session_get.call_args_list), sorted(urls))
+
+            # resolutions reuse the prefetched models
+            doc_2 = copy.deepcopy(doc)
+            utils.resolve_model(doc_2.models[3], doc_2, working_dir=self.tmp_dir, remote_model_cache=remote_model_cache)
+            with open(doc_2.models[3].source, 'r') as file:
+                self.assertEqual(file.read(), urls[1])
+            self.assertEqual(session_get.call_count, 3)
+
+            # models which could not be prefetched are downloaded again when they are resolved
+            with self.assertRaisesRegex(ValueError, 'could not be downloaded'):
+                utils.resolve_model(doc_2.models[9], doc_2, working_dir=self.tmp_dir, remote_model_cache=remote_model_cache)
+            self.assertEqual(session_get.call_count, 4)
+
+        utils.prefetch_remote_models(data_model.SedDocument(), remote_model_cache)
+
     def test_get_variables_for_task(self):
         doc = data_model.SedDocument()
 
@@ -842,13 +903,26 @@ class ApplyModelChangesTestCase(unittest.TestCase):
         working_dir = self.tmp_dir
         with open(model_filename, 'rb') as file:
             model_1_xml = file.read()
-        with mock.patch('requests.get', return_value=mock.Mock(raise_for_status=lambda: None, content=model_1_xml)):
+        with mock.patch('requests.Session.get', return_value=mock.Mock(raise_for_status=lambda: None, content=model_1_xml)):
             variable_values = utils.get_values_of_variable_model_xml_targets_of_model_change(change, doc, {}, working_dir)
         self.assertEqual(variable_values, {
             'x': 2.,
             'y': 3.,
         })
 
+        # variable models are resolved with the remote models cached for the SED document
+        remote_model_cache = utils.get_remote_model_cache(Config())
+        with mock.patch('requests.Session.get', return_value=mock.Mock(raise_for_status=lambda: None, content=model_1_xml)):
+            utils.prefetch_remote_models(doc, remote_model_cache)
+        with mock.patch('requests.Session.get', side_effect=Exception('error')) as requests_get:
+            variable_values = utils.get_values_of_variable_model_xml_targets_of_model_change(
+                change, doc, {}, working_dir, remote_model_cache=remote_model_cache)
+        requests_get.assert_not_called()
+        self.assertEqual(variable_values, {
+            'x': 2.,
+            'y': 3.,
+        })
+
         # calc new value
         variable_values = {}
         with self.assertRaisesRegex(ValueError, 'is not defined'):
@@ -1111,6 +1185,57 @@ class ApplyModelChangesTestCase(unittest.TestCase):
         numpy.testing.assert_allclose(utils.calc_data_generator_results(data_gen, var_results),
                                       numpy.array([[5., numpy.nan, numpy.nan], [numpy.nan, numpy.nan, numpy.nan]]))
 
+    def test_get_all_nested_children_of_doc(self):
+        model_1 = data_model.Model(id='model_1')
+        model_2 = data_model.Model(id='model_2')
+        sim = data_model.UniformTimeCourseSimulation(id='sim')
+        task = data_model.Task(id='task', model=model_2, simulation=sim)
+        data_gen = data_model.DataGenerator(id='data_gen', variables=[data_model.Variable(id='var', task=task)])
+        report = data_model.Report(id='report', data_sets=[data_model.DataSet(id='data_set', data_generator=data_gen)])
+        doc = data_model.SedDocument(models=[model_1], outputs=[report])
+        expected_doc = copy.deepcopy(doc)
+
+        children = utils.get_all_nested_children_of_doc(doc)
+        self.assertEqual(children['models'], [model_1, model_2])
+        self.assertEqual(children['simulations'], [sim])
+        self.assertEqual(children['tasks'], [task])
+        self.assertEqual(children['data_generators'], [data_gen])
+        self.assertEqual(children['outputs'], [report])
+        self.assertEqual(children['styles'], [])
+        self.assertTrue(doc.is_equal(expected_doc))
+
+        utils.append_all_nested_children_to_doc(doc)
+        self.assertEqual(doc.models, [model_1, model_2])
+        self.assertEqual(doc.tasks, [task])
+
+    def test_model_overlay(self):
+        change_1 = data_model.ModelAttributeChange(target='1')
+        change_2 = data_model.ModelAttributeChange(target='2')
+        change_3 = data_model.ModelAttributeChange(target='3')
+        changes = [change_1]
+        model = data_model.Model(id='model', source='model.xml', changes=changes)
+
+        with utils.ModelOverlay() as overlay:
+            overlay.set(model, 'modified-model.xml', [])
+            state = overlay.get_state()
+            overlay.add_change(model, change_2)
+            self.assertEqual(model.source, 'modified-model.xml')
+            self.assertEqual(model.changes, [change_2])
+
+            overlay.restore_state(state)
+            self.assertEqual(model.changes, [])
+
+            overlay.restore_state({})
+            self.assertEqual(model.source, 'model.xml')
+            self.assertEqual(model.changes, [change_1])
+
+            overlay.add_change(model, change_3)
+            self.assertEqual(model.changes, [change_1, change_3])
+
+        self.assertEqual(model.source, 'model.xml')
+        self.assertIs(model.changes, changes)
+        self.assertEqual(changes, [change_1])
+
     def test_remove_model_changes(self):
         doc = data_model.SedDocument(
             models=[
@@ -1650,6 +1775,13 @@ class ApplyModelChangesTestCase(unittest.TestCase):
         objs = set(utils.get_all_sed_objects(doc))
         self.assertEqual(objs, set(expected_objs))
 
+        # attributes which are not declared by slots (e.g., of subclasses defined by simulators) are also traversed
+        self.assertNotIn('__dict__', utils.get_attribute_names(data_model.SedDocument))
+        self.assertNotIn('__weakref__', utils.get_attribute_names(data_model.SedDocument))
+        doc.tasks[0].simulator_model = data_model.Model(id='simulatorModel')
+        objs = set(utils.get_all_sed_objects(doc))
+        self.assertEqual(objs, set(expected_objs + [doc.tasks[0].simulator_model]))
+
     def test_get_model_changes_for_task(self):
         task = data_model.Task()
         self.assertEqual(utils.get_model_changes_for_task(task), [])
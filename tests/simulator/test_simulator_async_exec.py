@@ -0,0 +1,151 @@
+from biosimulators_utils.log.data_model import Status
+from biosimulators_utils.simulator import async_exec
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+DUMMY_CLI = '''
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument('-i', dest='archive')
+parser.add_argument('-o', dest='out_dir')
+args = parser.parse_args()
+
+with open(args.archive, 'r') as file:
+    behavior = file.read()
+
+print('executing ' + os.path.basename(args.archive), flush=True)
+if behavior == 'fail':
+    sys.stderr.write('simulation failed')
+    sys.exit(3)
+elif behavior == 'sleep':
+    time.sleep(30)
+elif behavior == 'spawn':
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    with open(os.path.join(args.out_dir, 'child.pid'), 'w') as file:
+        file.write(str(child.pid))
+    time.sleep(30)
+elif behavior == 'spin':
+    while True:
+        pass
+elif behavior == 'memory':
+    data = bytearray(2 ** 30)
+
+with open(os.path.join(args.out_dir, 'report.csv'), 'w') as file:
+    file.write(os.environ.get('KEY', 'results'))
+'''
+
+
+class AsyncExecTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cli_filename = os.path.join(self.tmp_dir, 'cli.py')
+        with open(self.cli_filename, 'w') as file:
+            file.write(DUMMY_CLI)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _build_job(self, name, behavior, **kwargs):
+        archive_filename = os.path.join(self.tmp_dir, name + '.omex')
+        with open(archive_filename, 'w') as file:
+            file.write(behavior)
+        return async_exec.SimulatorCliJob(archive_filename, os.path.join(self.tmp_dir, 'out', name),
+                                          [sys.executable, self.cli_filename], **kwargs)
+
+    def test_exec_sedml_docs_in_archives_with_simulator_cli(self):
+        jobs = [self._build_job('archive-{}'.format(i_job), 'succeed') for i_job in range(4)]
+        jobs.append(self._build_job('archive-env', 'succeed', environment={'KEY': 'value'}))
+        jobs.append(self._build_job('archive-fail', 'fail', stderr_filename=os.path.join(self.tmp_dir, 'logs', 'stderr.txt')))
+        jobs.append(self._build_job('archive-timeout', 'sleep', limits=async_exec.ResourceLimits(wall_time=0.5)))
+
+        progress = []
+        self.assertEqual(async_exec.exec_sedml_docs_in_archives_with_simulator_cli(
+            jobs, max_concurrency=3, progress_callback=lambda job, num_completed, num_jobs: progress.append(
+                (os.path.basename(job.archive_filename), job.status, num_completed, num_jobs))), jobs)
+
+        for job in jobs[0:5]:
+            self.assertEqual(job.status, Status.SUCCEEDED)
+            self.assertEqual(job.return_code, 0)
+            self.assertEqual(job.exception, None)
+            self.assertGreater(job.duration, 0.)
+            with open(job.stdout_filename, 'r') as file:
+                self.assertEqual(file.read(), 'executing {}\n'.format(os.path.basename(job.archive_filename)))
+        with open(os.path.join(jobs[0].out_dir, 'report.csv'), 'r') as file:
+            self.assertEqual(file.read(), 'results')
+        with open(os.path.join(jobs[4].out_dir, 'report.csv'), 'r') as file:
+            self.assertEqual(file.read(), 'value')
+
+        self.assertEqual(jobs[5].status, Status.FAILED)
+        self.assertEqual(jobs[5].return_code, 3)
+        self.assertRegex(str(jobs[5].exception), 'exit code 3')
+        with open(os.path.join(self.tmp_dir, 'logs', 'stderr.txt'), 'r') as file:
+            self.assertEqual(file.read(), 'simulation failed')
+
+        self.assertEqual(jobs[6].status, Status.FAILED)
+        self.assertTrue(jobs[6].timed_out)
+        self.assertRegex(str(jobs[6].exception), 'within 0.5 s')
+        self.assertLess(jobs[6].duration, 10.)
+
+        # progress is reported when each job starts and completes
+        self.assertEqual(len(progress), 2 * len(jobs))
+        self.assertEqual(progress[0][1:], (Status.RUNNING, 0, len(jobs)))
+        self.assertEqual([num_completed for _, status, num_completed, _ in progress if status != Status.RUNNING],
+                         list(range(1, len(jobs) + 1)))
+        self.assertEqual(max(sum(1 if status == Status.RUNNING else -1 for _, status, _, _ in progress[:i + 1])
+                             for i in range(len(progress))), 3)
+
+    @unittest.skipIf(not os.path.isdir('/proc'), 'The states of processes are not available on this platform')
+    def test_processes_started_by_simulators_are_killed(self):
+        job = self._build_job('archive-spawn', 'spawn', limits=async_exec.ResourceLimits(wall_time=2.))
+        async_exec.exec_sedml_docs_in_archives_with_simulator_cli([job])
+        self.assertTrue(job.timed_out)
+
+        with open(os.path.join(job.out_dir, 'child.pid'), 'r') as file:
+            child_pid = int(file.read())
+
+        # the orphaned child is killed (and may remain a zombie until it is reaped)
+        for _ in range(50):
+            try:
+                with open('/proc/{}/stat'.format(child_pid), 'r') as file:
+                    state = file.read().rpartition(')')[2].split()[0]
+            except FileNotFoundError:
+                state = None
+            if state in (None, 'Z', 'X'):
+                break
+            time.sleep(0.1)
+        self.assertIn(state, (None, 'Z', 'X'))
+
+    @unittest.skipIf(async_exec.resource is None, 'Resource limits are not supported on this platform')
+    def test_resource_limits(self):
+        jobs = [
+            self._build_job('archive-cpu', 'spin', limits=async_exec.ResourceLimits(cpu_time=1, wall_time=20.)),
+            self._build_job('archive-memory', 'memory', limits=async_exec.ResourceLimits(memory=2 ** 29)),
+            self._build_job('archive-ok', 'succeed', limits=async_exec.ResourceLimits(cpu_time=10, memory=2 ** 32)),
+        ]
+        async_exec.exec_sedml_docs_in_archives_with_simulator_cli(jobs)
+
+        self.assertEqual(jobs[0].status, Status.FAILED)
+        self.assertFalse(jobs[0].timed_out)
+        self.assertNotEqual(jobs[0].return_code, 0)
+
+        self.assertEqual(jobs[1].status, Status.FAILED)
+        with open(jobs[1].stderr_filename, 'r') as file:
+            self.assertIn('MemoryError', file.read())
+
+        self.assertEqual(jobs[2].status, Status.SUCCEEDED)
+
+    def test_command_not_found(self):
+        job = self._build_job('archive', 'succeed')
+        job.simulator_command = os.path.join(self.tmp_dir, 'undefined')
+        async_exec.exec_sedml_docs_in_archives_with_simulator_cli([job])
+        self.assertEqual(job.status, Status.FAILED)
+        self.assertRegex(str(job.exception), 'could not be found')
@@ -0,0 +1,180 @@
+from biosimulators_utils.simulator import exec
+from biosimulators_utils.simulator.container_pool import DockerContainerPool
+from unittest import mock
+import concurrent.futures
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+
+
+class FakeDocker(object):
+    """ Stand-in for the Docker command-line program """
+
+    def __init__(self, pool_work_dir_getter):
+        self.pool_work_dir_getter = pool_work_dir_getter
+        self.started = []
+        self.removed = []
+        self.execs = []
+        self.stopped = set()
+        self.fail_exec = False
+        self.fail_run = False
+        self.num_concurrent_execs = 0
+        self.max_concurrent_execs = 0
+        self.lock = threading.Lock()
+
+    def check_output(self, args, **kwargs):
+        if args[1] == 'run':
+            if self.fail_run:
+                raise subprocess.CalledProcessError(125, args, stderr=b'docker: Error response from daemon:\nno space left on device.\n')
+            container_id = 'container-{}'.format(len(self.started) + 1)
+            self.started.append((container_id, args))
+            return (container_id + '\n').encode()
+        elif args[1] == 'inspect':
+            return b'false\n' if args[-1] in self.stopped else b'true\n'
+        raise NotImplementedError(args)  # pragma: no cover
+
+    def check_call(self, args):
+        assert args[1] == 'exec'
+        with self.lock:
+            self.num_concurrent_execs += 1
+            self.max_concurrent_execs = max(self.max_concurrent_execs, self.num_concurrent_execs)
+        try:
+            time.sleep(0.01)
+            container_id = args[args.index('my-simulator') - 1]
+            self.execs.append((container_id, args))
+
+            image_archive_filename = args[args.index('-i') + 1]
+            image_out_dir = args[args.index('-o') + 1]
+            host_out_dir = image_out_dir.replace('/tmp/biosimulators-container-pool', self.pool_work_dir_getter())
+            host_archive_filename = image_archive_filename.replace('/tmp/biosimulators-container-pool', self.pool_work_dir_getter())
+            assert os.path.isfile(host_archive_filename)
+            assert os.stat(host_archive_filename).st_nlink == 1
+            with open(os.path.join(host_out_dir, 'log.yml'), 'w') as file:
+                file.write('status: FAILED' if self.fail_exec else 'status: SUCCEEDED')
+            if self.fail_exec:
+                raise subprocess.CalledProcessError(1, args)
+
+            os.makedirs(os.path.join(host_out_dir, 'sim.sedml'))
+            with open(os.path.join(host_out_dir, 'sim.sedml', 'report.csv'), 'w') as file:
+                file.write('results')
+        finally:
+            with self.lock:
+                self.num_concurrent_execs -= 1
+
+    def call(self, args, **kwargs):
+        assert args[1] == 'rm'
+        self.removed.append(args[-1])
+        return 0
+
+
+class DockerContainerPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.archive_filename = os.path.join(self.tmp_dir, 'archive.omex')
+        with open(self.archive_filename, 'w') as file:
+            file.write('')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _build_pool(self, **kwargs):
+        pool = DockerContainerPool('ghcr.io/biosimulators/my-simulator', command=['my-simulator'],
+                                   user_to_exec_within_container='1000', **kwargs)
+        docker = FakeDocker(lambda: pool.work_dir)
+        return pool, docker
+
+    def _patch(self, docker):
+        return mock.patch.multiple('subprocess', check_output=docker.check_output, check_call=docker.check_call, call=docker.call)
+
+    def test_exec_archive(self):
+        pool, docker = self._build_pool(max_jobs_per_container=2, environment={'KEY': 'value'})
+        with self._patch(docker):
+            for i_job in range(3):
+                out_dir = os.path.join(self.tmp_dir, 'out-{}'.format(i_job))
+                exec.exec_sedml_docs_in_archive_with_containerized_simulator(
+                    self.archive_filename, out_dir, 'ghcr.io/biosimulators/my-simulator',
+                    environment={'JOB_KEY': 'job-value'}, allocate_tty=False, container_pool=pool)
+                with open(os.path.join(out_dir, 'sim.sedml', 'report.csv'), 'r') as file:
+                    self.assertEqual(file.read(), 'results')
+
+            # containers idle and are recycled after executing the maximum number of archives
+            self.assertEqual([container_id for container_id, _ in docker.started], ['container-1', 'container-2'])
+            self.assertEqual(docker.removed, ['container-1'])
+            self.assertEqual([container_id for container_id, _ in docker.execs], ['container-1', 'container-1', 'container-2'])
+            run_args = docker.started[0][1]
+            self.assertIn('--detach', run_args)
+            self.assertIn('KEY=value', run_args)
+            self.assertEqual(run_args[run_args.index('--entrypoint') + 1:], ['tail', 'ghcr.io/biosimulators/my-simulator', '-f', '/dev/null'])
+            exec_args = docker.execs[0][1]
+            self.assertEqual(exec_args[:7], ['docker', 'exec', '--user', '1000', '--env', 'JOB_KEY=job-value', 'container-1'])
+            self.assertEqual(os.listdir(pool.work_dir), [])
+
+            # containers which stopped are replaced
+            docker.stopped.add('container-2')
+            pool.exec_archive(self.archive_filename, os.path.join(self.tmp_dir, 'out-3'))
+            self.assertEqual(docker.removed, ['container-1', 'container-2'])
+            self.assertEqual(docker.execs[-1][0], 'container-3')
+
+            # failed executions raise errors, and healthy containers are reused
+            pool.max_jobs_per_container = None
+            docker.fail_exec = True
+            with self.assertRaisesRegex(RuntimeError, 'could not execute the archive:\n\n  The simulator exited with status 1'):
+                pool.exec_archive(self.archive_filename, os.path.join(self.tmp_dir, 'out-4'))
+            self.assertEqual(pool.get_num_containers(), 1)
+
+            # the outputs of failed executions, including their logs, are kept
+            with open(os.path.join(self.tmp_dir, 'out-4', 'log.yml'), 'r') as file:
+                self.assertEqual(file.read(), 'status: FAILED')
+            self.assertEqual(os.listdir(pool.work_dir), [])
+
+            # errors of Docker in starting containers are reported
+            docker.fail_exec = False
+            docker.fail_run = True
+            docker.stopped.add('container-3')
+            with self.assertRaisesRegex(RuntimeError, '(?s)could not be started:.*docker: Error response from daemon:.*no space left'):
+                pool.exec_archive(self.archive_filename, os.path.join(self.tmp_dir, 'out-4'))
+            docker.fail_run = False
+
+            work_dir = pool.work_dir
+            pool.close()
+            self.assertEqual(docker.removed, ['container-1', 'container-2', 'container-3'])
+            self.assertEqual(pool.get_num_containers(), 0)
+            self.assertFalse(os.path.isdir(work_dir))
+
+            with self.assertRaisesRegex(RuntimeError, 'has been closed'):
+                pool.exec_archive(self.archive_filename, os.path.join(self.tmp_dir, 'out-5'))
+
+        with self.assertRaisesRegex(ValueError, 'rather than'):
+            exec.exec_sedml_docs_in_archive_with_containerized_simulator(
+                self.archive_filename, self.tmp_dir, 'ghcr.io/biosimulators/other-simulator', container_pool=pool)
+
+    def test_bounded_concurrency(self):
+        pool, docker = self._build_pool(size=2)
+        with self._patch(docker):
+            with pool:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
+                    list(executor.map(
+                        lambda i_job: pool.exec_archive(self.archive_filename, os.path.join(self.tmp_dir, 'out-{}'.format(i_job))),
+                        range(12)))
+
+        self.assertLessEqual(len(docker.started), 2)
+        self.assertEqual(docker.max_concurrent_execs, 2)
+        self.assertEqual(len(docker.execs), 12)
+
+    def test_command_from_image(self):
+        image = mock.Mock(attrs={'Config': {'Entrypoint': ['/xvfb-startup.sh', 'my-simulator']}})
+        with mock.patch('biosimulators_utils.simulator.container_pool.get_docker_image', return_value=image):
+            with DockerContainerPool('ghcr.io/biosimulators/my-simulator', docker_client=mock.Mock()) as pool:
+                self.assertEqual(pool.command, ['/xvfb-startup.sh', 'my-simulator'])
+
+        image = mock.Mock(attrs={'Config': {'Entrypoint': None}})
+        with mock.patch('biosimulators_utils.simulator.container_pool.get_docker_image', return_value=image):
+            with self.assertRaisesRegex(ValueError, 'no entry point'):
+                DockerContainerPool('ghcr.io/biosimulators/my-simulator', docker_client=mock.Mock())
+
+        with self.assertRaisesRegex(ValueError, 'at least 1'):
+            DockerContainerPool('ghcr.io/biosimulators/my-simulator', size=0, command=['my-simulator'])
@@ -1,3 +1,4 @@
+from biosimulators_utils.biosimulations.utils import get_api_cache
 from biosimulators_utils.simulator_registry.query import get_simulator_version_specs
 from unittest import mock
 import requests
@@ -11,13 +12,9 @@ class QuerySimulatorRegistryTestCase(unittest.TestCase):
         self.assertIsInstance(version_specs[0], dict)
         self.assertEqual(set(version_spec['id'] for version_spec in version_specs), set(['tellurium']))
 
-        def raise_for_status():
-            raise requests.exceptions.HTTPError()
-
-        def requests_get(self):
-            return mock.Mock(
+        def requests_get(url, **kwargs):
+            response = mock.Mock(
                 status_code=404,
-                raise_for_status=raise_for_status,
                 json=lambda: {
                     'error': [
                         {
@@ -28,14 +25,16 @@ class QuerySimulatorRegistryTestCase(unittest.TestCase):
                     ],
                 },
             )
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+            return response
 
-        with mock.patch('requests.get', side_effect=requests_get):
+        get_api_cache().clear()
+        with mock.patch('requests.Session.get', side_effect=requests_get):
             self.assertEqual(get_simulator_version_specs('tellurium'), [])
 
-        def requests_get(self):
-            return mock.Mock(
+        def requests_get(url, **kwargs):
+            response = mock.Mock(
                 status_code=400,
-                raise_for_status=raise_for_status,
                 json=lambda: {
                     'error': [
                         {
@@ -46,7 +45,10 @@ class QuerySimulatorRegistryTestCase(unittest.TestCase):
                     ],
                 },
             )
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+            return response
 
-        with mock.patch('requests.get', side_effect=requests_get):
+        get_api_cache().clear()
+        with mock.patch('requests.Session.get', side_effect=requests_get):
             with self.assertRaises(ValueError):
                 self.assertEqual(get_simulator_version_specs('tellurium'), [])
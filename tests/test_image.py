@@ -1,12 +1,42 @@
 from biosimulators_utils import image
+from biosimulators_utils.utils import cache as image_cache_utils
 from unittest import mock
+import concurrent.futures
 import docker
 import os
 import shutil
+import subprocess
 import tempfile
+import threading
+import time
 import unittest
 
 
+class FakeRegistry(object):
+    """ Stand-in for a Docker registry and the images of a local Docker daemon """
+
+    def __init__(self, images):
+        self.images = images
+        self.local_images = {}
+        self.pulls = []
+        self.lock = threading.Lock()
+
+    def get(self, tag):
+        if tag not in self.local_images:
+            raise docker.errors.ImageNotFound(tag)
+        return self.local_images[tag]
+
+    def pull(self, tag):
+        time.sleep(0.01)
+        with self.lock:
+            self.pulls.append(tag)
+        if tag not in self.images:
+            raise docker.errors.NotFound(tag)
+        image_id, digest = self.images[tag]
+        image = self.local_images[tag] = mock.Mock(id=image_id, attrs={'RepoDigests': [tag + '@' + digest]})
+        return image
+
+
 class ImageTestCase(unittest.TestCase):
     def test_login_to_docker_registry(self):
         with mock.patch.object(docker.client.DockerClient, 'login', return_value=None):
@@ -35,6 +65,77 @@ class ImageTestCase(unittest.TestCase):
                 with self.assertRaises(docker.errors.ImageNotFound):
                     image.get_docker_image(docker_client, 'unknown', pull=True)
 
+    def test_get_docker_image_with_digest_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        digest_cache = image.DockerImageDigestCache(dirname=tmpdir)
+        registry = FakeRegistry({'simulator:1': ('sha256:image-1', 'sha256:digest-1')})
+        docker_client = mock.Mock(images=registry)
+
+        # images are pulled if they haven't been pulled recently
+        img = image.get_docker_image(docker_client, 'simulator:1', max_age=60., digest_cache=digest_cache)
+        self.assertEqual(img.id, 'sha256:image-1')
+        self.assertEqual(registry.pulls, ['simulator:1'])
+        self.assertEqual(digest_cache.get_digest('simulator:1'), 'simulator:1@sha256:digest-1')
+
+        image.get_docker_image(docker_client, 'simulator:1', max_age=60., digest_cache=digest_cache)
+        self.assertEqual(registry.pulls, ['simulator:1'])
+
+        # images are pulled again if they are older than the maximum age
+        image.get_docker_image(docker_client, 'simulator:1', max_age=0., digest_cache=digest_cache)
+        self.assertEqual(registry.pulls, ['simulator:1'] * 2)
+
+        digest_cache.set('simulator:1', registry.local_images['simulator:1'], pulled=time.time() - 120.)
+        image.get_docker_image(docker_client, 'simulator:1', max_age=60., digest_cache=digest_cache)
+        self.assertEqual(registry.pulls, ['simulator:1'] * 3)
+
+        # images are pulled again if the local image changed
+        registry.local_images['simulator:1'] = mock.Mock(id='sha256:image-2')
+        image.get_docker_image(docker_client, 'simulator:1', max_age=60., digest_cache=digest_cache)
+        self.assertEqual(registry.pulls, ['simulator:1'] * 4)
+
+        # the maximum age defaults to the configuration
+        config = image.Config(DOCKER_IMAGE_PULL_MAX_AGE=60., DOCKER_IMAGE_DIGEST_CACHE_DIR=tmpdir)
+        image.get_docker_image(docker_client, 'simulator:1', config=config)
+        self.assertEqual(registry.pulls, ['simulator:1'] * 4)
+
+        image.get_docker_image(docker_client, 'simulator:1', config=image.Config())
+        self.assertEqual(registry.pulls, ['simulator:1'] * 5)
+
+        # invalid records are ignored
+        with open(digest_cache._get_filename('simulator:1'), 'w') as file:
+            file.write('invalid')
+        self.assertEqual(digest_cache.get('simulator:1'), None)
+        image.get_docker_image(docker_client, 'simulator:1', max_age=60., digest_cache=digest_cache)
+        self.assertEqual(registry.pulls, ['simulator:1'] * 6)
+
+        digest_cache.clear()
+        self.assertEqual(digest_cache.get('simulator:1'), None)
+
+        shutil.rmtree(tmpdir)
+
+    def test_pull_docker_images(self):
+        tmpdir = tempfile.mkdtemp()
+        digest_cache = image.DockerImageDigestCache(dirname=tmpdir)
+        registry = FakeRegistry({
+            'simulator-{}:1'.format(i): ('sha256:image-{}'.format(i), 'sha256:digest-{}'.format(i))
+            for i in range(8)
+        })
+        docker_client = mock.Mock(images=registry)
+
+        tags = ['simulator-{}:1'.format(i) for i in range(8)] + ['simulator-0:1']
+        images = image.pull_docker_images(docker_client, tags, max_age=60., max_workers=4, digest_cache=digest_cache)
+        self.assertEqual(list(images.keys()), tags[:-1])
+        self.assertEqual(images['simulator-3:1'].id, 'sha256:image-3')
+        self.assertEqual(sorted(registry.pulls), sorted(tags[:-1]))
+
+        images = image.pull_docker_images(docker_client, tags, max_age=60., digest_cache=digest_cache)
+        self.assertEqual(len(registry.pulls), 8)
+
+        with self.assertRaisesRegex(docker.errors.ImageNotFound, '2 images could not be pulled'):
+            image.pull_docker_images(docker_client, ['simulator-0:1', 'undefined-1', 'undefined-2'], config=image.Config())
+
+        shutil.rmtree(tmpdir)
+
     def test_pull_docker_image(self):
         with mock.patch.object(docker.client.DockerClient, 'login', return_value=None):
             docker_client = image.login_to_docker_registry(
@@ -89,3 +190,74 @@ class ImageTestCase(unittest.TestCase):
         with mock.patch('subprocess.check_call', side_effect=side_effect):
             image.convert_docker_image_to_singularity('hello-world', singularity_filename=singularity_filename)
         shutil.rmtree(tmpdir)
+
+    def test_convert_docker_image_to_singularity_with_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        cache = image.SingularityImageCache(dirname=os.path.join(tmpdir, 'cache'), max_size=25)
+        image_ids = {'simulator-1:latest': 'sha256:id-1', 'simulator-2:latest': 'sha256:id-2', 'simulator-3:latest': 'sha256:id-3'}
+        builds = []
+        lock = threading.Lock()
+
+        def check_output(cmd, **kwargs):
+            if cmd[-1] not in image_ids:
+                raise subprocess.CalledProcessError(1, cmd)
+            return (image_ids[cmd[-1]] + '\n').encode()
+
+        def check_call(cmd):
+            if cmd[1] == 'build':
+                time.sleep(0.05)
+                with lock:
+                    builds.append(cmd[-1])
+                with open(cmd[2], 'w') as file:
+                    file.write('0123456789')
+
+        with mock.patch('subprocess.check_output', side_effect=check_output):
+            with mock.patch('subprocess.check_call', side_effect=check_call):
+                # images are converted once
+                filename = image.convert_docker_image_to_singularity('simulator-1', cache=cache)
+                self.assertEqual(filename, cache.get_filename('sha256:id-1'))
+                self.assertEqual(image.convert_docker_image_to_singularity('simulator-1', cache=cache), filename)
+                self.assertEqual(len(builds), 1)
+
+                singularity_filename = os.path.join(tmpdir, 'subdir', 'simulator-1.sif')
+                self.assertEqual(image.convert_docker_image_to_singularity(
+                    'simulator-1', singularity_filename=singularity_filename, cache=cache), singularity_filename)
+                with open(singularity_filename, 'r') as file:
+                    self.assertEqual(file.read(), '0123456789')
+                self.assertEqual(len(builds), 1)
+
+                # concurrent conversions of the same image are serialized
+                with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                    filenames = list(executor.map(
+                        lambda _: image.convert_docker_image_to_singularity('simulator-2', cache=cache), range(4)))
+                self.assertEqual(set(filenames), set([cache.get_filename('sha256:id-2')]))
+                self.assertEqual(len(builds), 2)
+                self.assertEqual(sorted(os.listdir(os.path.dirname(filename))),
+                                 sorted(['id-1.sif', 'id-1.sif.lock', 'id-2.sif', 'id-2.sif.lock']))
+
+                # the least recently used images are evicted
+                os.utime(cache.get_filename('sha256:id-2'), ns=(0, 0))
+                image.convert_docker_image_to_singularity('simulator-3', cache=cache)
+                self.assertEqual(sorted(filename for _, filename, _ in cache._get_entries()),
+                                 sorted([cache.get_filename('sha256:id-1'), cache.get_filename('sha256:id-3')]))
+                self.assertEqual(cache.get_size(), 20)
+                self.assertTrue(os.path.isfile(singularity_filename))
+
+                # the cache is enabled by the configuration
+                config = image.Config(CACHE_SINGULARITY_IMAGES=True, SINGULARITY_IMAGE_CACHE_DIR=cache.dirname)
+                self.assertEqual(image.convert_docker_image_to_singularity('simulator-3', config=config),
+                                 cache.get_filename('sha256:id-3'))
+                self.assertEqual(len(builds), 3)
+
+                # images which are in use are not evicted
+                cache.max_size = 0
+                with image_cache_utils.lock_cache_entry(cache.get_filename('sha256:id-1')):
+                    cache.evict()
+                    if image_cache_utils.fcntl:
+                        self.assertTrue(os.path.isfile(cache.get_filename('sha256:id-1')))
+                self.assertFalse(os.path.isfile(cache.get_filename('sha256:id-3')))
+
+        cache.clear()
+        self.assertEqual(cache.get_size(), 0)
+
+        shutil.rmtree(tmpdir)
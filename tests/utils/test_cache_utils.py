@@ -0,0 +1,69 @@
+from biosimulators_utils.utils import cache
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+
+class CacheUtilsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_read_write(self):
+        dirname = cache.get_versioned_cache_dirname(os.path.join(self.tmp_dir, 'cache'), 2)
+        self.assertEqual(dirname, os.path.join(self.tmp_dir, 'cache', 'v2'))
+
+        filename = os.path.join(dirname, 'entry')
+        self.assertEqual(cache.read_cache_file(filename, pickle.load), None)
+
+        self.assertTrue(cache.write_cache_file(filename, pickle.dumps({'a': 1})))
+        self.assertEqual(cache.read_cache_file(filename, pickle.load), {'a': 1})
+        self.assertEqual(os.listdir(dirname), ['entry'])
+
+        with open(filename, 'w') as file:
+            file.write('invalid')
+        with self.assertWarnsRegex(UserWarning, 'could not be read'):
+            self.assertEqual(cache.read_cache_file(filename, pickle.load), None)
+
+        self.assertFalse(cache.write_cache_file(os.path.join(filename, 'entry'), b''))
+
+    def test_evict(self):
+        for name in ['a', 'b', 'c']:
+            cache.write_cache_file(os.path.join(self.tmp_dir, name), b'x' * 10)
+        os.utime(os.path.join(self.tmp_dir, 'a'), ns=(0, 0))
+        os.utime(os.path.join(self.tmp_dir, 'b'), ns=(1, 1))
+        with open(os.path.join(self.tmp_dir, '.tmp-entry'), 'w'):
+            pass
+
+        self.assertEqual(sorted(path for _, path, _ in cache.get_cache_entries(self.tmp_dir)),
+                         [os.path.join(self.tmp_dir, name) for name in ['a', 'b', 'c']])
+
+        # the least recently used entries are evicted first, except the entry to keep
+        cache.evict_cache_entries(self.tmp_dir, 20, keep=os.path.join(self.tmp_dir, 'a'))
+        self.assertEqual(sorted(path for _, path, _ in cache.get_cache_entries(self.tmp_dir)),
+                         [os.path.join(self.tmp_dir, name) for name in ['a', 'c']])
+
+        cache.clear_cache_entries(self.tmp_dir)
+        self.assertEqual(cache.get_cache_entries(self.tmp_dir), [])
+
+    def test_locked_entries_are_not_removed(self):
+        dirname = os.path.join(self.tmp_dir, 'entry')
+        os.mkdir(dirname)
+
+        with cache.lock_cache_entry(dirname) as locked:
+            self.assertTrue(locked)
+            with cache.lock_cache_entry(dirname) as locked:
+                self.assertTrue(locked)
+            with cache.lock_cache_entry(dirname, shared=False, blocking=False) as locked:
+                self.assertFalse(locked)
+
+            self.assertFalse(cache.remove_cache_entry(dirname, use_lock=True))
+            self.assertTrue(os.path.isdir(dirname))
+
+        self.assertTrue(cache.remove_cache_entry(dirname, use_lock=True))
+        self.assertFalse(os.path.isdir(dirname))
+        self.assertEqual(cache.get_cache_entries(self.tmp_dir), [])
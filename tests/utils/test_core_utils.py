@@ -24,6 +24,46 @@ class TestCase(unittest.TestCase):
 
         self.assertTrue(utils.are_lists_equal([Obj('a'), Obj('b')], [Obj('b'), Obj('a')]))
 
+    def test_memoize_structures(self):
+        calls = []
+
+        class Obj(object):
+            def __init__(self, value, children=None):
+                self.value = value
+                self.children = children or []
+
+            @utils.memoize_to_tuple
+            def to_tuple(self):
+                calls.append(self.value)
+                return (self.value, tuple(child.to_tuple() for child in self.children), {'key': [self.value]})
+
+        child = Obj('b')
+        obj_1 = Obj('a', [child, child])
+        obj_2 = Obj('a', [Obj('b'), Obj('b')])
+        obj_3 = Obj('a', [Obj('c')])
+
+        self.assertEqual(utils.get_structural_digest(obj_1), utils.get_structural_digest(obj_2))
+        self.assertNotEqual(utils.get_structural_digest(obj_1), utils.get_structural_digest(obj_3))
+
+        # outside of a context, tuple representations are recomputed
+        calls.clear()
+        obj_1.to_tuple()
+        obj_1.to_tuple()
+        self.assertEqual(calls, ['a', 'b', 'b', 'a', 'b', 'b'])
+
+        # within a context, tuple representations are computed once per object
+        calls.clear()
+        with utils.memoize_structures():
+            with utils.memoize_structures():
+                digest = utils.get_structural_digest(obj_1)
+            obj_1.to_tuple()
+            self.assertEqual(utils.get_structural_digest(obj_1), digest)
+        self.assertEqual(calls, ['a', 'b'])
+
+        # modifications after a context are reflected
+        child.value = 'c'
+        self.assertNotEqual(utils.get_structural_digest(obj_1), digest)
+
     def test_assert_exception(self):
         utils.assert_exception(True, Exception('message'))
         with self.assertRaisesRegex(Exception, 'message'):
@@ -0,0 +1,144 @@
+from biosimulators_utils.utils.http_cache import HttpCache, get_http_session
+import concurrent.futures
+import http.server
+import os
+import requests
+import shutil
+import tempfile
+import threading
+import unittest
+
+
+class ModelServer(http.server.ThreadingHTTPServer):
+    """ Stand-in for a server of models which supports conditional requests """
+
+    def __init__(self):
+        super(ModelServer, self).__init__(('127.0.0.1', 0), ModelRequestHandler)
+        self.files = {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+
+class ModelRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, self.headers.get('If-None-Match', None),
+                                         self.headers.get('If-Modified-Since', None)))
+
+        if self.path not in self.server.files:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        content, etag = self.server.files[self.path]
+        if etag and self.headers.get('If-None-Match', None) == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(content)))
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Last-Modified', 'Sat, 17 Oct 2026 00:00:00 GMT')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.server = ModelServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_get_http_session(self):
+        self.assertIs(get_http_session(), get_http_session())
+        self.assertIsNot(get_http_session(num_retries=1), get_http_session())
+
+    def test_get(self):
+        self.server.files['/model.xml'] = (b'<model/>', '"v1"')
+        url = self.server.url + '/model.xml'
+
+        # files are downloaded at most once per instance of the cache
+        cache = HttpCache()
+        self.assertEqual(cache.get(url), b'<model/>')
+        self.assertEqual(cache.get(url), b'<model/>')
+        self.assertEqual(len(self.server.requests), 1)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            other_url = self.server.url + '/model.xml?version=2'
+            self.server.files['/model.xml?version=2'] = (b'<model version="2"/>', None)
+            self.assertEqual(list(executor.map(cache.get, [other_url] * 8)), [b'<model version="2"/>'] * 8)
+        self.assertEqual(len(self.server.requests), 2)
+
+        with self.assertRaises(requests.HTTPError):
+            cache.get(self.server.url + '/undefined.xml')
+
+    def test_persistent_cache(self):
+        self.server.files['/model.xml'] = (b'<model/>', '"v1"')
+        url = self.server.url + '/model.xml'
+        dirname = os.path.join(self.tmp_dir, 'cache')
+
+        self.assertEqual(HttpCache(dirname=dirname, ttl=60.).get(url), b'<model/>')
+        self.assertEqual(len(self.server.requests), 1)
+
+        # stored files are used without contacting the server within the TTL
+        self.assertEqual(HttpCache(dirname=dirname, ttl=60.).get(url), b'<model/>')
+        self.assertEqual(len(self.server.requests), 1)
+
+        # afterwards, stored files are revalidated
+        self.assertEqual(HttpCache(dirname=dirname, ttl=0.).get(url), b'<model/>')
+        self.assertEqual(self.server.requests[-1], ('/model.xml', '"v1"', 'Sat, 17 Oct 2026 00:00:00 GMT'))
+        self.assertEqual(len(self.server.requests), 2)
+
+        self.server.files['/model.xml'] = (b'<model version="2"/>', '"v2"')
+        self.assertEqual(HttpCache(dirname=dirname, ttl=0.).get(url), b'<model version="2"/>')
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(HttpCache(dirname=dirname, ttl=60.).get(url), b'<model version="2"/>')
+        self.assertEqual(len(self.server.requests), 3)
+
+        # invalid entries are ignored
+        cache = HttpCache(dirname=dirname, ttl=60.)
+        with open(cache._get_filename(url), 'wb') as file:
+            file.write(b'invalid')
+        with self.assertWarnsRegex(UserWarning, 'could not be read'):
+            self.assertEqual(cache.get(url), b'<model version="2"/>')
+        self.assertEqual(len(self.server.requests), 4)
+
+        cache.clear(disk=True)
+        self.assertEqual(os.listdir(os.path.join(dirname, 'v1')), [])
+
+    def test_memo_ttl_and_offline(self):
+        self.server.files['/model.xml'] = (b'<model/>', '"v1"')
+        url = self.server.url + '/model.xml'
+        dirname = os.path.join(self.tmp_dir, 'cache')
+
+        # files in memory are revalidated after the memo TTL
+        cache = HttpCache(dirname=dirname, ttl=60., memo_ttl=0.)
+        self.assertEqual(cache.get(url), b'<model/>')
+        self.assertEqual(cache.get(url), b'<model/>')
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[-1][1], '"v1"')
+
+        # in offline mode, files are only served from the cache, regardless of their age
+        cache = HttpCache(dirname=dirname, ttl=0., offline=True)
+        self.assertEqual(cache.get(url), b'<model/>')
+        with self.assertRaisesRegex(requests.ConnectionError, 'offline'):
+            cache.get(self.server.url + '/other.xml')
+        self.assertEqual(len(self.server.requests), 2)
+
+        self.server.files['/data.json'] = (b'{"a": [1, 2]}', None)
+        self.assertEqual(HttpCache().get_json(self.server.url + '/data.json'), {'a': [1, 2]})
@@ -1,10 +1,16 @@
+from biosimulators_utils.utils import identifiers_org
 from biosimulators_utils.utils.identifiers_org import (
     IdentifiersOrgNamespace,
     InvalidIdentifiersOrgUri,
     get_identifiers_org_namespaces,
     get_identifiers_org_namespace,
     validate_identifiers_org_uri,
+    validate_identifiers_org_uris,
 )
+from unittest import mock
+import os
+import shutil
+import tempfile
 import unittest
 
 
@@ -16,6 +22,47 @@ class IdentifiersOrgUtilsTestCase(unittest.TestCase):
 
         get_identifiers_org_namespaces()
 
+    def test_get_identifiers_org_namespaces_cache(self):
+        dirname = tempfile.mkdtemp()
+        cache_filename = os.path.join(dirname, 'identifiers_org', 'namespaces.pickle')
+        try:
+            with mock.patch.object(identifiers_org, 'get_identifiers_org_namespaces_cache_filename', return_value=cache_filename):
+                with mock.patch.object(identifiers_org, 'IDENTIFIERS_ORG_NAMESPACES', None):
+                    namespaces = get_identifiers_org_namespaces()
+                self.assertTrue(os.path.isfile(cache_filename))
+
+                with mock.patch.object(identifiers_org, 'IDENTIFIERS_ORG_NAMESPACES', None):
+                    with mock.patch.object(identifiers_org, 'parse_identifiers_org_namespaces',
+                                           side_effect=Exception('cache not used')):
+                        cached_namespaces = get_identifiers_org_namespaces()
+
+            self.assertEqual(set(cached_namespaces.keys()), set(namespaces.keys()))
+            self.assertEqual(cached_namespaces['pubmed'], namespaces['pubmed'])
+            self.assertIs(cached_namespaces['pubmed'], cached_namespaces['ncbi/pubmed'])
+            self.assertTrue(cached_namespaces['pubmed'].pattern.match('1234'))
+
+            self.assertEqual(identifiers_org.read_identifiers_org_namespaces_cache(os.path.join(dirname, 'missing.pickle')), None)
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_namespace_pattern(self):
+        kwargs = dict(id=1, mir_id='MIR:00000001', prefix='ns', name='Namespace', description='', embedded_in_lui=False,
+                      sample_id='1', resources=[], deprecated=False, deprecated_date=None, created=None, modified=None)
+
+        # patterns can be sources, which are compiled when they are first used, or compiled patterns
+        namespace = IdentifiersOrgNamespace(pattern=r'^\d+$', **kwargs)
+        self.assertTrue(namespace.pattern.match('1234'))
+        self.assertFalse(namespace.pattern.match('abc'))
+        self.assertIs(namespace.pattern, namespace.pattern)
+
+        compiled_pattern = identifiers_org.re.compile(r'^\d+$')
+        namespace_2 = IdentifiersOrgNamespace(pattern=compiled_pattern, **kwargs)
+        self.assertIs(namespace_2.pattern, compiled_pattern)
+        self.assertEqual(namespace_2, namespace)
+
+        with self.assertRaises(TypeError):
+            IdentifiersOrgNamespace(**kwargs)
+
     def test_get_identifiers_org_namespace(self):
         namespace = get_identifiers_org_namespace('pubmed')
         self.assertIsInstance(namespace, IdentifiersOrgNamespace)
@@ -53,3 +100,58 @@ class IdentifiersOrgUtilsTestCase(unittest.TestCase):
             validate_identifiers_org_uri('http://identifiers.org/ols/cl:CL:0001057')
         with self.assertRaises(InvalidIdentifiersOrgUri):
             validate_identifiers_org_uri('http://identifiers.org/ols/cl/CL:0001057')
+
+        with self.assertRaisesRegex(InvalidIdentifiersOrgUri, 'not an Identifiers.org URI'):
+            validate_identifiers_org_uri('http://example.org/pubmed:1234')
+
+    def test_validate_identifiers_org_uri_memoized(self):
+        identifiers_org.get_identifiers_org_uri_error.cache_clear()
+        with mock.patch.object(identifiers_org, 'parse_identifiers_org_uri',
+                               side_effect=identifiers_org.parse_identifiers_org_uri) as parse:
+            validate_identifiers_org_uri('http://identifiers.org/pubmed:1234')
+            validate_identifiers_org_uri('http://identifiers.org/pubmed:1234')
+            with self.assertRaises(InvalidIdentifiersOrgUri):
+                validate_identifiers_org_uri('https://identifiers.org/pubmed:abc')
+            with self.assertRaises(InvalidIdentifiersOrgUri):
+                validate_identifiers_org_uri('https://identifiers.org/pubmed:abc')
+        self.assertEqual(parse.call_count, 2)
+
+    def test_validate_identifiers_org_uris(self):
+        results = validate_identifiers_org_uris(iter([
+            'http://identifiers.org/pubmed:1234',
+            'http://identifiers.org/ncbi/pubmed:1234',
+            'https://identifiers.org/pubmed:abc',
+            'http://identifiers.org/CL:0001057',
+            'http://identifiers.org/cl:0001057',
+            'http://identifiers.org/undefined:1234',
+            'http://identifiers.org/pubmed:1234',
+        ]))
+        self.assertEqual(list(results.keys()), [
+            'http://identifiers.org/pubmed:1234',
+            'http://identifiers.org/ncbi/pubmed:1234',
+            'https://identifiers.org/pubmed:abc',
+            'http://identifiers.org/CL:0001057',
+            'http://identifiers.org/cl:0001057',
+            'http://identifiers.org/undefined:1234',
+        ])
+        self.assertEqual(results['http://identifiers.org/pubmed:1234'], None)
+        self.assertEqual(results['http://identifiers.org/ncbi/pubmed:1234'], None)
+        self.assertIsInstance(results['https://identifiers.org/pubmed:abc'], InvalidIdentifiersOrgUri)
+        self.assertEqual(results['http://identifiers.org/CL:0001057'], None)
+        self.assertIsInstance(results['http://identifiers.org/cl:0001057'], InvalidIdentifiersOrgUri)
+        self.assertIsInstance(results['http://identifiers.org/undefined:1234'], InvalidIdentifiersOrgUri)
+
+        self.assertEqual(validate_identifiers_org_uris([]), {})
+
+    def test_validate_identifiers_org_uris_memoized(self):
+        identifiers_org.get_identifiers_org_uri_error.cache_clear()
+        with mock.patch.object(identifiers_org, 'parse_identifiers_org_uri',
+                               side_effect=identifiers_org.parse_identifiers_org_uri) as parse:
+            validate_identifiers_org_uri('http://identifiers.org/pubmed:1234')
+            results = validate_identifiers_org_uris(['http://identifiers.org/pubmed:1234', 'https://identifiers.org/pubmed:abc'])
+            self.assertEqual(results['http://identifiers.org/pubmed:1234'], None)
+            self.assertIsInstance(results['https://identifiers.org/pubmed:abc'], InvalidIdentifiersOrgUri)
+            validate_identifiers_org_uris(['https://identifiers.org/pubmed:abc'])
+            with self.assertRaises(InvalidIdentifiersOrgUri):
+                validate_identifiers_org_uri('https://identifiers.org/pubmed:abc')
+        self.assertEqual(parse.call_count, 2)
@@ -0,0 +1,84 @@
+from biosimulators_utils.report.data_model import DataSetResults, ReportFormat
+from biosimulators_utils.report.io import ReportWriter
+from biosimulators_utils.sedml.data_model import Report, DataSet
+from biosimulators_utils.utils.output_manifest import OutputManifest, register_output_file
+import numpy
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class OutputManifestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write_file(self, *path):
+        filename = os.path.join(self.tmp_dir, *path)
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        with open(filename, 'w') as file:
+            file.write('')
+        return filename
+
+    def test_register(self):
+        out_dir = os.path.join(self.tmp_dir, 'out')
+        manifest = OutputManifest(out_dir)
+
+        filename_1 = self._write_file('out', 'a', 'report.csv')
+        filename_2 = self._write_file('out', 'a', 'b', 'plot.pdf')
+        filename_3 = self._write_file('other', 'report.csv')
+        filename_4 = self._write_file('out', 'a', 'unregistered.csv')
+
+        # files are only recorded while the manifest is active
+        register_output_file(filename_1)
+        self.assertEqual(manifest.get_filenames(), [])
+
+        with manifest:
+            register_output_file(filename_2)
+            register_output_file(filename_1)
+            register_output_file(filename_3)
+        self.assertEqual(manifest.get_filenames(), [filename_2, filename_1])
+        self.assertEqual(manifest.get_filenames(extensions=['.csv']), [filename_1])
+        self.assertEqual(manifest.get_filenames(dirname=os.path.join(out_dir, 'a', 'b')), [filename_2])
+
+        # files which have been deleted are ignored
+        os.remove(filename_2)
+        self.assertEqual(manifest.get_filenames(), [filename_1])
+
+        # files which were not registered are not recorded
+        self.assertNotIn(filename_4, manifest.get_filenames())
+
+    def test_remove_files(self):
+        out_dir = os.path.join(self.tmp_dir, 'out')
+        manifest = OutputManifest(out_dir)
+
+        filename_1 = self._write_file('out', 'a', 'b', 'report.csv')
+        filename_2 = self._write_file('out', 'a', 'extra-file')
+        filename_3 = self._write_file('out', 'c', 'plot.pdf')
+        manifest.register(filename_1)
+        manifest.register(filename_3)
+
+        manifest.remove_files(manifest.get_filenames())
+        self.assertEqual(manifest.get_filenames(), [])
+        self.assertFalse(os.path.isdir(os.path.join(out_dir, 'a', 'b')))
+        self.assertTrue(os.path.isfile(filename_2))
+        self.assertFalse(os.path.isdir(os.path.join(out_dir, 'c')))
+        self.assertTrue(os.path.isdir(out_dir))
+
+    def test_report_writer_registers_files(self):
+        report = Report(id='report', data_sets=[DataSet(id='x', label='x')])
+        results = DataSetResults({'x': numpy.array([1., 2.])})
+
+        out_dir = os.path.join(self.tmp_dir, 'out')
+        with OutputManifest(out_dir) as manifest:
+            ReportWriter().run(report, results, out_dir, 'sim.sedml/report', format=ReportFormat.csv)
+            ReportWriter().run(report, results, out_dir, 'sim.sedml/report', format=ReportFormat.h5)
+
+        self.assertEqual(manifest.get_filenames(), [
+            os.path.join(out_dir, 'sim.sedml', 'report.csv'),
+            os.path.join(out_dir, 'reports.h5'),
+        ])